@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import hmac
+from typing import Any, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from app.services.reaction_config import get_reaction_data, reload_reaction_data
+from app.state.session_log import iter_records
+from app.ws.encoding import encode_json
+
+
+class ReloadReactionConfigRequest(BaseModel):
+    # Knob overrides, e.g. {"FIRE_SUPPRESSION_PROB": 0.2}; merged with earlier overrides
+    tuning: Optional[dict[str, Any]] = None
+
+
+def require_admin(request: Request, x_admin_token: Optional[str] = Header(default=None)) -> None:
+    # Fail closed: without ADMIN_TOKEN the admin (and internal) routes are off
+    _check_admin_token(request, x_admin_token)
+
+
+def _check_admin_token(request: Request, x_admin_token: Optional[str]) -> None:
+    expected = request.app.state.settings.admin_token  # type: ignore[attr-defined]
+    if not expected:
+        raise HTTPException(status_code=403, detail="admin API disabled (set ADMIN_TOKEN)")
+    if x_admin_token is None or not hmac.compare_digest(x_admin_token, expected):
+        raise HTTPException(status_code=403, detail="invalid admin token")
+
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin)])
+
+
+@router.get("/reaction-config")
+async def get_reaction_config() -> dict:
+    return get_reaction_data().describe()
+
+
+@router.post("/reaction-config/reload")
+async def reload_reaction_config(body: ReloadReactionConfigRequest | None = None) -> dict:
+    """Re-read reaction_config.json (plus optional tuning overrides) and swap it in."""
+    try:
+        data = await reload_reaction_data(tuning=body.tuning if body is not None else None)
+    except (OSError, ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=f"reload failed: {e}")
+    return data.describe()
+
+
+@router.get("/session-log")
+async def stream_session_log(
+    request: Request,
+    roomId: Optional[str] = None,
+    x_admin_token: Optional[str] = Header(default=None),
+) -> StreamingResponse:
+    """Stream the retained session log (one room's records with roomId) as NDJSON, oldest first."""
+    # Every room's full history: checked here too, so it stays closed whatever guards the router
+    _check_admin_token(request, x_admin_token)
+    session_log = request.app.state.session_log
+    if not session_log.enabled:
+        raise HTTPException(status_code=404, detail="session log disabled (set SESSION_LOG_DIR)")
+    # A sync generator: Starlette reads the segment files in its threadpool
+    lines = (encode_json(record) + "\n" for record in iter_records(session_log.directory, roomId))
+    return StreamingResponse(lines, media_type="application/x-ndjson")
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from fastapi import APIRouter, Depends, Request
+from pydantic import BaseModel, Field
+
+from app.api.admin import require_admin
+from app.services.bot import Bot as ServiceBot
+from app.services.coach import MegaKnight
+
+
+# Worker-to-worker calls; mounted only when room affinity is on, always behind X-Admin-Token
+router = APIRouter(prefix="/internal", tags=["internal"], dependencies=[Depends(require_admin)])
+
+
+class RoomHandoff(BaseModel):
+    """RoomManager.export_room snapshot; malformed bots/coach/transcript are a 422, not a 500."""
+
+    createdAt: Optional[datetime] = None
+    category: Optional[str] = None
+    bots: List[ServiceBot] = Field(default_factory=list)
+    coach: Optional[MegaKnight] = None
+    transcript: List[Tuple[datetime, str]] = Field(default_factory=list)
+
+
+@router.post("/rooms/{roomId}/handoff", status_code=204)
+async def accept_room_handoff(roomId: str, body: RoomHandoff, request: Request) -> None:
+    """Install a room handed over by its previous owner (see app.core.affinity)."""
+    request.app.state.room_affinity.accept_handoff(roomId, body.model_dump(mode="json"))  # type: ignore[attr-defined]
+    return None
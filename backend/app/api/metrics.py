@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Request
+
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("")
+async def get_metrics(request: Request) -> dict:
+    """Operational counters for sizing pools and queues."""
+    state = request.app.state
+    return {
+        "personaPool": state.persona_warehouse.metrics(),
+        "rooms": state.room_lifecycle.metrics(),
+        "sessionLog": state.session_log.metrics(),
+        "ws": state.ws_manager.metrics(),
+        "eventBus": state.event_bus.metrics(),
+        "affinity": state.room_affinity.metrics(),
+        "reactionFrames": state.reaction_frames.metrics(),
+        "scheduler": state.delivery_scheduler.metrics(),
+        "reactionGenerations": state.reaction_generations.metrics(),
+        "transcriptBuffer": state.transcript_buffer.metrics(),
+    }
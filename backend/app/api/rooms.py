@@ -1,7 +1,5 @@
 from __future__ import annotations
 from datetime import datetime, timezone
-import asyncio
-import uuid
 from fastapi import APIRouter, HTTPException, Request, Depends
 
 from app.schemas.room import (
@@ -12,7 +10,7 @@ from app.schemas.room import (
 )
 from app.events.bus import EventBus
 from app.services.bot_spawner import createBotFromPool, generatePersonaPool
-from app.services.reaction_config import CATEGORIES
+from app.services.reaction_config import get_category_preset
 import random
 from app.services.coach import create_megaknight_coach
 
@@ -20,7 +18,9 @@ router = APIRouter(prefix="/rooms", tags=["rooms"])
 
 @router.post("", response_model=CreateRoomResponse, status_code=201)
 async def create_room(request: Request, body: CreateRoomRequest | None = None) -> CreateRoomResponse:
-    room_id = str(uuid.uuid4())
+    # An id this worker owns, so the room's state starts where it will live
+    room_id = request.app.state.room_affinity.new_room_id()
+    request.app.state.room_lifecycle.open(room_id)
     coach = create_megaknight_coach()
     request.app.state.room_manager.add_coach_to_room(room_id, coach)
     # category if provided
@@ -32,7 +32,7 @@ async def create_room(request: Request, body: CreateRoomRequest | None = None) -
     request.app.state.room_manager.set_category(room_id, category)
     bots_api: list[SchemaBot] = []
 
-    # Create bots concurrently; reuse persona generation here rather than inside add_bot
+    # Create bots from pooled personas; reuse persona generation here rather than inside add_bot
     num_bots = 18
     try:
         topic = None
@@ -40,12 +40,12 @@ async def create_room(request: Request, body: CreateRoomRequest | None = None) -
             topic = (body.topic or "").strip() if body is not None else None
         except Exception:
             topic = None
-        persona_tasks = [generatePersonaPool(topic=topic or (category or "Public Speaking")) for _ in range(num_bots)]
-        personas = await asyncio.gather(*persona_tasks, return_exceptions=True)
+        # Take pre-generated personas from the warehouse; only misses wait on the model
+        personas = await request.app.state.persona_warehouse.acquire(topic or (category or "Public Speaking"), num_bots)
 
         # Prepare diversity helpers
         stance_cycle = ["supportive", "skeptical", "curious"]
-        domain_bias = CATEGORIES.get(category or "", {}).get("domain_bias", {"tech": 0.5, "design": 0.25, "finance": 0.25})
+        domain_bias = get_category_preset(category).get("domain_bias", {"tech": 0.5, "design": 0.25, "finance": 0.25})
         domains = list(domain_bias.keys())
         weights = [float(domain_bias[d]) for d in domains]
         total_w = sum(weights) or 1.0
@@ -128,6 +128,9 @@ async def add_bot(
     request: Request,
     bus: EventBus = Depends(get_bus),
 ) -> SchemaBot:
+    # Rooms are opened by POST /rooms (or speech), never implicitly by a mistyped id
+    if not request.app.state.room_manager.has_room(roomId):
+        raise HTTPException(status_code=404, detail="Room not found.")
     persona_pool = await generatePersonaPool(topic="AI Presentations")
     new_bot_instance = createBotFromPool(persona_pool)
 
@@ -135,6 +138,7 @@ async def add_bot(
         raise HTTPException(status_code=500, detail="Failed to create a new bot.")
 
     request.app.state.room_manager.add_bot_to_room(roomId, new_bot_instance)
+    request.app.state.room_lifecycle.touch(roomId)
 
     bot_for_api = SchemaBot(
         id=new_bot_instance.id,
@@ -149,6 +153,13 @@ async def add_bot(
     await bus.publish("bot:join", {"roomId": roomId, "bot": bot_for_api.model_dump()})
     return bot_for_api
 
+@router.delete("/{roomId}", status_code=204)
+async def close_room(roomId: str, request: Request) -> None:
+    # Drops bots, transcript, buffers and in-flight reactions; connected clients are closed
+    if not await request.app.state.room_lifecycle.close(roomId):
+        raise HTTPException(status_code=404, detail="Room not found.")
+    return None
+
 @router.delete("/{roomId}/bots/{botId}", status_code=204)
 async def remove_bot(
     roomId: str,
@@ -171,6 +182,9 @@ async def get_final_feedback(roomId: str, request: Request, bus: EventBus = Depe
     feedback = await coach.generate_end_session_feedback()
 
     if feedback:
+        request.app.state.session_log.append(
+            {"type": "feedback", "roomId": roomId, "coachId": coach.id, "feedback": feedback}
+        )
         await bus.publish(
             "coach:feedback",
             {"roomId": roomId, "coachId": coach.id, "feedback": feedback}
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from pydantic import BaseModel
 
 from app.events.bus import EventBus
@@ -27,12 +27,36 @@ def get_buffer(request: Request) -> TranscriptBuffer:
 @router.post("/deepgram", status_code=202)
 async def deepgram_webhook(
     body: DeepgramWebhook,
+    request: Request,
     bus: EventBus = Depends(get_bus),
     buffer: TranscriptBuffer = Depends(get_buffer),
-) -> dict:
+) -> dict | Response:
     if not body.roomId or not body.text:
         raise HTTPException(status_code=400, detail="roomId and text are required")
 
+    affinity = request.app.state.room_affinity  # type: ignore[attr-defined]
+    if not affinity.is_forwarded(request.headers) and not affinity.is_local(body.roomId):
+        # The owner buffers this room's transcript. Buffering it here instead would leave
+        # a stray copy of the room that is never handed back, so an unreachable owner is a 503
+        response = await affinity.forward(
+            body.roomId,
+            "POST",
+            "/webhooks/deepgram",
+            body.model_dump_json().encode("utf-8"),
+            {"content-type": "application/json"},
+        )
+        if response is None:
+            raise HTTPException(status_code=503, detail="room owner unavailable")
+        if response.status_code >= 300:
+            return Response(
+                status_code=response.status_code,
+                content=response.content,
+                media_type=response.headers.get("content-type"),
+            )
+        return {**response.json(), "forwarded": True}
+
+    # Incoming speech opens the room (or keeps it from expiring)
+    request.app.state.room_lifecycle.open(body.roomId)  # type: ignore[attr-defined]
     flushed, chunk, flush_meta = buffer.append(body.roomId, body.text, body.meta or {})
     if flushed:
         await bus.publish(
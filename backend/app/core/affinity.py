@@ -0,0 +1,307 @@
+"""Room affinity: every room is owned by exactly one worker."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import time
+import uuid
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Optional, Set
+
+import httpx
+
+from app.ws.encoding import encode_json
+
+if TYPE_CHECKING:
+    from app.core.scheduler import DeliveryScheduler, ScheduledCall
+    from app.events.bus import EventBus
+    from app.state.room_lifecycle import RoomLifecycle
+    from app.state.room_manager import RoomManager
+
+HEARTBEAT_TOPIC = "worker:heartbeat"
+LEAVE_TOPIC = "worker:leave"
+# Set on requests one worker forwards to another; they are never forwarded again.
+# Only trusted together with the shared worker token (ADMIN_TOKEN) in TOKEN_HEADER.
+FORWARDED_HEADER = "x-podium-forwarded"
+TOKEN_HEADER = "x-admin-token"
+# Close code after telling a client to reconnect to the room's owner
+REDIRECT_CLOSE_CODE = 4307
+
+
+def _score(worker_url: str, room_id: str) -> int:
+    digest = hashlib.blake2b(f"{worker_url}\0{room_id}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def room_id_from_path(path: str) -> Optional[str]:
+    """roomId of a /rooms/{roomId}/... path (not POST /rooms itself)."""
+    parts = path.split("/", 3)
+    if len(parts) >= 3 and parts[1] == "rooms" and parts[2]:
+        return parts[2]
+    return None
+
+
+@dataclass
+class _Worker:
+    url: str
+    public_url: str
+    last_seen: float
+
+
+@dataclass
+class _Stats:
+    forwarded: int = 0
+    forward_failures: int = 0
+    redirects: int = 0
+    handoffs_out: int = 0
+    handoffs_in: int = 0
+    handoff_failures: int = 0
+    rebalances: int = 0
+
+
+class RoomAffinity:
+    """Rendezvous-hashes each roomId to one live worker.
+
+    Workers announce themselves (internal URL, optional public URL) on the
+    event bus every `heartbeat_s`, answer a newcomer's first heartbeat at
+    once, and drop a peer after three missed beats or its worker:leave.
+    Ownership is the highest hash of (worker, roomId), so a worker joining
+    or leaving only moves the rooms it wins or held (about 1/N).
+
+    Requests for a room that land on another worker are forwarded there
+    (HTTP) or redirected (WebSocket, when the owner has a public URL). When
+    a room held here changes owner, its RoomManager snapshot is POSTed to
+    the new owner and dropped locally; a failed handoff keeps the room and
+    is retried on the next beat. Rooms live only in memory, so a worker
+    that dies without leaving loses its rooms' bots and history.
+
+    Disabled (every room is local) unless `self_url` is set, the bus has
+    a cross-process transport, and `admin_token` is set: workers sign
+    forwarded requests and handoffs with it, so without one neither could
+    be told apart from a client's.
+    """
+
+    def __init__(
+        self,
+        self_url: str,
+        bus: "EventBus",
+        rooms: "RoomManager",
+        lifecycle: "RoomLifecycle",
+        public_url: str = "",
+        heartbeat_s: float = 2.0,
+        admin_token: Optional[str] = None,
+        forward_timeout_s: float = 5.0,
+        scheduler: Optional["DeliveryScheduler"] = None,
+    ) -> None:
+        self.self_url = self_url.rstrip("/")
+        self.public_url = public_url.rstrip("/")
+        self.bus = bus
+        self.rooms = rooms
+        self.lifecycle = lifecycle
+        self.heartbeat_s = heartbeat_s
+        self.admin_token = admin_token
+        self.forward_timeout_s = forward_timeout_s
+        self.scheduler = scheduler
+        self.enabled = bool(self.self_url) and HEARTBEAT_TOPIC in bus.transport.topics and bool(admin_token)
+        if self.self_url and not admin_token:
+            print("[affinity] WORKER_URL is set but ADMIN_TOKEN is not; room affinity disabled")
+        self._workers: Dict[str, _Worker] = {}
+        self._members: list[str] = [self.self_url]
+        self._handing_off: Set[str] = set()
+        self._dirty = False
+        self._beat: Optional["ScheduledCall"] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._stats = _Stats()
+
+    # -- ownership ---------------------------------------------------------
+
+    def owner(self, room_id: str) -> str:
+        if not self.enabled:
+            return self.self_url
+        if len(self._members) == 1:
+            return self._members[0]
+        return max(self._members, key=lambda url: _score(url, room_id))
+
+    def is_local(self, room_id: str) -> bool:
+        return not self.enabled or self.owner(room_id) == self.self_url
+
+    def new_room_id(self) -> str:
+        """A fresh room id this worker owns, so POST /rooms needs no handoff."""
+        room_id = str(uuid.uuid4())
+        for _ in range(64):
+            if self.is_local(room_id):
+                break
+            room_id = str(uuid.uuid4())
+        return room_id
+
+    def ws_redirect_url(self, room_id: str) -> Optional[str]:
+        """Public WebSocket URL of the room's owner, if it announced one."""
+        worker = self._workers.get(self.owner(room_id))
+        if worker is None or not worker.public_url:
+            return None
+        base = worker.public_url.replace("https://", "wss://", 1).replace("http://", "ws://", 1)
+        self._stats.redirects += 1
+        return f"{base}/ws/rooms/{room_id}"
+
+    # -- forwarding --------------------------------------------------------
+
+    def is_forwarded(self, headers) -> bool:
+        """True for a request another worker forwarded (header plus a valid worker token)."""
+        if not self.enabled or not headers.get(FORWARDED_HEADER):
+            return False
+        token = headers.get(TOKEN_HEADER) or ""
+        return hmac.compare_digest(token, self.admin_token or "")
+
+    def _http(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=httpx.Timeout(self.forward_timeout_s, connect=2.0))
+        return self._client
+
+    async def forward(
+        self,
+        room_id: str,
+        method: str,
+        path: str,
+        content: bytes = b"",
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[httpx.Response]:
+        """Send a request to the room's owner; None if it could not be reached."""
+        headers = dict(headers or {})
+        headers[FORWARDED_HEADER] = self.self_url
+        headers[TOKEN_HEADER] = self.admin_token or ""
+        try:
+            response = await self._http().request(method, self.owner(room_id) + path, content=content, headers=headers)
+        except httpx.HTTPError as e:
+            self._stats.forward_failures += 1
+            print(f"[affinity] forward failed room={room_id} path={path}: {e}")
+            return None
+        self._stats.forwarded += 1
+        return response
+
+    # -- membership --------------------------------------------------------
+
+    async def start(self) -> None:
+        if not self.enabled:
+            return
+        self.bus.subscribe(HEARTBEAT_TOPIC, self._on_heartbeat)
+        self.bus.subscribe(LEAVE_TOPIC, self._on_leave)
+        await self._announce()
+        self._arm()
+
+    def _arm(self) -> None:
+        if self.scheduler is not None:
+            self._beat = self.scheduler.call_later(self.heartbeat_s, ("affinity", "heartbeat"), self._tick)
+
+    async def _announce(self) -> None:
+        await self.bus.publish(HEARTBEAT_TOPIC, {"url": self.self_url, "publicUrl": self.public_url})
+
+    def _set_members(self) -> None:
+        members = sorted({self.self_url, *self._workers})
+        if members != self._members:
+            print(f"[affinity] workers={members}")
+            self._members = members
+            self._stats.rebalances += 1
+            self._dirty = True
+
+    async def _on_heartbeat(self, payload: dict) -> None:
+        url = str(payload.get("url") or "").rstrip("/")
+        if not url or url == self.self_url:
+            return
+        is_new = url not in self._workers
+        self._workers[url] = _Worker(url=url, public_url=str(payload.get("publicUrl") or ""), last_seen=time.monotonic())
+        if is_new:
+            # Let the newcomer learn about us without waiting a full beat
+            await self._announce()
+            self._set_members()
+            await self._rebalance()
+
+    async def _on_leave(self, payload: dict) -> None:
+        url = str(payload.get("url") or "").rstrip("/")
+        if self._workers.pop(url, None) is not None:
+            self._set_members()
+            await self._rebalance()
+
+    async def _tick(self) -> None:
+        self._beat = None
+        horizon = time.monotonic() - 3 * self.heartbeat_s
+        for url, worker in list(self._workers.items()):
+            if worker.last_seen < horizon:
+                self._workers.pop(url, None)
+        self._set_members()
+        try:
+            await self._announce()
+            await self._rebalance()
+        finally:
+            self._arm()
+
+    # -- handoff -----------------------------------------------------------
+
+    async def _rebalance(self) -> None:
+        if not self._dirty:
+            return
+        self._dirty = False
+        moved = [room_id for room_id in self.rooms.room_ids() if not self.is_local(room_id)]
+        if moved:
+            await asyncio.gather(*(self._handoff(room_id) for room_id in moved))
+
+    async def _handoff(self, room_id: str) -> None:
+        if room_id in self._handing_off:
+            return
+        snapshot = self.rooms.export_room(room_id)
+        if snapshot is None:
+            return
+        self._handing_off.add(room_id)
+        headers = {"content-type": "application/json"}
+        try:
+            response = await self.forward(
+                room_id,
+                "POST",
+                f"/internal/rooms/{room_id}/handoff",
+                content=encode_json(snapshot).encode("utf-8"),
+                headers=headers,
+            )
+            if response is None or response.status_code >= 300:
+                self._stats.handoff_failures += 1
+                self._dirty = True  # keep the room; retry on the next beat
+                return
+            self._stats.handoffs_out += 1
+            await self.lifecycle.close(room_id, reason="handoff", close_sockets=False)
+        finally:
+            self._handing_off.discard(room_id)
+
+    def accept_handoff(self, room_id: str, snapshot: dict) -> None:
+        self.rooms.import_room(room_id, snapshot)
+        self.lifecycle.touch(room_id)
+        self._stats.handoffs_in += 1
+
+    async def stop(self) -> None:
+        """Leave the ring and hand every room held here to its next owner."""
+        if self._beat is not None and self.scheduler is not None:
+            self.scheduler.cancel(self._beat)
+            self._beat = None
+        if self.enabled and self._workers:
+            await self.bus.publish(LEAVE_TOPIC, {"url": self.self_url})
+            self._members = sorted(self._workers)
+            self._dirty = True
+            await self._rebalance()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def metrics(self) -> dict:
+        s = self._stats
+        return {
+            "enabled": self.enabled,
+            "self": self.self_url,
+            "workers": list(self._members),
+            "local_rooms": len(self.rooms),
+            "forwarded": s.forwarded,
+            "forward_failures": s.forward_failures,
+            "redirects": s.redirects,
+            "handoffs_out": s.handoffs_out,
+            "handoffs_in": s.handoffs_in,
+            "handoff_failures": s.handoff_failures,
+            "rebalances": s.rebalances,
+        }
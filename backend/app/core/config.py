@@ -12,6 +12,52 @@ class Settings(BaseModel):
     cors_origins: List[str] = []
     deepgram_api_key: str | None = None
     openrouter_api_key: str | None = None
+    openrouter_base_url: str = "https://openrouter.ai/api/v1"
+    # Stage-2 LLM client pool
+    llm_max_connections: int = 32
+    llm_max_keepalive: int = 16
+    llm_keepalive_expiry_s: float = 30.0
+    llm_max_concurrency: int = 24
+    # Pre-generated persona pool (empty path disables the snapshot)
+    persona_pool_path: str = "persona_pool.json"
+    persona_pool_capacity: int = 72
+    persona_pool_low_watermark: int = 36
+    # Admin (and internal) endpoints require it in X-Admin-Token; they return 403 while it is unset
+    admin_token: str | None = None
+    # reaction_debug stream: rate used when a subscriber does not ask for one, and the cap (0 disables)
+    reaction_debug_sample_rate: float = 1.0
+    reaction_debug_max_sample_rate: float = 1.0
+    # Transcript chunking: "fixed" (sentence end or max interval) or "adaptive"
+    # (paces chunks per room against a reactions-per-minute budget)
+    transcript_flush_policy: str = "fixed"
+    transcript_max_interval_s: float = 7.0
+    transcript_min_interval_s: float = 1.5
+    reaction_budget_rpm: float = 120.0
+    # Coalesce bot reactions per room into one `reactions` frame every N ms (0 sends each one)
+    reaction_frame_ms: int = 75
+    # Fan bus events out to other workers/nodes (redis://host:port; empty = this process only)
+    event_bus_url: str = ""
+    event_bus_prefix: str = "podium:"
+    # Per-topic handler pool size and queue bound
+    event_bus_workers: int = 8
+    event_bus_max_queue: int = 1000
+    # Run each room's transcript/join/leave/reaction/feedback handlers one at a time, in publish order
+    event_bus_ordered: bool = True
+    # Room affinity (needs EVENT_BUS_URL): this worker's URL as reachable by the other
+    # workers, and optionally as reachable by browsers (WebSocket redirects)
+    worker_url: str = ""
+    worker_public_url: str = ""
+    worker_heartbeat_s: float = 2.0
+    # Close rooms with no sockets and no activity for N seconds (0 disables); sweep period
+    room_idle_ttl_s: float = 1800.0
+    room_sweep_interval_s: float = 60.0
+    # Write-ahead session log directory (empty disables); rooms are replayed from it on startup
+    session_log_dir: str = ""
+    session_log_segment_mb: int = 64
+    session_log_fsync_ms: int = 50
+    session_log_retain_segments: int = 8
+    # Poll reaction_config.json for changes every N seconds (0 disables)
+    reaction_config_watch_s: float = 0.0
 
 
 @lru_cache
@@ -26,6 +72,37 @@ def get_settings() -> Settings:
         cors_origins=origins_list,
         deepgram_api_key=os.getenv("DEEPGRAM_API_KEY"),
         openrouter_api_key=os.getenv("OPENROUTER_API_KEY"),
+        openrouter_base_url=os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1"),
+        llm_max_connections=int(os.getenv("LLM_MAX_CONNECTIONS", "32")),
+        llm_max_keepalive=int(os.getenv("LLM_MAX_KEEPALIVE", "16")),
+        llm_keepalive_expiry_s=float(os.getenv("LLM_KEEPALIVE_EXPIRY_S", "30")),
+        llm_max_concurrency=int(os.getenv("LLM_MAX_CONCURRENCY", "24")),
+        persona_pool_path=os.getenv("PERSONA_POOL_PATH", "persona_pool.json"),
+        persona_pool_capacity=int(os.getenv("PERSONA_POOL_CAPACITY", "72")),
+        persona_pool_low_watermark=int(os.getenv("PERSONA_POOL_LOW_WATERMARK", "36")),
+        admin_token=os.getenv("ADMIN_TOKEN") or None,
+        reaction_debug_sample_rate=float(os.getenv("REACTION_DEBUG_SAMPLE_RATE", "1.0")),
+        reaction_debug_max_sample_rate=float(os.getenv("REACTION_DEBUG_MAX_SAMPLE_RATE", "1.0")),
+        transcript_flush_policy=os.getenv("TRANSCRIPT_FLUSH_POLICY", "fixed").strip().lower(),
+        transcript_max_interval_s=float(os.getenv("TRANSCRIPT_MAX_INTERVAL_S", "7.0")),
+        transcript_min_interval_s=float(os.getenv("TRANSCRIPT_MIN_INTERVAL_S", "1.5")),
+        reaction_budget_rpm=float(os.getenv("REACTION_BUDGET_RPM", "120")),
+        reaction_frame_ms=int(os.getenv("REACTION_FRAME_MS", "75")),
+        event_bus_url=os.getenv("EVENT_BUS_URL", "").strip(),
+        event_bus_prefix=os.getenv("EVENT_BUS_PREFIX", "podium:"),
+        event_bus_workers=int(os.getenv("EVENT_BUS_WORKERS", "8")),
+        event_bus_max_queue=int(os.getenv("EVENT_BUS_MAX_QUEUE", "1000")),
+        event_bus_ordered=os.getenv("EVENT_BUS_ORDERED", "true").strip().lower() not in ("0", "false", "no", "off"),
+        worker_url=os.getenv("WORKER_URL", "").strip(),
+        worker_public_url=os.getenv("WORKER_PUBLIC_URL", "").strip(),
+        worker_heartbeat_s=float(os.getenv("WORKER_HEARTBEAT_S", "2.0")),
+        room_idle_ttl_s=float(os.getenv("ROOM_IDLE_TTL_S", "1800")),
+        room_sweep_interval_s=float(os.getenv("ROOM_SWEEP_INTERVAL_S", "60")),
+        session_log_dir=os.getenv("SESSION_LOG_DIR", "").strip(),
+        session_log_segment_mb=int(os.getenv("SESSION_LOG_SEGMENT_MB", "64")),
+        session_log_fsync_ms=int(os.getenv("SESSION_LOG_FSYNC_MS", "50")),
+        session_log_retain_segments=int(os.getenv("SESSION_LOG_RETAIN_SEGMENTS", "8")),
+        reaction_config_watch_s=float(os.getenv("REACTION_CONFIG_WATCH_S", "0")),
     )
 
 
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+
+@dataclass(eq=False)
+class ScheduledCall:
+    when: float
+    key: Hashable
+    callback: Callable[..., Any]
+    args: Tuple[Any, ...] = ()
+    cancelled: bool = False
+
+
+@dataclass
+class _Stats:
+    scheduled: int = 0
+    fired: int = 0
+    cancelled: int = 0
+    errors: int = 0
+
+
+class DeliveryScheduler:
+    """One timer heap per process for delayed callbacks.
+
+    Instead of a sleeping task per delayed item, calls sit in a heap and a
+    single loop timer is armed for the earliest one. Each call carries a key
+    (e.g. ("reactions", room_id)) so everything pending for a room can be
+    dropped with one cancel_key().
+
+    Callbacks run on the event loop; if one returns a coroutine it is run as
+    a task (strong reference kept until it finishes).
+    """
+
+    def __init__(self) -> None:
+        self._heap: List[Tuple[float, int, ScheduledCall]] = []
+        self._by_key: Dict[Hashable, Set[ScheduledCall]] = {}
+        self._seq = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_when: Optional[float] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._stats = _Stats()
+
+    def call_later(self, delay_s: float, key: Hashable, callback: Callable[..., Any], *args: Any) -> ScheduledCall:
+        loop = asyncio.get_running_loop()
+        return self.call_at(loop.time() + max(0.0, delay_s), key, callback, *args)
+
+    def call_at(self, when: float, key: Hashable, callback: Callable[..., Any], *args: Any) -> ScheduledCall:
+        """Run callback(*args) at loop time `when`."""
+        call = ScheduledCall(when=when, key=key, callback=callback, args=args)
+        heapq.heappush(self._heap, (when, next(self._seq), call))
+        self._by_key.setdefault(key, set()).add(call)
+        self._stats.scheduled += 1
+        self._arm()
+        return call
+
+    def cancel(self, call: ScheduledCall) -> None:
+        if call.cancelled:
+            return
+        call.cancelled = True
+        self._stats.cancelled += 1
+        self._forget(call)
+        # Heap entry is skipped lazily when it comes due
+
+    def cancel_key(self, key: Hashable) -> int:
+        """Cancel every pending call for a key; returns how many were dropped."""
+        calls = self._by_key.pop(key, None)
+        if not calls:
+            return 0
+        for call in calls:
+            call.cancelled = True
+        self._stats.cancelled += len(calls)
+        self._compact()
+        return len(calls)
+
+    def pending(self, key: Optional[Hashable] = None) -> int:
+        if key is not None:
+            return len(self._by_key.get(key, ()))
+        return sum(len(calls) for calls in self._by_key.values())
+
+    def _forget(self, call: ScheduledCall) -> None:
+        calls = self._by_key.get(call.key)
+        if calls is not None:
+            calls.discard(call)
+            if not calls:
+                self._by_key.pop(call.key, None)
+
+    def _compact(self) -> None:
+        # Rebuild once cancelled entries dominate so the heap stays bounded
+        if len(self._heap) > 64 and len(self._heap) > 2 * self.pending():
+            self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+            heapq.heapify(self._heap)
+
+    def _arm(self) -> None:
+        while self._heap and self._heap[0][2].cancelled:
+            heapq.heappop(self._heap)
+        if not self._heap:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = self._timer_when = None
+            return
+        when = self._heap[0][0]
+        if self._timer is not None and self._timer_when is not None and self._timer_when <= when:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+        loop = asyncio.get_running_loop()
+        self._timer = loop.call_at(when, self._fire)
+        self._timer_when = when
+
+    def _fire(self) -> None:
+        self._timer = self._timer_when = None
+        loop = asyncio.get_running_loop()
+        # Loop timers may fire up to one clock tick early
+        now = loop.time() + 0.001
+        while self._heap and self._heap[0][0] <= now:
+            _, _, call = heapq.heappop(self._heap)
+            if call.cancelled:
+                continue
+            self._forget(call)
+            self._stats.fired += 1
+            try:
+                result = call.callback(*call.args)
+                if asyncio.iscoroutine(result):
+                    task = loop.create_task(result)
+                    self._tasks.add(task)
+                    task.add_done_callback(self._task_done)
+            except Exception as e:
+                self._stats.errors += 1
+                print(f"[scheduler] callback error key={call.key} err={e}")
+        if self._heap:
+            self._arm()
+
+    def _task_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self._stats.errors += 1
+            print(f"[scheduler] callback error err={task.exception()}")
+
+    async def close(self) -> None:
+        """Drop every pending call and wait for running callbacks (shutdown)."""
+        for key in list(self._by_key):
+            self.cancel_key(key)
+        self._heap.clear()
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = self._timer_when = None
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def metrics(self) -> dict:
+        return {
+            "pending": self.pending(),
+            "keys": len(self._by_key),
+            "heap_size": len(self._heap),
+            "scheduled": self._stats.scheduled,
+            "fired": self._stats.fired,
+            "cancelled": self._stats.cancelled,
+            "errors": self._stats.errors,
+            "running_callbacks": len(self._tasks),
+        }
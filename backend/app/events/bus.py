@@ -1,22 +1,39 @@
 from __future__ import annotations
 
-import asyncio
-from typing import Callable, Dict, Set, Any, Coroutine, Any as AnyType
+from typing import Callable, Dict, Optional, Set, Any, Coroutine, Any as AnyType
+
+from app.events.dispatcher import Dispatcher, TopicPolicy
+from app.events.transport import InMemoryTransport, Transport
 
 
 AsyncHandler = Callable[[Any], Coroutine[AnyType, AnyType, None]]
 
 
 class EventBus:
-    """Simple in-process pub/sub event bus for a single-process MVP.
+    """Async pub/sub event bus; in-process unless given a transport.
 
     - subscribe(topic, handler): register an async handler
     - unsubscribe(topic, handler): remove a handler
-    - publish(topic, payload): schedule all handlers for that topic
+    - publish(topic, payload): queue all local handlers for that topic,
+      then hand the event to the transport for the other workers
+    - configure(topic, policy): worker count, queue bound and overflow
+      policy for a topic's handlers (see app.events.dispatcher)
+
+    Events arriving from other workers run the same local handlers. The
+    default InMemoryTransport forwards nothing (single process).
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        transport: Optional[Transport] = None,
+        default_policy: Optional[TopicPolicy] = None,
+    ) -> None:
         self._topic_to_handlers: Dict[str, Set[AsyncHandler]] = {}
+        self.transport = transport or InMemoryTransport()
+        self.dispatcher = Dispatcher(default_policy)
+
+    def configure(self, topic: str, policy: TopicPolicy) -> None:
+        self.dispatcher.configure(topic, policy)
 
     def subscribe(self, topic: str, handler: AsyncHandler) -> None:
         handlers = self._topic_to_handlers.setdefault(topic, set())
@@ -30,11 +47,26 @@ class EventBus:
         if not handlers:
             self._topic_to_handlers.pop(topic, None)
 
+    async def start(self) -> None:
+        await self.transport.start(self._deliver)
+
+    async def close(self) -> None:
+        await self.transport.close()
+        await self.dispatcher.close()
+
     async def publish(self, topic: str, payload: Any) -> None:
+        await self._dispatch(topic, payload)
+        if topic in self.transport.topics:
+            await self.transport.publish(topic, payload)
+
+    async def _deliver(self, topic: str, payload: Any) -> None:
+        # Published by another worker: local handlers only, never re-forwarded
+        await self._dispatch(topic, payload)
+
+    async def _dispatch(self, topic: str, payload: Any) -> None:
         # Snapshot to avoid mutation during iteration
         for handler in list(self._topic_to_handlers.get(topic, set())):
-            # Fire and forget; add proper error logging if needed
-            coro = handler(payload)
-            asyncio.create_task(coro)
-
+            await self.dispatcher.submit(topic, handler, payload)
 
+    def metrics(self) -> dict:
+        return {**self.transport.metrics(), "lanes": self.dispatcher.lanes(), "topics": self.dispatcher.metrics()}
@@ -0,0 +1,334 @@
+"""Supervised, bounded execution of EventBus handlers."""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import traceback
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, List, Optional, Set, Tuple
+
+Handler = Callable[[Any], Awaitable[None]]
+
+# What publish() does when a topic's queue is full
+BLOCK = "block"  # wait for room (backpressure on the publisher)
+DROP_OLDEST = "drop_oldest"  # evict the oldest queued event
+COALESCE = "coalesce"  # replace a queued event with the same key; else drop oldest
+OVERFLOW_POLICIES = (BLOCK, DROP_OLDEST, COALESCE)
+
+# Handler latency buckets (upper bounds, ms)
+LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+@dataclass
+class TopicPolicy:
+    workers: int = 8
+    max_queue: int = 1000
+    overflow: str = BLOCK
+    # COALESCE: events with the same key (e.g. roomId) keep only the newest payload
+    coalesce_key: Optional[Callable[[Any], Hashable]] = None
+    # Events with the same non-None key run one at a time, in publish order,
+    # across every topic that sets an order_key (e.g. roomId)
+    order_key: Optional[Callable[[Any], Hashable]] = None
+
+
+class LatencyHistogram:
+    def __init__(self, bounds_ms: Tuple[float, ...] = LATENCY_BUCKETS_MS) -> None:
+        self.bounds_ms = bounds_ms
+        self.counts = [0] * (len(bounds_ms) + 1)
+        self.total = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds_ms, ms)] += 1
+        self.total += 1
+        self.sum_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile (max_ms past the last bound)."""
+        if not self.total:
+            return 0.0
+        rank = q * self.total
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return float(self.bounds_ms[i]) if i < len(self.bounds_ms) else self.max_ms
+        return self.max_ms
+
+    def snapshot(self) -> dict:
+        labels = [str(b) for b in self.bounds_ms] + ["+Inf"]
+        return {
+            "count": self.total,
+            "buckets": dict(zip(labels, self.counts)),
+            "mean": round(self.sum_ms / self.total, 3) if self.total else 0.0,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "max": round(self.max_ms, 3),
+        }
+
+
+@dataclass
+class _Job:
+    handler: Handler
+    payload: Any
+    key: Optional[Tuple[Handler, Hashable]] = None
+    lane: Optional[Hashable] = None
+    seq: int = 0
+
+
+@dataclass
+class _Lane:
+    """Publish-order sequence of the jobs sharing one order key."""
+
+    next_seq: int = 0  # handed to the next job submitted on this lane
+    next_run: int = 0  # the only seq allowed to start
+    parked: Dict[int, Tuple["_Topic", _Job]] = field(default_factory=dict)
+    skipped: Set[int] = field(default_factory=set)
+
+
+@dataclass
+class _TopicStats:
+    published: int = 0
+    handled: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    blocked: int = 0
+    errors: int = 0
+    last_error: Optional[str] = None
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+
+class _Topic:
+    def __init__(self, name: str, policy: TopicPolicy) -> None:
+        self.name = name
+        self.policy = policy
+        self.queue: Deque[_Job] = deque()
+        self.pending: Dict[Tuple[Handler, Hashable], _Job] = {}
+        self.ready = asyncio.Event()
+        self.space = asyncio.Event()
+        self.space.set()
+        self.workers: Set[asyncio.Task] = set()
+        self.busy = 0
+        # Popped but waiting for an earlier job on their lane; count toward max_queue
+        self.parked = 0
+        self.stats = _TopicStats()
+
+
+class Dispatcher:
+    """Runs handlers on per-topic worker pools fed by bounded queues.
+
+    Each topic gets up to `policy.workers` long-lived worker tasks (started
+    on demand, held in a set so none is garbage-collected mid-flight) and a
+    queue of at most `policy.max_queue` events; the overflow policy decides
+    whether a full queue blocks the publisher, drops the oldest event, or
+    coalesces by key. Handler exceptions are caught, counted and logged
+    with their traceback. Topics without an explicit policy use `default`.
+
+    Topics with an `order_key` share lanes: jobs with the same key get a
+    sequence number at submit and a worker that pops one whose predecessor
+    has not finished parks it on the lane, to be requeued at the front of
+    its topic when the predecessor completes (or is dropped). So a room's
+    bot:join handler finishes before its first bot:reaction starts, while
+    other rooms keep running in parallel. Parked jobs count against their
+    topic's max_queue; when a DROP_OLDEST topic is full of parked jobs the
+    incoming event is dropped instead.
+
+    A BLOCK topic whose handlers publish to the same topic can deadlock
+    once every worker waits for room; give such topics DROP_OLDEST.
+    """
+
+    def __init__(self, default: Optional[TopicPolicy] = None) -> None:
+        self.default = default or TopicPolicy()
+        self._policies: Dict[str, TopicPolicy] = {}
+        self._topics: Dict[str, _Topic] = {}
+        self._lanes: Dict[Hashable, _Lane] = {}
+        self._closed = False
+
+    def configure(self, topic: str, policy: TopicPolicy) -> None:
+        if policy.overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"unknown overflow policy {policy.overflow!r}")
+        self._policies[topic] = policy
+        state = self._topics.get(topic)
+        if state is not None:
+            state.policy = policy
+
+    def _topic(self, topic: str) -> _Topic:
+        state = self._topics.get(topic)
+        if state is None:
+            state = _Topic(topic, self._policies.get(topic, self.default))
+            self._topics[topic] = state
+        return state
+
+    async def submit(self, topic: str, handler: Handler, payload: Any) -> None:
+        if self._closed:
+            return
+        t = self._topic(topic)
+        policy = t.policy
+        stats = t.stats
+        stats.published += 1
+
+        key = None
+        if policy.overflow == COALESCE and policy.coalesce_key is not None:
+            try:
+                key = (handler, policy.coalesce_key(payload))
+            except Exception:
+                key = None
+        if key is not None:
+            queued = t.pending.get(key)
+            if queued is not None:
+                queued.payload = payload
+                stats.coalesced += 1
+                return
+
+        if len(t.queue) + t.parked >= policy.max_queue:
+            if policy.overflow == BLOCK:
+                stats.blocked += 1
+                while len(t.queue) + t.parked >= policy.max_queue and not self._closed:
+                    t.space.clear()
+                    await t.space.wait()
+            else:
+                while len(t.queue) + t.parked >= policy.max_queue:
+                    if not t.queue:
+                        stats.dropped += 1
+                        return
+                    dropped = t.queue.popleft()
+                    if dropped.key is not None:
+                        t.pending.pop(dropped.key, None)
+                    if dropped.lane is not None:
+                        self._skip(dropped)
+                    stats.dropped += 1
+
+        job = _Job(handler, payload, key)
+        if policy.order_key is not None:
+            try:
+                job.lane = policy.order_key(payload)
+            except Exception:
+                job.lane = None
+            if job.lane is not None:
+                lane = self._lanes.get(job.lane)
+                if lane is None:
+                    lane = self._lanes[job.lane] = _Lane()
+                job.seq = lane.next_seq
+                lane.next_seq += 1
+        t.queue.append(job)
+        if key is not None:
+            t.pending[key] = job
+        t.ready.set()
+        self._grow(t)
+
+    def _grow(self, t: _Topic) -> None:
+        # Grow the pool while queued events outnumber idle workers
+        if len(t.workers) < t.policy.workers and len(t.workers) - t.busy < len(t.queue):
+            task = asyncio.create_task(self._worker(t))
+            t.workers.add(task)
+            task.add_done_callback(t.workers.discard)
+
+    async def _worker(self, t: _Topic) -> None:
+        loop = asyncio.get_running_loop()
+        stats = t.stats
+        while True:
+            while not t.queue:
+                t.ready.clear()
+                await t.ready.wait()
+            job = t.queue.popleft()
+            if job.key is not None:
+                t.pending.pop(job.key, None)
+            if job.lane is not None:
+                lane = self._lanes.get(job.lane)
+                if lane is not None and job.seq != lane.next_run:
+                    lane.parked[job.seq] = (t, job)
+                    t.parked += 1
+                    continue
+            t.space.set()
+            t.busy += 1
+            started = loop.time()
+            try:
+                await job.handler(job.payload)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                stats.errors += 1
+                stats.last_error = f"{type(e).__name__}: {e}"
+                print(f"[bus] handler {getattr(job.handler, '__name__', job.handler)} failed topic={t.name}")
+                traceback.print_exc()
+            finally:
+                t.busy -= 1
+                stats.handled += 1
+                stats.latency.observe((loop.time() - started) * 1000)
+                if job.lane is not None:
+                    self._finish(job)
+
+    def _finish(self, job: _Job) -> None:
+        lane = self._lanes.get(job.lane)
+        if lane is not None:
+            lane.next_run += 1
+            self._advance(job.lane, lane)
+
+    def _skip(self, job: _Job) -> None:
+        lane = self._lanes.get(job.lane)
+        if lane is not None:
+            lane.skipped.add(job.seq)
+            self._advance(job.lane, lane)
+
+    def _advance(self, key: Hashable, lane: _Lane) -> None:
+        while lane.next_run in lane.skipped:
+            lane.skipped.discard(lane.next_run)
+            lane.next_run += 1
+        parked = lane.parked.pop(lane.next_run, None)
+        if parked is not None:
+            t, job = parked
+            t.parked -= 1
+            t.queue.appendleft(job)
+            t.ready.set()
+            self._grow(t)
+        elif lane.next_run == lane.next_seq:
+            # Nothing queued or running on this key any more
+            del self._lanes[key]
+
+    def depth(self, topic: str) -> int:
+        t = self._topics.get(topic)
+        return len(t.queue) + t.parked if t is not None else 0
+
+    def lanes(self) -> int:
+        """Order keys with events queued or running."""
+        return len(self._lanes)
+
+    async def close(self) -> None:
+        """Cancel every worker; events still queued are dropped."""
+        self._closed = True
+        workers: List[asyncio.Task] = []
+        for t in self._topics.values():
+            t.space.set()
+            workers.extend(t.workers)
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    def metrics(self) -> dict:
+        topics = {}
+        for name, t in self._topics.items():
+            s = t.stats
+            topics[name] = {
+                "overflow": t.policy.overflow,
+                "workers": len(t.workers),
+                "max_workers": t.policy.workers,
+                "busy": t.busy,
+                "queue_depth": len(t.queue),
+                "parked": t.parked,
+                "ordered": t.policy.order_key is not None,
+                "max_queue": t.policy.max_queue,
+                "published": s.published,
+                "handled": s.handled,
+                "dropped": s.dropped,
+                "coalesced": s.coalesced,
+                "blocked": s.blocked,
+                "errors": s.errors,
+                "last_error": s.last_error,
+                "latency_ms": s.latency.snapshot(),
+            }
+        return topics
@@ -0,0 +1,317 @@
+"""Cross-process transports for the EventBus.
+
+The bus always runs its own handlers in-process; a transport only carries
+published events to the other workers and hands back the events they
+published. InMemoryTransport (the default) carries nothing, which keeps the
+single-process behaviour. RedisTransport speaks plain RESP over asyncio
+streams to Redis, or anything that implements PUBLISH/SUBSCRIBE (see
+benchmarks/pubsub_server.py for a local stand-in), without a client library.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterable, Optional
+from urllib.parse import unquote, urlparse
+
+from app.ws.encoding import encode_json
+
+# Deliver a remote event to local handlers: deliver(topic, payload)
+Deliver = Callable[[str, Any], Awaitable[None]]
+
+# Events every worker must see: each one broadcasts to the sockets it holds,
+# and only the worker holding a room's bots reacts to its transcript chunks.
+# worker:* carry room-affinity membership (app.core.affinity).
+DISTRIBUTED_TOPICS = frozenset({
+    "transcript:chunk",
+    "bot:reaction",
+    "bot:join",
+    "bot:leave",
+    "coach:feedback",
+    "worker:heartbeat",
+    "worker:leave",
+})
+
+
+class Transport:
+    """Carries published events between processes."""
+
+    name = "base"
+    topics: frozenset = frozenset()
+
+    async def start(self, deliver: Deliver) -> None:
+        pass
+
+    async def publish(self, topic: str, payload: Any) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    def metrics(self) -> dict:
+        return {"transport": self.name}
+
+
+class InMemoryTransport(Transport):
+    """Single process: handlers already ran locally, nothing to forward."""
+
+    name = "memory"
+
+
+@dataclass
+class _Stats:
+    published: int = 0
+    received: int = 0
+    publish_errors: int = 0
+    # Publishes skipped without trying while the publisher waits out a reconnect backoff
+    dropped_disconnected: int = 0
+    decode_errors: int = 0
+    reconnects: int = 0
+
+
+def _command(*parts: Any) -> bytes:
+    out = [b"*%d\r\n" % len(parts)]
+    for part in parts:
+        data = part if isinstance(part, bytes) else str(part).encode("utf-8")
+        out.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(out)
+
+
+async def _read_reply(reader: asyncio.StreamReader) -> Any:
+    line = await reader.readline()
+    if not line:
+        raise ConnectionError("connection closed")
+    kind, rest = line[:1], line[1:-2]
+    if kind == b"+":
+        return rest.decode()
+    if kind == b"-":
+        raise RuntimeError(rest.decode())
+    if kind == b":":
+        return int(rest)
+    if kind == b"$":
+        size = int(rest)
+        if size < 0:
+            return None
+        data = await reader.readexactly(size + 2)
+        return data[:-2]
+    if kind in (b"*", b">"):
+        size = int(rest)
+        if size < 0:
+            return None
+        return [await _read_reply(reader) for _ in range(size)]
+    raise RuntimeError(f"unexpected reply {line!r}")
+
+
+class RedisTransport(Transport):
+    """PUBLISH/SUBSCRIBE over RESP, one channel per topic (`prefix + topic`).
+
+    Two connections: publishes are written without waiting for their reply
+    (a reader task drains them), and a subscriber connection that is
+    re-established with backoff if it drops. Events carry the publishing
+    node's id so a worker ignores its own events on the way back. A publish
+    that fails while disconnected is counted and dropped, never raised to
+    the caller: cross-worker delivery is best-effort, like the sockets it
+    feeds. Publishes run inline in EventBus.publish, so connecting and
+    writing are bounded by `connect_timeout_s`; after a failed connect the
+    publisher backs off (up to `reconnect_max_s`) and publishes in between
+    are dropped at once instead of each waiting on a dead host.
+    """
+
+    name = "redis"
+
+    def __init__(
+        self,
+        url: str,
+        prefix: str = "podium:",
+        topics: Iterable[str] = DISTRIBUTED_TOPICS,
+        reconnect_max_s: float = 5.0,
+        connect_timeout_s: float = 1.0,
+    ) -> None:
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "127.0.0.1"
+        self.port = parsed.port or 6379
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.username = unquote(parsed.username) if parsed.username else None
+        self.prefix = prefix
+        self.topics = frozenset(topics)
+        self.reconnect_max_s = reconnect_max_s
+        self.connect_timeout_s = connect_timeout_s
+        self.node_id = uuid.uuid4().hex
+        self._deliver: Optional[Deliver] = None
+        self._pub_writer: Optional[asyncio.StreamWriter] = None
+        self._pub_lock = asyncio.Lock()
+        self._pub_retry_at = 0.0
+        self._pub_backoff = 0.1
+        self._tasks: set[asyncio.Task] = set()
+        self._subscribed = asyncio.Event()
+        self._closing = False
+        self._stats = _Stats()
+
+    async def _open(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        # A blackholed host must not hold a publisher for the OS connect timeout
+        return await asyncio.wait_for(self._handshake(), timeout=self.connect_timeout_s)
+
+    async def _handshake(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            if self.password is not None:
+                args = ("AUTH", self.username, self.password) if self.username else ("AUTH", self.password)
+                writer.write(_command(*args))
+                await _read_reply(reader)
+        except BaseException:
+            # Includes the cancellation from _open's timeout: do not leak the socket
+            writer.close()
+            raise
+        return reader, writer
+
+    def _spawn(self, coro: Awaitable[None]) -> None:
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def start(self, deliver: Deliver) -> None:
+        self._deliver = deliver
+        self._spawn(self._subscribe_loop())
+        try:
+            await self._connect_publisher()
+        except (OSError, asyncio.TimeoutError) as e:
+            print(f"[bus] redis publisher unavailable ({e!r}); will retry on publish")
+        # Do not report ready before this worker can receive what others publish
+        try:
+            await asyncio.wait_for(self._subscribed.wait(), timeout=self.reconnect_max_s)
+        except asyncio.TimeoutError:
+            print("[bus] redis subscriber not connected yet; retrying in the background")
+
+    async def _connect_publisher(self) -> None:
+        reader, writer = await self._open()
+        self._pub_writer = writer
+        self._spawn(self._drain_replies(reader, writer))
+
+    async def _drain_replies(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    await _read_reply(reader)
+                except RuntimeError as e:
+                    self._stats.publish_errors += 1
+                    print(f"[bus] redis publish rejected: {e}")
+        except (ConnectionError, OSError, asyncio.IncompleteReadError):
+            if self._pub_writer is writer:
+                self._pub_writer = None
+            writer.close()
+
+    async def publish(self, topic: str, payload: Any) -> None:
+        if topic not in self.topics:
+            return
+        data = encode_json({"o": self.node_id, "t": topic, "p": payload}).encode("utf-8")
+        if self._pub_writer is None and time.monotonic() < self._pub_retry_at:
+            self._stats.dropped_disconnected += 1
+            return
+        try:
+            async with self._pub_lock:
+                if self._pub_writer is None:
+                    if self._closing:
+                        return
+                    if time.monotonic() < self._pub_retry_at:
+                        self._stats.dropped_disconnected += 1
+                        return
+                    try:
+                        await self._connect_publisher()
+                    except (OSError, asyncio.TimeoutError):
+                        self._pub_retry_at = time.monotonic() + self._pub_backoff
+                        self._pub_backoff = min(self._pub_backoff * 2, self.reconnect_max_s)
+                        raise
+                    self._pub_backoff = 0.1
+                    self._stats.reconnects += 1
+                writer = self._pub_writer
+                assert writer is not None
+                writer.write(_command("PUBLISH", self.prefix + topic, data))
+                # A peer that stopped reading must not stall the publisher either
+                await asyncio.wait_for(writer.drain(), timeout=self.connect_timeout_s)
+            self._stats.published += 1
+        except (OSError, ConnectionError, asyncio.TimeoutError) as e:
+            self._stats.publish_errors += 1
+            if self._pub_writer is not None:
+                self._pub_writer.close()
+            self._pub_writer = None
+            print(f"[bus] redis publish failed topic={topic}: {e!r}")
+
+    async def _subscribe_loop(self) -> None:
+        delay = 0.1
+        while not self._closing:
+            writer = None
+            try:
+                reader, writer = await self._open()
+                channels = [self.prefix + t for t in sorted(self.topics)]
+                writer.write(_command("SUBSCRIBE", *channels))
+                await writer.drain()
+                for _ in channels:
+                    await _read_reply(reader)
+                self._subscribed.set()
+                delay = 0.1
+                while True:
+                    message = await _read_reply(reader)
+                    if isinstance(message, list) and len(message) == 3 and message[0] == b"message":
+                        await self._on_message(message[2])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._subscribed.clear()
+                if self._closing:
+                    break
+                print(f"[bus] redis subscriber disconnected ({e}); retrying in {delay:.1f}s")
+                self._stats.reconnects += 1
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.reconnect_max_s)
+            finally:
+                if writer is not None:
+                    writer.close()
+
+    async def _on_message(self, data: bytes) -> None:
+        try:
+            envelope = json.loads(data)
+            origin, topic, payload = envelope["o"], envelope["t"], envelope["p"]
+        except (ValueError, KeyError, TypeError):
+            self._stats.decode_errors += 1
+            return
+        if origin == self.node_id or self._deliver is None:
+            return
+        self._stats.received += 1
+        await self._deliver(topic, payload)
+
+    async def close(self) -> None:
+        self._closing = True
+        if self._pub_writer is not None:
+            self._pub_writer.close()
+            self._pub_writer = None
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def metrics(self) -> dict:
+        s = self._stats
+        return {
+            "transport": self.name,
+            "node": self.node_id[:8],
+            "subscribed": self._subscribed.is_set(),
+            "published": s.published,
+            "received": s.received,
+            "publish_errors": s.publish_errors,
+            "dropped_disconnected": s.dropped_disconnected,
+            "decode_errors": s.decode_errors,
+            "reconnects": s.reconnects,
+        }
+
+
+def make_transport(url: str, prefix: str = "podium:") -> Transport:
+    """Build a transport from EVENT_BUS_URL; empty means in-process only."""
+    if not url:
+        return InMemoryTransport()
+    scheme = urlparse(url).scheme
+    if scheme == "redis":
+        return RedisTransport(url, prefix=prefix)
+    raise ValueError(f"unsupported EVENT_BUS_URL scheme: {scheme!r}")
@@ -1,4 +1,4 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 import asyncio
 import random
@@ -9,20 +9,33 @@ from app.api.rooms import router as rooms_router
 from app.api.broadcast import router as broadcast_router
 from app.api.events import router as events_router
 from app.ws.manager import ConnectionManager
+from app.ws.frames import ReactionFrameScheduler
 from app.ws.routes import router as ws_router
 from app.events.bus import EventBus
+from app.events.dispatcher import COALESCE, DROP_OLDEST, TopicPolicy
+from app.events.transport import make_transport
 from app.api.webhooks import router as webhooks_router
 from app.services.transcript_buffer import TranscriptBuffer
-from app.services.bot import Bot
+from app.services.flush_policy import make_flush_policy
+from app.services.bot import Bot, generateBatchReactions, close_client as close_llm_client
+from app.services.bot_spawner import PersonaWarehouse
+from app.api.metrics import router as metrics_router
+from app.api.admin import router as admin_router
+from app.api.internal import router as internal_router
 from app.state.room_manager import RoomManager
+from app.state.reaction_generations import ReactionGenerations
+from app.state.room_lifecycle import RoomLifecycle
+from app.state.session_log import SessionLog
 from app.core import registry
+from app.core.affinity import RoomAffinity, room_id_from_path
+from app.core.scheduler import DeliveryScheduler
 from typing import Optional
 from app.services.reaction_config import (
-    STAGE1_DELAY_MIN_S,
-    STAGE1_DELAY_MAX_S,
-    STAGE2_TIMEOUT_S,
+    ReactionConfigWatcher,
+    get_reaction_data,
     choose_emoji_phrase,
-    score_text,
+    score_chunk,
+    apply_domain_bias,
     map_score_to_bucket,
     get_phrases,
     adjust_bucket_for_meta,
@@ -32,6 +45,8 @@ from app.services.reaction_config import (
     should_suppress_fire,
     should_escalate,
     compute_reaction_probability,
+    warm_keyword_matchers,
+    get_category_names,
 )
 
 app = FastAPI(title="Podium Backend", version="0.1.0")
@@ -39,9 +54,95 @@ app = FastAPI(title="Podium Backend", version="0.1.0")
 settings = get_settings()
 app.state.settings = settings
 app.state.ws_manager = ConnectionManager()
-app.state.event_bus = EventBus()
-app.state.transcript_buffer = TranscriptBuffer(max_interval_s=7.0, flush_on_interval=True)
+# One timer heap for all delayed deliveries in this process
+app.state.delivery_scheduler = DeliveryScheduler()
+app.state.reaction_frames = ReactionFrameScheduler(
+    app.state.ws_manager,
+    window_s=settings.reaction_frame_ms / 1000,
+    scheduler=app.state.delivery_scheduler,
+)
+# Room events share one ordered lane per roomId: handled in publish order, rooms in parallel
+_room_order_key = (lambda p: p.get("roomId")) if settings.event_bus_ordered else None
+# Other workers see the same events when EVENT_BUS_URL is set
+app.state.event_bus = EventBus(
+    make_transport(settings.event_bus_url, settings.event_bus_prefix),
+    # Transcript chunks, joins/leaves and feedback must not be lost: publishers wait for room
+    default_policy=TopicPolicy(workers=settings.event_bus_workers, max_queue=settings.event_bus_max_queue),
+)
+for _topic in ("transcript:chunk", "bot:join", "bot:leave", "coach:feedback"):
+    app.state.event_bus.configure(
+        _topic,
+        TopicPolicy(
+            workers=settings.event_bus_workers,
+            max_queue=settings.event_bus_max_queue,
+            order_key=_room_order_key,
+        ),
+    )
+# Under a burst, the oldest queued reactions are the stalest; shed those first
+app.state.event_bus.configure(
+    "bot:reaction",
+    TopicPolicy(
+        workers=settings.event_bus_workers,
+        max_queue=settings.event_bus_max_queue,
+        overflow=DROP_OLDEST,
+        order_key=_room_order_key,
+    ),
+)
+# Only a worker's latest heartbeat matters
+app.state.event_bus.configure(
+    "worker:heartbeat",
+    TopicPolicy(workers=1, max_queue=64, overflow=COALESCE, coalesce_key=lambda p: p.get("url")),
+)
+app.state.transcript_buffer = TranscriptBuffer(
+    max_interval_s=settings.transcript_max_interval_s,
+    flush_on_interval=True,
+    policy=make_flush_policy(
+        settings.transcript_flush_policy,
+        max_interval_s=settings.transcript_max_interval_s,
+        reactions_per_minute=settings.reaction_budget_rpm,
+        min_interval_s=settings.transcript_min_interval_s,
+    ),
+    # Idle flushes (speaker paused mid-sentence) run off the shared timer heap
+    scheduler=app.state.delivery_scheduler,
+    bus=app.state.event_bus,
+)
 app.state.room_manager = RoomManager()
+# Journals room writes to disk (when SESSION_LOG_DIR is set) and rebuilds rooms on startup
+app.state.session_log = SessionLog(
+    settings.session_log_dir,
+    app.state.room_manager,
+    segment_bytes=settings.session_log_segment_mb * 1024 * 1024,
+    fsync_interval_s=settings.session_log_fsync_ms / 1000,
+    retain_segments=settings.session_log_retain_segments,
+)
+app.state.reaction_generations = ReactionGenerations()
+# Open/close and idle eviction across all of the per-room stores above
+app.state.room_lifecycle = RoomLifecycle(
+    app.state.room_manager,
+    app.state.ws_manager,
+    app.state.transcript_buffer,
+    app.state.reaction_generations,
+    app.state.reaction_frames,
+    idle_ttl_s=settings.room_idle_ttl_s,
+    sweep_interval_s=settings.room_sweep_interval_s,
+    scheduler=app.state.delivery_scheduler,
+)
+# Which worker owns each room when several share the bus
+app.state.room_affinity = RoomAffinity(
+    settings.worker_url,
+    app.state.event_bus,
+    app.state.room_manager,
+    app.state.room_lifecycle,
+    public_url=settings.worker_public_url,
+    heartbeat_s=settings.worker_heartbeat_s,
+    admin_token=settings.admin_token,
+    scheduler=app.state.delivery_scheduler,
+)
+app.state.persona_warehouse = PersonaWarehouse(
+    capacity=settings.persona_pool_capacity,
+    low_watermark=settings.persona_pool_low_watermark,
+    snapshot_path=settings.persona_pool_path or None,
+)
 registry.bind(app)
 
 if settings.cors_origins:
@@ -53,6 +154,74 @@ if settings.cors_origins:
         allow_headers=["*"],
     )
 
+@app.on_event("startup")
+async def _warm_reaction_data() -> None:
+    # Load reaction data and compile keyword automata before the first chunk
+    warm_keyword_matchers()
+    if settings.reaction_config_watch_s > 0:
+        app.state.reaction_config_watcher = ReactionConfigWatcher(interval_s=settings.reaction_config_watch_s)
+        app.state.reaction_config_watcher.start()
+
+@app.on_event("startup")
+async def _start_persona_warehouse() -> None:
+    warehouse: PersonaWarehouse = app.state.persona_warehouse
+    warehouse.load_snapshot()
+    warehouse.prime(["Public Speaking", *get_category_names()])
+
+@app.on_event("startup")
+async def _replay_session_log() -> None:
+    session_log: SessionLog = app.state.session_log
+    await session_log.replay()
+    for room_id in app.state.room_manager.room_ids():
+        # Restored rooms start their idle clock now
+        app.state.room_lifecycle.touch(room_id)
+    await session_log.start()
+
+@app.on_event("startup")
+async def _start_event_bus() -> None:
+    await app.state.event_bus.start()
+    await app.state.room_affinity.start()
+
+@app.on_event("startup")
+async def _start_room_sweep() -> None:
+    app.state.room_lifecycle.start()
+
+@app.on_event("shutdown")
+async def _close_llm_client() -> None:
+    watcher = getattr(app.state, "reaction_config_watcher", None)
+    if watcher is not None:
+        await watcher.stop()
+    app.state.room_lifecycle.stop()
+    # Hand rooms held here to their next owners while the bus is still up
+    await app.state.room_affinity.stop()
+    await app.state.event_bus.close()
+    await app.state.reaction_generations.close()
+    await app.state.session_log.close()
+    await app.state.reaction_frames.close()
+    await app.state.delivery_scheduler.close()
+    await app.state.ws_manager.close()
+    await app.state.persona_warehouse.close()
+    await close_llm_client()
+
+@app.middleware("http")
+async def _route_to_room_owner(request: Request, call_next):
+    # /rooms/{roomId}/... is served by the room's owner; requests another worker forwarded
+    # (signed with the worker token) are never re-forwarded. A bare forwarded header is ignored.
+    affinity: RoomAffinity = app.state.room_affinity
+    room_id = room_id_from_path(request.url.path) if affinity.enabled else None
+    if room_id is None or affinity.is_forwarded(request.headers) or affinity.is_local(room_id):
+        return await call_next(request)
+    path = request.url.path + (f"?{request.url.query}" if request.url.query else "")
+    headers = {k: v for k, v in request.headers.items() if k == "content-type"}
+    response = await affinity.forward(room_id, request.method, path, await request.body(), headers)
+    if response is None:
+        return Response(status_code=503, content=b'{"detail":"room owner unavailable"}', media_type="application/json")
+    return Response(
+        status_code=response.status_code,
+        content=response.content,
+        media_type=response.headers.get("content-type"),
+    )
+
 @app.get("/health")
 async def health() -> dict[str, str]:
     return {"status": "ok"}
@@ -62,21 +231,26 @@ app.include_router(broadcast_router)
 app.include_router(events_router)
 app.include_router(webhooks_router)
 app.include_router(ws_router)
+app.include_router(metrics_router)
+app.include_router(admin_router)
+# Worker-to-worker handoffs exist only when affinity is on (which requires ADMIN_TOKEN)
+if app.state.room_affinity.enabled:
+    app.include_router(internal_router)
 
 async def _on_bot_reaction(payload: dict) -> None:
     room_id = payload.get("roomId")
     if not room_id:
         return
-    print(f"[ws] broadcasting reaction room={room_id} bot={payload.get('botId')}")
-    await app.state.ws_manager.broadcast_json(
-        room_id,
-        {"event": "reaction", "payload": payload},
-    )
+    print(f"[ws] queueing reaction room={room_id} bot={payload.get('botId')}")
+    # Reactions from one chunk land within a few hundred ms; send them as frames
+    await app.state.reaction_frames.add(room_id, payload)
 
 app.state.event_bus.subscribe("bot:reaction", _on_bot_reaction)
 
 async def _on_transcript_chunk(payload: dict) -> None:
     room_id = payload.get("roomId")
+    if not room_id:
+        return
     text_chunk = payload.get("text", "")
     flush_meta = payload.get("flush_meta") or {}
 
@@ -85,31 +259,45 @@ async def _on_transcript_chunk(payload: dict) -> None:
     await app.state.ws_manager.broadcast_json(
         room_id, {"event": "transcript", "payload": payload}
     )
+    if not app.state.room_manager.has_room(room_id):
+        # Another worker holds this room's bots (multi-worker bus); it reacts
+        return
 
     bots_in_room = app.state.room_manager.get_service_bots_in_room(room_id)
 
+    # Pin one reaction-config snapshot for the whole chunk; hot reloads only
+    # take effect from the next chunk.
+    rdata = get_reaction_data()
+    tuning = rdata.tuning
+    stage2_timeout_s = tuning["STAGE2_TIMEOUT_S"]
+
+    # Keyword scoring depends only on the chunk and room category, so do it
+    # once here; bots only add their domain bias on top.
+    cat: Optional[str] = app.state.room_manager.get_category(room_id)
+    chunk_score = score_chunk(
+        text_chunk, cat, bool(flush_meta.get("question")), bool(flush_meta.get("exclaim")), data=rdata
+    )
+
     async def stage1_react(bot: Bot, text: str, fm: dict) -> dict:
         """Generate a quick, local reaction (Stage-1) without model calls.
         Uses scoring, bucket mapping, and lightweight adjustments for delivery cues.
         """
         is_question = bool(fm.get("question"))
-        is_exclaim = bool(fm.get("exclaim"))
         stutters = int(fm.get("stutter_count") or 0)
         rhet = bool(fm.get("rhetorical_pause"))
 
-        cat: Optional[str] = app.state.room_manager.get_category(room_id)
         stance = getattr(bot.personality, "stance", "supportive")
         domain = getattr(bot.personality, "domain", "tech")
 
-        # Score and map to coarse sentiment bucket
-        score = score_text(text, cat, stance, domain, is_question, is_exclaim)
+        # Per-persona score from the shared chunk score, then coarse sentiment bucket
+        score = apply_domain_bias(chunk_score, cat, domain, data=rdata)
         bucket = map_score_to_bucket(score, is_question)
 
         # Adjust bucket for stance and delivery cues
         bucket = adjust_bucket_for_meta(bucket, stance, stutters, rhet)
 
         # Choose emoji and phrase for bucket
-        emoji, phrase, delta = choose_emoji_phrase(bucket, stance, domain, stutters, rhet)
+        emoji, phrase, delta = choose_emoji_phrase(bucket, stance, domain, stutters, rhet, data=rdata)
 
         # Prefer random phrase selection avoiding recent repeats
         phrase = select_phrase_for_bucket(
@@ -118,6 +306,7 @@ async def _on_transcript_chunk(payload: dict) -> None:
             domain,
             len(getattr(bot.state, "recentEmojis", [])),
             getattr(bot.state, "recentPhrases", []),
+            data=rdata,
         ) or phrase
 
         # Apply recent-emoji LRU to reduce repetition and update state
@@ -130,34 +319,77 @@ async def _on_transcript_chunk(payload: dict) -> None:
         phrase, recent_phrases = apply_recent_phrase_lru(phrase, recent_phrases)
         bot.state.recentPhrases = recent_phrases  # type: ignore[attr-defined]
 
-        # timer for realistic reaction time
-        await asyncio.sleep(random.uniform(STAGE1_DELAY_MIN_S, STAGE1_DELAY_MAX_S))
-
+        # Realistic reaction time is applied at delivery (delayMs), not by sleeping here
         return {"emoji_unicode": emoji, "micro_phrase": phrase, "score_delta": delta}
 
+    generations: ReactionGenerations = app.state.reaction_generations
+    generation = generations.begin(room_id)
+
     async def generate_and_publish_reactions():
+        is_question = bool(flush_meta.get("question"))
+        # Include prior transcript tail to provide brief context
+        stage2_input = f"{tail_context}{text_chunk}"
+
+        # Decide each bot's path up front so escalating bots can share one Stage-2 call
+        plans: dict[str, str] = {}
+        for bot in bots_in_room:
+            stance = getattr(bot.personality, "stance", "supportive")
+            # suppression: use configured probability to ignore entirely
+            if random.random() < 0.45:
+                plans[bot.id] = "skip"
+                continue
+            # base: allowed only on questions for certain stances
+            escalate, escalate_allowed = should_escalate(is_question, stance, data=rdata)
+            if escalate and escalate_allowed:
+                plans[bot.id] = "stage2"
+            # running supression prob again to increase randomness
+            elif should_suppress_fire(data=rdata):
+                plans[bot.id] = "skip"
+            else:
+                plans[bot.id] = "stage1"
+
+        stage2_bots = [b for b in bots_in_room if plans.get(b.id) == "stage2"]
+        batch_task: Optional[asyncio.Task] = None
+        # Bots still waiting on the shared batch; it is cancelled once all are superseded
+        batch_waiters: set[str] = set()
+        if tuning["STAGE2_BATCH_ENABLED"] and len(stage2_bots) > 1:
+            batch_task = asyncio.create_task(asyncio.wait_for(
+                generateBatchReactions(stage2_bots, stage2_input), timeout=stage2_timeout_s
+            ))
+            batch_waiters = {b.id for b in stage2_bots}
+
         async def one_bot_react(bot):
+            delay_ms = 0
             try:
-
-                
                 start = asyncio.get_event_loop().time()
                 stance = getattr(bot.personality, "stance", "supportive")
-                is_question = bool(flush_meta.get("question"))
-                # suppression: use configured probability to ignore entirely
-                if random.random() < 0.45:
+                plan = plans.get(bot.id, "skip")
+                if plan == "skip":
                     reaction = None
                 else:
-                    # base: allowed only on questions for certain stances
-                    escalate, escalate_allowed = should_escalate(is_question, stance)
-
+                    escalate = plan == "stage2"
                     stage1_used = False
-                    if escalate and escalate_allowed:
+                    if escalate:
                         try:
-                            # Include prior transcript tail to provide brief context
-                            stage2_input = f"{tail_context}{text_chunk}"
-                            reaction = await asyncio.wait_for(
-                                bot.generateReaction(stage2_input), timeout=STAGE2_TIMEOUT_S
-                            )
+                            if batch_task is not None:
+                                # Shared batch; bots the model skipped fall back individually
+                                try:
+                                    batch = await asyncio.shield(batch_task)
+                                except asyncio.CancelledError:
+                                    batch_waiters.discard(bot.id)
+                                    if not batch_waiters and not batch_task.done():
+                                        batch_task.cancel()
+                                        generations.record_llm_call_avoided()
+                                    raise
+                                reaction = batch.get(bot.id)
+                            else:
+                                generations.set_awaiting_llm(room_id, bot.id, True)
+                                try:
+                                    reaction = await asyncio.wait_for(
+                                        bot.generateReaction(stage2_input), timeout=stage2_timeout_s
+                                    )
+                                finally:
+                                    generations.set_awaiting_llm(room_id, bot.id, False)
                             if reaction is None:
                                 reaction = await stage1_react(bot, text_chunk, flush_meta)
                                 stage1_used = True
@@ -165,12 +397,11 @@ async def _on_transcript_chunk(payload: dict) -> None:
                             reaction = await stage1_react(bot, text_chunk, flush_meta)
                             stage1_used = True
                     else:
-                        # running supression prob again to increase randomness
-                        if should_suppress_fire():
-                            reaction = None
-                        else:
-                            reaction = await stage1_react(bot, text_chunk, flush_meta)
-                            stage1_used = True
+                        reaction = await stage1_react(bot, text_chunk, flush_meta)
+                        stage1_used = True
+                    if stage1_used:
+                        # Stage-1 answers instantly; clients stagger it by this much
+                        delay_ms = int(random.uniform(tuning["STAGE1_DELAY_MIN_S"], tuning["STAGE1_DELAY_MAX_S"]) * 1000)
 
                 cooldown = getattr(bot.state, 'cooldownSeconds', 6.0)
                 prob = compute_reaction_probability(
@@ -213,23 +444,30 @@ async def _on_transcript_chunk(payload: dict) -> None:
                 if should_react:
                     bot.state.lastReactionTs = now  # type: ignore[attr-defined]
                     print(f"[bot] publishing reaction room={room_id} bot={bot.id}")
-                    # emit debug events about decision path
-                    await app.state.ws_manager.broadcast_json(
-                        room_id,
-                        {"event": "reaction_debug", "payload": {
-                            "roomId": room_id,
-                            "botId": bot.id,
-                            "decision": {
-                                "is_question": bool(flush_meta.get("question")),
-                                "escalated": bool('stage1_used' in locals() and not stage1_used),
-                                "timeout_s": STAGE2_TIMEOUT_S if ('escalate' in locals() and escalate) else 0,
-                            },
-                            "reaction": reaction,
-                        }}
+                    # emit debug events about decision path (only to sockets that subscribed)
+                    if app.state.ws_manager.has_subscribers(room_id, "reaction_debug"):
+                        await app.state.ws_manager.publish_sampled(
+                            room_id,
+                            "reaction_debug",
+                            {"event": "reaction_debug", "payload": {
+                                "roomId": room_id,
+                                "botId": bot.id,
+                                "decision": {
+                                    "is_question": bool(flush_meta.get("question")),
+                                    "escalated": bool('stage1_used' in locals() and not stage1_used),
+                                    "timeout_s": stage2_timeout_s if ('escalate' in locals() and escalate) else 0,
+                                },
+                                "reaction": reaction,
+                            }}
+                        )
+                    # Reaction load feeds the adaptive chunking policy
+                    app.state.transcript_buffer.record_reactions(room_id)
+                    app.state.session_log.append(
+                        {"type": "reaction", "roomId": room_id, "botId": bot.id, "reaction": reaction, "delayMs": delay_ms}
                     )
                     await app.state.event_bus.publish(
                         "bot:reaction",
-                        {"roomId": room_id, "botId": bot.id, "reaction": reaction},
+                        {"roomId": room_id, "botId": bot.id, "reaction": reaction, "delayMs": delay_ms},
                     )
                 else:
                     print(f"[bot] reaction suppressed room={room_id} bot={bot.id}")
@@ -239,17 +477,33 @@ async def _on_transcript_chunk(payload: dict) -> None:
         tasks = []
         for bot in bots_in_room:
             print(f"[bot] start reaction room={room_id} bot={bot.id}")
-            tasks.append(asyncio.create_task(one_bot_react(bot)))
+            task = asyncio.create_task(one_bot_react(bot))
+            if plans.get(bot.id, "skip") != "skip":
+                # This chunk supersedes the bot's pending reaction to an older one
+                generations.claim(room_id, bot.id, generation, task)
+            tasks.append(task)
 
         try:
             if tasks:
-                await asyncio.gather(*tasks)
+                # Superseded bots end up as CancelledError results
+                await asyncio.gather(*tasks, return_exceptions=True)
         finally:
+            if batch_task is not None:
+                if not batch_task.done():
+                    # Every bot that shared it finished or was superseded (possibly before
+                    # it started waiting); nobody reads the result
+                    batch_task.cancel()
+                    generations.record_llm_call_avoided()
+                elif not batch_task.cancelled():
+                    # A failed batch was already covered by stage-1 fallbacks
+                    batch_task.exception()
             # Append transcript AFTER reactions are published to avoid duplicating
-            # the current chunk when constructing Stage-2 context (tail + chunk)
+            # the current chunk when constructing Stage-2 context (tail + chunk);
+            # a room closed in the meantime stays closed
             app.state.room_manager.append_transcript(room_id, text_chunk)
 
-    asyncio.create_task(generate_and_publish_reactions())
+    # Runs past this handler (a newer chunk supersedes its bots); the bus only times the fan-out
+    generations.spawn(room_id, generate_and_publish_reactions())
 
 app.state.event_bus.subscribe("transcript:chunk", _on_transcript_chunk)
 
@@ -1,14 +1,21 @@
 import os
 import json
 import uuid
-from typing import List, Tuple, Literal
+import asyncio
+from typing import Dict, List, Tuple, Literal
+import httpx
 from pydantic import BaseModel, Field
-from openai import OpenAI, APIError
+from openai import AsyncOpenAI, APIError
 from openai.types.chat import ChatCompletionMessageParam
 
+from app.core.config import get_settings
+
 # OpenRouter configuration (inline constants per user request)
 OPENROUTER_API_KEY = "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"
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+STAGE2_MODEL = "mistralai/ministral-8b"
+# Per-request HTTP timeout; callers also wrap generateReaction in STAGE2_TIMEOUT_S
+STAGE2_HTTP_TIMEOUT_S = 10.0
 
 class BotPersona(BaseModel):
     name: str
@@ -38,20 +45,76 @@ React to the speech with a JSON object containing:
 
 Example: {{"emoji_unicode": "🙂", "micro_phrase": "Interesting", "score_delta": 1}}"""
 
-# Reuse one async OpenAI client per process to reduce connection/setup overhead
-_shared_client: OpenAI | None = None
+def create_batch_system_prompt(bots) -> str:
+    lines = "\n".join(
+        f"- {key}: stance={bot.personality.stance}, domain={bot.personality.domain}, "
+        f"snark={bot.personality.snark:.1f}, politeness={bot.personality.politeness:.1f}"
+        for key, bot in bots
+    )
+    return f"""You are simulating several audience members reacting to the same speech.
+
+Audience members:
+{lines}
+
+Reply with a JSON object {{"reactions": [...]}} containing one entry per audience member:
+- "id": the member id from the list above
+- "emoji_unicode": an emoji glyph (like "🙂")
+- "micro_phrase": short phrase (max 3 words) in that member's voice
+- "score_delta": number from -5 to +5
+
+Example: {{"reactions": [{{"id": "b1", "emoji_unicode": "🙂", "micro_phrase": "Interesting", "score_delta": 1}}]}}"""
+
 
+def _valid_reaction(item) -> bool:
+    return (
+        isinstance(item, dict)
+        and isinstance(item.get("emoji_unicode"), str)
+        and isinstance(item.get("micro_phrase"), str)
+        and isinstance(item.get("score_delta"), (int, float))
+    )
 
-def get_client() -> OpenAI:
+# One AsyncOpenAI client per process, backed by a pooled keep-alive httpx client.
+# Stage-2 calls await the network instead of blocking the event loop.
+_shared_client: AsyncOpenAI | None = None
+_llm_semaphore: asyncio.Semaphore | None = None
+
+
+def get_client() -> AsyncOpenAI:
     global _shared_client
     if _shared_client is None:
-        _shared_client = OpenAI(
-            base_url=OPENROUTER_BASE_URL,
+        settings = get_settings()
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.llm_max_connections,
+                max_keepalive_connections=settings.llm_max_keepalive,
+                keepalive_expiry=settings.llm_keepalive_expiry_s,
+            ),
+            timeout=httpx.Timeout(STAGE2_HTTP_TIMEOUT_S, connect=5.0),
+        )
+        _shared_client = AsyncOpenAI(
+            base_url=settings.openrouter_base_url or OPENROUTER_BASE_URL,
             api_key=OPENROUTER_API_KEY,
+            http_client=http_client,
         )
     return _shared_client
 
 
+def get_llm_semaphore() -> asyncio.Semaphore:
+    """Caps concurrent Stage-2 requests across all rooms in this process."""
+    global _llm_semaphore
+    if _llm_semaphore is None:
+        _llm_semaphore = asyncio.Semaphore(max(1, get_settings().llm_max_concurrency))
+    return _llm_semaphore
+
+
+async def close_client() -> None:
+    global _shared_client, _llm_semaphore
+    if _shared_client is not None:
+        await _shared_client.close()
+    _shared_client = None
+    _llm_semaphore = None
+
+
 class Bot(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     avatar: str = Field(default="🤖")
@@ -69,13 +132,14 @@ class Bot(BaseModel):
         ]
 
         try:
-            response = client.chat.completions.create(
-                model='mistralai/ministral-8b', # 'inception/mercury-coder' lowest throughoutput, # 'mistralai/ministral-8b' lowest latency, # 'x-ai/grok-code-fast-1',
-                messages=messages,
-                response_format={"type": "json_object"},
-                temperature=1,
-                max_tokens=60
-            )
+            async with get_llm_semaphore():
+                response = await client.chat.completions.create(
+                    model=STAGE2_MODEL, # 'inception/mercury-coder' lowest throughoutput, # 'mistralai/ministral-8b' lowest latency, # 'x-ai/grok-code-fast-1',
+                    messages=messages,
+                    response_format={"type": "json_object"},
+                    temperature=1,
+                    max_tokens=60
+                )
             
             content_string = response.choices[0].message.content
             if not content_string:
@@ -85,4 +149,57 @@ class Bot(BaseModel):
 
         except (APIError, KeyError, IndexError, json.JSONDecodeError) as e:
             print(f"[bot] Failed to get reaction for bot={self.id}: {e}")
-            return None
\ No newline at end of file
+            return None
+
+
+async def generateBatchReactions(bots: List["Bot"], transcript_chunk: str) -> Dict[str, dict]:
+    """Stage-2 for many bots with one chat completion.
+
+    Returns {bot_id: reaction} for every bot the model answered for with a
+    well-formed reaction. Bots missing from the result should fall back to
+    Stage-1 individually.
+    """
+    if not bots:
+        return {}
+    # Short ids keep the prompt and the reply small; map back afterwards
+    keyed = [(f"b{i + 1}", bot) for i, bot in enumerate(bots)]
+    key_to_id = {key: bot.id for key, bot in keyed}
+
+    messages: List[ChatCompletionMessageParam] = [
+        {"role": "system", "content": create_batch_system_prompt(keyed)},
+        {"role": "user", "content": transcript_chunk},
+    ]
+
+    try:
+        async with get_llm_semaphore():
+            response = await get_client().chat.completions.create(
+                model=STAGE2_MODEL,
+                messages=messages,
+                response_format={"type": "json_object"},
+                temperature=1,
+                max_tokens=20 + 40 * len(keyed),
+            )
+        content_string = response.choices[0].message.content
+        if not content_string:
+            return {}
+        data = json.loads(content_string)
+    except (APIError, KeyError, IndexError, json.JSONDecodeError) as e:
+        print(f"[bot] Failed to get batch reactions for {len(bots)} bots: {e}")
+        return {}
+
+    items = data.get("reactions") if isinstance(data, dict) else data
+    if not isinstance(items, list):
+        return {}
+    reactions: Dict[str, dict] = {}
+    for item in items:
+        if not _valid_reaction(item):
+            continue
+        bot_id = key_to_id.get(str(item.get("id")))
+        if bot_id is None or bot_id in reactions:
+            continue
+        reactions[bot_id] = {
+            "emoji_unicode": item["emoji_unicode"],
+            "micro_phrase": item["micro_phrase"],
+            "score_delta": item["score_delta"],
+        }
+    return reactions
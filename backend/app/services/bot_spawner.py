@@ -1,17 +1,31 @@
 import os
 import json
 import random
-from typing import List, Dict, Optional
+import asyncio
+from collections import deque
+from typing import Deque, List, Dict, Optional, Set
 from openai import AsyncOpenAI, APIError
 from openai.types.chat import ChatCompletionMessageParam
+from pydantic import ValidationError
 from .bot import Bot, BotPersona, BotState
 
+# Reuse one client (and its connection pool) for all persona requests
+_spawner_client: AsyncOpenAI | None = None
+
+
+def _get_client() -> AsyncOpenAI:
+    global _spawner_client
+    if _spawner_client is None:
+        _spawner_client = AsyncOpenAI()
+    return _spawner_client
+
+
 async def _call_openai_api(messages: List[ChatCompletionMessageParam], timeout: int = 30) -> Optional[str]:
     if not os.getenv('OPENAI_API_KEY'):
         print("❌ ERROR: OPENAI_API_KEY environment variable not set.")
         return None
         
-    client = AsyncOpenAI()
+    client = _get_client()
     try:
         response = await client.chat.completions.create(
             model="gpt-5-nano-2025-08-07",
@@ -34,6 +48,12 @@ AVATAR_EMOJIS = [
 ALLOWED_STANCES = ["supportive", "skeptical", "curious"]
 ALLOWED_DOMAINS = ["tech", "design", "finance"]
 
+FALLBACK_NAMES = [
+    "Engaged Student", "Curious Analyst", "Product Lead", "Startup Founder", "Design Intern",
+    "Data Scientist", "Angel Investor", "Staff Engineer", "UX Researcher", "Finance Manager",
+    "Tech Journalist", "Grad Student", "Marketing Lead", "Ops Engineer", "Skeptical CFO",
+]
+
 async def generatePersonaPool(topic: str = "Public Speaking") -> Dict:
     prompt = f"""
     Generate a single persona object for a presentation on "{topic}".
@@ -66,9 +86,13 @@ async def generatePersonaPool(topic: str = "Public Speaking") -> Dict:
 
     # Fallback if the API response is not valid
     print("⚠️ Using fallback persona data.")
-    # Fallback with random personality
+    return synthesizePersona(name="Engaged Student")
+
+
+def synthesizePersona(name: Optional[str] = None) -> Dict:
+    """Local persona with a random personality (no model call)."""
     return {
-        "name": "Engaged Student",
+        "name": name or random.choice(FALLBACK_NAMES),
         "stance": random.choice(ALLOWED_STANCES),
         "domain": random.choice(ALLOWED_DOMAINS),
         "snark": round(random.uniform(0.0, 1.0), 2),
@@ -76,6 +100,236 @@ async def generatePersonaPool(topic: str = "Public Speaking") -> Dict:
     }
 
 
+def _validate_persona(candidate) -> Optional[Dict]:
+    if not isinstance(candidate, dict):
+        return None
+    persona = dict(candidate)
+    # Randomize stance/domain to increase diversity (same as single generation)
+    persona["stance"] = random.choice(ALLOWED_STANCES)
+    persona["domain"] = random.choice(ALLOWED_DOMAINS)
+    try:
+        return BotPersona.model_validate(persona).model_dump()
+    except ValidationError:
+        return None
+
+
+async def generatePersonaBatch(count: int, topic: str = "Public Speaking", synthesize_missing: bool = True) -> List[Dict]:
+    """Generate `count` personas with a single structured request.
+
+    Every returned dict validates against BotPersona. If the model returns
+    fewer valid personas than requested (or fails outright), the missing
+    slots are filled with locally synthesized personas unless
+    `synthesize_missing` is False.
+    """
+    if count <= 0:
+        return []
+    prompt = f"""
+    Generate {count} distinct audience persona objects for a presentation on "{topic}".
+    Your response MUST be a single, valid JSON object of the form {{"personas": [...]}}.
+    Each persona MUST contain exactly the following keys:
+    - "name": string (unique across the list)
+    - "stance": string (must be one of "supportive", "skeptical", or "curious")
+    - "domain": string (must be one of "tech", "design", or "finance")
+    - "snark": float (a JSON number between 0.0 and 1.0)
+    - "politeness": float (a JSON number between 0.0 and 1.0)
+    Do not include any additional text before or after the JSON object.
+    """
+
+    messages: List[ChatCompletionMessageParam] = [
+        {"role": "user", "content": prompt}
+    ]
+
+    personas: List[Dict] = []
+    contentString = await _call_openai_api(messages)
+    if contentString:
+        try:
+            data = json.loads(contentString)
+            items = data.get("personas") if isinstance(data, dict) else data
+            if isinstance(items, list):
+                for item in items[:count]:
+                    persona = _validate_persona(item)
+                    if persona is not None:
+                        personas.append(persona)
+            else:
+                print("⚠️ The API response does not contain a persona list.")
+        except json.JSONDecodeError as e:
+            print(f"Failed to parse persona batch JSON: {e}")
+
+    missing = count - len(personas)
+    if missing > 0 and synthesize_missing:
+        print(f"⚠️ Synthesizing {missing}/{count} personas locally.")
+        personas.extend(synthesizePersona() for _ in range(missing))
+    return personas
+
+
+def _pool_key(topic: Optional[str]) -> str:
+    return (topic or "Public Speaking").strip().lower()
+
+
+class PersonaWarehouse:
+    """Pre-generated, validated persona dicts keyed by topic/category.
+
+    - acquire(topic, count): pop personas in O(1); only misses wait on the model
+    - pools below `low_watermark` are refilled in the background, up to `capacity`
+    - pools are snapshotted to `snapshot_path` (JSON) so they survive restarts
+    - only topics passed to prime() are pooled; any other (client-supplied)
+      topic is generated on demand, so free text cannot grow the pools or
+      trigger refills
+    """
+
+    def __init__(
+        self,
+        capacity: int = 72,
+        low_watermark: int = 36,
+        refill_batch: int = 18,
+        snapshot_path: Optional[str] = None,
+    ) -> None:
+        self.capacity = capacity
+        self.low_watermark = low_watermark
+        self.refill_batch = refill_batch
+        self.snapshot_path = snapshot_path
+        self._pools: Dict[str, Deque[Dict]] = {}
+        self._topics: Dict[str, str] = {}
+        self._pooled: Set[str] = set()
+        # Strong references so refill tasks are not garbage-collected mid-flight
+        self._refills: Dict[str, asyncio.Task] = {}
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "unpooled": 0,
+            "refills": 0,
+            "refill_failures": 0,
+            "refilled_personas": 0,
+        }
+
+    def load_snapshot(self) -> None:
+        if not self.snapshot_path or not os.path.exists(self.snapshot_path):
+            return
+        try:
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"[personas] could not load snapshot {self.snapshot_path}: {e}")
+            return
+        loaded = 0
+        for key, entry in (data.get("pools") or {}).items():
+            pool = self._pools.setdefault(key, deque())
+            self._topics.setdefault(key, entry.get("topic") or key)
+            for candidate in entry.get("personas") or []:
+                if len(pool) >= self.capacity:
+                    break
+                try:
+                    pool.append(BotPersona.model_validate(candidate).model_dump())
+                    loaded += 1
+                except ValidationError:
+                    continue
+        print(f"[personas] loaded {loaded} personas from snapshot")
+
+    def _snapshot_payload(self) -> Dict:
+        return {
+            "pools": {
+                key: {"topic": self._topics.get(key, key), "personas": list(pool)}
+                for key, pool in self._pools.items()
+            }
+        }
+
+    def _write_snapshot(self, payload: Dict) -> None:
+        assert self.snapshot_path
+        tmp_path = f"{self.snapshot_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, self.snapshot_path)
+
+    async def save_snapshot(self) -> None:
+        if not self.snapshot_path:
+            return
+        try:
+            await asyncio.to_thread(self._write_snapshot, self._snapshot_payload())
+        except OSError as e:
+            print(f"[personas] could not write snapshot {self.snapshot_path}: {e}")
+
+    def size(self, topic: Optional[str]) -> int:
+        pool = self._pools.get(_pool_key(topic))
+        return len(pool) if pool else 0
+
+    def prime(self, topics: List[str]) -> None:
+        """Pool exactly these topics (dropping other snapshot pools) and start filling them."""
+        self._pooled = {_pool_key(topic) for topic in topics}
+        for key in [key for key in self._pools if key not in self._pooled]:
+            del self._pools[key]
+            self._topics.pop(key, None)
+        for topic in topics:
+            self._maybe_refill(topic)
+
+    async def acquire(self, topic: Optional[str], count: int) -> List[Dict]:
+        key = _pool_key(topic)
+        if key not in self._pooled:
+            self._stats["unpooled"] += count
+            return await generatePersonaBatch(count, topic=topic or "Public Speaking")
+        self._topics.setdefault(key, topic or "Public Speaking")
+        pool = self._pools.setdefault(key, deque())
+        personas: List[Dict] = []
+        while pool and len(personas) < count:
+            personas.append(pool.popleft())
+        self._stats["hits"] += len(personas)
+        missing = count - len(personas)
+        self._maybe_refill(topic)
+        if missing > 0:
+            self._stats["misses"] += missing
+            personas.extend(await generatePersonaBatch(missing, topic=topic or "Public Speaking"))
+        return personas
+
+    def _maybe_refill(self, topic: Optional[str]) -> None:
+        key = _pool_key(topic)
+        if key not in self._pooled or len(self._pools.get(key) or ()) >= self.low_watermark:
+            return
+        task = self._refills.get(key)
+        if task is not None and not task.done():
+            return
+        self._topics.setdefault(key, topic or "Public Speaking")
+        self._refills[key] = asyncio.create_task(self._refill(key))
+
+    async def _refill(self, key: str) -> None:
+        topic = self._topics.get(key, key)
+        pool = self._pools.setdefault(key, deque())
+        added = 0
+        try:
+            while len(pool) < self.capacity:
+                want = min(self.refill_batch, self.capacity - len(pool))
+                # Only cache model output; synthetic personas are free to make on demand
+                batch = await generatePersonaBatch(want, topic=topic, synthesize_missing=False)
+                if not batch:
+                    self._stats["refill_failures"] += 1
+                    break
+                pool.extend(batch)
+                added += len(batch)
+            self._stats["refills"] += 1
+            self._stats["refilled_personas"] += added
+        except Exception as e:
+            self._stats["refill_failures"] += 1
+            print(f"[personas] refill failed topic={topic}: {e}")
+        finally:
+            self._refills.pop(key, None)
+        if added:
+            await self.save_snapshot()
+
+    async def close(self) -> None:
+        tasks = list(self._refills.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.save_snapshot()
+
+    def metrics(self) -> Dict:
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": (self._stats["hits"] / lookups) if lookups else None,
+            "refilling": sorted(k for k, t in self._refills.items() if not t.done()),
+            "pools": {key: len(pool) for key, pool in self._pools.items()},
+        }
+
+
 def createBotFromPool(persona_pool: dict) -> Optional[Bot]:
     if not persona_pool:
         return None
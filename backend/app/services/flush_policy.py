@@ -0,0 +1,231 @@
+"""When a room's transcript buffer becomes a chunk (and a reaction fan-out)."""
+
+from __future__ import annotations
+
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.services.transcript_buffer import BufferState
+
+SENTENCE_TERMINALS = ".!?"
+
+
+class FlushPolicy(ABC):
+    """Decides when TranscriptBuffer flushes a room's pending text.
+
+    should_flush() is asked on every append and when the idle timer fires;
+    idle_deadline() is when (monotonic seconds) to ask again if no new text
+    arrives, or None to wait for input. The remaining hooks let a policy
+    track speaking rate and reaction load per room.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def should_flush(self, room_id: str, state: "BufferState", now: float) -> bool:
+        ...
+
+    def idle_deadline(self, room_id: str, state: "BufferState") -> Optional[float]:
+        return None
+
+    def on_append(self, room_id: str, words: int, now: float) -> None:
+        pass
+
+    def on_flush(self, room_id: str, now: float) -> None:
+        pass
+
+    def record_reactions(self, room_id: str, count: int, now: float) -> None:
+        pass
+
+    def forget(self, room_id: str) -> None:
+        pass
+
+    def metrics(self) -> dict:
+        return {"policy": self.name}
+
+
+def _ends_sentence(state: "BufferState") -> bool:
+    return bool(state.last_char) and state.last_char in SENTENCE_TERMINALS
+
+
+class FixedFlushPolicy(FlushPolicy):
+    """Flush on a sentence terminator (. ! ?) or after max_interval_s."""
+
+    name = "fixed"
+
+    def __init__(self, max_interval_s: float = 2.0, flush_on_interval: bool = True) -> None:
+        self.max_interval_s = max_interval_s
+        self.flush_on_interval = flush_on_interval
+
+    def should_flush(self, room_id: str, state: "BufferState", now: float) -> bool:
+        if _ends_sentence(state):
+            return True
+        return self.flush_on_interval and (now - state.last_flush_s >= self.max_interval_s)
+
+    def idle_deadline(self, room_id: str, state: "BufferState") -> Optional[float]:
+        if not self.flush_on_interval:
+            return None
+        return state.last_flush_s + self.max_interval_s
+
+    def metrics(self) -> dict:
+        return {"policy": self.name, "max_interval_s": self.max_interval_s}
+
+
+@dataclass
+class _RoomRate:
+    words_per_s: float
+    last_append_s: Optional[float] = None
+    # (time, count) of published reactions and times of flushes in the window
+    reactions: Deque[Tuple[float, int]] = field(default_factory=deque)
+    reaction_total: int = 0
+    flushes: Deque[float] = field(default_factory=deque)
+
+
+class AdaptiveFlushPolicy(FlushPolicy):
+    """Keep each room near a reactions-per-minute budget.
+
+    Every chunk fans out to the room's bots, so the cost of a flush is the
+    number of reactions a chunk produced recently (reactions / flushes over
+    the last `window_s`). The minimum gap between flushes is chosen so that
+    chunks x reactions-per-chunk stays within `reactions_per_minute`:
+
+    - before the gap has passed nothing flushes; short sentences from a fast
+      speaker merge into one chunk
+    - after it, a sentence terminator flushes; mid-sentence text flushes
+      once the speaker had `grace_words` worth of time (from their measured
+      words per second, at most half a gap more) to finish the sentence and
+      `min_words` are buffered, so slow speakers are not held to the max
+    - `max_interval_s` always flushes; over budget, it is the only rule
+    """
+
+    name = "adaptive"
+
+    def __init__(
+        self,
+        reactions_per_minute: float = 60.0,
+        min_interval_s: float = 1.5,
+        max_interval_s: float = 7.0,
+        min_words: int = 4,
+        grace_words: int = 8,
+        window_s: float = 60.0,
+        default_words_per_s: float = 2.5,
+    ) -> None:
+        self.reactions_per_minute = reactions_per_minute
+        self.min_interval_s = min_interval_s
+        self.max_interval_s = max_interval_s
+        self.min_words = min_words
+        self.grace_words = grace_words
+        self.window_s = window_s
+        self.default_words_per_s = default_words_per_s
+        self._rooms: Dict[str, _RoomRate] = {}
+
+    def _room(self, room_id: str) -> _RoomRate:
+        rate = self._rooms.get(room_id)
+        if rate is None:
+            rate = _RoomRate(words_per_s=self.default_words_per_s)
+            self._rooms[room_id] = rate
+        return rate
+
+    def _prune(self, rate: _RoomRate, now: float) -> None:
+        horizon = now - self.window_s
+        while rate.reactions and rate.reactions[0][0] < horizon:
+            rate.reaction_total -= rate.reactions.popleft()[1]
+        while rate.flushes and rate.flushes[0] < horizon:
+            rate.flushes.popleft()
+
+    def gap_s(self, room_id: str, now: float) -> float:
+        """Minimum seconds between flushes for the room's recent load."""
+        rate = self._room(room_id)
+        self._prune(rate, now)
+        if rate.reaction_total >= self.reactions_per_minute * self.window_s / 60.0:
+            return self.max_interval_s
+        if not rate.flushes or not rate.reaction_total:
+            return self.min_interval_s
+        per_chunk = rate.reaction_total / len(rate.flushes)
+        gap = 60.0 * per_chunk / max(self.reactions_per_minute, 1e-6)
+        return min(self.max_interval_s, max(self.min_interval_s, gap))
+
+    def _mid_sentence_after_s(self, room_id: str, gap: float) -> float:
+        # Time to finish a sentence, but never more than half a gap extra
+        grace = min(gap / 2, self.grace_words / max(self._room(room_id).words_per_s, 0.1))
+        return min(self.max_interval_s, gap + grace)
+
+    def should_flush(self, room_id: str, state: "BufferState", now: float) -> bool:
+        elapsed = now - state.last_flush_s
+        if elapsed >= self.max_interval_s:
+            return True
+        gap = self.gap_s(room_id, now)
+        if elapsed < gap:
+            return False
+        if _ends_sentence(state):
+            return True
+        return state.words >= self.min_words and elapsed >= self._mid_sentence_after_s(room_id, gap)
+
+    def idle_deadline(self, room_id: str, state: "BufferState") -> Optional[float]:
+        if state.words < self.min_words:
+            return state.last_flush_s + self.max_interval_s
+        gap = self.gap_s(room_id, state.last_flush_s)
+        return state.last_flush_s + self._mid_sentence_after_s(room_id, gap)
+
+    def on_append(self, room_id: str, words: int, now: float) -> None:
+        rate = self._room(room_id)
+        if rate.last_append_s is not None and words:
+            dt = now - rate.last_append_s
+            # Pauses longer than a few seconds say nothing about speaking rate
+            if 0 < dt <= 3.0:
+                instant = words / max(dt, 0.25)
+                rate.words_per_s = 0.7 * rate.words_per_s + 0.3 * instant
+        rate.last_append_s = now
+
+    def on_flush(self, room_id: str, now: float) -> None:
+        rate = self._room(room_id)
+        rate.flushes.append(now)
+        self._prune(rate, now)
+
+    def record_reactions(self, room_id: str, count: int, now: float) -> None:
+        if count <= 0:
+            return
+        rate = self._room(room_id)
+        rate.reactions.append((now, count))
+        rate.reaction_total += count
+        self._prune(rate, now)
+
+    def forget(self, room_id: str) -> None:
+        self._rooms.pop(room_id, None)
+
+    def metrics(self) -> dict:
+        now = time.monotonic()
+        rooms = {}
+        for room_id, rate in list(self._rooms.items()):
+            self._prune(rate, now)
+            rooms[room_id] = {
+                "gap_s": round(self.gap_s(room_id, now), 2),
+                "words_per_s": round(rate.words_per_s, 2),
+                "reactions_last_window": rate.reaction_total,
+                "flushes_last_window": len(rate.flushes),
+            }
+        return {
+            "policy": self.name,
+            "reactions_per_minute": self.reactions_per_minute,
+            "rooms": rooms,
+        }
+
+
+def make_flush_policy(
+    name: str,
+    max_interval_s: float,
+    reactions_per_minute: float = 60.0,
+    min_interval_s: float = 1.5,
+) -> FlushPolicy:
+    """Build a policy from settings; unknown names fall back to fixed."""
+    if name == "adaptive":
+        return AdaptiveFlushPolicy(
+            reactions_per_minute=reactions_per_minute,
+            min_interval_s=min_interval_s,
+            max_interval_s=max_interval_s,
+        )
+    return FixedFlushPolicy(max_interval_s=max_interval_s, flush_on_interval=True)
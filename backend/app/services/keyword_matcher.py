@@ -0,0 +1,103 @@
+"""Compiled multi-pattern keyword matching for transcript scoring.
+
+`score_text` used to run one substring check per keyword per call. With
+several thousand phrases per category that cost grows with the size of the
+category, not with the size of the chunk. `KeywordMatcher` compiles the
+positive/negative keyword lists of a category into a single Aho-Corasick
+automaton so a chunk is scored in one linear pass over its text.
+
+Counting semantics match the old loop exactly: every keyword entry that
+occurs anywhere in the lowercased text counts once (duplicates in the list
+count once per entry, overlapping matches are fine, empty keywords always
+match).
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Iterable
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton over a category's positive and negative keywords."""
+
+    __slots__ = ("_goto", "_fail", "_dict_link", "_pos", "_neg", "_empty_pos", "_empty_neg")
+
+    def __init__(self, keywords_pos: Iterable[str], keywords_neg: Iterable[str]) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._pos: list[int] = [0]
+        self._neg: list[int] = [0]
+        self._empty_pos = 0
+        self._empty_neg = 0
+
+        for kw in keywords_pos:
+            self._add(kw.lower(), positive=True)
+        for kw in keywords_neg:
+            self._add(kw.lower(), positive=False)
+
+        self._fail: list[int] = [0] * len(self._goto)
+        # Nearest proper suffix state that ends a keyword (0 if none)
+        self._dict_link: list[int] = [0] * len(self._goto)
+        self._build_links()
+
+    def _add(self, kw: str, positive: bool) -> None:
+        if not kw:
+            if positive:
+                self._empty_pos += 1
+            else:
+                self._empty_neg += 1
+            return
+        state = 0
+        for ch in kw:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._pos.append(0)
+                self._neg.append(0)
+            state = nxt
+        if positive:
+            self._pos[state] += 1
+        else:
+            self._neg[state] += 1
+
+    def _build_links(self) -> None:
+        goto, fail, dict_link = self._goto, self._fail, self._dict_link
+        pos, neg = self._pos, self._neg
+        queue: deque[int] = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                t = goto[f].get(ch, 0)
+                fail[nxt] = t
+                dict_link[nxt] = t if (pos[t] or neg[t]) else dict_link[t]
+                queue.append(nxt)
+
+    def __len__(self) -> int:
+        return len(self._goto)
+
+    def count(self, text: str) -> tuple[int, int]:
+        """Return (positive_hits, negative_hits) for already-lowercased text."""
+        goto, fail, dict_link = self._goto, self._fail, self._dict_link
+        pos, neg = self._pos, self._neg
+        seen: set[int] = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            s = state if (pos[state] or neg[state]) else dict_link[state]
+            # Once a terminal state is seen its whole suffix chain has been too
+            while s and s not in seen:
+                seen.add(s)
+                s = dict_link[s]
+        hits_pos = self._empty_pos
+        hits_neg = self._empty_neg
+        for s in seen:
+            hits_pos += pos[s]
+            hits_neg += neg[s]
+        return hits_pos, hits_neg
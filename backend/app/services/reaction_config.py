@@ -1,11369 +1,379 @@
-# AUTO-GENERATED expanded reaction config
+# Reaction tuning knobs and helpers.
+#
+# The bulky keyword/template/emoji data (CATEGORIES, TEMPLATES, EMOJI,
+# DEFAULT_PHRASE, DEFAULT_PHRASES, ENCOURAGE) is generated into
+# reaction_config.json and loaded lazily on first use, so importing this module
+# does not parse or compile it. The names stay importable from here.
+#
+# The data and the tuning knobs below form one versioned ReactionData
+# snapshot that can be swapped at runtime (reload_reaction_data). An optional
+# "TUNING" object in the JSON file overrides the module-level defaults.
 from __future__ import annotations
 
-CATEGORIES = {
-  "technical_pitch": {
-    "keywords_pos": [
-      ".net 8",
-      ".net 8 acceleration",
-      ".net 8 alpha",
-      ".net 8 benchmark",
-      ".net 8 benchmarks",
-      ".net 8 best practice",
-      ".net 8 beta",
-      ".net 8 boost",
-      ".net 8 ga",
-      ".net 8 gain",
-      ".net 8 guidelines",
-      ".net 8 hardened",
-      ".net 8 improvement",
-      ".net 8 instrumented",
-      ".net 8 observability",
-      ".net 8 optimization",
-      ".net 8 pilot",
-      ".net 8 poc",
-      ".net 8 profiled",
-      ".net 8 prototype",
-      ".net 8 reference architecture",
-      ".net 8 rollout",
-      ".net 8 speedup",
-      ".net 8 telemetry",
-      "99.9%",
-      "99.9% acceleration",
-      "99.9% alpha",
-      "99.9% benchmark",
-      "99.9% benchmarks",
-      "99.9% best practice",
-      "99.9% beta",
-      "99.9% boost",
-      "99.9% ga",
-      "99.9% gain",
-      "99.9% guidelines",
-      "99.9% hardened",
-      "99.9% improvement",
-      "99.9% instrumented",
-      "99.9% observability",
-      "99.9% optimization",
-      "99.9% pilot",
-      "99.9% poc",
-      "99.9% profiled",
-      "99.9% prototype",
-      "99.9% reference architecture",
-      "99.9% rollout",
-      "99.9% speedup",
-      "99.9% telemetry",
-      "99.99%",
-      "99.99% acceleration",
-      "99.99% alpha",
-      "99.99% benchmark",
-      "99.99% benchmarks",
-      "99.99% best practice",
-      "99.99% beta",
-      "99.99% boost",
-      "99.99% ga",
-      "99.99% gain",
-      "99.99% guidelines",
-      "99.99% hardened",
-      "99.99% improvement",
-      "99.99% instrumented",
-      "99.99% observability",
-      "99.99% optimization",
-      "99.99% pilot",
-      "99.99% poc",
-      "99.99% profiled",
-      "99.99% prototype",
-      "99.99% reference architecture",
-      "99.99% rollout",
-      "99.99% speedup",
-      "99.99% telemetry",
-      "abac",
-      "abac acceleration",
-      "abac alpha",
-      "abac benchmark",
-      "abac benchmarks",
-      "abac best practice",
-      "abac beta",
-      "abac boost",
-      "abac ga",
-      "abac gain",
-      "abac guidelines",
-      "abac hardened",
-      "abac improvement",
-      "abac instrumented",
-      "abac observability",
-      "abac optimization",
-      "abac pilot",
-      "abac poc",
-      "abac profiled",
-      "abac prototype",
-      "abac reference architecture",
-      "abac rollout",
-      "abac speedup",
-      "abac telemetry",
-      "agentic",
-      "agentic acceleration",
-      "agentic alpha",
-      "agentic benchmark",
-      "agentic benchmarks",
-      "agentic best practice",
-      "agentic beta",
-      "agentic boost",
-      "agentic ga",
-      "agentic gain",
-      "agentic guidelines",
-      "agentic hardened",
-      "agentic improvement",
-      "agentic instrumented",
-      "agentic observability",
-      "agentic optimization",
-      "agentic pilot",
-      "agentic poc",
-      "agentic profiled",
-      "agentic prototype",
-      "agentic reference architecture",
-      "agentic rollout",
-      "agentic speedup",
-      "agentic telemetry",
-      "ann",
-      "ann acceleration",
-      "ann alpha",
-      "ann benchmark",
-      "ann benchmarks",
-      "ann best practice",
-      "ann beta",
-      "ann boost",
-      "ann ga",
-      "ann gain",
-      "ann guidelines",
-      "ann hardened",
-      "ann improvement",
-      "ann instrumented",
-      "ann observability",
-      "ann optimization",
-      "ann pilot",
-      "ann poc",
-      "ann profiled",
-      "ann prototype",
-      "ann reference architecture",
-      "ann rollout",
-      "ann speedup",
-      "ann telemetry",
-      "approximate nearest neighbor",
-      "approximate nearest neighbor acceleration",
-      "approximate nearest neighbor alpha",
-      "approximate nearest neighbor benchmark",
-      "approximate nearest neighbor benchmarks",
-      "approximate nearest neighbor best practice",
-      "approximate nearest neighbor beta",
-      "approximate nearest neighbor boost",
-      "approximate nearest neighbor ga",
-      "approximate nearest neighbor gain",
-      "approximate nearest neighbor guidelines",
-      "approximate nearest neighbor hardened",
-      "approximate nearest neighbor improvement",
-      "approximate nearest neighbor instrumented",
-      "approximate nearest neighbor observability",
-      "approximate nearest neighbor optimization",
-      "approximate nearest neighbor pilot",
-      "approximate nearest neighbor poc",
-      "approximate nearest neighbor profiled",
-      "approximate nearest neighbor prototype",
-      "approximate nearest neighbor reference architecture",
-      "approximate nearest neighbor rollout",
-      "approximate nearest neighbor speedup",
-      "approximate nearest neighbor telemetry",
-      "argocd",
-      "argocd acceleration",
-      "argocd alpha",
-      "argocd benchmark",
-      "argocd benchmarks",
-      "argocd best practice",
-      "argocd beta",
-      "argocd boost",
-      "argocd ga",
-      "argocd gain",
-      "argocd guidelines",
-      "argocd hardened",
-      "argocd improvement",
-      "argocd instrumented",
-      "argocd observability",
-      "argocd optimization",
-      "argocd pilot",
-      "argocd poc",
-      "argocd profiled",
-      "argocd prototype",
-      "argocd reference architecture",
-      "argocd rollout",
-      "argocd speedup",
-      "argocd telemetry",
-      "asvs",
-      "asvs acceleration",
-      "asvs alpha",
-      "asvs benchmark",
-      "asvs benchmarks",
-      "asvs best practice",
-      "asvs beta",
-      "asvs boost",
-      "asvs ga",
-      "asvs gain",
-      "asvs guidelines",
-      "asvs hardened",
-      "asvs improvement",
-      "asvs instrumented",
-      "asvs observability",
-      "asvs optimization",
-      "asvs pilot",
-      "asvs poc",
-      "asvs profiled",
-      "asvs prototype",
-      "asvs reference architecture",
-      "asvs rollout",
-      "asvs speedup",
-      "asvs telemetry",
-      "at least once",
-      "at least once acceleration",
-      "at least once alpha",
-      "at least once benchmark",
-      "at least once benchmarks",
-      "at least once best practice",
-      "at least once beta",
-      "at least once boost",
-      "at least once ga",
-      "at least once gain",
-      "at least once guidelines",
-      "at least once hardened",
-      "at least once improvement",
-      "at least once instrumented",
-      "at least once observability",
-      "at least once optimization",
-      "at least once pilot",
-      "at least once poc",
-      "at least once profiled",
-      "at least once prototype",
-      "at least once reference architecture",
-      "at least once rollout",
-      "at least once speedup",
-      "at least once telemetry",
-      "attestation",
-      "attestation acceleration",
-      "attestation alpha",
-      "attestation benchmark",
-      "attestation benchmarks",
-      "attestation best practice",
-      "attestation beta",
-      "attestation boost",
-      "attestation ga",
-      "attestation gain",
-      "attestation guidelines",
-      "attestation hardened",
-      "attestation improvement",
-      "attestation instrumented",
-      "attestation observability",
-      "attestation optimization",
-      "attestation pilot",
-      "attestation poc",
-      "attestation profiled",
-      "attestation prototype",
-      "attestation reference architecture",
-      "attestation rollout",
-      "attestation speedup",
-      "attestation telemetry",
-      "audit trail",
-      "audit trail acceleration",
-      "audit trail alpha",
-      "audit trail benchmark",
-      "audit trail benchmarks",
-      "audit trail best practice",
-      "audit trail beta",
-      "audit trail boost",
-      "audit trail ga",
-      "audit trail gain",
-      "audit trail guidelines",
-      "audit trail hardened",
-      "audit trail improvement",
-      "audit trail instrumented",
-      "audit trail observability",
-      "audit trail optimization",
-      "audit trail pilot",
-      "audit trail poc",
-      "audit trail profiled",
-      "audit trail prototype",
-      "audit trail reference architecture",
-      "audit trail rollout",
-      "audit trail speedup",
-      "audit trail telemetry",
-      "autoscale",
-      "autoscale acceleration",
-      "autoscale alpha",
-      "autoscale benchmark",
-      "autoscale benchmarks",
-      "autoscale best practice",
-      "autoscale beta",
-      "autoscale boost",
-      "autoscale ga",
-      "autoscale gain",
-      "autoscale guidelines",
-      "autoscale hardened",
-      "autoscale improvement",
-      "autoscale instrumented",
-      "autoscale observability",
-      "autoscale optimization",
-      "autoscale pilot",
-      "autoscale poc",
-      "autoscale profiled",
-      "autoscale prototype",
-      "autoscale reference architecture",
-      "autoscale rollout",
-      "autoscale speedup",
-      "autoscale telemetry",
-      "autoscaling",
-      "autoscaling acceleration",
-      "autoscaling alpha",
-      "autoscaling benchmark",
-      "autoscaling benchmarks",
-      "autoscaling best practice",
-      "autoscaling beta",
-      "autoscaling boost",
-      "autoscaling ga",
-      "autoscaling gain",
-      "autoscaling guidelines",
-      "autoscaling hardened",
-      "autoscaling improvement",
-      "autoscaling instrumented",
-      "autoscaling observability",
-      "autoscaling optimization",
-      "autoscaling pilot",
-      "autoscaling poc",
-      "autoscaling profiled",
-      "autoscaling prototype",
-      "autoscaling reference architecture",
-      "autoscaling rollout",
-      "autoscaling speedup",
-      "autoscaling telemetry",
-      "avx",
-      "avx acceleration",
-      "avx alpha",
-      "avx benchmark",
-      "avx benchmarks",
-      "avx best practice",
-      "avx beta",
-      "avx boost",
-      "avx ga",
-      "avx gain",
-      "avx guidelines",
-      "avx hardened",
-      "avx improvement",
-      "avx instrumented",
-      "avx observability",
-      "avx optimization",
-      "avx pilot",
-      "avx poc",
-      "avx profiled",
-      "avx prototype",
-      "avx reference architecture",
-      "avx rollout",
-      "avx speedup",
-      "avx telemetry",
-      "azure functions",
-      "azure functions acceleration",
-      "azure functions alpha",
-      "azure functions benchmark",
-      "azure functions benchmarks",
-      "azure functions best practice",
-      "azure functions beta",
-      "azure functions boost",
-      "azure functions ga",
-      "azure functions gain",
-      "azure functions guidelines",
-      "azure functions hardened",
-      "azure functions improvement",
-      "azure functions instrumented",
-      "azure functions observability",
-      "azure functions optimization",
-      "azure functions pilot",
-      "azure functions poc",
-      "azure functions profiled",
-      "azure functions prototype",
-      "azure functions reference architecture",
-      "azure functions rollout",
-      "azure functions speedup",
-      "azure functions telemetry",
-      "backoff",
-      "backoff acceleration",
-      "backoff alpha",
-      "backoff benchmark",
-      "backoff benchmarks",
-      "backoff best practice",
-      "backoff beta",
-      "backoff boost",
-      "backoff ga",
-      "backoff gain",
-      "backoff guidelines",
-      "backoff hardened",
-      "backoff improvement",
-      "backoff instrumented",
-      "backoff observability",
-      "backoff optimization",
-      "backoff pilot",
-      "backoff poc",
-      "backoff profiled",
-      "backoff prototype",
-      "backoff reference architecture",
-      "backoff rollout",
-      "backoff speedup",
-      "backoff telemetry",
-      "backpressure",
-      "backpressure acceleration",
-      "backpressure alpha",
-      "backpressure benchmark",
-      "backpressure benchmarks",
-      "backpressure best practice",
-      "backpressure beta",
-      "backpressure boost",
-      "backpressure ga",
-      "backpressure gain",
-      "backpressure guidelines",
-      "backpressure hardened",
-      "backpressure improvement",
-      "backpressure instrumented",
-      "backpressure observability",
-      "backpressure optimization",
-      "backpressure pilot",
-      "backpressure poc",
-      "backpressure profiled",
-      "backpressure prototype",
-      "backpressure reference architecture",
-      "backpressure rollout",
-      "backpressure speedup",
-      "backpressure telemetry",
-      "batch + streaming",
-      "batch + streaming acceleration",
-      "batch + streaming alpha",
-      "batch + streaming benchmark",
-      "batch + streaming benchmarks",
-      "batch + streaming best practice",
-      "batch + streaming beta",
-      "batch + streaming boost",
-      "batch + streaming ga",
-      "batch + streaming gain",
-      "batch + streaming guidelines",
-      "batch + streaming hardened",
-      "batch + streaming improvement",
-      "batch + streaming instrumented",
-      "batch + streaming observability",
-      "batch + streaming optimization",
-      "batch + streaming pilot",
-      "batch + streaming poc",
-      "batch + streaming profiled",
-      "batch + streaming prototype",
-      "batch + streaming reference architecture",
-      "batch + streaming rollout",
-      "batch + streaming speedup",
-      "batch + streaming telemetry",
-      "batching",
-      "batching acceleration",
-      "batching alpha",
-      "batching benchmark",
-      "batching benchmarks",
-      "batching best practice",
-      "batching beta",
-      "batching boost",
-      "batching ga",
-      "batching gain",
-      "batching guidelines",
-      "batching hardened",
-      "batching improvement",
-      "batching instrumented",
-      "batching observability",
-      "batching optimization",
-      "batching pilot",
-      "batching poc",
-      "batching profiled",
-      "batching prototype",
-      "batching reference architecture",
-      "batching rollout",
-      "batching speedup",
-      "batching telemetry",
-      "bazel",
-      "bazel acceleration",
-      "bazel alpha",
-      "bazel benchmark",
-      "bazel benchmarks",
-      "bazel best practice",
-      "bazel beta",
-      "bazel boost",
-      "bazel ga",
-      "bazel gain",
-      "bazel guidelines",
-      "bazel hardened",
-      "bazel improvement",
-      "bazel instrumented",
-      "bazel observability",
-      "bazel optimization",
-      "bazel pilot",
-      "bazel poc",
-      "bazel profiled",
-      "bazel prototype",
-      "bazel reference architecture",
-      "bazel rollout",
-      "bazel speedup",
-      "bazel telemetry",
-      "blameless",
-      "blameless acceleration",
-      "blameless alpha",
-      "blameless benchmark",
-      "blameless benchmarks",
-      "blameless best practice",
-      "blameless beta",
-      "blameless boost",
-      "blameless ga",
-      "blameless gain",
-      "blameless guidelines",
-      "blameless hardened",
-      "blameless improvement",
-      "blameless instrumented",
-      "blameless observability",
-      "blameless optimization",
-      "blameless pilot",
-      "blameless poc",
-      "blameless profiled",
-      "blameless prototype",
-      "blameless reference architecture",
-      "blameless rollout",
-      "blameless speedup",
-      "blameless telemetry",
-      "bloom filter",
-      "bloom filter acceleration",
-      "bloom filter alpha",
-      "bloom filter benchmark",
-      "bloom filter benchmarks",
-      "bloom filter best practice",
-      "bloom filter beta",
-      "bloom filter boost",
-      "bloom filter ga",
-      "bloom filter gain",
-      "bloom filter guidelines",
-      "bloom filter hardened",
-      "bloom filter improvement",
-      "bloom filter instrumented",
-      "bloom filter observability",
-      "bloom filter optimization",
-      "bloom filter pilot",
-      "bloom filter poc",
-      "bloom filter profiled",
-      "bloom filter prototype",
-      "bloom filter reference architecture",
-      "bloom filter rollout",
-      "bloom filter speedup",
-      "bloom filter telemetry",
-      "blue green deploy",
-      "blue green deploy acceleration",
-      "blue green deploy alpha",
-      "blue green deploy benchmark",
-      "blue green deploy benchmarks",
-      "blue green deploy best practice",
-      "blue green deploy beta",
-      "blue green deploy boost",
-      "blue green deploy ga",
-      "blue green deploy gain",
-      "blue green deploy guidelines",
-      "blue green deploy hardened",
-      "blue green deploy improvement",
-      "blue green deploy instrumented",
-      "blue green deploy observability",
-      "blue green deploy optimization",
-      "blue green deploy pilot",
-      "blue green deploy poc",
-      "blue green deploy profiled",
-      "blue green deploy prototype",
-      "blue green deploy reference architecture",
-      "blue green deploy rollout",
-      "blue green deploy speedup",
-      "blue green deploy telemetry",
-      "bm25",
-      "bm25 acceleration",
-      "bm25 alpha",
-      "bm25 benchmark",
-      "bm25 benchmarks",
-      "bm25 best practice",
-      "bm25 beta",
-      "bm25 boost",
-      "bm25 ga",
-      "bm25 gain",
-      "bm25 guidelines",
-      "bm25 hardened",
-      "bm25 improvement",
-      "bm25 instrumented",
-      "bm25 observability",
-      "bm25 optimization",
-      "bm25 pilot",
-      "bm25 poc",
-      "bm25 profiled",
-      "bm25 prototype",
-      "bm25 reference architecture",
-      "bm25 rollout",
-      "bm25 speedup",
-      "bm25 telemetry",
-      "buck2",
-      "buck2 acceleration",
-      "buck2 alpha",
-      "buck2 benchmark",
-      "buck2 benchmarks",
-      "buck2 best practice",
-      "buck2 beta",
-      "buck2 boost",
-      "buck2 ga",
-      "buck2 gain",
-      "buck2 guidelines",
-      "buck2 hardened",
-      "buck2 improvement",
-      "buck2 instrumented",
-      "buck2 observability",
-      "buck2 optimization",
-      "buck2 pilot",
-      "buck2 poc",
-      "buck2 profiled",
-      "buck2 prototype",
-      "buck2 reference architecture",
-      "buck2 rollout",
-      "buck2 speedup",
-      "buck2 telemetry",
-      "bun",
-      "bun acceleration",
-      "bun alpha",
-      "bun benchmark",
-      "bun benchmarks",
-      "bun best practice",
-      "bun beta",
-      "bun boost",
-      "bun ga",
-      "bun gain",
-      "bun guidelines",
-      "bun hardened",
-      "bun improvement",
-      "bun instrumented",
-      "bun observability",
-      "bun optimization",
-      "bun pilot",
-      "bun poc",
-      "bun profiled",
-      "bun prototype",
-      "bun reference architecture",
-      "bun rollout",
-      "bun speedup",
-      "bun telemetry",
-      "c#",
-      "c# acceleration",
-      "c# alpha",
-      "c# benchmark",
-      "c# benchmarks",
-      "c# best practice",
-      "c# beta",
-      "c# boost",
-      "c# ga",
-      "c# gain",
-      "c# guidelines",
-      "c# hardened",
-      "c# improvement",
-      "c# instrumented",
-      "c# observability",
-      "c# optimization",
-      "c# pilot",
-      "c# poc",
-      "c# profiled",
-      "c# prototype",
-      "c# reference architecture",
-      "c# rollout",
-      "c# speedup",
-      "c# telemetry",
-      "c++20",
-      "c++20 acceleration",
-      "c++20 alpha",
-      "c++20 benchmark",
-      "c++20 benchmarks",
-      "c++20 best practice",
-      "c++20 beta",
-      "c++20 boost",
-      "c++20 ga",
-      "c++20 gain",
-      "c++20 guidelines",
-      "c++20 hardened",
-      "c++20 improvement",
-      "c++20 instrumented",
-      "c++20 observability",
-      "c++20 optimization",
-      "c++20 pilot",
-      "c++20 poc",
-      "c++20 profiled",
-      "c++20 prototype",
-      "c++20 reference architecture",
-      "c++20 rollout",
-      "c++20 speedup",
-      "c++20 telemetry",
-      "c++23",
-      "c++23 acceleration",
-      "c++23 alpha",
-      "c++23 benchmark",
-      "c++23 benchmarks",
-      "c++23 best practice",
-      "c++23 beta",
-      "c++23 boost",
-      "c++23 ga",
-      "c++23 gain",
-      "c++23 guidelines",
-      "c++23 hardened",
-      "c++23 improvement",
-      "c++23 instrumented",
-      "c++23 observability",
-      "c++23 optimization",
-      "c++23 pilot",
-      "c++23 poc",
-      "c++23 profiled",
-      "c++23 prototype",
-      "c++23 reference architecture",
-      "c++23 rollout",
-      "c++23 speedup",
-      "c++23 telemetry",
-      "cache",
-      "cache acceleration",
-      "cache alpha",
-      "cache benchmark",
-      "cache benchmarks",
-      "cache best practice",
-      "cache beta",
-      "cache boost",
-      "cache ga",
-      "cache gain",
-      "cache guidelines",
-      "cache hardened",
-      "cache improvement",
-      "cache instrumented",
-      "cache observability",
-      "cache optimization",
-      "cache pilot",
-      "cache poc",
-      "cache profiled",
-      "cache prototype",
-      "cache reference architecture",
-      "cache rollout",
-      "cache speedup",
-      "cache telemetry",
-      "caching",
-      "caching acceleration",
-      "caching alpha",
-      "caching benchmark",
-      "caching benchmarks",
-      "caching best practice",
-      "caching beta",
-      "caching boost",
-      "caching ga",
-      "caching gain",
-      "caching guidelines",
-      "caching hardened",
-      "caching improvement",
-      "caching instrumented",
-      "caching observability",
-      "caching optimization",
-      "caching pilot",
-      "caching poc",
-      "caching profiled",
-      "caching prototype",
-      "caching reference architecture",
-      "caching rollout",
-      "caching speedup",
-      "caching telemetry",
-      "canary",
-      "canary acceleration",
-      "canary alpha",
-      "canary benchmark",
-      "canary benchmarks",
-      "canary best practice",
-      "canary beta",
-      "canary boost",
-      "canary ga",
-      "canary gain",
-      "canary guidelines",
-      "canary hardened",
-      "canary improvement",
-      "canary instrumented",
-      "canary observability",
-      "canary optimization",
-      "canary pilot",
-      "canary poc",
-      "canary profiled",
-      "canary prototype",
-      "canary reference architecture",
-      "canary rollout",
-      "canary speedup",
-      "canary telemetry",
-      "cdn",
-      "cdn acceleration",
-      "cdn alpha",
-      "cdn benchmark",
-      "cdn benchmarks",
-      "cdn best practice",
-      "cdn beta",
-      "cdn boost",
-      "cdn edge compute",
-      "cdn edge compute acceleration",
-      "cdn edge compute alpha",
-      "cdn edge compute benchmark",
-      "cdn edge compute benchmarks",
-      "cdn edge compute best practice",
-      "cdn edge compute beta",
-      "cdn edge compute boost",
-      "cdn edge compute ga",
-      "cdn edge compute gain",
-      "cdn edge compute guidelines",
-      "cdn edge compute hardened",
-      "cdn edge compute improvement",
-      "cdn edge compute instrumented",
-      "cdn edge compute observability",
-      "cdn edge compute optimization",
-      "cdn edge compute pilot",
-      "cdn edge compute poc",
-      "cdn edge compute profiled",
-      "cdn edge compute prototype",
-      "cdn edge compute reference architecture",
-      "cdn edge compute rollout",
-      "cdn edge compute speedup",
-      "cdn edge compute telemetry",
-      "cdn ga",
-      "cdn gain",
-      "cdn guidelines",
-      "cdn hardened",
-      "cdn improvement",
-      "cdn instrumented",
-      "cdn observability",
-      "cdn optimization",
-      "cdn pilot",
-      "cdn poc",
-      "cdn profiled",
-      "cdn prototype",
-      "cdn reference architecture",
-      "cdn rollout",
-      "cdn speedup",
-      "cdn telemetry",
-      "chaos engineering",
-      "chaos engineering acceleration",
-      "chaos engineering alpha",
-      "chaos engineering benchmark",
-      "chaos engineering benchmarks",
-      "chaos engineering best practice",
-      "chaos engineering beta",
-      "chaos engineering boost",
-      "chaos engineering ga",
-      "chaos engineering gain",
-      "chaos engineering guidelines",
-      "chaos engineering hardened",
-      "chaos engineering improvement",
-      "chaos engineering instrumented",
-      "chaos engineering observability",
-      "chaos engineering optimization",
-      "chaos engineering pilot",
-      "chaos engineering poc",
-      "chaos engineering profiled",
-      "chaos engineering prototype",
-      "chaos engineering reference architecture",
-      "chaos engineering rollout",
-      "chaos engineering speedup",
-      "chaos engineering telemetry",
-      "choreography",
-      "choreography acceleration",
-      "choreography alpha",
-      "choreography benchmark",
-      "choreography benchmarks",
-      "choreography best practice",
-      "choreography beta",
-      "choreography boost",
-      "choreography ga",
-      "choreography gain",
-      "choreography guidelines",
-      "choreography hardened",
-      "choreography improvement",
-      "choreography instrumented",
-      "choreography observability",
-      "choreography optimization",
-      "choreography pilot",
-      "choreography poc",
-      "choreography profiled",
-      "choreography prototype",
-      "choreography reference architecture",
-      "choreography rollout",
-      "choreography speedup",
-      "choreography telemetry",
-      "circuit breaker",
-      "circuit breaker acceleration",
-      "circuit breaker alpha",
-      "circuit breaker benchmark",
-      "circuit breaker benchmarks",
-      "circuit breaker best practice",
-      "circuit breaker beta",
-      "circuit breaker boost",
-      "circuit breaker ga",
-      "circuit breaker gain",
-      "circuit breaker guidelines",
-      "circuit breaker hardened",
-      "circuit breaker improvement",
-      "circuit breaker instrumented",
-      "circuit breaker observability",
-      "circuit breaker optimization",
-      "circuit breaker pilot",
-      "circuit breaker poc",
-      "circuit breaker profiled",
-      "circuit breaker prototype",
-      "circuit breaker reference architecture",
-      "circuit breaker rollout",
-      "circuit breaker speedup",
-      "circuit breaker telemetry",
-      "clean architecture",
-      "clean architecture acceleration",
-      "clean architecture alpha",
-      "clean architecture benchmark",
-      "clean architecture benchmarks",
-      "clean architecture best practice",
-      "clean architecture beta",
-      "clean architecture boost",
-      "clean architecture ga",
-      "clean architecture gain",
-      "clean architecture guidelines",
-      "clean architecture hardened",
-      "clean architecture improvement",
-      "clean architecture instrumented",
-      "clean architecture observability",
-      "clean architecture optimization",
-      "clean architecture pilot",
-      "clean architecture poc",
-      "clean architecture profiled",
-      "clean architecture prototype",
-      "clean architecture reference architecture",
-      "clean architecture rollout",
-      "clean architecture speedup",
-      "clean architecture telemetry",
-      "client library",
-      "client library acceleration",
-      "client library alpha",
-      "client library benchmark",
-      "client library benchmarks",
-      "client library best practice",
-      "client library beta",
-      "client library boost",
-      "client library ga",
-      "client library gain",
-      "client library guidelines",
-      "client library hardened",
-      "client library improvement",
-      "client library instrumented",
-      "client library observability",
-      "client library optimization",
-      "client library pilot",
-      "client library poc",
-      "client library profiled",
-      "client library prototype",
-      "client library reference architecture",
-      "client library rollout",
-      "client library speedup",
-      "client library telemetry",
-      "cloud run",
-      "cloud run acceleration",
-      "cloud run alpha",
-      "cloud run benchmark",
-      "cloud run benchmarks",
-      "cloud run best practice",
-      "cloud run beta",
-      "cloud run boost",
-      "cloud run ga",
-      "cloud run gain",
-      "cloud run guidelines",
-      "cloud run hardened",
-      "cloud run improvement",
-      "cloud run instrumented",
-      "cloud run observability",
-      "cloud run optimization",
-      "cloud run pilot",
-      "cloud run poc",
-      "cloud run profiled",
-      "cloud run prototype",
-      "cloud run reference architecture",
-      "cloud run rollout",
-      "cloud run speedup",
-      "cloud run telemetry",
-      "cloudflare workers",
-      "cloudflare workers acceleration",
-      "cloudflare workers alpha",
-      "cloudflare workers benchmark",
-      "cloudflare workers benchmarks",
-      "cloudflare workers best practice",
-      "cloudflare workers beta",
-      "cloudflare workers boost",
-      "cloudflare workers ga",
-      "cloudflare workers gain",
-      "cloudflare workers guidelines",
-      "cloudflare workers hardened",
-      "cloudflare workers improvement",
-      "cloudflare workers instrumented",
-      "cloudflare workers observability",
-      "cloudflare workers optimization",
-      "cloudflare workers pilot",
-      "cloudflare workers poc",
-      "cloudflare workers profiled",
-      "cloudflare workers prototype",
-      "cloudflare workers reference architecture",
-      "cloudflare workers rollout",
-      "cloudflare workers speedup",
-      "cloudflare workers telemetry",
-      "cloudfront functions",
-      "cloudfront functions acceleration",
-      "cloudfront functions alpha",
-      "cloudfront functions benchmark",
-      "cloudfront functions benchmarks",
-      "cloudfront functions best practice",
-      "cloudfront functions beta",
-      "cloudfront functions boost",
-      "cloudfront functions ga",
-      "cloudfront functions gain",
-      "cloudfront functions guidelines",
-      "cloudfront functions hardened",
-      "cloudfront functions improvement",
-      "cloudfront functions instrumented",
-      "cloudfront functions observability",
-      "cloudfront functions optimization",
-      "cloudfront functions pilot",
-      "cloudfront functions poc",
-      "cloudfront functions profiled",
-      "cloudfront functions prototype",
-      "cloudfront functions reference architecture",
-      "cloudfront functions rollout",
-      "cloudfront functions speedup",
-      "cloudfront functions telemetry",
-      "coalescing",
-      "coalescing acceleration",
-      "coalescing alpha",
-      "coalescing benchmark",
-      "coalescing benchmarks",
-      "coalescing best practice",
-      "coalescing beta",
-      "coalescing boost",
-      "coalescing ga",
-      "coalescing gain",
-      "coalescing guidelines",
-      "coalescing hardened",
-      "coalescing improvement",
-      "coalescing instrumented",
-      "coalescing observability",
-      "coalescing optimization",
-      "coalescing pilot",
-      "coalescing poc",
-      "coalescing profiled",
-      "coalescing prototype",
-      "coalescing reference architecture",
-      "coalescing rollout",
-      "coalescing speedup",
-      "coalescing telemetry",
-      "code sample",
-      "code sample acceleration",
-      "code sample alpha",
-      "code sample benchmark",
-      "code sample benchmarks",
-      "code sample best practice",
-      "code sample beta",
-      "code sample boost",
-      "code sample ga",
-      "code sample gain",
-      "code sample guidelines",
-      "code sample hardened",
-      "code sample improvement",
-      "code sample instrumented",
-      "code sample observability",
-      "code sample optimization",
-      "code sample pilot",
-      "code sample poc",
-      "code sample profiled",
-      "code sample prototype",
-      "code sample reference architecture",
-      "code sample rollout",
-      "code sample speedup",
-      "code sample telemetry",
-      "columnar",
-      "columnar acceleration",
-      "columnar alpha",
-      "columnar benchmark",
-      "columnar benchmarks",
-      "columnar best practice",
-      "columnar beta",
-      "columnar boost",
-      "columnar ga",
-      "columnar gain",
-      "columnar guidelines",
-      "columnar hardened",
-      "columnar improvement",
-      "columnar instrumented",
-      "columnar observability",
-      "columnar optimization",
-      "columnar pilot",
-      "columnar poc",
-      "columnar profiled",
-      "columnar prototype",
-      "columnar reference architecture",
-      "columnar rollout",
-      "columnar speedup",
-      "columnar telemetry",
-      "compaction",
-      "compaction acceleration",
-      "compaction alpha",
-      "compaction benchmark",
-      "compaction benchmarks",
-      "compaction best practice",
-      "compaction beta",
-      "compaction boost",
-      "compaction ga",
-      "compaction gain",
-      "compaction guidelines",
-      "compaction hardened",
-      "compaction improvement",
-      "compaction instrumented",
-      "compaction observability",
-      "compaction optimization",
-      "compaction pilot",
-      "compaction poc",
-      "compaction profiled",
-      "compaction prototype",
-      "compaction reference architecture",
-      "compaction rollout",
-      "compaction speedup",
-      "compaction telemetry",
-      "consumer driven contracts",
-      "consumer driven contracts acceleration",
-      "consumer driven contracts alpha",
-      "consumer driven contracts benchmark",
-      "consumer driven contracts benchmarks",
-      "consumer driven contracts best practice",
-      "consumer driven contracts beta",
-      "consumer driven contracts boost",
-      "consumer driven contracts ga",
-      "consumer driven contracts gain",
-      "consumer driven contracts guidelines",
-      "consumer driven contracts hardened",
-      "consumer driven contracts improvement",
-      "consumer driven contracts instrumented",
-      "consumer driven contracts observability",
-      "consumer driven contracts optimization",
-      "consumer driven contracts pilot",
-      "consumer driven contracts poc",
-      "consumer driven contracts profiled",
-      "consumer driven contracts prototype",
-      "consumer driven contracts reference architecture",
-      "consumer driven contracts rollout",
-      "consumer driven contracts speedup",
-      "consumer driven contracts telemetry",
-      "container",
-      "container acceleration",
-      "container alpha",
-      "container benchmark",
-      "container benchmarks",
-      "container best practice",
-      "container beta",
-      "container boost",
-      "container ga",
-      "container gain",
-      "container guidelines",
-      "container hardened",
-      "container improvement",
-      "container instrumented",
-      "container observability",
-      "container optimization",
-      "container pilot",
-      "container poc",
-      "container profiled",
-      "container prototype",
-      "container reference architecture",
-      "container rollout",
-      "container speedup",
-      "container telemetry",
-      "containerd",
-      "containerd acceleration",
-      "containerd alpha",
-      "containerd benchmark",
-      "containerd benchmarks",
-      "containerd best practice",
-      "containerd beta",
-      "containerd boost",
-      "containerd ga",
-      "containerd gain",
-      "containerd guidelines",
-      "containerd hardened",
-      "containerd improvement",
-      "containerd instrumented",
-      "containerd observability",
-      "containerd optimization",
-      "containerd pilot",
-      "containerd poc",
-      "containerd profiled",
-      "containerd prototype",
-      "containerd reference architecture",
-      "containerd rollout",
-      "containerd speedup",
-      "containerd telemetry",
-      "contract testing",
-      "contract testing acceleration",
-      "contract testing alpha",
-      "contract testing benchmark",
-      "contract testing benchmarks",
-      "contract testing best practice",
-      "contract testing beta",
-      "contract testing boost",
-      "contract testing ga",
-      "contract testing gain",
-      "contract testing guidelines",
-      "contract testing hardened",
-      "contract testing improvement",
-      "contract testing instrumented",
-      "contract testing observability",
-      "contract testing optimization",
-      "contract testing pilot",
-      "contract testing poc",
-      "contract testing profiled",
-      "contract testing prototype",
-      "contract testing reference architecture",
-      "contract testing rollout",
-      "contract testing speedup",
-      "contract testing telemetry",
-      "cosign",
-      "cosign acceleration",
-      "cosign alpha",
-      "cosign benchmark",
-      "cosign benchmarks",
-      "cosign best practice",
-      "cosign beta",
-      "cosign boost",
-      "cosign ga",
-      "cosign gain",
-      "cosign guidelines",
-      "cosign hardened",
-      "cosign improvement",
-      "cosign instrumented",
-      "cosign observability",
-      "cosign optimization",
-      "cosign pilot",
-      "cosign poc",
-      "cosign profiled",
-      "cosign prototype",
-      "cosign reference architecture",
-      "cosign rollout",
-      "cosign speedup",
-      "cosign telemetry",
-      "cqrs",
-      "cqrs acceleration",
-      "cqrs alpha",
-      "cqrs benchmark",
-      "cqrs benchmarks",
-      "cqrs best practice",
-      "cqrs beta",
-      "cqrs boost",
-      "cqrs ga",
-      "cqrs gain",
-      "cqrs guidelines",
-      "cqrs hardened",
-      "cqrs improvement",
-      "cqrs instrumented",
-      "cqrs observability",
-      "cqrs optimization",
-      "cqrs pilot",
-      "cqrs poc",
-      "cqrs profiled",
-      "cqrs prototype",
-      "cqrs reference architecture",
-      "cqrs rollout",
-      "cqrs speedup",
-      "cqrs telemetry",
-      "cuda",
-      "cuda acceleration",
-      "cuda alpha",
-      "cuda benchmark",
-      "cuda benchmarks",
-      "cuda best practice",
-      "cuda beta",
-      "cuda boost",
-      "cuda ga",
-      "cuda gain",
-      "cuda guidelines",
-      "cuda hardened",
-      "cuda improvement",
-      "cuda instrumented",
-      "cuda observability",
-      "cuda optimization",
-      "cuda pilot",
-      "cuda poc",
-      "cuda profiled",
-      "cuda prototype",
-      "cuda reference architecture",
-      "cuda rollout",
-      "cuda speedup",
-      "cuda telemetry",
-      "dark launch",
-      "dark launch acceleration",
-      "dark launch alpha",
-      "dark launch benchmark",
-      "dark launch benchmarks",
-      "dark launch best practice",
-      "dark launch beta",
-      "dark launch boost",
-      "dark launch ga",
-      "dark launch gain",
-      "dark launch guidelines",
-      "dark launch hardened",
-      "dark launch improvement",
-      "dark launch instrumented",
-      "dark launch observability",
-      "dark launch optimization",
-      "dark launch pilot",
-      "dark launch poc",
-      "dark launch profiled",
-      "dark launch prototype",
-      "dark launch reference architecture",
-      "dark launch rollout",
-      "dark launch speedup",
-      "dark launch telemetry",
-      "dast",
-      "dast acceleration",
-      "dast alpha",
-      "dast benchmark",
-      "dast benchmarks",
-      "dast best practice",
-      "dast beta",
-      "dast boost",
-      "dast ga",
-      "dast gain",
-      "dast guidelines",
-      "dast hardened",
-      "dast improvement",
-      "dast instrumented",
-      "dast observability",
-      "dast optimization",
-      "dast pilot",
-      "dast poc",
-      "dast profiled",
-      "dast prototype",
-      "dast reference architecture",
-      "dast rollout",
-      "dast speedup",
-      "dast telemetry",
-      "data lake",
-      "data lake acceleration",
-      "data lake alpha",
-      "data lake benchmark",
-      "data lake benchmarks",
-      "data lake best practice",
-      "data lake beta",
-      "data lake boost",
-      "data lake ga",
-      "data lake gain",
-      "data lake guidelines",
-      "data lake hardened",
-      "data lake improvement",
-      "data lake instrumented",
-      "data lake observability",
-      "data lake optimization",
-      "data lake pilot",
-      "data lake poc",
-      "data lake profiled",
-      "data lake prototype",
-      "data lake reference architecture",
-      "data lake rollout",
-      "data lake speedup",
-      "data lake telemetry",
-      "ddd",
-      "ddd acceleration",
-      "ddd alpha",
-      "ddd benchmark",
-      "ddd benchmarks",
-      "ddd best practice",
-      "ddd beta",
-      "ddd boost",
-      "ddd ga",
-      "ddd gain",
-      "ddd guidelines",
-      "ddd hardened",
-      "ddd improvement",
-      "ddd instrumented",
-      "ddd observability",
-      "ddd optimization",
-      "ddd pilot",
-      "ddd poc",
-      "ddd profiled",
-      "ddd prototype",
-      "ddd reference architecture",
-      "ddd rollout",
-      "ddd speedup",
-      "ddd telemetry",
-      "debounce",
-      "debounce acceleration",
-      "debounce alpha",
-      "debounce benchmark",
-      "debounce benchmarks",
-      "debounce best practice",
-      "debounce beta",
-      "debounce boost",
-      "debounce ga",
-      "debounce gain",
-      "debounce guidelines",
-      "debounce hardened",
-      "debounce improvement",
-      "debounce instrumented",
-      "debounce observability",
-      "debounce optimization",
-      "debounce pilot",
-      "debounce poc",
-      "debounce profiled",
-      "debounce prototype",
-      "debounce reference architecture",
-      "debounce rollout",
-      "debounce speedup",
-      "debounce telemetry",
-      "deno",
-      "deno acceleration",
-      "deno alpha",
-      "deno benchmark",
-      "deno benchmarks",
-      "deno best practice",
-      "deno beta",
-      "deno boost",
-      "deno ga",
-      "deno gain",
-      "deno guidelines",
-      "deno hardened",
-      "deno improvement",
-      "deno instrumented",
-      "deno observability",
-      "deno optimization",
-      "deno pilot",
-      "deno poc",
-      "deno profiled",
-      "deno prototype",
-      "deno reference architecture",
-      "deno rollout",
-      "deno speedup",
-      "deno telemetry",
-      "distillation",
-      "distillation acceleration",
-      "distillation alpha",
-      "distillation benchmark",
-      "distillation benchmarks",
-      "distillation best practice",
-      "distillation beta",
-      "distillation boost",
-      "distillation ga",
-      "distillation gain",
-      "distillation guidelines",
-      "distillation hardened",
-      "distillation improvement",
-      "distillation instrumented",
-      "distillation observability",
-      "distillation optimization",
-      "distillation pilot",
-      "distillation poc",
-      "distillation profiled",
-      "distillation prototype",
-      "distillation reference architecture",
-      "distillation rollout",
-      "distillation speedup",
-      "distillation telemetry",
-      "distributed tracing",
-      "distributed tracing acceleration",
-      "distributed tracing alpha",
-      "distributed tracing benchmark",
-      "distributed tracing benchmarks",
-      "distributed tracing best practice",
-      "distributed tracing beta",
-      "distributed tracing boost",
-      "distributed tracing ga",
-      "distributed tracing gain",
-      "distributed tracing guidelines",
-      "distributed tracing hardened",
-      "distributed tracing improvement",
-      "distributed tracing instrumented",
-      "distributed tracing observability",
-      "distributed tracing optimization",
-      "distributed tracing pilot",
-      "distributed tracing poc",
-      "distributed tracing profiled",
-      "distributed tracing prototype",
-      "distributed tracing reference architecture",
-      "distributed tracing rollout",
-      "distributed tracing speedup",
-      "distributed tracing telemetry",
-      "docker",
-      "docker acceleration",
-      "docker alpha",
-      "docker benchmark",
-      "docker benchmarks",
-      "docker best practice",
-      "docker beta",
-      "docker boost",
-      "docker ga",
-      "docker gain",
-      "docker guidelines",
-      "docker hardened",
-      "docker improvement",
-      "docker instrumented",
-      "docker observability",
-      "docker optimization",
-      "docker pilot",
-      "docker poc",
-      "docker profiled",
-      "docker prototype",
-      "docker reference architecture",
-      "docker rollout",
-      "docker speedup",
-      "docker telemetry",
-      "domain driven design",
-      "domain driven design acceleration",
-      "domain driven design alpha",
-      "domain driven design benchmark",
-      "domain driven design benchmarks",
-      "domain driven design best practice",
-      "domain driven design beta",
-      "domain driven design boost",
-      "domain driven design ga",
-      "domain driven design gain",
-      "domain driven design guidelines",
-      "domain driven design hardened",
-      "domain driven design improvement",
-      "domain driven design instrumented",
-      "domain driven design observability",
-      "domain driven design optimization",
-      "domain driven design pilot",
-      "domain driven design poc",
-      "domain driven design profiled",
-      "domain driven design prototype",
-      "domain driven design reference architecture",
-      "domain driven design rollout",
-      "domain driven design speedup",
-      "domain driven design telemetry",
-      "dotnet 8",
-      "dotnet 8 acceleration",
-      "dotnet 8 alpha",
-      "dotnet 8 benchmark",
-      "dotnet 8 benchmarks",
-      "dotnet 8 best practice",
-      "dotnet 8 beta",
-      "dotnet 8 boost",
-      "dotnet 8 ga",
-      "dotnet 8 gain",
-      "dotnet 8 guidelines",
-      "dotnet 8 hardened",
-      "dotnet 8 improvement",
-      "dotnet 8 instrumented",
-      "dotnet 8 observability",
-      "dotnet 8 optimization",
-      "dotnet 8 pilot",
-      "dotnet 8 poc",
-      "dotnet 8 profiled",
-      "dotnet 8 prototype",
-      "dotnet 8 reference architecture",
-      "dotnet 8 rollout",
-      "dotnet 8 speedup",
-      "dotnet 8 telemetry",
-      "edge",
-      "edge acceleration",
-      "edge alpha",
-      "edge benchmark",
-      "edge benchmarks",
-      "edge best practice",
-      "edge beta",
-      "edge boost",
-      "edge cache",
-      "edge cache acceleration",
-      "edge cache alpha",
-      "edge cache benchmark",
-      "edge cache benchmarks",
-      "edge cache best practice",
-      "edge cache beta",
-      "edge cache boost",
-      "edge cache ga",
-      "edge cache gain",
-      "edge cache guidelines",
-      "edge cache hardened",
-      "edge cache improvement",
-      "edge cache instrumented",
-      "edge cache observability",
-      "edge cache optimization",
-      "edge cache pilot",
-      "edge cache poc",
-      "edge cache profiled",
-      "edge cache prototype",
-      "edge cache reference architecture",
-      "edge cache rollout",
-      "edge cache speedup",
-      "edge cache telemetry",
-      "edge ga",
-      "edge gain",
-      "edge guidelines",
-      "edge hardened",
-      "edge improvement",
-      "edge instrumented",
-      "edge observability",
-      "edge optimization",
-      "edge pilot",
-      "edge poc",
-      "edge profiled",
-      "edge prototype",
-      "edge reference architecture",
-      "edge rollout",
-      "edge speedup",
-      "edge telemetry",
-      "elastic",
-      "elastic acceleration",
-      "elastic alpha",
-      "elastic benchmark",
-      "elastic benchmarks",
-      "elastic best practice",
-      "elastic beta",
-      "elastic boost",
-      "elastic ga",
-      "elastic gain",
-      "elastic guidelines",
-      "elastic hardened",
-      "elastic improvement",
-      "elastic instrumented",
-      "elastic observability",
-      "elastic optimization",
-      "elastic pilot",
-      "elastic poc",
-      "elastic profiled",
-      "elastic prototype",
-      "elastic reference architecture",
-      "elastic rollout",
-      "elastic speedup",
-      "elastic telemetry",
-      "embedding",
-      "embedding acceleration",
-      "embedding alpha",
-      "embedding benchmark",
-      "embedding benchmarks",
-      "embedding best practice",
-      "embedding beta",
-      "embedding boost",
-      "embedding ga",
-      "embedding gain",
-      "embedding guidelines",
-      "embedding hardened",
-      "embedding improvement",
-      "embedding instrumented",
-      "embedding observability",
-      "embedding optimization",
-      "embedding pilot",
-      "embedding poc",
-      "embedding profiled",
-      "embedding prototype",
-      "embedding reference architecture",
-      "embedding rollout",
-      "embedding speedup",
-      "embedding telemetry",
-      "epoll",
-      "epoll acceleration",
-      "epoll alpha",
-      "epoll benchmark",
-      "epoll benchmarks",
-      "epoll best practice",
-      "epoll beta",
-      "epoll boost",
-      "epoll ga",
-      "epoll gain",
-      "epoll guidelines",
-      "epoll hardened",
-      "epoll improvement",
-      "epoll instrumented",
-      "epoll observability",
-      "epoll optimization",
-      "epoll pilot",
-      "epoll poc",
-      "epoll profiled",
-      "epoll prototype",
-      "epoll reference architecture",
-      "epoll rollout",
-      "epoll speedup",
-      "epoll telemetry",
-      "error budget",
-      "error budget acceleration",
-      "error budget alpha",
-      "error budget benchmark",
-      "error budget benchmarks",
-      "error budget best practice",
-      "error budget beta",
-      "error budget boost",
-      "error budget ga",
-      "error budget gain",
-      "error budget guidelines",
-      "error budget hardened",
-      "error budget improvement",
-      "error budget instrumented",
-      "error budget observability",
-      "error budget optimization",
-      "error budget pilot",
-      "error budget poc",
-      "error budget profiled",
-      "error budget prototype",
-      "error budget reference architecture",
-      "error budget rollout",
-      "error budget speedup",
-      "error budget telemetry",
-      "event driven",
-      "event driven acceleration",
-      "event driven alpha",
-      "event driven benchmark",
-      "event driven benchmarks",
-      "event driven best practice",
-      "event driven beta",
-      "event driven boost",
-      "event driven ga",
-      "event driven gain",
-      "event driven guidelines",
-      "event driven hardened",
-      "event driven improvement",
-      "event driven instrumented",
-      "event driven observability",
-      "event driven optimization",
-      "event driven pilot",
-      "event driven poc",
-      "event driven profiled",
-      "event driven prototype",
-      "event driven reference architecture",
-      "event driven rollout",
-      "event driven speedup",
-      "event driven telemetry",
-      "event sourcing",
-      "event sourcing acceleration",
-      "event sourcing alpha",
-      "event sourcing benchmark",
-      "event sourcing benchmarks",
-      "event sourcing best practice",
-      "event sourcing beta",
-      "event sourcing boost",
-      "event sourcing ga",
-      "event sourcing gain",
-      "event sourcing guidelines",
-      "event sourcing hardened",
-      "event sourcing improvement",
-      "event sourcing instrumented",
-      "event sourcing observability",
-      "event sourcing optimization",
-      "event sourcing pilot",
-      "event sourcing poc",
-      "event sourcing profiled",
-      "event sourcing prototype",
-      "event sourcing reference architecture",
-      "event sourcing rollout",
-      "event sourcing speedup",
-      "event sourcing telemetry",
-      "exactly once",
-      "exactly once acceleration",
-      "exactly once alpha",
-      "exactly once benchmark",
-      "exactly once benchmarks",
-      "exactly once best practice",
-      "exactly once beta",
-      "exactly once boost",
-      "exactly once ga",
-      "exactly once gain",
-      "exactly once guidelines",
-      "exactly once hardened",
-      "exactly once improvement",
-      "exactly once instrumented",
-      "exactly once observability",
-      "exactly once optimization",
-      "exactly once pilot",
-      "exactly once poc",
-      "exactly once profiled",
-      "exactly once prototype",
-      "exactly once reference architecture",
-      "exactly once rollout",
-      "exactly once speedup",
-      "exactly once telemetry",
-      "exponential backoff",
-      "exponential backoff acceleration",
-      "exponential backoff alpha",
-      "exponential backoff benchmark",
-      "exponential backoff benchmarks",
-      "exponential backoff best practice",
-      "exponential backoff beta",
-      "exponential backoff boost",
-      "exponential backoff ga",
-      "exponential backoff gain",
-      "exponential backoff guidelines",
-      "exponential backoff hardened",
-      "exponential backoff improvement",
-      "exponential backoff instrumented",
-      "exponential backoff observability",
-      "exponential backoff optimization",
-      "exponential backoff pilot",
-      "exponential backoff poc",
-      "exponential backoff profiled",
-      "exponential backoff prototype",
-      "exponential backoff reference architecture",
-      "exponential backoff rollout",
-      "exponential backoff speedup",
-      "exponential backoff telemetry",
-      "faiss",
-      "faiss acceleration",
-      "faiss alpha",
-      "faiss benchmark",
-      "faiss benchmarks",
-      "faiss best practice",
-      "faiss beta",
-      "faiss boost",
-      "faiss ga",
-      "faiss gain",
-      "faiss guidelines",
-      "faiss hardened",
-      "faiss improvement",
-      "faiss instrumented",
-      "faiss observability",
-      "faiss optimization",
-      "faiss pilot",
-      "faiss poc",
-      "faiss profiled",
-      "faiss prototype",
-      "faiss reference architecture",
-      "faiss rollout",
-      "faiss speedup",
-      "faiss telemetry",
-      "fargate",
-      "fargate acceleration",
-      "fargate alpha",
-      "fargate benchmark",
-      "fargate benchmarks",
-      "fargate best practice",
-      "fargate beta",
-      "fargate boost",
-      "fargate ga",
-      "fargate gain",
-      "fargate guidelines",
-      "fargate hardened",
-      "fargate improvement",
-      "fargate instrumented",
-      "fargate observability",
-      "fargate optimization",
-      "fargate pilot",
-      "fargate poc",
-      "fargate profiled",
-      "fargate prototype",
-      "fargate reference architecture",
-      "fargate rollout",
-      "fargate speedup",
-      "fargate telemetry",
-      "fault injection",
-      "fault injection acceleration",
-      "fault injection alpha",
-      "fault injection benchmark",
-      "fault injection benchmarks",
-      "fault injection best practice",
-      "fault injection beta",
-      "fault injection boost",
-      "fault injection ga",
-      "fault injection gain",
-      "fault injection guidelines",
-      "fault injection hardened",
-      "fault injection improvement",
-      "fault injection instrumented",
-      "fault injection observability",
-      "fault injection optimization",
-      "fault injection pilot",
-      "fault injection poc",
-      "fault injection profiled",
-      "fault injection prototype",
-      "fault injection reference architecture",
-      "fault injection rollout",
-      "fault injection speedup",
-      "fault injection telemetry",
-      "fault tolerant",
-      "fault tolerant acceleration",
-      "fault tolerant alpha",
-      "fault tolerant benchmark",
-      "fault tolerant benchmarks",
-      "fault tolerant best practice",
-      "fault tolerant beta",
-      "fault tolerant boost",
-      "fault tolerant ga",
-      "fault tolerant gain",
-      "fault tolerant guidelines",
-      "fault tolerant hardened",
-      "fault tolerant improvement",
-      "fault tolerant instrumented",
-      "fault tolerant observability",
-      "fault tolerant optimization",
-      "fault tolerant pilot",
-      "fault tolerant poc",
-      "fault tolerant profiled",
-      "fault tolerant prototype",
-      "fault tolerant reference architecture",
-      "fault tolerant rollout",
-      "fault tolerant speedup",
-      "fault tolerant telemetry",
-      "feature flags",
-      "feature flags acceleration",
-      "feature flags alpha",
-      "feature flags benchmark",
-      "feature flags benchmarks",
-      "feature flags best practice",
-      "feature flags beta",
-      "feature flags boost",
-      "feature flags ga",
-      "feature flags gain",
-      "feature flags guidelines",
-      "feature flags hardened",
-      "feature flags improvement",
-      "feature flags instrumented",
-      "feature flags observability",
-      "feature flags optimization",
-      "feature flags pilot",
-      "feature flags poc",
-      "feature flags profiled",
-      "feature flags prototype",
-      "feature flags reference architecture",
-      "feature flags rollout",
-      "feature flags speedup",
-      "feature flags telemetry",
-      "five nines",
-      "five nines acceleration",
-      "five nines alpha",
-      "five nines benchmark",
-      "five nines benchmarks",
-      "five nines best practice",
-      "five nines beta",
-      "five nines boost",
-      "five nines ga",
-      "five nines gain",
-      "five nines guidelines",
-      "five nines hardened",
-      "five nines improvement",
-      "five nines instrumented",
-      "five nines observability",
-      "five nines optimization",
-      "five nines pilot",
-      "five nines poc",
-      "five nines profiled",
-      "five nines prototype",
-      "five nines reference architecture",
-      "five nines rollout",
-      "five nines speedup",
-      "five nines telemetry",
-      "flux",
-      "flux acceleration",
-      "flux alpha",
-      "flux benchmark",
-      "flux benchmarks",
-      "flux best practice",
-      "flux beta",
-      "flux boost",
-      "flux ga",
-      "flux gain",
-      "flux guidelines",
-      "flux hardened",
-      "flux improvement",
-      "flux instrumented",
-      "flux observability",
-      "flux optimization",
-      "flux pilot",
-      "flux poc",
-      "flux profiled",
-      "flux prototype",
-      "flux reference architecture",
-      "flux rollout",
-      "flux speedup",
-      "flux telemetry",
-      "function calling",
-      "function calling acceleration",
-      "function calling alpha",
-      "function calling benchmark",
-      "function calling benchmarks",
-      "function calling best practice",
-      "function calling beta",
-      "function calling boost",
-      "function calling ga",
-      "function calling gain",
-      "function calling guidelines",
-      "function calling hardened",
-      "function calling improvement",
-      "function calling instrumented",
-      "function calling observability",
-      "function calling optimization",
-      "function calling pilot",
-      "function calling poc",
-      "function calling profiled",
-      "function calling prototype",
-      "function calling reference architecture",
-      "function calling rollout",
-      "function calling speedup",
-      "function calling telemetry",
-      "fuzzing",
-      "fuzzing acceleration",
-      "fuzzing alpha",
-      "fuzzing benchmark",
-      "fuzzing benchmarks",
-      "fuzzing best practice",
-      "fuzzing beta",
-      "fuzzing boost",
-      "fuzzing ga",
-      "fuzzing gain",
-      "fuzzing guidelines",
-      "fuzzing hardened",
-      "fuzzing improvement",
-      "fuzzing instrumented",
-      "fuzzing observability",
-      "fuzzing optimization",
-      "fuzzing pilot",
-      "fuzzing poc",
-      "fuzzing profiled",
-      "fuzzing prototype",
-      "fuzzing reference architecture",
-      "fuzzing rollout",
-      "fuzzing speedup",
-      "fuzzing telemetry",
-      "gguf",
-      "gguf acceleration",
-      "gguf alpha",
-      "gguf benchmark",
-      "gguf benchmarks",
-      "gguf best practice",
-      "gguf beta",
-      "gguf boost",
-      "gguf ga",
-      "gguf gain",
-      "gguf guidelines",
-      "gguf hardened",
-      "gguf improvement",
-      "gguf instrumented",
-      "gguf observability",
-      "gguf optimization",
-      "gguf pilot",
-      "gguf poc",
-      "gguf profiled",
-      "gguf prototype",
-      "gguf reference architecture",
-      "gguf rollout",
-      "gguf speedup",
-      "gguf telemetry",
-      "gitops",
-      "gitops acceleration",
-      "gitops alpha",
-      "gitops benchmark",
-      "gitops benchmarks",
-      "gitops best practice",
-      "gitops beta",
-      "gitops boost",
-      "gitops ga",
-      "gitops gain",
-      "gitops guidelines",
-      "gitops hardened",
-      "gitops improvement",
-      "gitops instrumented",
-      "gitops observability",
-      "gitops optimization",
-      "gitops pilot",
-      "gitops poc",
-      "gitops profiled",
-      "gitops prototype",
-      "gitops reference architecture",
-      "gitops rollout",
-      "gitops speedup",
-      "gitops telemetry",
-      "go",
-      "go acceleration",
-      "go alpha",
-      "go benchmark",
-      "go benchmarks",
-      "go best practice",
-      "go beta",
-      "go boost",
-      "go ga",
-      "go gain",
-      "go guidelines",
-      "go hardened",
-      "go improvement",
-      "go instrumented",
-      "go observability",
-      "go optimization",
-      "go pilot",
-      "go poc",
-      "go profiled",
-      "go prototype",
-      "go reference architecture",
-      "go rollout",
-      "go speedup",
-      "go telemetry",
-      "gpu-accelerated",
-      "gpu-accelerated acceleration",
-      "gpu-accelerated alpha",
-      "gpu-accelerated benchmark",
-      "gpu-accelerated benchmarks",
-      "gpu-accelerated best practice",
-      "gpu-accelerated beta",
-      "gpu-accelerated boost",
-      "gpu-accelerated ga",
-      "gpu-accelerated gain",
-      "gpu-accelerated guidelines",
-      "gpu-accelerated hardened",
-      "gpu-accelerated improvement",
-      "gpu-accelerated instrumented",
-      "gpu-accelerated observability",
-      "gpu-accelerated optimization",
-      "gpu-accelerated pilot",
-      "gpu-accelerated poc",
-      "gpu-accelerated profiled",
-      "gpu-accelerated prototype",
-      "gpu-accelerated reference architecture",
-      "gpu-accelerated rollout",
-      "gpu-accelerated speedup",
-      "gpu-accelerated telemetry",
-      "graalvm",
-      "graalvm acceleration",
-      "graalvm alpha",
-      "graalvm benchmark",
-      "graalvm benchmarks",
-      "graalvm best practice",
-      "graalvm beta",
-      "graalvm boost",
-      "graalvm ga",
-      "graalvm gain",
-      "graalvm guidelines",
-      "graalvm hardened",
-      "graalvm improvement",
-      "graalvm instrumented",
-      "graalvm observability",
-      "graalvm optimization",
-      "graalvm pilot",
-      "graalvm poc",
-      "graalvm profiled",
-      "graalvm prototype",
-      "graalvm reference architecture",
-      "graalvm rollout",
-      "graalvm speedup",
-      "graalvm telemetry",
-      "graceful degradation",
-      "graceful degradation acceleration",
-      "graceful degradation alpha",
-      "graceful degradation benchmark",
-      "graceful degradation benchmarks",
-      "graceful degradation best practice",
-      "graceful degradation beta",
-      "graceful degradation boost",
-      "graceful degradation ga",
-      "graceful degradation gain",
-      "graceful degradation guidelines",
-      "graceful degradation hardened",
-      "graceful degradation improvement",
-      "graceful degradation instrumented",
-      "graceful degradation observability",
-      "graceful degradation optimization",
-      "graceful degradation pilot",
-      "graceful degradation poc",
-      "graceful degradation profiled",
-      "graceful degradation prototype",
-      "graceful degradation reference architecture",
-      "graceful degradation rollout",
-      "graceful degradation speedup",
-      "graceful degradation telemetry",
-      "grafana",
-      "grafana acceleration",
-      "grafana alpha",
-      "grafana benchmark",
-      "grafana benchmarks",
-      "grafana best practice",
-      "grafana beta",
-      "grafana boost",
-      "grafana ga",
-      "grafana gain",
-      "grafana guidelines",
-      "grafana hardened",
-      "grafana improvement",
-      "grafana instrumented",
-      "grafana observability",
-      "grafana optimization",
-      "grafana pilot",
-      "grafana poc",
-      "grafana profiled",
-      "grafana prototype",
-      "grafana reference architecture",
-      "grafana rollout",
-      "grafana speedup",
-      "grafana telemetry",
-      "grpc",
-      "grpc acceleration",
-      "grpc alpha",
-      "grpc benchmark",
-      "grpc benchmarks",
-      "grpc best practice",
-      "grpc beta",
-      "grpc boost",
-      "grpc ga",
-      "grpc gain",
-      "grpc guidelines",
-      "grpc hardened",
-      "grpc improvement",
-      "grpc instrumented",
-      "grpc observability",
-      "grpc optimization",
-      "grpc pilot",
-      "grpc poc",
-      "grpc profiled",
-      "grpc prototype",
-      "grpc reference architecture",
-      "grpc reflection",
-      "grpc reflection acceleration",
-      "grpc reflection alpha",
-      "grpc reflection benchmark",
-      "grpc reflection benchmarks",
-      "grpc reflection best practice",
-      "grpc reflection beta",
-      "grpc reflection boost",
-      "grpc reflection ga",
-      "grpc reflection gain",
-      "grpc reflection guidelines",
-      "grpc reflection hardened",
-      "grpc reflection improvement",
-      "grpc reflection instrumented",
-      "grpc reflection observability",
-      "grpc reflection optimization",
-      "grpc reflection pilot",
-      "grpc reflection poc",
-      "grpc reflection profiled",
-      "grpc reflection prototype",
-      "grpc reflection reference architecture",
-      "grpc reflection rollout",
-      "grpc reflection speedup",
-      "grpc reflection telemetry",
-      "grpc rollout",
-      "grpc speedup",
-      "grpc telemetry",
-      "guardrails",
-      "guardrails acceleration",
-      "guardrails alpha",
-      "guardrails benchmark",
-      "guardrails benchmarks",
-      "guardrails best practice",
-      "guardrails beta",
-      "guardrails boost",
-      "guardrails ga",
-      "guardrails gain",
-      "guardrails guidelines",
-      "guardrails hardened",
-      "guardrails improvement",
-      "guardrails instrumented",
-      "guardrails observability",
-      "guardrails optimization",
-      "guardrails pilot",
-      "guardrails poc",
-      "guardrails profiled",
-      "guardrails prototype",
-      "guardrails reference architecture",
-      "guardrails rollout",
-      "guardrails speedup",
-      "guardrails telemetry",
-      "helm",
-      "helm acceleration",
-      "helm alpha",
-      "helm benchmark",
-      "helm benchmarks",
-      "helm best practice",
-      "helm beta",
-      "helm boost",
-      "helm ga",
-      "helm gain",
-      "helm guidelines",
-      "helm hardened",
-      "helm improvement",
-      "helm instrumented",
-      "helm observability",
-      "helm optimization",
-      "helm pilot",
-      "helm poc",
-      "helm profiled",
-      "helm prototype",
-      "helm reference architecture",
-      "helm rollout",
-      "helm speedup",
-      "helm telemetry",
-      "hexagonal",
-      "hexagonal acceleration",
-      "hexagonal alpha",
-      "hexagonal benchmark",
-      "hexagonal benchmarks",
-      "hexagonal best practice",
-      "hexagonal beta",
-      "hexagonal boost",
-      "hexagonal ga",
-      "hexagonal gain",
-      "hexagonal guidelines",
-      "hexagonal hardened",
-      "hexagonal improvement",
-      "hexagonal instrumented",
-      "hexagonal observability",
-      "hexagonal optimization",
-      "hexagonal pilot",
-      "hexagonal poc",
-      "hexagonal profiled",
-      "hexagonal prototype",
-      "hexagonal reference architecture",
-      "hexagonal rollout",
-      "hexagonal speedup",
-      "hexagonal telemetry",
-      "high performance",
-      "high performance acceleration",
-      "high performance alpha",
-      "high performance benchmark",
-      "high performance benchmarks",
-      "high performance best practice",
-      "high performance beta",
-      "high performance boost",
-      "high performance ga",
-      "high performance gain",
-      "high performance guidelines",
-      "high performance hardened",
-      "high performance improvement",
-      "high performance instrumented",
-      "high performance observability",
-      "high performance optimization",
-      "high performance pilot",
-      "high performance poc",
-      "high performance profiled",
-      "high performance prototype",
-      "high performance reference architecture",
-      "high performance rollout",
-      "high performance speedup",
-      "high performance telemetry",
-      "hnsw",
-      "hnsw acceleration",
-      "hnsw alpha",
-      "hnsw benchmark",
-      "hnsw benchmarks",
-      "hnsw best practice",
-      "hnsw beta",
-      "hnsw boost",
-      "hnsw ga",
-      "hnsw gain",
-      "hnsw guidelines",
-      "hnsw hardened",
-      "hnsw improvement",
-      "hnsw instrumented",
-      "hnsw observability",
-      "hnsw optimization",
-      "hnsw pilot",
-      "hnsw poc",
-      "hnsw profiled",
-      "hnsw prototype",
-      "hnsw reference architecture",
-      "hnsw rollout",
-      "hnsw speedup",
-      "hnsw telemetry",
-      "horizontal scale",
-      "horizontal scale acceleration",
-      "horizontal scale alpha",
-      "horizontal scale benchmark",
-      "horizontal scale benchmarks",
-      "horizontal scale best practice",
-      "horizontal scale beta",
-      "horizontal scale boost",
-      "horizontal scale ga",
-      "horizontal scale gain",
-      "horizontal scale guidelines",
-      "horizontal scale hardened",
-      "horizontal scale improvement",
-      "horizontal scale instrumented",
-      "horizontal scale observability",
-      "horizontal scale optimization",
-      "horizontal scale pilot",
-      "horizontal scale poc",
-      "horizontal scale profiled",
-      "horizontal scale prototype",
-      "horizontal scale reference architecture",
-      "horizontal scale rollout",
-      "horizontal scale speedup",
-      "horizontal scale telemetry",
-      "hsm",
-      "hsm acceleration",
-      "hsm alpha",
-      "hsm benchmark",
-      "hsm benchmarks",
-      "hsm best practice",
-      "hsm beta",
-      "hsm boost",
-      "hsm ga",
-      "hsm gain",
-      "hsm guidelines",
-      "hsm hardened",
-      "hsm improvement",
-      "hsm instrumented",
-      "hsm observability",
-      "hsm optimization",
-      "hsm pilot",
-      "hsm poc",
-      "hsm profiled",
-      "hsm prototype",
-      "hsm reference architecture",
-      "hsm rollout",
-      "hsm speedup",
-      "hsm telemetry",
-      "http/3",
-      "http/3 acceleration",
-      "http/3 alpha",
-      "http/3 benchmark",
-      "http/3 benchmarks",
-      "http/3 best practice",
-      "http/3 beta",
-      "http/3 boost",
-      "http/3 ga",
-      "http/3 gain",
-      "http/3 guidelines",
-      "http/3 hardened",
-      "http/3 improvement",
-      "http/3 instrumented",
-      "http/3 observability",
-      "http/3 optimization",
-      "http/3 pilot",
-      "http/3 poc",
-      "http/3 profiled",
-      "http/3 prototype",
-      "http/3 reference architecture",
-      "http/3 rollout",
-      "http/3 speedup",
-      "http/3 telemetry",
-      "hybrid search",
-      "hybrid search acceleration",
-      "hybrid search alpha",
-      "hybrid search benchmark",
-      "hybrid search benchmarks",
-      "hybrid search best practice",
-      "hybrid search beta",
-      "hybrid search boost",
-      "hybrid search ga",
-      "hybrid search gain",
-      "hybrid search guidelines",
-      "hybrid search hardened",
-      "hybrid search improvement",
-      "hybrid search instrumented",
-      "hybrid search observability",
-      "hybrid search optimization",
-      "hybrid search pilot",
-      "hybrid search poc",
-      "hybrid search profiled",
-      "hybrid search prototype",
-      "hybrid search reference architecture",
-      "hybrid search rollout",
-      "hybrid search speedup",
-      "hybrid search telemetry",
-      "idempotency key",
-      "idempotency key acceleration",
-      "idempotency key alpha",
-      "idempotency key benchmark",
-      "idempotency key benchmarks",
-      "idempotency key best practice",
-      "idempotency key beta",
-      "idempotency key boost",
-      "idempotency key ga",
-      "idempotency key gain",
-      "idempotency key guidelines",
-      "idempotency key hardened",
-      "idempotency key improvement",
-      "idempotency key instrumented",
-      "idempotency key observability",
-      "idempotency key optimization",
-      "idempotency key pilot",
-      "idempotency key poc",
-      "idempotency key profiled",
-      "idempotency key prototype",
-      "idempotency key reference architecture",
-      "idempotency key rollout",
-      "idempotency key speedup",
-      "idempotency key telemetry",
-      "idempotent",
-      "idempotent acceleration",
-      "idempotent alpha",
-      "idempotent benchmark",
-      "idempotent benchmarks",
-      "idempotent best practice",
-      "idempotent beta",
-      "idempotent boost",
-      "idempotent ga",
-      "idempotent gain",
-      "idempotent guidelines",
-      "idempotent hardened",
-      "idempotent improvement",
-      "idempotent instrumented",
-      "idempotent observability",
-      "idempotent optimization",
-      "idempotent pilot",
-      "idempotent poc",
-      "idempotent profiled",
-      "idempotent prototype",
-      "idempotent reference architecture",
-      "idempotent rollout",
-      "idempotent speedup",
-      "idempotent telemetry",
-      "indexing",
-      "indexing acceleration",
-      "indexing alpha",
-      "indexing benchmark",
-      "indexing benchmarks",
-      "indexing best practice",
-      "indexing beta",
-      "indexing boost",
-      "indexing ga",
-      "indexing gain",
-      "indexing guidelines",
-      "indexing hardened",
-      "indexing improvement",
-      "indexing instrumented",
-      "indexing observability",
-      "indexing optimization",
-      "indexing pilot",
-      "indexing poc",
-      "indexing profiled",
-      "indexing prototype",
-      "indexing reference architecture",
-      "indexing rollout",
-      "indexing speedup",
-      "indexing telemetry",
-      "int8",
-      "int8 acceleration",
-      "int8 alpha",
-      "int8 benchmark",
-      "int8 benchmarks",
-      "int8 best practice",
-      "int8 beta",
-      "int8 boost",
-      "int8 ga",
-      "int8 gain",
-      "int8 guidelines",
-      "int8 hardened",
-      "int8 improvement",
-      "int8 instrumented",
-      "int8 observability",
-      "int8 optimization",
-      "int8 pilot",
-      "int8 poc",
-      "int8 profiled",
-      "int8 prototype",
-      "int8 reference architecture",
-      "int8 rollout",
-      "int8 speedup",
-      "int8 telemetry",
-      "io_uring",
-      "io_uring acceleration",
-      "io_uring alpha",
-      "io_uring benchmark",
-      "io_uring benchmarks",
-      "io_uring best practice",
-      "io_uring beta",
-      "io_uring boost",
-      "io_uring ga",
-      "io_uring gain",
-      "io_uring guidelines",
-      "io_uring hardened",
-      "io_uring improvement",
-      "io_uring instrumented",
-      "io_uring observability",
-      "io_uring optimization",
-      "io_uring pilot",
-      "io_uring poc",
-      "io_uring profiled",
-      "io_uring prototype",
-      "io_uring reference architecture",
-      "io_uring rollout",
-      "io_uring speedup",
-      "io_uring telemetry",
-      "iops",
-      "iops acceleration",
-      "iops alpha",
-      "iops benchmark",
-      "iops benchmarks",
-      "iops best practice",
-      "iops beta",
-      "iops boost",
-      "iops ga",
-      "iops gain",
-      "iops guidelines",
-      "iops hardened",
-      "iops improvement",
-      "iops instrumented",
-      "iops observability",
-      "iops optimization",
-      "iops pilot",
-      "iops poc",
-      "iops profiled",
-      "iops prototype",
-      "iops reference architecture",
-      "iops rollout",
-      "iops speedup",
-      "iops telemetry",
-      "istio",
-      "istio acceleration",
-      "istio alpha",
-      "istio benchmark",
-      "istio benchmarks",
-      "istio best practice",
-      "istio beta",
-      "istio boost",
-      "istio ga",
-      "istio gain",
-      "istio guidelines",
-      "istio hardened",
-      "istio improvement",
-      "istio instrumented",
-      "istio observability",
-      "istio optimization",
-      "istio pilot",
-      "istio poc",
-      "istio profiled",
-      "istio prototype",
-      "istio reference architecture",
-      "istio rollout",
-      "istio speedup",
-      "istio telemetry",
-      "jaeger",
-      "jaeger acceleration",
-      "jaeger alpha",
-      "jaeger benchmark",
-      "jaeger benchmarks",
-      "jaeger best practice",
-      "jaeger beta",
-      "jaeger boost",
-      "jaeger ga",
-      "jaeger gain",
-      "jaeger guidelines",
-      "jaeger hardened",
-      "jaeger improvement",
-      "jaeger instrumented",
-      "jaeger observability",
-      "jaeger optimization",
-      "jaeger pilot",
-      "jaeger poc",
-      "jaeger profiled",
-      "jaeger prototype",
-      "jaeger reference architecture",
-      "jaeger rollout",
-      "jaeger speedup",
-      "jaeger telemetry",
-      "java 21",
-      "java 21 acceleration",
-      "java 21 alpha",
-      "java 21 benchmark",
-      "java 21 benchmarks",
-      "java 21 best practice",
-      "java 21 beta",
-      "java 21 boost",
-      "java 21 ga",
-      "java 21 gain",
-      "java 21 guidelines",
-      "java 21 hardened",
-      "java 21 improvement",
-      "java 21 instrumented",
-      "java 21 observability",
-      "java 21 optimization",
-      "java 21 pilot",
-      "java 21 poc",
-      "java 21 profiled",
-      "java 21 prototype",
-      "java 21 reference architecture",
-      "java 21 rollout",
-      "java 21 speedup",
-      "java 21 telemetry",
-      "jitter",
-      "jitter acceleration",
-      "jitter alpha",
-      "jitter benchmark",
-      "jitter benchmarks",
-      "jitter best practice",
-      "jitter beta",
-      "jitter boost",
-      "jitter ga",
-      "jitter gain",
-      "jitter guidelines",
-      "jitter hardened",
-      "jitter improvement",
-      "jitter instrumented",
-      "jitter observability",
-      "jitter optimization",
-      "jitter pilot",
-      "jitter poc",
-      "jitter profiled",
-      "jitter prototype",
-      "jitter reference architecture",
-      "jitter rollout",
-      "jitter speedup",
-      "jitter telemetry",
-      "jvm",
-      "jvm acceleration",
-      "jvm alpha",
-      "jvm benchmark",
-      "jvm benchmarks",
-      "jvm best practice",
-      "jvm beta",
-      "jvm boost",
-      "jvm ga",
-      "jvm gain",
-      "jvm guidelines",
-      "jvm hardened",
-      "jvm improvement",
-      "jvm instrumented",
-      "jvm observability",
-      "jvm optimization",
-      "jvm pilot",
-      "jvm poc",
-      "jvm profiled",
-      "jvm prototype",
-      "jvm reference architecture",
-      "jvm rollout",
-      "jvm speedup",
-      "jvm telemetry",
-      "jwt",
-      "jwt acceleration",
-      "jwt alpha",
-      "jwt benchmark",
-      "jwt benchmarks",
-      "jwt best practice",
-      "jwt beta",
-      "jwt boost",
-      "jwt ga",
-      "jwt gain",
-      "jwt guidelines",
-      "jwt hardened",
-      "jwt improvement",
-      "jwt instrumented",
-      "jwt observability",
-      "jwt optimization",
-      "jwt pilot",
-      "jwt poc",
-      "jwt profiled",
-      "jwt prototype",
-      "jwt reference architecture",
-      "jwt rollout",
-      "jwt speedup",
-      "jwt telemetry",
-      "kafka",
-      "kafka acceleration",
-      "kafka alpha",
-      "kafka benchmark",
-      "kafka benchmarks",
-      "kafka best practice",
-      "kafka beta",
-      "kafka boost",
-      "kafka ga",
-      "kafka gain",
-      "kafka guidelines",
-      "kafka hardened",
-      "kafka improvement",
-      "kafka instrumented",
-      "kafka observability",
-      "kafka optimization",
-      "kafka pilot",
-      "kafka poc",
-      "kafka profiled",
-      "kafka prototype",
-      "kafka reference architecture",
-      "kafka rollout",
-      "kafka speedup",
-      "kafka telemetry",
-      "kappa architecture",
-      "kappa architecture acceleration",
-      "kappa architecture alpha",
-      "kappa architecture benchmark",
-      "kappa architecture benchmarks",
-      "kappa architecture best practice",
-      "kappa architecture beta",
-      "kappa architecture boost",
-      "kappa architecture ga",
-      "kappa architecture gain",
-      "kappa architecture guidelines",
-      "kappa architecture hardened",
-      "kappa architecture improvement",
-      "kappa architecture instrumented",
-      "kappa architecture observability",
-      "kappa architecture optimization",
-      "kappa architecture pilot",
-      "kappa architecture poc",
-      "kappa architecture profiled",
-      "kappa architecture prototype",
-      "kappa architecture reference architecture",
-      "kappa architecture rollout",
-      "kappa architecture speedup",
-      "kappa architecture telemetry",
-      "key rotation",
-      "key rotation acceleration",
-      "key rotation alpha",
-      "key rotation benchmark",
-      "key rotation benchmarks",
-      "key rotation best practice",
-      "key rotation beta",
-      "key rotation boost",
-      "key rotation ga",
-      "key rotation gain",
-      "key rotation guidelines",
-      "key rotation hardened",
-      "key rotation improvement",
-      "key rotation instrumented",
-      "key rotation observability",
-      "key rotation optimization",
-      "key rotation pilot",
-      "key rotation poc",
-      "key rotation profiled",
-      "key rotation prototype",
-      "key rotation reference architecture",
-      "key rotation rollout",
-      "key rotation speedup",
-      "key rotation telemetry",
-      "kms",
-      "kms acceleration",
-      "kms alpha",
-      "kms benchmark",
-      "kms benchmarks",
-      "kms best practice",
-      "kms beta",
-      "kms boost",
-      "kms ga",
-      "kms gain",
-      "kms guidelines",
-      "kms hardened",
-      "kms improvement",
-      "kms instrumented",
-      "kms observability",
-      "kms optimization",
-      "kms pilot",
-      "kms poc",
-      "kms profiled",
-      "kms prototype",
-      "kms reference architecture",
-      "kms rollout",
-      "kms speedup",
-      "kms telemetry",
-      "kotlin",
-      "kotlin acceleration",
-      "kotlin alpha",
-      "kotlin benchmark",
-      "kotlin benchmarks",
-      "kotlin best practice",
-      "kotlin beta",
-      "kotlin boost",
-      "kotlin ga",
-      "kotlin gain",
-      "kotlin guidelines",
-      "kotlin hardened",
-      "kotlin improvement",
-      "kotlin instrumented",
-      "kotlin observability",
-      "kotlin optimization",
-      "kotlin pilot",
-      "kotlin poc",
-      "kotlin profiled",
-      "kotlin prototype",
-      "kotlin reference architecture",
-      "kotlin rollout",
-      "kotlin speedup",
-      "kotlin telemetry",
-      "kqueue",
-      "kqueue acceleration",
-      "kqueue alpha",
-      "kqueue benchmark",
-      "kqueue benchmarks",
-      "kqueue best practice",
-      "kqueue beta",
-      "kqueue boost",
-      "kqueue ga",
-      "kqueue gain",
-      "kqueue guidelines",
-      "kqueue hardened",
-      "kqueue improvement",
-      "kqueue instrumented",
-      "kqueue observability",
-      "kqueue optimization",
-      "kqueue pilot",
-      "kqueue poc",
-      "kqueue profiled",
-      "kqueue prototype",
-      "kqueue reference architecture",
-      "kqueue rollout",
-      "kqueue speedup",
-      "kqueue telemetry",
-      "kubernetes",
-      "kubernetes acceleration",
-      "kubernetes alpha",
-      "kubernetes benchmark",
-      "kubernetes benchmarks",
-      "kubernetes best practice",
-      "kubernetes beta",
-      "kubernetes boost",
-      "kubernetes ga",
-      "kubernetes gain",
-      "kubernetes guidelines",
-      "kubernetes hardened",
-      "kubernetes improvement",
-      "kubernetes instrumented",
-      "kubernetes observability",
-      "kubernetes optimization",
-      "kubernetes pilot",
-      "kubernetes poc",
-      "kubernetes profiled",
-      "kubernetes prototype",
-      "kubernetes reference architecture",
-      "kubernetes rollout",
-      "kubernetes speedup",
-      "kubernetes telemetry",
-      "lakehouse",
-      "lakehouse acceleration",
-      "lakehouse alpha",
-      "lakehouse benchmark",
-      "lakehouse benchmarks",
-      "lakehouse best practice",
-      "lakehouse beta",
-      "lakehouse boost",
-      "lakehouse ga",
-      "lakehouse gain",
-      "lakehouse guidelines",
-      "lakehouse hardened",
-      "lakehouse improvement",
-      "lakehouse instrumented",
-      "lakehouse observability",
-      "lakehouse optimization",
-      "lakehouse pilot",
-      "lakehouse poc",
-      "lakehouse profiled",
-      "lakehouse prototype",
-      "lakehouse reference architecture",
-      "lakehouse rollout",
-      "lakehouse speedup",
-      "lakehouse telemetry",
-      "lambda",
-      "lambda acceleration",
-      "lambda alpha",
-      "lambda architecture",
-      "lambda architecture acceleration",
-      "lambda architecture alpha",
-      "lambda architecture benchmark",
-      "lambda architecture benchmarks",
-      "lambda architecture best practice",
-      "lambda architecture beta",
-      "lambda architecture boost",
-      "lambda architecture ga",
-      "lambda architecture gain",
-      "lambda architecture guidelines",
-      "lambda architecture hardened",
-      "lambda architecture improvement",
-      "lambda architecture instrumented",
-      "lambda architecture observability",
-      "lambda architecture optimization",
-      "lambda architecture pilot",
-      "lambda architecture poc",
-      "lambda architecture profiled",
-      "lambda architecture prototype",
-      "lambda architecture reference architecture",
-      "lambda architecture rollout",
-      "lambda architecture speedup",
-      "lambda architecture telemetry",
-      "lambda benchmark",
-      "lambda benchmarks",
-      "lambda best practice",
-      "lambda beta",
-      "lambda boost",
-      "lambda ga",
-      "lambda gain",
-      "lambda guidelines",
-      "lambda hardened",
-      "lambda improvement",
-      "lambda instrumented",
-      "lambda observability",
-      "lambda optimization",
-      "lambda pilot",
-      "lambda poc",
-      "lambda profiled",
-      "lambda prototype",
-      "lambda reference architecture",
-      "lambda rollout",
-      "lambda speedup",
-      "lambda telemetry",
-      "lambda@edge",
-      "lambda@edge acceleration",
-      "lambda@edge alpha",
-      "lambda@edge benchmark",
-      "lambda@edge benchmarks",
-      "lambda@edge best practice",
-      "lambda@edge beta",
-      "lambda@edge boost",
-      "lambda@edge ga",
-      "lambda@edge gain",
-      "lambda@edge guidelines",
-      "lambda@edge hardened",
-      "lambda@edge improvement",
-      "lambda@edge instrumented",
-      "lambda@edge observability",
-      "lambda@edge optimization",
-      "lambda@edge pilot",
-      "lambda@edge poc",
-      "lambda@edge profiled",
-      "lambda@edge prototype",
-      "lambda@edge reference architecture",
-      "lambda@edge rollout",
-      "lambda@edge speedup",
-      "lambda@edge telemetry",
-      "latency",
-      "latency acceleration",
-      "latency alpha",
-      "latency benchmark",
-      "latency benchmarks",
-      "latency best practice",
-      "latency beta",
-      "latency boost",
-      "latency ga",
-      "latency gain",
-      "latency guidelines",
-      "latency hardened",
-      "latency improvement",
-      "latency instrumented",
-      "latency observability",
-      "latency optimization",
-      "latency pilot",
-      "latency poc",
-      "latency profiled",
-      "latency prototype",
-      "latency reference architecture",
-      "latency rollout",
-      "latency speedup",
-      "latency telemetry",
-      "linkerd",
-      "linkerd acceleration",
-      "linkerd alpha",
-      "linkerd benchmark",
-      "linkerd benchmarks",
-      "linkerd best practice",
-      "linkerd beta",
-      "linkerd boost",
-      "linkerd ga",
-      "linkerd gain",
-      "linkerd guidelines",
-      "linkerd hardened",
-      "linkerd improvement",
-      "linkerd instrumented",
-      "linkerd observability",
-      "linkerd optimization",
-      "linkerd pilot",
-      "linkerd poc",
-      "linkerd profiled",
-      "linkerd prototype",
-      "linkerd reference architecture",
-      "linkerd rollout",
-      "linkerd speedup",
-      "linkerd telemetry",
-      "load test",
-      "load test acceleration",
-      "load test alpha",
-      "load test benchmark",
-      "load test benchmarks",
-      "load test best practice",
-      "load test beta",
-      "load test boost",
-      "load test ga",
-      "load test gain",
-      "load test guidelines",
-      "load test hardened",
-      "load test improvement",
-      "load test instrumented",
-      "load test observability",
-      "load test optimization",
-      "load test pilot",
-      "load test poc",
-      "load test profiled",
-      "load test prototype",
-      "load test reference architecture",
-      "load test rollout",
-      "load test speedup",
-      "load test telemetry",
-      "logs",
-      "logs acceleration",
-      "logs alpha",
-      "logs benchmark",
-      "logs benchmarks",
-      "logs best practice",
-      "logs beta",
-      "logs boost",
-      "logs ga",
-      "logs gain",
-      "logs guidelines",
-      "logs hardened",
-      "logs improvement",
-      "logs instrumented",
-      "logs observability",
-      "logs optimization",
-      "logs pilot",
-      "logs poc",
-      "logs profiled",
-      "logs prototype",
-      "logs reference architecture",
-      "logs rollout",
-      "logs speedup",
-      "logs telemetry",
-      "loki",
-      "loki acceleration",
-      "loki alpha",
-      "loki benchmark",
-      "loki benchmarks",
-      "loki best practice",
-      "loki beta",
-      "loki boost",
-      "loki ga",
-      "loki gain",
-      "loki guidelines",
-      "loki hardened",
-      "loki improvement",
-      "loki instrumented",
-      "loki observability",
-      "loki optimization",
-      "loki pilot",
-      "loki poc",
-      "loki profiled",
-      "loki prototype",
-      "loki reference architecture",
-      "loki rollout",
-      "loki speedup",
-      "loki telemetry",
-      "low latency",
-      "low latency acceleration",
-      "low latency alpha",
-      "low latency benchmark",
-      "low latency benchmarks",
-      "low latency best practice",
-      "low latency beta",
-      "low latency boost",
-      "low latency ga",
-      "low latency gain",
-      "low latency guidelines",
-      "low latency hardened",
-      "low latency improvement",
-      "low latency instrumented",
-      "low latency observability",
-      "low latency optimization",
-      "low latency pilot",
-      "low latency poc",
-      "low latency profiled",
-      "low latency prototype",
-      "low latency reference architecture",
-      "low latency rollout",
-      "low latency speedup",
-      "low latency telemetry",
-      "mTLS",
-      "mTLS acceleration",
-      "mTLS alpha",
-      "mTLS benchmark",
-      "mTLS benchmarks",
-      "mTLS best practice",
-      "mTLS beta",
-      "mTLS boost",
-      "mTLS ga",
-      "mTLS gain",
-      "mTLS guidelines",
-      "mTLS hardened",
-      "mTLS improvement",
-      "mTLS instrumented",
-      "mTLS observability",
-      "mTLS optimization",
-      "mTLS pilot",
-      "mTLS poc",
-      "mTLS profiled",
-      "mTLS prototype",
-      "mTLS reference architecture",
-      "mTLS rollout",
-      "mTLS speedup",
-      "mTLS telemetry",
-      "memcached",
-      "memcached acceleration",
-      "memcached alpha",
-      "memcached benchmark",
-      "memcached benchmarks",
-      "memcached best practice",
-      "memcached beta",
-      "memcached boost",
-      "memcached ga",
-      "memcached gain",
-      "memcached guidelines",
-      "memcached hardened",
-      "memcached improvement",
-      "memcached instrumented",
-      "memcached observability",
-      "memcached optimization",
-      "memcached pilot",
-      "memcached poc",
-      "memcached profiled",
-      "memcached prototype",
-      "memcached reference architecture",
-      "memcached rollout",
-      "memcached speedup",
-      "memcached telemetry",
-      "message queue",
-      "message queue acceleration",
-      "message queue alpha",
-      "message queue benchmark",
-      "message queue benchmarks",
-      "message queue best practice",
-      "message queue beta",
-      "message queue boost",
-      "message queue ga",
-      "message queue gain",
-      "message queue guidelines",
-      "message queue hardened",
-      "message queue improvement",
-      "message queue instrumented",
-      "message queue observability",
-      "message queue optimization",
-      "message queue pilot",
-      "message queue poc",
-      "message queue profiled",
-      "message queue prototype",
-      "message queue reference architecture",
-      "message queue rollout",
-      "message queue speedup",
-      "message queue telemetry",
-      "metrics",
-      "metrics acceleration",
-      "metrics alpha",
-      "metrics benchmark",
-      "metrics benchmarks",
-      "metrics best practice",
-      "metrics beta",
-      "metrics boost",
-      "metrics ga",
-      "metrics gain",
-      "metrics guidelines",
-      "metrics hardened",
-      "metrics improvement",
-      "metrics instrumented",
-      "metrics observability",
-      "metrics optimization",
-      "metrics pilot",
-      "metrics poc",
-      "metrics profiled",
-      "metrics prototype",
-      "metrics reference architecture",
-      "metrics rollout",
-      "metrics speedup",
-      "metrics telemetry",
-      "mfa",
-      "mfa acceleration",
-      "mfa alpha",
-      "mfa benchmark",
-      "mfa benchmarks",
-      "mfa best practice",
-      "mfa beta",
-      "mfa boost",
-      "mfa ga",
-      "mfa gain",
-      "mfa guidelines",
-      "mfa hardened",
-      "mfa improvement",
-      "mfa instrumented",
-      "mfa observability",
-      "mfa optimization",
-      "mfa pilot",
-      "mfa poc",
-      "mfa profiled",
-      "mfa prototype",
-      "mfa reference architecture",
-      "mfa rollout",
-      "mfa speedup",
-      "mfa telemetry",
-      "microservice",
-      "microservice acceleration",
-      "microservice alpha",
-      "microservice benchmark",
-      "microservice benchmarks",
-      "microservice best practice",
-      "microservice beta",
-      "microservice boost",
-      "microservice ga",
-      "microservice gain",
-      "microservice guidelines",
-      "microservice hardened",
-      "microservice improvement",
-      "microservice instrumented",
-      "microservice observability",
-      "microservice optimization",
-      "microservice pilot",
-      "microservice poc",
-      "microservice profiled",
-      "microservice prototype",
-      "microservice reference architecture",
-      "microservice rollout",
-      "microservice speedup",
-      "microservice telemetry",
-      "microservices",
-      "microservices acceleration",
-      "microservices alpha",
-      "microservices benchmark",
-      "microservices benchmarks",
-      "microservices best practice",
-      "microservices beta",
-      "microservices boost",
-      "microservices ga",
-      "microservices gain",
-      "microservices guidelines",
-      "microservices hardened",
-      "microservices improvement",
-      "microservices instrumented",
-      "microservices observability",
-      "microservices optimization",
-      "microservices pilot",
-      "microservices poc",
-      "microservices profiled",
-      "microservices prototype",
-      "microservices reference architecture",
-      "microservices rollout",
-      "microservices speedup",
-      "microservices telemetry",
-      "mmap",
-      "mmap acceleration",
-      "mmap alpha",
-      "mmap benchmark",
-      "mmap benchmarks",
-      "mmap best practice",
-      "mmap beta",
-      "mmap boost",
-      "mmap ga",
-      "mmap gain",
-      "mmap guidelines",
-      "mmap hardened",
-      "mmap improvement",
-      "mmap instrumented",
-      "mmap observability",
-      "mmap optimization",
-      "mmap pilot",
-      "mmap poc",
-      "mmap profiled",
-      "mmap prototype",
-      "mmap reference architecture",
-      "mmap rollout",
-      "mmap speedup",
-      "mmap telemetry",
-      "monorepo",
-      "monorepo acceleration",
-      "monorepo alpha",
-      "monorepo benchmark",
-      "monorepo benchmarks",
-      "monorepo best practice",
-      "monorepo beta",
-      "monorepo boost",
-      "monorepo ga",
-      "monorepo gain",
-      "monorepo guidelines",
-      "monorepo hardened",
-      "monorepo improvement",
-      "monorepo instrumented",
-      "monorepo observability",
-      "monorepo optimization",
-      "monorepo pilot",
-      "monorepo poc",
-      "monorepo profiled",
-      "monorepo prototype",
-      "monorepo reference architecture",
-      "monorepo rollout",
-      "monorepo speedup",
-      "monorepo telemetry",
-      "mqtt",
-      "mqtt acceleration",
-      "mqtt alpha",
-      "mqtt benchmark",
-      "mqtt benchmarks",
-      "mqtt best practice",
-      "mqtt beta",
-      "mqtt boost",
-      "mqtt ga",
-      "mqtt gain",
-      "mqtt guidelines",
-      "mqtt hardened",
-      "mqtt improvement",
-      "mqtt instrumented",
-      "mqtt observability",
-      "mqtt optimization",
-      "mqtt pilot",
-      "mqtt poc",
-      "mqtt profiled",
-      "mqtt prototype",
-      "mqtt reference architecture",
-      "mqtt rollout",
-      "mqtt speedup",
-      "mqtt telemetry",
-      "nats",
-      "nats acceleration",
-      "nats alpha",
-      "nats benchmark",
-      "nats benchmarks",
-      "nats best practice",
-      "nats beta",
-      "nats boost",
-      "nats ga",
-      "nats gain",
-      "nats guidelines",
-      "nats hardened",
-      "nats improvement",
-      "nats instrumented",
-      "nats observability",
-      "nats optimization",
-      "nats pilot",
-      "nats poc",
-      "nats profiled",
-      "nats prototype",
-      "nats reference architecture",
-      "nats rollout",
-      "nats speedup",
-      "nats telemetry",
-      "neon",
-      "neon acceleration",
-      "neon alpha",
-      "neon benchmark",
-      "neon benchmarks",
-      "neon best practice",
-      "neon beta",
-      "neon boost",
-      "neon ga",
-      "neon gain",
-      "neon guidelines",
-      "neon hardened",
-      "neon improvement",
-      "neon instrumented",
-      "neon observability",
-      "neon optimization",
-      "neon pilot",
-      "neon poc",
-      "neon profiled",
-      "neon prototype",
-      "neon reference architecture",
-      "neon rollout",
-      "neon speedup",
-      "neon telemetry",
-      "node 22",
-      "node 22 acceleration",
-      "node 22 alpha",
-      "node 22 benchmark",
-      "node 22 benchmarks",
-      "node 22 best practice",
-      "node 22 beta",
-      "node 22 boost",
-      "node 22 ga",
-      "node 22 gain",
-      "node 22 guidelines",
-      "node 22 hardened",
-      "node 22 improvement",
-      "node 22 instrumented",
-      "node 22 observability",
-      "node 22 optimization",
-      "node 22 pilot",
-      "node 22 poc",
-      "node 22 profiled",
-      "node 22 prototype",
-      "node 22 reference architecture",
-      "node 22 rollout",
-      "node 22 speedup",
-      "node 22 telemetry",
-      "nx",
-      "nx acceleration",
-      "nx alpha",
-      "nx benchmark",
-      "nx benchmarks",
-      "nx best practice",
-      "nx beta",
-      "nx boost",
-      "nx ga",
-      "nx gain",
-      "nx guidelines",
-      "nx hardened",
-      "nx improvement",
-      "nx instrumented",
-      "nx observability",
-      "nx optimization",
-      "nx pilot",
-      "nx poc",
-      "nx profiled",
-      "nx prototype",
-      "nx reference architecture",
-      "nx rollout",
-      "nx speedup",
-      "nx telemetry",
-      "oauth2",
-      "oauth2 acceleration",
-      "oauth2 alpha",
-      "oauth2 benchmark",
-      "oauth2 benchmarks",
-      "oauth2 best practice",
-      "oauth2 beta",
-      "oauth2 boost",
-      "oauth2 ga",
-      "oauth2 gain",
-      "oauth2 guidelines",
-      "oauth2 hardened",
-      "oauth2 improvement",
-      "oauth2 instrumented",
-      "oauth2 observability",
-      "oauth2 optimization",
-      "oauth2 pilot",
-      "oauth2 poc",
-      "oauth2 profiled",
-      "oauth2 prototype",
-      "oauth2 reference architecture",
-      "oauth2 rollout",
-      "oauth2 speedup",
-      "oauth2 telemetry",
-      "oisf",
-      "oisf acceleration",
-      "oisf alpha",
-      "oisf benchmark",
-      "oisf benchmarks",
-      "oisf best practice",
-      "oisf beta",
-      "oisf boost",
-      "oisf ga",
-      "oisf gain",
-      "oisf guidelines",
-      "oisf hardened",
-      "oisf improvement",
-      "oisf instrumented",
-      "oisf observability",
-      "oisf optimization",
-      "oisf pilot",
-      "oisf poc",
-      "oisf profiled",
-      "oisf prototype",
-      "oisf reference architecture",
-      "oisf rollout",
-      "oisf speedup",
-      "oisf telemetry",
-      "onion architecture",
-      "onion architecture acceleration",
-      "onion architecture alpha",
-      "onion architecture benchmark",
-      "onion architecture benchmarks",
-      "onion architecture best practice",
-      "onion architecture beta",
-      "onion architecture boost",
-      "onion architecture ga",
-      "onion architecture gain",
-      "onion architecture guidelines",
-      "onion architecture hardened",
-      "onion architecture improvement",
-      "onion architecture instrumented",
-      "onion architecture observability",
-      "onion architecture optimization",
-      "onion architecture pilot",
-      "onion architecture poc",
-      "onion architecture profiled",
-      "onion architecture prototype",
-      "onion architecture reference architecture",
-      "onion architecture rollout",
-      "onion architecture speedup",
-      "onion architecture telemetry",
-      "onnx",
-      "onnx acceleration",
-      "onnx alpha",
-      "onnx benchmark",
-      "onnx benchmarks",
-      "onnx best practice",
-      "onnx beta",
-      "onnx boost",
-      "onnx ga",
-      "onnx gain",
-      "onnx guidelines",
-      "onnx hardened",
-      "onnx improvement",
-      "onnx instrumented",
-      "onnx observability",
-      "onnx optimization",
-      "onnx pilot",
-      "onnx poc",
-      "onnx profiled",
-      "onnx prototype",
-      "onnx reference architecture",
-      "onnx rollout",
-      "onnx speedup",
-      "onnx telemetry",
-      "opa",
-      "opa acceleration",
-      "opa alpha",
-      "opa benchmark",
-      "opa benchmarks",
-      "opa best practice",
-      "opa beta",
-      "opa boost",
-      "opa ga",
-      "opa gain",
-      "opa guidelines",
-      "opa hardened",
-      "opa improvement",
-      "opa instrumented",
-      "opa observability",
-      "opa optimization",
-      "opa pilot",
-      "opa poc",
-      "opa profiled",
-      "opa prototype",
-      "opa reference architecture",
-      "opa rollout",
-      "opa speedup",
-      "opa telemetry",
-      "openapi",
-      "openapi acceleration",
-      "openapi alpha",
-      "openapi benchmark",
-      "openapi benchmarks",
-      "openapi best practice",
-      "openapi beta",
-      "openapi boost",
-      "openapi ga",
-      "openapi gain",
-      "openapi guidelines",
-      "openapi hardened",
-      "openapi improvement",
-      "openapi instrumented",
-      "openapi observability",
-      "openapi optimization",
-      "openapi pilot",
-      "openapi poc",
-      "openapi profiled",
-      "openapi prototype",
-      "openapi reference architecture",
-      "openapi rollout",
-      "openapi speedup",
-      "openapi telemetry",
-      "opencl",
-      "opencl acceleration",
-      "opencl alpha",
-      "opencl benchmark",
-      "opencl benchmarks",
-      "opencl best practice",
-      "opencl beta",
-      "opencl boost",
-      "opencl ga",
-      "opencl gain",
-      "opencl guidelines",
-      "opencl hardened",
-      "opencl improvement",
-      "opencl instrumented",
-      "opencl observability",
-      "opencl optimization",
-      "opencl pilot",
-      "opencl poc",
-      "opencl profiled",
-      "opencl prototype",
-      "opencl reference architecture",
-      "opencl rollout",
-      "opencl speedup",
-      "opencl telemetry",
-      "openid connect",
-      "openid connect acceleration",
-      "openid connect alpha",
-      "openid connect benchmark",
-      "openid connect benchmarks",
-      "openid connect best practice",
-      "openid connect beta",
-      "openid connect boost",
-      "openid connect ga",
-      "openid connect gain",
-      "openid connect guidelines",
-      "openid connect hardened",
-      "openid connect improvement",
-      "openid connect instrumented",
-      "openid connect observability",
-      "openid connect optimization",
-      "openid connect pilot",
-      "openid connect poc",
-      "openid connect profiled",
-      "openid connect prototype",
-      "openid connect reference architecture",
-      "openid connect rollout",
-      "openid connect speedup",
-      "openid connect telemetry",
-      "opentelemetry",
-      "opentelemetry acceleration",
-      "opentelemetry alpha",
-      "opentelemetry benchmark",
-      "opentelemetry benchmarks",
-      "opentelemetry best practice",
-      "opentelemetry beta",
-      "opentelemetry boost",
-      "opentelemetry ga",
-      "opentelemetry gain",
-      "opentelemetry guidelines",
-      "opentelemetry hardened",
-      "opentelemetry improvement",
-      "opentelemetry instrumented",
-      "opentelemetry observability",
-      "opentelemetry optimization",
-      "opentelemetry pilot",
-      "opentelemetry poc",
-      "opentelemetry profiled",
-      "opentelemetry prototype",
-      "opentelemetry reference architecture",
-      "opentelemetry rollout",
-      "opentelemetry speedup",
-      "opentelemetry telemetry",
-      "optimization",
-      "optimization acceleration",
-      "optimization alpha",
-      "optimization benchmark",
-      "optimization benchmarks",
-      "optimization best practice",
-      "optimization beta",
-      "optimization boost",
-      "optimization ga",
-      "optimization gain",
-      "optimization guidelines",
-      "optimization hardened",
-      "optimization improvement",
-      "optimization instrumented",
-      "optimization observability",
-      "optimization optimization",
-      "optimization pilot",
-      "optimization poc",
-      "optimization profiled",
-      "optimization prototype",
-      "optimization reference architecture",
-      "optimization rollout",
-      "optimization speedup",
-      "optimization telemetry",
-      "optimize",
-      "optimize acceleration",
-      "optimize alpha",
-      "optimize benchmark",
-      "optimize benchmarks",
-      "optimize best practice",
-      "optimize beta",
-      "optimize boost",
-      "optimize ga",
-      "optimize gain",
-      "optimize guidelines",
-      "optimize hardened",
-      "optimize improvement",
-      "optimize instrumented",
-      "optimize observability",
-      "optimize optimization",
-      "optimize pilot",
-      "optimize poc",
-      "optimize profiled",
-      "optimize prototype",
-      "optimize reference architecture",
-      "optimize rollout",
-      "optimize speedup",
-      "optimize telemetry",
-      "optimized",
-      "optimized acceleration",
-      "optimized alpha",
-      "optimized benchmark",
-      "optimized benchmarks",
-      "optimized best practice",
-      "optimized beta",
-      "optimized boost",
-      "optimized ga",
-      "optimized gain",
-      "optimized guidelines",
-      "optimized hardened",
-      "optimized improvement",
-      "optimized instrumented",
-      "optimized observability",
-      "optimized optimization",
-      "optimized pilot",
-      "optimized poc",
-      "optimized profiled",
-      "optimized prototype",
-      "optimized reference architecture",
-      "optimized rollout",
-      "optimized speedup",
-      "optimized telemetry",
-      "orchestration",
-      "orchestration acceleration",
-      "orchestration alpha",
-      "orchestration benchmark",
-      "orchestration benchmarks",
-      "orchestration best practice",
-      "orchestration beta",
-      "orchestration boost",
-      "orchestration ga",
-      "orchestration gain",
-      "orchestration guidelines",
-      "orchestration hardened",
-      "orchestration improvement",
-      "orchestration instrumented",
-      "orchestration observability",
-      "orchestration optimization",
-      "orchestration pilot",
-      "orchestration poc",
-      "orchestration profiled",
-      "orchestration prototype",
-      "orchestration reference architecture",
-      "orchestration rollout",
-      "orchestration speedup",
-      "orchestration telemetry",
-      "owasp top 10",
-      "owasp top 10 acceleration",
-      "owasp top 10 alpha",
-      "owasp top 10 benchmark",
-      "owasp top 10 benchmarks",
-      "owasp top 10 best practice",
-      "owasp top 10 beta",
-      "owasp top 10 boost",
-      "owasp top 10 ga",
-      "owasp top 10 gain",
-      "owasp top 10 guidelines",
-      "owasp top 10 hardened",
-      "owasp top 10 improvement",
-      "owasp top 10 instrumented",
-      "owasp top 10 observability",
-      "owasp top 10 optimization",
-      "owasp top 10 pilot",
-      "owasp top 10 poc",
-      "owasp top 10 profiled",
-      "owasp top 10 prototype",
-      "owasp top 10 reference architecture",
-      "owasp top 10 rollout",
-      "owasp top 10 speedup",
-      "owasp top 10 telemetry",
-      "p95",
-      "p95 acceleration",
-      "p95 alpha",
-      "p95 benchmark",
-      "p95 benchmarks",
-      "p95 best practice",
-      "p95 beta",
-      "p95 boost",
-      "p95 ga",
-      "p95 gain",
-      "p95 guidelines",
-      "p95 hardened",
-      "p95 improvement",
-      "p95 instrumented",
-      "p95 observability",
-      "p95 optimization",
-      "p95 pilot",
-      "p95 poc",
-      "p95 profiled",
-      "p95 prototype",
-      "p95 reference architecture",
-      "p95 rollout",
-      "p95 speedup",
-      "p95 telemetry",
-      "p99",
-      "p99 acceleration",
-      "p99 alpha",
-      "p99 benchmark",
-      "p99 benchmarks",
-      "p99 best practice",
-      "p99 beta",
-      "p99 boost",
-      "p99 ga",
-      "p99 gain",
-      "p99 guidelines",
-      "p99 hardened",
-      "p99 improvement",
-      "p99 instrumented",
-      "p99 observability",
-      "p99 optimization",
-      "p99 pilot",
-      "p99 poc",
-      "p99 profiled",
-      "p99 prototype",
-      "p99 reference architecture",
-      "p99 rollout",
-      "p99 speedup",
-      "p99 telemetry",
-      "partitioning",
-      "partitioning acceleration",
-      "partitioning alpha",
-      "partitioning benchmark",
-      "partitioning benchmarks",
-      "partitioning best practice",
-      "partitioning beta",
-      "partitioning boost",
-      "partitioning ga",
-      "partitioning gain",
-      "partitioning guidelines",
-      "partitioning hardened",
-      "partitioning improvement",
-      "partitioning instrumented",
-      "partitioning observability",
-      "partitioning optimization",
-      "partitioning pilot",
-      "partitioning poc",
-      "partitioning profiled",
-      "partitioning prototype",
-      "partitioning reference architecture",
-      "partitioning rollout",
-      "partitioning speedup",
-      "partitioning telemetry",
-      "performance",
-      "performance acceleration",
-      "performance alpha",
-      "performance benchmark",
-      "performance benchmarks",
-      "performance best practice",
-      "performance beta",
-      "performance boost",
-      "performance ga",
-      "performance gain",
-      "performance guidelines",
-      "performance hardened",
-      "performance improvement",
-      "performance instrumented",
-      "performance observability",
-      "performance optimization",
-      "performance pilot",
-      "performance poc",
-      "performance profiled",
-      "performance prototype",
-      "performance reference architecture",
-      "performance rollout",
-      "performance speedup",
-      "performance telemetry",
-      "pipeline",
-      "pipeline acceleration",
-      "pipeline alpha",
-      "pipeline benchmark",
-      "pipeline benchmarks",
-      "pipeline best practice",
-      "pipeline beta",
-      "pipeline boost",
-      "pipeline ga",
-      "pipeline gain",
-      "pipeline guidelines",
-      "pipeline hardened",
-      "pipeline improvement",
-      "pipeline instrumented",
-      "pipeline observability",
-      "pipeline optimization",
-      "pipeline pilot",
-      "pipeline poc",
-      "pipeline profiled",
-      "pipeline prototype",
-      "pipeline reference architecture",
-      "pipeline rollout",
-      "pipeline speedup",
-      "pipeline telemetry",
-      "pipelined",
-      "pipelined acceleration",
-      "pipelined alpha",
-      "pipelined benchmark",
-      "pipelined benchmarks",
-      "pipelined best practice",
-      "pipelined beta",
-      "pipelined boost",
-      "pipelined ga",
-      "pipelined gain",
-      "pipelined guidelines",
-      "pipelined hardened",
-      "pipelined improvement",
-      "pipelined instrumented",
-      "pipelined observability",
-      "pipelined optimization",
-      "pipelined pilot",
-      "pipelined poc",
-      "pipelined profiled",
-      "pipelined prototype",
-      "pipelined reference architecture",
-      "pipelined rollout",
-      "pipelined speedup",
-      "pipelined telemetry",
-      "pnpm",
-      "pnpm acceleration",
-      "pnpm alpha",
-      "pnpm benchmark",
-      "pnpm benchmarks",
-      "pnpm best practice",
-      "pnpm beta",
-      "pnpm boost",
-      "pnpm ga",
-      "pnpm gain",
-      "pnpm guidelines",
-      "pnpm hardened",
-      "pnpm improvement",
-      "pnpm instrumented",
-      "pnpm observability",
-      "pnpm optimization",
-      "pnpm pilot",
-      "pnpm poc",
-      "pnpm profiled",
-      "pnpm prototype",
-      "pnpm reference architecture",
-      "pnpm rollout",
-      "pnpm speedup",
-      "pnpm telemetry",
-      "podman",
-      "podman acceleration",
-      "podman alpha",
-      "podman benchmark",
-      "podman benchmarks",
-      "podman best practice",
-      "podman beta",
-      "podman boost",
-      "podman ga",
-      "podman gain",
-      "podman guidelines",
-      "podman hardened",
-      "podman improvement",
-      "podman instrumented",
-      "podman observability",
-      "podman optimization",
-      "podman pilot",
-      "podman poc",
-      "podman profiled",
-      "podman prototype",
-      "podman reference architecture",
-      "podman rollout",
-      "podman speedup",
-      "podman telemetry",
-      "postman collection",
-      "postman collection acceleration",
-      "postman collection alpha",
-      "postman collection benchmark",
-      "postman collection benchmarks",
-      "postman collection best practice",
-      "postman collection beta",
-      "postman collection boost",
-      "postman collection ga",
-      "postman collection gain",
-      "postman collection guidelines",
-      "postman collection hardened",
-      "postman collection improvement",
-      "postman collection instrumented",
-      "postman collection observability",
-      "postman collection optimization",
-      "postman collection pilot",
-      "postman collection poc",
-      "postman collection profiled",
-      "postman collection prototype",
-      "postman collection reference architecture",
-      "postman collection rollout",
-      "postman collection speedup",
-      "postman collection telemetry",
-      "postmortem",
-      "postmortem acceleration",
-      "postmortem alpha",
-      "postmortem benchmark",
-      "postmortem benchmarks",
-      "postmortem best practice",
-      "postmortem beta",
-      "postmortem boost",
-      "postmortem ga",
-      "postmortem gain",
-      "postmortem guidelines",
-      "postmortem hardened",
-      "postmortem improvement",
-      "postmortem instrumented",
-      "postmortem observability",
-      "postmortem optimization",
-      "postmortem pilot",
-      "postmortem poc",
-      "postmortem profiled",
-      "postmortem prototype",
-      "postmortem reference architecture",
-      "postmortem rollout",
-      "postmortem speedup",
-      "postmortem telemetry",
-      "prewarm cache",
-      "prewarm cache acceleration",
-      "prewarm cache alpha",
-      "prewarm cache benchmark",
-      "prewarm cache benchmarks",
-      "prewarm cache best practice",
-      "prewarm cache beta",
-      "prewarm cache boost",
-      "prewarm cache ga",
-      "prewarm cache gain",
-      "prewarm cache guidelines",
-      "prewarm cache hardened",
-      "prewarm cache improvement",
-      "prewarm cache instrumented",
-      "prewarm cache observability",
-      "prewarm cache optimization",
-      "prewarm cache pilot",
-      "prewarm cache poc",
-      "prewarm cache profiled",
-      "prewarm cache prototype",
-      "prewarm cache reference architecture",
-      "prewarm cache rollout",
-      "prewarm cache speedup",
-      "prewarm cache telemetry",
-      "progressive delivery",
-      "progressive delivery acceleration",
-      "progressive delivery alpha",
-      "progressive delivery benchmark",
-      "progressive delivery benchmarks",
-      "progressive delivery best practice",
-      "progressive delivery beta",
-      "progressive delivery boost",
-      "progressive delivery ga",
-      "progressive delivery gain",
-      "progressive delivery guidelines",
-      "progressive delivery hardened",
-      "progressive delivery improvement",
-      "progressive delivery instrumented",
-      "progressive delivery observability",
-      "progressive delivery optimization",
-      "progressive delivery pilot",
-      "progressive delivery poc",
-      "progressive delivery profiled",
-      "progressive delivery prototype",
-      "progressive delivery reference architecture",
-      "progressive delivery rollout",
-      "progressive delivery speedup",
-      "progressive delivery telemetry",
-      "prometheus",
-      "prometheus acceleration",
-      "prometheus alpha",
-      "prometheus benchmark",
-      "prometheus benchmarks",
-      "prometheus best practice",
-      "prometheus beta",
-      "prometheus boost",
-      "prometheus ga",
-      "prometheus gain",
-      "prometheus guidelines",
-      "prometheus hardened",
-      "prometheus improvement",
-      "prometheus instrumented",
-      "prometheus observability",
-      "prometheus optimization",
-      "prometheus pilot",
-      "prometheus poc",
-      "prometheus profiled",
-      "prometheus prototype",
-      "prometheus reference architecture",
-      "prometheus rollout",
-      "prometheus speedup",
-      "prometheus telemetry",
-      "property based testing",
-      "property based testing acceleration",
-      "property based testing alpha",
-      "property based testing benchmark",
-      "property based testing benchmarks",
-      "property based testing best practice",
-      "property based testing beta",
-      "property based testing boost",
-      "property based testing ga",
-      "property based testing gain",
-      "property based testing guidelines",
-      "property based testing hardened",
-      "property based testing improvement",
-      "property based testing instrumented",
-      "property based testing observability",
-      "property based testing optimization",
-      "property based testing pilot",
-      "property based testing poc",
-      "property based testing profiled",
-      "property based testing prototype",
-      "property based testing reference architecture",
-      "property based testing rollout",
-      "property based testing speedup",
-      "property based testing telemetry",
-      "pub-sub",
-      "pub-sub acceleration",
-      "pub-sub alpha",
-      "pub-sub benchmark",
-      "pub-sub benchmarks",
-      "pub-sub best practice",
-      "pub-sub beta",
-      "pub-sub boost",
-      "pub-sub ga",
-      "pub-sub gain",
-      "pub-sub guidelines",
-      "pub-sub hardened",
-      "pub-sub improvement",
-      "pub-sub instrumented",
-      "pub-sub observability",
-      "pub-sub optimization",
-      "pub-sub pilot",
-      "pub-sub poc",
-      "pub-sub profiled",
-      "pub-sub prototype",
-      "pub-sub reference architecture",
-      "pub-sub rollout",
-      "pub-sub speedup",
-      "pub-sub telemetry",
-      "pubsub",
-      "pubsub acceleration",
-      "pubsub alpha",
-      "pubsub benchmark",
-      "pubsub benchmarks",
-      "pubsub best practice",
-      "pubsub beta",
-      "pubsub boost",
-      "pubsub ga",
-      "pubsub gain",
-      "pubsub guidelines",
-      "pubsub hardened",
-      "pubsub improvement",
-      "pubsub instrumented",
-      "pubsub observability",
-      "pubsub optimization",
-      "pubsub pilot",
-      "pubsub poc",
-      "pubsub profiled",
-      "pubsub prototype",
-      "pubsub reference architecture",
-      "pubsub rollout",
-      "pubsub speedup",
-      "pubsub telemetry",
-      "pulsar",
-      "pulsar acceleration",
-      "pulsar alpha",
-      "pulsar benchmark",
-      "pulsar benchmarks",
-      "pulsar best practice",
-      "pulsar beta",
-      "pulsar boost",
-      "pulsar ga",
-      "pulsar gain",
-      "pulsar guidelines",
-      "pulsar hardened",
-      "pulsar improvement",
-      "pulsar instrumented",
-      "pulsar observability",
-      "pulsar optimization",
-      "pulsar pilot",
-      "pulsar poc",
-      "pulsar profiled",
-      "pulsar prototype",
-      "pulsar reference architecture",
-      "pulsar rollout",
-      "pulsar speedup",
-      "pulsar telemetry",
-      "python 3.12",
-      "python 3.12 acceleration",
-      "python 3.12 alpha",
-      "python 3.12 benchmark",
-      "python 3.12 benchmarks",
-      "python 3.12 best practice",
-      "python 3.12 beta",
-      "python 3.12 boost",
-      "python 3.12 ga",
-      "python 3.12 gain",
-      "python 3.12 guidelines",
-      "python 3.12 hardened",
-      "python 3.12 improvement",
-      "python 3.12 instrumented",
-      "python 3.12 observability",
-      "python 3.12 optimization",
-      "python 3.12 pilot",
-      "python 3.12 poc",
-      "python 3.12 profiled",
-      "python 3.12 prototype",
-      "python 3.12 reference architecture",
-      "python 3.12 rollout",
-      "python 3.12 speedup",
-      "python 3.12 telemetry",
-      "qps",
-      "qps acceleration",
-      "qps alpha",
-      "qps benchmark",
-      "qps benchmarks",
-      "qps best practice",
-      "qps beta",
-      "qps boost",
-      "qps ga",
-      "qps gain",
-      "qps guidelines",
-      "qps hardened",
-      "qps improvement",
-      "qps instrumented",
-      "qps observability",
-      "qps optimization",
-      "qps pilot",
-      "qps poc",
-      "qps profiled",
-      "qps prototype",
-      "qps reference architecture",
-      "qps rollout",
-      "qps speedup",
-      "qps telemetry",
-      "quantization",
-      "quantization acceleration",
-      "quantization alpha",
-      "quantization benchmark",
-      "quantization benchmarks",
-      "quantization best practice",
-      "quantization beta",
-      "quantization boost",
-      "quantization ga",
-      "quantization gain",
-      "quantization guidelines",
-      "quantization hardened",
-      "quantization improvement",
-      "quantization instrumented",
-      "quantization observability",
-      "quantization optimization",
-      "quantization pilot",
-      "quantization poc",
-      "quantization profiled",
-      "quantization prototype",
-      "quantization reference architecture",
-      "quantization rollout",
-      "quantization speedup",
-      "quantization telemetry",
-      "quic",
-      "quic acceleration",
-      "quic alpha",
-      "quic benchmark",
-      "quic benchmarks",
-      "quic best practice",
-      "quic beta",
-      "quic boost",
-      "quic ga",
-      "quic gain",
-      "quic guidelines",
-      "quic hardened",
-      "quic improvement",
-      "quic instrumented",
-      "quic observability",
-      "quic optimization",
-      "quic pilot",
-      "quic poc",
-      "quic profiled",
-      "quic prototype",
-      "quic reference architecture",
-      "quic rollout",
-      "quic speedup",
-      "quic telemetry",
-      "quickstart",
-      "quickstart acceleration",
-      "quickstart alpha",
-      "quickstart benchmark",
-      "quickstart benchmarks",
-      "quickstart best practice",
-      "quickstart beta",
-      "quickstart boost",
-      "quickstart ga",
-      "quickstart gain",
-      "quickstart guidelines",
-      "quickstart hardened",
-      "quickstart improvement",
-      "quickstart instrumented",
-      "quickstart observability",
-      "quickstart optimization",
-      "quickstart pilot",
-      "quickstart poc",
-      "quickstart profiled",
-      "quickstart prototype",
-      "quickstart reference architecture",
-      "quickstart rollout",
-      "quickstart speedup",
-      "quickstart telemetry",
-      "rag",
-      "rag acceleration",
-      "rag alpha",
-      "rag benchmark",
-      "rag benchmarks",
-      "rag best practice",
-      "rag beta",
-      "rag boost",
-      "rag ga",
-      "rag gain",
-      "rag guidelines",
-      "rag hardened",
-      "rag improvement",
-      "rag instrumented",
-      "rag observability",
-      "rag optimization",
-      "rag pilot",
-      "rag poc",
-      "rag profiled",
-      "rag prototype",
-      "rag reference architecture",
-      "rag rollout",
-      "rag speedup",
-      "rag telemetry",
-      "rate limit",
-      "rate limit acceleration",
-      "rate limit alpha",
-      "rate limit benchmark",
-      "rate limit benchmarks",
-      "rate limit best practice",
-      "rate limit beta",
-      "rate limit boost",
-      "rate limit ga",
-      "rate limit gain",
-      "rate limit guidelines",
-      "rate limit hardened",
-      "rate limit improvement",
-      "rate limit instrumented",
-      "rate limit observability",
-      "rate limit optimization",
-      "rate limit pilot",
-      "rate limit poc",
-      "rate limit profiled",
-      "rate limit prototype",
-      "rate limit reference architecture",
-      "rate limit rollout",
-      "rate limit speedup",
-      "rate limit telemetry",
-      "rbac",
-      "rbac acceleration",
-      "rbac alpha",
-      "rbac benchmark",
-      "rbac benchmarks",
-      "rbac best practice",
-      "rbac beta",
-      "rbac boost",
-      "rbac ga",
-      "rbac gain",
-      "rbac guidelines",
-      "rbac hardened",
-      "rbac improvement",
-      "rbac instrumented",
-      "rbac observability",
-      "rbac optimization",
-      "rbac pilot",
-      "rbac poc",
-      "rbac profiled",
-      "rbac prototype",
-      "rbac reference architecture",
-      "rbac rollout",
-      "rbac speedup",
-      "rbac telemetry",
-      "rdma",
-      "rdma acceleration",
-      "rdma alpha",
-      "rdma benchmark",
-      "rdma benchmarks",
-      "rdma best practice",
-      "rdma beta",
-      "rdma boost",
-      "rdma ga",
-      "rdma gain",
-      "rdma guidelines",
-      "rdma hardened",
-      "rdma improvement",
-      "rdma instrumented",
-      "rdma observability",
-      "rdma optimization",
-      "rdma pilot",
-      "rdma poc",
-      "rdma profiled",
-      "rdma prototype",
-      "rdma reference architecture",
-      "rdma rollout",
-      "rdma speedup",
-      "rdma telemetry",
-      "realtime",
-      "realtime acceleration",
-      "realtime alpha",
-      "realtime benchmark",
-      "realtime benchmarks",
-      "realtime best practice",
-      "realtime beta",
-      "realtime boost",
-      "realtime ga",
-      "realtime gain",
-      "realtime guidelines",
-      "realtime hardened",
-      "realtime improvement",
-      "realtime instrumented",
-      "realtime observability",
-      "realtime optimization",
-      "realtime pilot",
-      "realtime poc",
-      "realtime profiled",
-      "realtime prototype",
-      "realtime reference architecture",
-      "realtime rollout",
-      "realtime speedup",
-      "realtime telemetry",
-      "redis",
-      "redis acceleration",
-      "redis alpha",
-      "redis benchmark",
-      "redis benchmarks",
-      "redis best practice",
-      "redis beta",
-      "redis boost",
-      "redis ga",
-      "redis gain",
-      "redis guidelines",
-      "redis hardened",
-      "redis improvement",
-      "redis instrumented",
-      "redis observability",
-      "redis optimization",
-      "redis pilot",
-      "redis poc",
-      "redis profiled",
-      "redis prototype",
-      "redis reference architecture",
-      "redis rollout",
-      "redis speedup",
-      "redis telemetry",
-      "rego",
-      "rego acceleration",
-      "rego alpha",
-      "rego benchmark",
-      "rego benchmarks",
-      "rego best practice",
-      "rego beta",
-      "rego boost",
-      "rego ga",
-      "rego gain",
-      "rego guidelines",
-      "rego hardened",
-      "rego improvement",
-      "rego instrumented",
-      "rego observability",
-      "rego optimization",
-      "rego pilot",
-      "rego poc",
-      "rego profiled",
-      "rego prototype",
-      "rego reference architecture",
-      "rego rollout",
-      "rego speedup",
-      "rego telemetry",
-      "rerank",
-      "rerank acceleration",
-      "rerank alpha",
-      "rerank benchmark",
-      "rerank benchmarks",
-      "rerank best practice",
-      "rerank beta",
-      "rerank boost",
-      "rerank ga",
-      "rerank gain",
-      "rerank guidelines",
-      "rerank hardened",
-      "rerank improvement",
-      "rerank instrumented",
-      "rerank observability",
-      "rerank optimization",
-      "rerank pilot",
-      "rerank poc",
-      "rerank profiled",
-      "rerank prototype",
-      "rerank reference architecture",
-      "rerank rollout",
-      "rerank speedup",
-      "rerank telemetry",
-      "resilient",
-      "resilient acceleration",
-      "resilient alpha",
-      "resilient benchmark",
-      "resilient benchmarks",
-      "resilient best practice",
-      "resilient beta",
-      "resilient boost",
-      "resilient ga",
-      "resilient gain",
-      "resilient guidelines",
-      "resilient hardened",
-      "resilient improvement",
-      "resilient instrumented",
-      "resilient observability",
-      "resilient optimization",
-      "resilient pilot",
-      "resilient poc",
-      "resilient profiled",
-      "resilient prototype",
-      "resilient reference architecture",
-      "resilient rollout",
-      "resilient speedup",
-      "resilient telemetry",
-      "retry",
-      "retry acceleration",
-      "retry alpha",
-      "retry benchmark",
-      "retry benchmarks",
-      "retry best practice",
-      "retry beta",
-      "retry boost",
-      "retry ga",
-      "retry gain",
-      "retry guidelines",
-      "retry hardened",
-      "retry improvement",
-      "retry instrumented",
-      "retry observability",
-      "retry optimization",
-      "retry pilot",
-      "retry poc",
-      "retry profiled",
-      "retry prototype",
-      "retry reference architecture",
-      "retry rollout",
-      "retry speedup",
-      "retry telemetry",
-      "rocm",
-      "rocm acceleration",
-      "rocm alpha",
-      "rocm benchmark",
-      "rocm benchmarks",
-      "rocm best practice",
-      "rocm beta",
-      "rocm boost",
-      "rocm ga",
-      "rocm gain",
-      "rocm guidelines",
-      "rocm hardened",
-      "rocm improvement",
-      "rocm instrumented",
-      "rocm observability",
-      "rocm optimization",
-      "rocm pilot",
-      "rocm poc",
-      "rocm profiled",
-      "rocm prototype",
-      "rocm reference architecture",
-      "rocm rollout",
-      "rocm speedup",
-      "rocm telemetry",
-      "rollup",
-      "rollup acceleration",
-      "rollup alpha",
-      "rollup benchmark",
-      "rollup benchmarks",
-      "rollup best practice",
-      "rollup beta",
-      "rollup boost",
-      "rollup ga",
-      "rollup gain",
-      "rollup guidelines",
-      "rollup hardened",
-      "rollup improvement",
-      "rollup instrumented",
-      "rollup observability",
-      "rollup optimization",
-      "rollup pilot",
-      "rollup poc",
-      "rollup profiled",
-      "rollup prototype",
-      "rollup reference architecture",
-      "rollup rollout",
-      "rollup speedup",
-      "rollup telemetry",
-      "row store",
-      "row store acceleration",
-      "row store alpha",
-      "row store benchmark",
-      "row store benchmarks",
-      "row store best practice",
-      "row store beta",
-      "row store boost",
-      "row store ga",
-      "row store gain",
-      "row store guidelines",
-      "row store hardened",
-      "row store improvement",
-      "row store instrumented",
-      "row store observability",
-      "row store optimization",
-      "row store pilot",
-      "row store poc",
-      "row store profiled",
-      "row store prototype",
-      "row store reference architecture",
-      "row store rollout",
-      "row store speedup",
-      "row store telemetry",
-      "rps",
-      "rps acceleration",
-      "rps alpha",
-      "rps benchmark",
-      "rps benchmarks",
-      "rps best practice",
-      "rps beta",
-      "rps boost",
-      "rps ga",
-      "rps gain",
-      "rps guidelines",
-      "rps hardened",
-      "rps improvement",
-      "rps instrumented",
-      "rps observability",
-      "rps optimization",
-      "rps pilot",
-      "rps poc",
-      "rps profiled",
-      "rps prototype",
-      "rps reference architecture",
-      "rps rollout",
-      "rps speedup",
-      "rps telemetry",
-      "rust",
-      "rust acceleration",
-      "rust alpha",
-      "rust benchmark",
-      "rust benchmarks",
-      "rust best practice",
-      "rust beta",
-      "rust boost",
-      "rust ga",
-      "rust gain",
-      "rust guidelines",
-      "rust hardened",
-      "rust improvement",
-      "rust instrumented",
-      "rust observability",
-      "rust optimization",
-      "rust pilot",
-      "rust poc",
-      "rust profiled",
-      "rust prototype",
-      "rust reference architecture",
-      "rust rollout",
-      "rust speedup",
-      "rust telemetry",
-      "saga",
-      "saga acceleration",
-      "saga alpha",
-      "saga benchmark",
-      "saga benchmarks",
-      "saga best practice",
-      "saga beta",
-      "saga boost",
-      "saga ga",
-      "saga gain",
-      "saga guidelines",
-      "saga hardened",
-      "saga improvement",
-      "saga instrumented",
-      "saga observability",
-      "saga optimization",
-      "saga pilot",
-      "saga poc",
-      "saga profiled",
-      "saga prototype",
-      "saga reference architecture",
-      "saga rollout",
-      "saga speedup",
-      "saga telemetry",
-      "sast",
-      "sast acceleration",
-      "sast alpha",
-      "sast benchmark",
-      "sast benchmarks",
-      "sast best practice",
-      "sast beta",
-      "sast boost",
-      "sast ga",
-      "sast gain",
-      "sast guidelines",
-      "sast hardened",
-      "sast improvement",
-      "sast instrumented",
-      "sast observability",
-      "sast optimization",
-      "sast pilot",
-      "sast poc",
-      "sast profiled",
-      "sast prototype",
-      "sast reference architecture",
-      "sast rollout",
-      "sast speedup",
-      "sast telemetry",
-      "sbom",
-      "sbom acceleration",
-      "sbom alpha",
-      "sbom benchmark",
-      "sbom benchmarks",
-      "sbom best practice",
-      "sbom beta",
-      "sbom boost",
-      "sbom ga",
-      "sbom gain",
-      "sbom guidelines",
-      "sbom hardened",
-      "sbom improvement",
-      "sbom instrumented",
-      "sbom observability",
-      "sbom optimization",
-      "sbom pilot",
-      "sbom poc",
-      "sbom profiled",
-      "sbom prototype",
-      "sbom reference architecture",
-      "sbom rollout",
-      "sbom speedup",
-      "sbom telemetry",
-      "scalable",
-      "scalable acceleration",
-      "scalable alpha",
-      "scalable benchmark",
-      "scalable benchmarks",
-      "scalable best practice",
-      "scalable beta",
-      "scalable boost",
-      "scalable ga",
-      "scalable gain",
-      "scalable guidelines",
-      "scalable hardened",
-      "scalable improvement",
-      "scalable instrumented",
-      "scalable observability",
-      "scalable optimization",
-      "scalable pilot",
-      "scalable poc",
-      "scalable profiled",
-      "scalable prototype",
-      "scalable reference architecture",
-      "scalable rollout",
-      "scalable speedup",
-      "scalable telemetry",
-      "scale out",
-      "scale out acceleration",
-      "scale out alpha",
-      "scale out benchmark",
-      "scale out benchmarks",
-      "scale out best practice",
-      "scale out beta",
-      "scale out boost",
-      "scale out ga",
-      "scale out gain",
-      "scale out guidelines",
-      "scale out hardened",
-      "scale out improvement",
-      "scale out instrumented",
-      "scale out observability",
-      "scale out optimization",
-      "scale out pilot",
-      "scale out poc",
-      "scale out profiled",
-      "scale out prototype",
-      "scale out reference architecture",
-      "scale out rollout",
-      "scale out speedup",
-      "scale out telemetry",
-      "scale up",
-      "scale up acceleration",
-      "scale up alpha",
-      "scale up benchmark",
-      "scale up benchmarks",
-      "scale up best practice",
-      "scale up beta",
-      "scale up boost",
-      "scale up ga",
-      "scale up gain",
-      "scale up guidelines",
-      "scale up hardened",
-      "scale up improvement",
-      "scale up instrumented",
-      "scale up observability",
-      "scale up optimization",
-      "scale up pilot",
-      "scale up poc",
-      "scale up profiled",
-      "scale up prototype",
-      "scale up reference architecture",
-      "scale up rollout",
-      "scale up speedup",
-      "scale up telemetry",
-      "scaling",
-      "scaling acceleration",
-      "scaling alpha",
-      "scaling benchmark",
-      "scaling benchmarks",
-      "scaling best practice",
-      "scaling beta",
-      "scaling boost",
-      "scaling ga",
-      "scaling gain",
-      "scaling guidelines",
-      "scaling hardened",
-      "scaling improvement",
-      "scaling instrumented",
-      "scaling observability",
-      "scaling optimization",
-      "scaling pilot",
-      "scaling poc",
-      "scaling profiled",
-      "scaling prototype",
-      "scaling reference architecture",
-      "scaling rollout",
-      "scaling speedup",
-      "scaling telemetry",
-      "sdk",
-      "sdk acceleration",
-      "sdk alpha",
-      "sdk benchmark",
-      "sdk benchmarks",
-      "sdk best practice",
-      "sdk beta",
-      "sdk boost",
-      "sdk ga",
-      "sdk gain",
-      "sdk guidelines",
-      "sdk hardened",
-      "sdk improvement",
-      "sdk instrumented",
-      "sdk observability",
-      "sdk optimization",
-      "sdk pilot",
-      "sdk poc",
-      "sdk profiled",
-      "sdk prototype",
-      "sdk reference architecture",
-      "sdk rollout",
-      "sdk speedup",
-      "sdk telemetry",
-      "secure",
-      "secure acceleration",
-      "secure alpha",
-      "secure benchmark",
-      "secure benchmarks",
-      "secure best practice",
-      "secure beta",
-      "secure boost",
-      "secure ga",
-      "secure gain",
-      "secure guidelines",
-      "secure hardened",
-      "secure improvement",
-      "secure instrumented",
-      "secure observability",
-      "secure optimization",
-      "secure pilot",
-      "secure poc",
-      "secure profiled",
-      "secure prototype",
-      "secure reference architecture",
-      "secure rollout",
-      "secure speedup",
-      "secure telemetry",
-      "self healing",
-      "self healing acceleration",
-      "self healing alpha",
-      "self healing benchmark",
-      "self healing benchmarks",
-      "self healing best practice",
-      "self healing beta",
-      "self healing boost",
-      "self healing ga",
-      "self healing gain",
-      "self healing guidelines",
-      "self healing hardened",
-      "self healing improvement",
-      "self healing instrumented",
-      "self healing observability",
-      "self healing optimization",
-      "self healing pilot",
-      "self healing poc",
-      "self healing profiled",
-      "self healing prototype",
-      "self healing reference architecture",
-      "self healing rollout",
-      "self healing speedup",
-      "self healing telemetry",
-      "serverless",
-      "serverless acceleration",
-      "serverless alpha",
-      "serverless benchmark",
-      "serverless benchmarks",
-      "serverless best practice",
-      "serverless beta",
-      "serverless boost",
-      "serverless ga",
-      "serverless gain",
-      "serverless guidelines",
-      "serverless hardened",
-      "serverless improvement",
-      "serverless instrumented",
-      "serverless observability",
-      "serverless optimization",
-      "serverless pilot",
-      "serverless poc",
-      "serverless profiled",
-      "serverless prototype",
-      "serverless reference architecture",
-      "serverless rollout",
-      "serverless speedup",
-      "serverless telemetry",
-      "service mesh",
-      "service mesh acceleration",
-      "service mesh alpha",
-      "service mesh benchmark",
-      "service mesh benchmarks",
-      "service mesh best practice",
-      "service mesh beta",
-      "service mesh boost",
-      "service mesh ga",
-      "service mesh gain",
-      "service mesh guidelines",
-      "service mesh hardened",
-      "service mesh improvement",
-      "service mesh instrumented",
-      "service mesh observability",
-      "service mesh optimization",
-      "service mesh pilot",
-      "service mesh poc",
-      "service mesh profiled",
-      "service mesh prototype",
-      "service mesh reference architecture",
-      "service mesh rollout",
-      "service mesh speedup",
-      "service mesh telemetry",
-      "shadow traffic",
-      "shadow traffic acceleration",
-      "shadow traffic alpha",
-      "shadow traffic benchmark",
-      "shadow traffic benchmarks",
-      "shadow traffic best practice",
-      "shadow traffic beta",
-      "shadow traffic boost",
-      "shadow traffic ga",
-      "shadow traffic gain",
-      "shadow traffic guidelines",
-      "shadow traffic hardened",
-      "shadow traffic improvement",
-      "shadow traffic instrumented",
-      "shadow traffic observability",
-      "shadow traffic optimization",
-      "shadow traffic pilot",
-      "shadow traffic poc",
-      "shadow traffic profiled",
-      "shadow traffic prototype",
-      "shadow traffic reference architecture",
-      "shadow traffic rollout",
-      "shadow traffic speedup",
-      "shadow traffic telemetry",
-      "sigstore",
-      "sigstore acceleration",
-      "sigstore alpha",
-      "sigstore benchmark",
-      "sigstore benchmarks",
-      "sigstore best practice",
-      "sigstore beta",
-      "sigstore boost",
-      "sigstore ga",
-      "sigstore gain",
-      "sigstore guidelines",
-      "sigstore hardened",
-      "sigstore improvement",
-      "sigstore instrumented",
-      "sigstore observability",
-      "sigstore optimization",
-      "sigstore pilot",
-      "sigstore poc",
-      "sigstore profiled",
-      "sigstore prototype",
-      "sigstore reference architecture",
-      "sigstore rollout",
-      "sigstore speedup",
-      "sigstore telemetry",
-      "simd",
-      "simd acceleration",
-      "simd alpha",
-      "simd benchmark",
-      "simd benchmarks",
-      "simd best practice",
-      "simd beta",
-      "simd boost",
-      "simd ga",
-      "simd gain",
-      "simd guidelines",
-      "simd hardened",
-      "simd improvement",
-      "simd instrumented",
-      "simd observability",
-      "simd optimization",
-      "simd pilot",
-      "simd poc",
-      "simd profiled",
-      "simd prototype",
-      "simd reference architecture",
-      "simd rollout",
-      "simd speedup",
-      "simd telemetry",
-      "sla",
-      "sla acceleration",
-      "sla alpha",
-      "sla benchmark",
-      "sla benchmarks",
-      "sla best practice",
-      "sla beta",
-      "sla boost",
-      "sla ga",
-      "sla gain",
-      "sla guidelines",
-      "sla hardened",
-      "sla improvement",
-      "sla instrumented",
-      "sla observability",
-      "sla optimization",
-      "sla pilot",
-      "sla poc",
-      "sla profiled",
-      "sla prototype",
-      "sla reference architecture",
-      "sla rollout",
-      "sla speedup",
-      "sla telemetry",
-      "sli",
-      "sli acceleration",
-      "sli alpha",
-      "sli benchmark",
-      "sli benchmarks",
-      "sli best practice",
-      "sli beta",
-      "sli boost",
-      "sli ga",
-      "sli gain",
-      "sli guidelines",
-      "sli hardened",
-      "sli improvement",
-      "sli instrumented",
-      "sli observability",
-      "sli optimization",
-      "sli pilot",
-      "sli poc",
-      "sli profiled",
-      "sli prototype",
-      "sli reference architecture",
-      "sli rollout",
-      "sli speedup",
-      "sli telemetry",
-      "slo",
-      "slo acceleration",
-      "slo alpha",
-      "slo benchmark",
-      "slo benchmarks",
-      "slo best practice",
-      "slo beta",
-      "slo boost",
-      "slo ga",
-      "slo gain",
-      "slo guidelines",
-      "slo hardened",
-      "slo improvement",
-      "slo instrumented",
-      "slo observability",
-      "slo optimization",
-      "slo pilot",
-      "slo poc",
-      "slo profiled",
-      "slo prototype",
-      "slo reference architecture",
-      "slo rollout",
-      "slo speedup",
-      "slo telemetry",
-      "snapshot tests",
-      "snapshot tests acceleration",
-      "snapshot tests alpha",
-      "snapshot tests benchmark",
-      "snapshot tests benchmarks",
-      "snapshot tests best practice",
-      "snapshot tests beta",
-      "snapshot tests boost",
-      "snapshot tests ga",
-      "snapshot tests gain",
-      "snapshot tests guidelines",
-      "snapshot tests hardened",
-      "snapshot tests improvement",
-      "snapshot tests instrumented",
-      "snapshot tests observability",
-      "snapshot tests optimization",
-      "snapshot tests pilot",
-      "snapshot tests poc",
-      "snapshot tests profiled",
-      "snapshot tests prototype",
-      "snapshot tests reference architecture",
-      "snapshot tests rollout",
-      "snapshot tests speedup",
-      "snapshot tests telemetry",
-      "snowflake schema",
-      "snowflake schema acceleration",
-      "snowflake schema alpha",
-      "snowflake schema benchmark",
-      "snowflake schema benchmarks",
-      "snowflake schema best practice",
-      "snowflake schema beta",
-      "snowflake schema boost",
-      "snowflake schema ga",
-      "snowflake schema gain",
-      "snowflake schema guidelines",
-      "snowflake schema hardened",
-      "snowflake schema improvement",
-      "snowflake schema instrumented",
-      "snowflake schema observability",
-      "snowflake schema optimization",
-      "snowflake schema pilot",
-      "snowflake schema poc",
-      "snowflake schema profiled",
-      "snowflake schema prototype",
-      "snowflake schema reference architecture",
-      "snowflake schema rollout",
-      "snowflake schema speedup",
-      "snowflake schema telemetry",
-      "soak test",
-      "soak test acceleration",
-      "soak test alpha",
-      "soak test benchmark",
-      "soak test benchmarks",
-      "soak test best practice",
-      "soak test beta",
-      "soak test boost",
-      "soak test ga",
-      "soak test gain",
-      "soak test guidelines",
-      "soak test hardened",
-      "soak test improvement",
-      "soak test instrumented",
-      "soak test observability",
-      "soak test optimization",
-      "soak test pilot",
-      "soak test poc",
-      "soak test profiled",
-      "soak test prototype",
-      "soak test reference architecture",
-      "soak test rollout",
-      "soak test speedup",
-      "soak test telemetry",
-      "sse",
-      "sse acceleration",
-      "sse alpha",
-      "sse benchmark",
-      "sse benchmarks",
-      "sse best practice",
-      "sse beta",
-      "sse boost",
-      "sse ga",
-      "sse gain",
-      "sse guidelines",
-      "sse hardened",
-      "sse improvement",
-      "sse instrumented",
-      "sse observability",
-      "sse optimization",
-      "sse pilot",
-      "sse poc",
-      "sse profiled",
-      "sse prototype",
-      "sse reference architecture",
-      "sse rollout",
-      "sse speedup",
-      "sse telemetry",
-      "sse4",
-      "sse4 acceleration",
-      "sse4 alpha",
-      "sse4 benchmark",
-      "sse4 benchmarks",
-      "sse4 best practice",
-      "sse4 beta",
-      "sse4 boost",
-      "sse4 ga",
-      "sse4 gain",
-      "sse4 guidelines",
-      "sse4 hardened",
-      "sse4 improvement",
-      "sse4 instrumented",
-      "sse4 observability",
-      "sse4 optimization",
-      "sse4 pilot",
-      "sse4 poc",
-      "sse4 profiled",
-      "sse4 prototype",
-      "sse4 reference architecture",
-      "sse4 rollout",
-      "sse4 speedup",
-      "sse4 telemetry",
-      "sso",
-      "sso acceleration",
-      "sso alpha",
-      "sso benchmark",
-      "sso benchmarks",
-      "sso best practice",
-      "sso beta",
-      "sso boost",
-      "sso ga",
-      "sso gain",
-      "sso guidelines",
-      "sso hardened",
-      "sso improvement",
-      "sso instrumented",
-      "sso observability",
-      "sso optimization",
-      "sso pilot",
-      "sso poc",
-      "sso profiled",
-      "sso prototype",
-      "sso reference architecture",
-      "sso rollout",
-      "sso speedup",
-      "sso telemetry",
-      "star schema",
-      "star schema acceleration",
-      "star schema alpha",
-      "star schema benchmark",
-      "star schema benchmarks",
-      "star schema best practice",
-      "star schema beta",
-      "star schema boost",
-      "star schema ga",
-      "star schema gain",
-      "star schema guidelines",
-      "star schema hardened",
-      "star schema improvement",
-      "star schema instrumented",
-      "star schema observability",
-      "star schema optimization",
-      "star schema pilot",
-      "star schema poc",
-      "star schema profiled",
-      "star schema prototype",
-      "star schema reference architecture",
-      "star schema rollout",
-      "star schema speedup",
-      "star schema telemetry",
-      "streaming",
-      "streaming acceleration",
-      "streaming alpha",
-      "streaming benchmark",
-      "streaming benchmarks",
-      "streaming best practice",
-      "streaming beta",
-      "streaming boost",
-      "streaming ga",
-      "streaming gain",
-      "streaming guidelines",
-      "streaming hardened",
-      "streaming improvement",
-      "streaming instrumented",
-      "streaming observability",
-      "streaming optimization",
-      "streaming pilot",
-      "streaming poc",
-      "streaming profiled",
-      "streaming prototype",
-      "streaming reference architecture",
-      "streaming rollout",
-      "streaming speedup",
-      "streaming telemetry",
-      "supply chain security",
-      "supply chain security acceleration",
-      "supply chain security alpha",
-      "supply chain security benchmark",
-      "supply chain security benchmarks",
-      "supply chain security best practice",
-      "supply chain security beta",
-      "supply chain security boost",
-      "supply chain security ga",
-      "supply chain security gain",
-      "supply chain security guidelines",
-      "supply chain security hardened",
-      "supply chain security improvement",
-      "supply chain security instrumented",
-      "supply chain security observability",
-      "supply chain security optimization",
-      "supply chain security pilot",
-      "supply chain security poc",
-      "supply chain security profiled",
-      "supply chain security prototype",
-      "supply chain security reference architecture",
-      "supply chain security rollout",
-      "supply chain security speedup",
-      "supply chain security telemetry",
-      "swift",
-      "swift acceleration",
-      "swift alpha",
-      "swift benchmark",
-      "swift benchmarks",
-      "swift best practice",
-      "swift beta",
-      "swift boost",
-      "swift ga",
-      "swift gain",
-      "swift guidelines",
-      "swift hardened",
-      "swift improvement",
-      "swift instrumented",
-      "swift observability",
-      "swift optimization",
-      "swift pilot",
-      "swift poc",
-      "swift profiled",
-      "swift prototype",
-      "swift reference architecture",
-      "swift rollout",
-      "swift speedup",
-      "swift telemetry",
-      "tail latency",
-      "tail latency acceleration",
-      "tail latency alpha",
-      "tail latency benchmark",
-      "tail latency benchmarks",
-      "tail latency best practice",
-      "tail latency beta",
-      "tail latency boost",
-      "tail latency ga",
-      "tail latency gain",
-      "tail latency guidelines",
-      "tail latency hardened",
-      "tail latency improvement",
-      "tail latency instrumented",
-      "tail latency observability",
-      "tail latency optimization",
-      "tail latency pilot",
-      "tail latency poc",
-      "tail latency profiled",
-      "tail latency prototype",
-      "tail latency reference architecture",
-      "tail latency rollout",
-      "tail latency speedup",
-      "tail latency telemetry",
-      "tamper evident",
-      "tamper evident acceleration",
-      "tamper evident alpha",
-      "tamper evident benchmark",
-      "tamper evident benchmarks",
-      "tamper evident best practice",
-      "tamper evident beta",
-      "tamper evident boost",
-      "tamper evident ga",
-      "tamper evident gain",
-      "tamper evident guidelines",
-      "tamper evident hardened",
-      "tamper evident improvement",
-      "tamper evident instrumented",
-      "tamper evident observability",
-      "tamper evident optimization",
-      "tamper evident pilot",
-      "tamper evident poc",
-      "tamper evident profiled",
-      "tamper evident prototype",
-      "tamper evident reference architecture",
-      "tamper evident rollout",
-      "tamper evident speedup",
-      "tamper evident telemetry",
-      "tempo",
-      "tempo acceleration",
-      "tempo alpha",
-      "tempo benchmark",
-      "tempo benchmarks",
-      "tempo best practice",
-      "tempo beta",
-      "tempo boost",
-      "tempo ga",
-      "tempo gain",
-      "tempo guidelines",
-      "tempo hardened",
-      "tempo improvement",
-      "tempo instrumented",
-      "tempo observability",
-      "tempo optimization",
-      "tempo pilot",
-      "tempo poc",
-      "tempo profiled",
-      "tempo prototype",
-      "tempo reference architecture",
-      "tempo rollout",
-      "tempo speedup",
-      "tempo telemetry",
-      "tensorrt",
-      "tensorrt acceleration",
-      "tensorrt alpha",
-      "tensorrt benchmark",
-      "tensorrt benchmarks",
-      "tensorrt best practice",
-      "tensorrt beta",
-      "tensorrt boost",
-      "tensorrt ga",
-      "tensorrt gain",
-      "tensorrt guidelines",
-      "tensorrt hardened",
-      "tensorrt improvement",
-      "tensorrt instrumented",
-      "tensorrt observability",
-      "tensorrt optimization",
-      "tensorrt pilot",
-      "tensorrt poc",
-      "tensorrt profiled",
-      "tensorrt prototype",
-      "tensorrt reference architecture",
-      "tensorrt rollout",
-      "tensorrt speedup",
-      "tensorrt telemetry",
-      "throttle",
-      "throttle acceleration",
-      "throttle alpha",
-      "throttle benchmark",
-      "throttle benchmarks",
-      "throttle best practice",
-      "throttle beta",
-      "throttle boost",
-      "throttle ga",
-      "throttle gain",
-      "throttle guidelines",
-      "throttle hardened",
-      "throttle improvement",
-      "throttle instrumented",
-      "throttle observability",
-      "throttle optimization",
-      "throttle pilot",
-      "throttle poc",
-      "throttle profiled",
-      "throttle prototype",
-      "throttle reference architecture",
-      "throttle rollout",
-      "throttle speedup",
-      "throttle telemetry",
-      "throughput",
-      "throughput acceleration",
-      "throughput alpha",
-      "throughput benchmark",
-      "throughput benchmarks",
-      "throughput best practice",
-      "throughput beta",
-      "throughput boost",
-      "throughput ga",
-      "throughput gain",
-      "throughput guidelines",
-      "throughput hardened",
-      "throughput improvement",
-      "throughput instrumented",
-      "throughput observability",
-      "throughput optimization",
-      "throughput pilot",
-      "throughput poc",
-      "throughput profiled",
-      "throughput prototype",
-      "throughput reference architecture",
-      "throughput rollout",
-      "throughput speedup",
-      "throughput telemetry",
-      "tool use",
-      "tool use acceleration",
-      "tool use alpha",
-      "tool use benchmark",
-      "tool use benchmarks",
-      "tool use best practice",
-      "tool use beta",
-      "tool use boost",
-      "tool use ga",
-      "tool use gain",
-      "tool use guidelines",
-      "tool use hardened",
-      "tool use improvement",
-      "tool use instrumented",
-      "tool use observability",
-      "tool use optimization",
-      "tool use pilot",
-      "tool use poc",
-      "tool use profiled",
-      "tool use prototype",
-      "tool use reference architecture",
-      "tool use rollout",
-      "tool use speedup",
-      "tool use telemetry",
-      "traces",
-      "traces acceleration",
-      "traces alpha",
-      "traces benchmark",
-      "traces benchmarks",
-      "traces best practice",
-      "traces beta",
-      "traces boost",
-      "traces ga",
-      "traces gain",
-      "traces guidelines",
-      "traces hardened",
-      "traces improvement",
-      "traces instrumented",
-      "traces observability",
-      "traces optimization",
-      "traces pilot",
-      "traces poc",
-      "traces profiled",
-      "traces prototype",
-      "traces reference architecture",
-      "traces rollout",
-      "traces speedup",
-      "traces telemetry",
-      "transformer",
-      "transformer acceleration",
-      "transformer alpha",
-      "transformer benchmark",
-      "transformer benchmarks",
-      "transformer best practice",
-      "transformer beta",
-      "transformer boost",
-      "transformer ga",
-      "transformer gain",
-      "transformer guidelines",
-      "transformer hardened",
-      "transformer improvement",
-      "transformer instrumented",
-      "transformer observability",
-      "transformer optimization",
-      "transformer pilot",
-      "transformer poc",
-      "transformer profiled",
-      "transformer prototype",
-      "transformer reference architecture",
-      "transformer rollout",
-      "transformer speedup",
-      "transformer telemetry",
-      "turbopack",
-      "turbopack acceleration",
-      "turbopack alpha",
-      "turbopack benchmark",
-      "turbopack benchmarks",
-      "turbopack best practice",
-      "turbopack beta",
-      "turbopack boost",
-      "turbopack ga",
-      "turbopack gain",
-      "turbopack guidelines",
-      "turbopack hardened",
-      "turbopack improvement",
-      "turbopack instrumented",
-      "turbopack observability",
-      "turbopack optimization",
-      "turbopack pilot",
-      "turbopack poc",
-      "turbopack profiled",
-      "turbopack prototype",
-      "turbopack reference architecture",
-      "turbopack rollout",
-      "turbopack speedup",
-      "turbopack telemetry",
-      "typed sdk",
-      "typed sdk acceleration",
-      "typed sdk alpha",
-      "typed sdk benchmark",
-      "typed sdk benchmarks",
-      "typed sdk best practice",
-      "typed sdk beta",
-      "typed sdk boost",
-      "typed sdk ga",
-      "typed sdk gain",
-      "typed sdk guidelines",
-      "typed sdk hardened",
-      "typed sdk improvement",
-      "typed sdk instrumented",
-      "typed sdk observability",
-      "typed sdk optimization",
-      "typed sdk pilot",
-      "typed sdk poc",
-      "typed sdk profiled",
-      "typed sdk prototype",
-      "typed sdk reference architecture",
-      "typed sdk rollout",
-      "typed sdk speedup",
-      "typed sdk telemetry",
-      "typescript",
-      "typescript acceleration",
-      "typescript alpha",
-      "typescript benchmark",
-      "typescript benchmarks",
-      "typescript best practice",
-      "typescript beta",
-      "typescript boost",
-      "typescript ga",
-      "typescript gain",
-      "typescript guidelines",
-      "typescript hardened",
-      "typescript improvement",
-      "typescript instrumented",
-      "typescript observability",
-      "typescript optimization",
-      "typescript pilot",
-      "typescript poc",
-      "typescript profiled",
-      "typescript prototype",
-      "typescript reference architecture",
-      "typescript rollout",
-      "typescript speedup",
-      "typescript telemetry",
-      "ultra low latency",
-      "ultra low latency acceleration",
-      "ultra low latency alpha",
-      "ultra low latency benchmark",
-      "ultra low latency benchmarks",
-      "ultra low latency best practice",
-      "ultra low latency beta",
-      "ultra low latency boost",
-      "ultra low latency ga",
-      "ultra low latency gain",
-      "ultra low latency guidelines",
-      "ultra low latency hardened",
-      "ultra low latency improvement",
-      "ultra low latency instrumented",
-      "ultra low latency observability",
-      "ultra low latency optimization",
-      "ultra low latency pilot",
-      "ultra low latency poc",
-      "ultra low latency profiled",
-      "ultra low latency prototype",
-      "ultra low latency reference architecture",
-      "ultra low latency rollout",
-      "ultra low latency speedup",
-      "ultra low latency telemetry",
-      "vector",
-      "vector acceleration",
-      "vector alpha",
-      "vector benchmark",
-      "vector benchmarks",
-      "vector best practice",
-      "vector beta",
-      "vector boost",
-      "vector db",
-      "vector db acceleration",
-      "vector db alpha",
-      "vector db benchmark",
-      "vector db benchmarks",
-      "vector db best practice",
-      "vector db beta",
-      "vector db boost",
-      "vector db ga",
-      "vector db gain",
-      "vector db guidelines",
-      "vector db hardened",
-      "vector db improvement",
-      "vector db instrumented",
-      "vector db observability",
-      "vector db optimization",
-      "vector db pilot",
-      "vector db poc",
-      "vector db profiled",
-      "vector db prototype",
-      "vector db reference architecture",
-      "vector db rollout",
-      "vector db speedup",
-      "vector db telemetry",
-      "vector ga",
-      "vector gain",
-      "vector guidelines",
-      "vector hardened",
-      "vector improvement",
-      "vector index",
-      "vector index acceleration",
-      "vector index alpha",
-      "vector index benchmark",
-      "vector index benchmarks",
-      "vector index best practice",
-      "vector index beta",
-      "vector index boost",
-      "vector index ga",
-      "vector index gain",
-      "vector index guidelines",
-      "vector index hardened",
-      "vector index improvement",
-      "vector index instrumented",
-      "vector index observability",
-      "vector index optimization",
-      "vector index pilot",
-      "vector index poc",
-      "vector index profiled",
-      "vector index prototype",
-      "vector index reference architecture",
-      "vector index rollout",
-      "vector index speedup",
-      "vector index telemetry",
-      "vector instrumented",
-      "vector observability",
-      "vector optimization",
-      "vector pilot",
-      "vector poc",
-      "vector profiled",
-      "vector prototype",
-      "vector reference architecture",
-      "vector rollout",
-      "vector speedup",
-      "vector telemetry",
-      "vectorized",
-      "vectorized acceleration",
-      "vectorized alpha",
-      "vectorized benchmark",
-      "vectorized benchmarks",
-      "vectorized best practice",
-      "vectorized beta",
-      "vectorized boost",
-      "vectorized ga",
-      "vectorized gain",
-      "vectorized guidelines",
-      "vectorized hardened",
-      "vectorized improvement",
-      "vectorized instrumented",
-      "vectorized observability",
-      "vectorized optimization",
-      "vectorized pilot",
-      "vectorized poc",
-      "vectorized profiled",
-      "vectorized prototype",
-      "vectorized reference architecture",
-      "vectorized rollout",
-      "vectorized speedup",
-      "vectorized telemetry",
-      "verifiable build",
-      "verifiable build acceleration",
-      "verifiable build alpha",
-      "verifiable build benchmark",
-      "verifiable build benchmarks",
-      "verifiable build best practice",
-      "verifiable build beta",
-      "verifiable build boost",
-      "verifiable build ga",
-      "verifiable build gain",
-      "verifiable build guidelines",
-      "verifiable build hardened",
-      "verifiable build improvement",
-      "verifiable build instrumented",
-      "verifiable build observability",
-      "verifiable build optimization",
-      "verifiable build pilot",
-      "verifiable build poc",
-      "verifiable build profiled",
-      "verifiable build prototype",
-      "verifiable build reference architecture",
-      "verifiable build rollout",
-      "verifiable build speedup",
-      "verifiable build telemetry",
-      "vertical scale",
-      "vertical scale acceleration",
-      "vertical scale alpha",
-      "vertical scale benchmark",
-      "vertical scale benchmarks",
-      "vertical scale best practice",
-      "vertical scale beta",
-      "vertical scale boost",
-      "vertical scale ga",
-      "vertical scale gain",
-      "vertical scale guidelines",
-      "vertical scale hardened",
-      "vertical scale improvement",
-      "vertical scale instrumented",
-      "vertical scale observability",
-      "vertical scale optimization",
-      "vertical scale pilot",
-      "vertical scale poc",
-      "vertical scale profiled",
-      "vertical scale prototype",
-      "vertical scale reference architecture",
-      "vertical scale rollout",
-      "vertical scale speedup",
-      "vertical scale telemetry",
-      "vite",
-      "vite acceleration",
-      "vite alpha",
-      "vite benchmark",
-      "vite benchmarks",
-      "vite best practice",
-      "vite beta",
-      "vite boost",
-      "vite ga",
-      "vite gain",
-      "vite guidelines",
-      "vite hardened",
-      "vite improvement",
-      "vite instrumented",
-      "vite observability",
-      "vite optimization",
-      "vite pilot",
-      "vite poc",
-      "vite profiled",
-      "vite prototype",
-      "vite reference architecture",
-      "vite rollout",
-      "vite speedup",
-      "vite telemetry",
-      "warehouse",
-      "warehouse acceleration",
-      "warehouse alpha",
-      "warehouse benchmark",
-      "warehouse benchmarks",
-      "warehouse best practice",
-      "warehouse beta",
-      "warehouse boost",
-      "warehouse ga",
-      "warehouse gain",
-      "warehouse guidelines",
-      "warehouse hardened",
-      "warehouse improvement",
-      "warehouse instrumented",
-      "warehouse observability",
-      "warehouse optimization",
-      "warehouse pilot",
-      "warehouse poc",
-      "warehouse profiled",
-      "warehouse prototype",
-      "warehouse reference architecture",
-      "warehouse rollout",
-      "warehouse speedup",
-      "warehouse telemetry",
-      "wasm",
-      "wasm acceleration",
-      "wasm alpha",
-      "wasm benchmark",
-      "wasm benchmarks",
-      "wasm best practice",
-      "wasm beta",
-      "wasm boost",
-      "wasm ga",
-      "wasm gain",
-      "wasm guidelines",
-      "wasm hardened",
-      "wasm improvement",
-      "wasm instrumented",
-      "wasm observability",
-      "wasm optimization",
-      "wasm pilot",
-      "wasm poc",
-      "wasm profiled",
-      "wasm prototype",
-      "wasm reference architecture",
-      "wasm rollout",
-      "wasm speedup",
-      "wasm telemetry",
-      "webassembly",
-      "webassembly acceleration",
-      "webassembly alpha",
-      "webassembly benchmark",
-      "webassembly benchmarks",
-      "webassembly best practice",
-      "webassembly beta",
-      "webassembly boost",
-      "webassembly ga",
-      "webassembly gain",
-      "webassembly guidelines",
-      "webassembly hardened",
-      "webassembly improvement",
-      "webassembly instrumented",
-      "webassembly observability",
-      "webassembly optimization",
-      "webassembly pilot",
-      "webassembly poc",
-      "webassembly profiled",
-      "webassembly prototype",
-      "webassembly reference architecture",
-      "webassembly rollout",
-      "webassembly speedup",
-      "webassembly telemetry",
-      "webgpu",
-      "webgpu acceleration",
-      "webgpu alpha",
-      "webgpu benchmark",
-      "webgpu benchmarks",
-      "webgpu best practice",
-      "webgpu beta",
-      "webgpu boost",
-      "webgpu ga",
-      "webgpu gain",
-      "webgpu guidelines",
-      "webgpu hardened",
-      "webgpu improvement",
-      "webgpu instrumented",
-      "webgpu observability",
-      "webgpu optimization",
-      "webgpu pilot",
-      "webgpu poc",
-      "webgpu profiled",
-      "webgpu prototype",
-      "webgpu reference architecture",
-      "webgpu rollout",
-      "webgpu speedup",
-      "webgpu telemetry",
-      "websocket",
-      "websocket acceleration",
-      "websocket alpha",
-      "websocket benchmark",
-      "websocket benchmarks",
-      "websocket best practice",
-      "websocket beta",
-      "websocket boost",
-      "websocket ga",
-      "websocket gain",
-      "websocket guidelines",
-      "websocket hardened",
-      "websocket improvement",
-      "websocket instrumented",
-      "websocket observability",
-      "websocket optimization",
-      "websocket pilot",
-      "websocket poc",
-      "websocket profiled",
-      "websocket prototype",
-      "websocket reference architecture",
-      "websocket rollout",
-      "websocket speedup",
-      "websocket telemetry",
-      "workers",
-      "workers acceleration",
-      "workers alpha",
-      "workers benchmark",
-      "workers benchmarks",
-      "workers best practice",
-      "workers beta",
-      "workers boost",
-      "workers ga",
-      "workers gain",
-      "workers guidelines",
-      "workers hardened",
-      "workers improvement",
-      "workers instrumented",
-      "workers observability",
-      "workers optimization",
-      "workers pilot",
-      "workers poc",
-      "workers profiled",
-      "workers prototype",
-      "workers reference architecture",
-      "workers rollout",
-      "workers speedup",
-      "workers telemetry",
-      "write-back cache",
-      "write-back cache acceleration",
-      "write-back cache alpha",
-      "write-back cache benchmark",
-      "write-back cache benchmarks",
-      "write-back cache best practice",
-      "write-back cache beta",
-      "write-back cache boost",
-      "write-back cache ga",
-      "write-back cache gain",
-      "write-back cache guidelines",
-      "write-back cache hardened",
-      "write-back cache improvement",
-      "write-back cache instrumented",
-      "write-back cache observability",
-      "write-back cache optimization",
-      "write-back cache pilot",
-      "write-back cache poc",
-      "write-back cache profiled",
-      "write-back cache prototype",
-      "write-back cache reference architecture",
-      "write-back cache rollout",
-      "write-back cache speedup",
-      "write-back cache telemetry",
-      "write-through",
-      "write-through acceleration",
-      "write-through alpha",
-      "write-through benchmark",
-      "write-through benchmarks",
-      "write-through best practice",
-      "write-through beta",
-      "write-through boost",
-      "write-through ga",
-      "write-through gain",
-      "write-through guidelines",
-      "write-through hardened",
-      "write-through improvement",
-      "write-through instrumented",
-      "write-through observability",
-      "write-through optimization",
-      "write-through pilot",
-      "write-through poc",
-      "write-through profiled",
-      "write-through prototype",
-      "write-through reference architecture",
-      "write-through rollout",
-      "write-through speedup",
-      "write-through telemetry",
-      "z-order",
-      "z-order acceleration",
-      "z-order alpha",
-      "z-order benchmark",
-      "z-order benchmarks",
-      "z-order best practice",
-      "z-order beta",
-      "z-order boost",
-      "z-order ga",
-      "z-order gain",
-      "z-order guidelines",
-      "z-order hardened",
-      "z-order improvement",
-      "z-order instrumented",
-      "z-order observability",
-      "z-order optimization",
-      "z-order pilot",
-      "z-order poc",
-      "z-order profiled",
-      "z-order prototype",
-      "z-order reference architecture",
-      "z-order rollout",
-      "z-order speedup",
-      "z-order telemetry",
-      "zero copy",
-      "zero copy acceleration",
-      "zero copy alpha",
-      "zero copy benchmark",
-      "zero copy benchmarks",
-      "zero copy best practice",
-      "zero copy beta",
-      "zero copy boost",
-      "zero copy ga",
-      "zero copy gain",
-      "zero copy guidelines",
-      "zero copy hardened",
-      "zero copy improvement",
-      "zero copy instrumented",
-      "zero copy observability",
-      "zero copy optimization",
-      "zero copy pilot",
-      "zero copy poc",
-      "zero copy profiled",
-      "zero copy prototype",
-      "zero copy reference architecture",
-      "zero copy rollout",
-      "zero copy speedup",
-      "zero copy telemetry",
-      "zero downtime deploy",
-      "zero downtime deploy acceleration",
-      "zero downtime deploy alpha",
-      "zero downtime deploy benchmark",
-      "zero downtime deploy benchmarks",
-      "zero downtime deploy best practice",
-      "zero downtime deploy beta",
-      "zero downtime deploy boost",
-      "zero downtime deploy ga",
-      "zero downtime deploy gain",
-      "zero downtime deploy guidelines",
-      "zero downtime deploy hardened",
-      "zero downtime deploy improvement",
-      "zero downtime deploy instrumented",
-      "zero downtime deploy observability",
-      "zero downtime deploy optimization",
-      "zero downtime deploy pilot",
-      "zero downtime deploy poc",
-      "zero downtime deploy profiled",
-      "zero downtime deploy prototype",
-      "zero downtime deploy reference architecture",
-      "zero downtime deploy rollout",
-      "zero downtime deploy speedup",
-      "zero downtime deploy telemetry",
-      "zero trust",
-      "zero trust acceleration",
-      "zero trust alpha",
-      "zero trust benchmark",
-      "zero trust benchmarks",
-      "zero trust best practice",
-      "zero trust beta",
-      "zero trust boost",
-      "zero trust ga",
-      "zero trust gain",
-      "zero trust guidelines",
-      "zero trust hardened",
-      "zero trust improvement",
-      "zero trust instrumented",
-      "zero trust observability",
-      "zero trust optimization",
-      "zero trust pilot",
-      "zero trust poc",
-      "zero trust profiled",
-      "zero trust prototype",
-      "zero trust reference architecture",
-      "zero trust rollout",
-      "zero trust speedup",
-      "zero trust telemetry",
-      "zeromq",
-      "zeromq acceleration",
-      "zeromq alpha",
-      "zeromq benchmark",
-      "zeromq benchmarks",
-      "zeromq best practice",
-      "zeromq beta",
-      "zeromq boost",
-      "zeromq ga",
-      "zeromq gain",
-      "zeromq guidelines",
-      "zeromq hardened",
-      "zeromq improvement",
-      "zeromq instrumented",
-      "zeromq observability",
-      "zeromq optimization",
-      "zeromq pilot",
-      "zeromq poc",
-      "zeromq profiled",
-      "zeromq prototype",
-      "zeromq reference architecture",
-      "zeromq rollout",
-      "zeromq speedup",
-      "zeromq telemetry",
-      "zig",
-      "zig acceleration",
-      "zig alpha",
-      "zig benchmark",
-      "zig benchmarks",
-      "zig best practice",
-      "zig beta",
-      "zig boost",
-      "zig ga",
-      "zig gain",
-      "zig guidelines",
-      "zig hardened",
-      "zig improvement",
-      "zig instrumented",
-      "zig observability",
-      "zig optimization",
-      "zig pilot",
-      "zig poc",
-      "zig profiled",
-      "zig prototype",
-      "zig reference architecture",
-      "zig rollout",
-      "zig speedup",
-      "zig telemetry"
-    ],
-    "keywords_neg": [
-      "bottleneck",
-      "bottleneck alert",
-      "bottleneck bug",
-      "bottleneck failure",
-      "bottleneck hotfix",
-      "bottleneck incident",
-      "bottleneck issue",
-      "bottleneck page",
-      "bottleneck problem",
-      "bottleneck workaround",
-      "breach",
-      "breach alert",
-      "breach bug",
-      "breach failure",
-      "breach hotfix",
-      "breach incident",
-      "breach issue",
-      "breach page",
-      "breach problem",
-      "breach workaround",
-      "bug",
-      "bug alert",
-      "bug bug",
-      "bug failure",
-      "bug hotfix",
-      "bug incident",
-      "bug issue",
-      "bug page",
-      "bug problem",
-      "bug workaround",
-      "buggy",
-      "buggy alert",
-      "buggy bug",
-      "buggy failure",
-      "buggy hotfix",
-      "buggy incident",
-      "buggy issue",
-      "buggy page",
-      "buggy problem",
-      "buggy workaround",
-      "contention",
-      "contention alert",
-      "contention bug",
-      "contention failure",
-      "contention hotfix",
-      "contention incident",
-      "contention issue",
-      "contention page",
-      "contention problem",
-      "contention workaround",
-      "crash",
-      "crash alert",
-      "crash bug",
-      "crash failure",
-      "crash hotfix",
-      "crash incident",
-      "crash issue",
-      "crash page",
-      "crash problem",
-      "crash workaround",
-      "csrf",
-      "csrf alert",
-      "csrf bug",
-      "csrf failure",
-      "csrf hotfix",
-      "csrf incident",
-      "csrf issue",
-      "csrf page",
-      "csrf problem",
-      "csrf workaround",
-      "cve",
-      "cve alert",
-      "cve bug",
-      "cve failure",
-      "cve hotfix",
-      "cve incident",
-      "cve issue",
-      "cve page",
-      "cve problem",
-      "cve workaround",
-      "data race",
-      "data race alert",
-      "data race bug",
-      "data race failure",
-      "data race hotfix",
-      "data race incident",
-      "data race issue",
-      "data race page",
-      "data race problem",
-      "data race workaround",
-      "deadlock",
-      "deadlock alert",
-      "deadlock bug",
-      "deadlock failure",
-      "deadlock hotfix",
-      "deadlock incident",
-      "deadlock issue",
-      "deadlock page",
-      "deadlock problem",
-      "deadlock workaround",
-      "degraded",
-      "degraded alert",
-      "degraded bug",
-      "degraded failure",
-      "degraded hotfix",
-      "degraded incident",
-      "degraded issue",
-      "degraded page",
-      "degraded problem",
-      "degraded workaround",
-      "deserialization",
-      "deserialization alert",
-      "deserialization bug",
-      "deserialization failure",
-      "deserialization hotfix",
-      "deserialization incident",
-      "deserialization issue",
-      "deserialization page",
-      "deserialization problem",
-      "deserialization workaround",
-      "downtime",
-      "downtime alert",
-      "downtime bug",
-      "downtime failure",
-      "downtime hotfix",
-      "downtime incident",
-      "downtime issue",
-      "downtime page",
-      "downtime problem",
-      "downtime workaround",
-      "expensive",
-      "expensive alert",
-      "expensive bug",
-      "expensive failure",
-      "expensive hotfix",
-      "expensive incident",
-      "expensive issue",
-      "expensive page",
-      "expensive problem",
-      "expensive workaround",
-      "flaky test",
-      "flaky test alert",
-      "flaky test bug",
-      "flaky test failure",
-      "flaky test hotfix",
-      "flaky test incident",
-      "flaky test issue",
-      "flaky test page",
-      "flaky test problem",
-      "flaky test workaround",
-      "gc pause",
-      "gc pause alert",
-      "gc pause bug",
-      "gc pause failure",
-      "gc pause hotfix",
-      "gc pause incident",
-      "gc pause issue",
-      "gc pause page",
-      "gc pause problem",
-      "gc pause workaround",
-      "hotspot",
-      "hotspot alert",
-      "hotspot bug",
-      "hotspot failure",
-      "hotspot hotfix",
-      "hotspot incident",
-      "hotspot issue",
-      "hotspot page",
-      "hotspot problem",
-      "hotspot workaround",
-      "incident",
-      "incident alert",
-      "incident bug",
-      "incident failure",
-      "incident hotfix",
-      "incident incident",
-      "incident issue",
-      "incident page",
-      "incident problem",
-      "incident workaround",
-      "janky",
-      "janky alert",
-      "janky bug",
-      "janky failure",
-      "janky hotfix",
-      "janky incident",
-      "janky issue",
-      "janky page",
-      "janky problem",
-      "janky workaround",
-      "laggy",
-      "laggy alert",
-      "laggy bug",
-      "laggy failure",
-      "laggy hotfix",
-      "laggy incident",
-      "laggy issue",
-      "laggy page",
-      "laggy problem",
-      "laggy workaround",
-      "latency spike",
-      "latency spike alert",
-      "latency spike bug",
-      "latency spike failure",
-      "latency spike hotfix",
-      "latency spike incident",
-      "latency spike issue",
-      "latency spike page",
-      "latency spike problem",
-      "latency spike workaround",
-      "leak",
-      "leak alert",
-      "leak bug",
-      "leak failure",
-      "leak hotfix",
-      "leak incident",
-      "leak issue",
-      "leak page",
-      "leak problem",
-      "leak workaround",
-      "legacy",
-      "legacy alert",
-      "legacy bug",
-      "legacy failure",
-      "legacy hotfix",
-      "legacy incident",
-      "legacy issue",
-      "legacy page",
-      "legacy problem",
-      "legacy workaround",
-      "livelock",
-      "livelock alert",
-      "livelock bug",
-      "livelock failure",
-      "livelock hotfix",
-      "livelock incident",
-      "livelock issue",
-      "livelock page",
-      "livelock problem",
-      "livelock workaround",
-      "memory leak",
-      "memory leak alert",
-      "memory leak bug",
-      "memory leak failure",
-      "memory leak hotfix",
-      "memory leak incident",
-      "memory leak issue",
-      "memory leak page",
-      "memory leak problem",
-      "memory leak workaround",
-      "monolith",
-      "monolith alert",
-      "monolith bug",
-      "monolith failure",
-      "monolith hotfix",
-      "monolith incident",
-      "monolith issue",
-      "monolith page",
-      "monolith problem",
-      "monolith workaround",
-      "noisy neighbor",
-      "noisy neighbor alert",
-      "noisy neighbor bug",
-      "noisy neighbor failure",
-      "noisy neighbor hotfix",
-      "noisy neighbor incident",
-      "noisy neighbor issue",
-      "noisy neighbor page",
-      "noisy neighbor problem",
-      "noisy neighbor workaround",
-      "oom",
-      "oom alert",
-      "oom bug",
-      "oom failure",
-      "oom hotfix",
-      "oom incident",
-      "oom issue",
-      "oom page",
-      "oom problem",
-      "oom workaround",
-      "out of memory",
-      "out of memory alert",
-      "out of memory bug",
-      "out of memory failure",
-      "out of memory hotfix",
-      "out of memory incident",
-      "out of memory issue",
-      "out of memory page",
-      "out of memory problem",
-      "out of memory workaround",
-      "outage",
-      "outage alert",
-      "outage bug",
-      "outage failure",
-      "outage hotfix",
-      "outage incident",
-      "outage issue",
-      "outage page",
-      "outage problem",
-      "outage workaround",
-      "overprovisioned",
-      "overprovisioned alert",
-      "overprovisioned bug",
-      "overprovisioned failure",
-      "overprovisioned hotfix",
-      "overprovisioned incident",
-      "overprovisioned issue",
-      "overprovisioned page",
-      "overprovisioned problem",
-      "overprovisioned workaround",
-      "p0",
-      "p0 alert",
-      "p0 bug",
-      "p0 failure",
-      "p0 hotfix",
-      "p0 incident",
-      "p0 issue",
-      "p0 page",
-      "p0 problem",
-      "p0 workaround",
-      "panic",
-      "panic alert",
-      "panic bug",
-      "panic failure",
-      "panic hotfix",
-      "panic incident",
-      "panic issue",
-      "panic page",
-      "panic problem",
-      "panic workaround",
-      "race condition",
-      "race condition alert",
-      "race condition bug",
-      "race condition failure",
-      "race condition hotfix",
-      "race condition incident",
-      "race condition issue",
-      "race condition page",
-      "race condition problem",
-      "race condition workaround",
-      "rce",
-      "rce alert",
-      "rce bug",
-      "rce failure",
-      "rce hotfix",
-      "rce incident",
-      "rce issue",
-      "rce page",
-      "rce problem",
-      "rce workaround",
-      "regression",
-      "regression alert",
-      "regression bug",
-      "regression failure",
-      "regression hotfix",
-      "regression incident",
-      "regression issue",
-      "regression page",
-      "regression problem",
-      "regression workaround",
-      "rollback",
-      "rollback alert",
-      "rollback bug",
-      "rollback failure",
-      "rollback hotfix",
-      "rollback incident",
-      "rollback issue",
-      "rollback page",
-      "rollback problem",
-      "rollback workaround",
-      "security incident",
-      "security incident alert",
-      "security incident bug",
-      "security incident failure",
-      "security incident hotfix",
-      "security incident incident",
-      "security incident issue",
-      "security incident page",
-      "security incident problem",
-      "security incident workaround",
-      "segfault",
-      "segfault alert",
-      "segfault bug",
-      "segfault failure",
-      "segfault hotfix",
-      "segfault incident",
-      "segfault issue",
-      "segfault page",
-      "segfault problem",
-      "segfault workaround",
-      "sev-1",
-      "sev-1 alert",
-      "sev-1 bug",
-      "sev-1 failure",
-      "sev-1 hotfix",
-      "sev-1 incident",
-      "sev-1 issue",
-      "sev-1 page",
-      "sev-1 problem",
-      "sev-1 workaround",
-      "sev1",
-      "sev1 alert",
-      "sev1 bug",
-      "sev1 failure",
-      "sev1 hotfix",
-      "sev1 incident",
-      "sev1 issue",
-      "sev1 page",
-      "sev1 problem",
-      "sev1 workaround",
-      "slow",
-      "slow alert",
-      "slow bug",
-      "slow failure",
-      "slow hotfix",
-      "slow incident",
-      "slow issue",
-      "slow page",
-      "slow problem",
-      "slow workaround",
-      "sluggish",
-      "sluggish alert",
-      "sluggish bug",
-      "sluggish failure",
-      "sluggish hotfix",
-      "sluggish incident",
-      "sluggish issue",
-      "sluggish page",
-      "sluggish problem",
-      "sluggish workaround",
-      "spaghetti code",
-      "spaghetti code alert",
-      "spaghetti code bug",
-      "spaghetti code failure",
-      "spaghetti code hotfix",
-      "spaghetti code incident",
-      "spaghetti code issue",
-      "spaghetti code page",
-      "spaghetti code problem",
-      "spaghetti code workaround",
-      "spike",
-      "spike alert",
-      "spike bug",
-      "spike failure",
-      "spike hotfix",
-      "spike incident",
-      "spike issue",
-      "spike page",
-      "spike problem",
-      "spike workaround",
-      "sql injection",
-      "sql injection alert",
-      "sql injection bug",
-      "sql injection failure",
-      "sql injection hotfix",
-      "sql injection incident",
-      "sql injection issue",
-      "sql injection page",
-      "sql injection problem",
-      "sql injection workaround",
-      "ssrf",
-      "ssrf alert",
-      "ssrf bug",
-      "ssrf failure",
-      "ssrf hotfix",
-      "ssrf incident",
-      "ssrf issue",
-      "ssrf page",
-      "ssrf problem",
-      "ssrf workaround",
-      "stop the world",
-      "stop the world alert",
-      "stop the world bug",
-      "stop the world failure",
-      "stop the world hotfix",
-      "stop the world incident",
-      "stop the world issue",
-      "stop the world page",
-      "stop the world problem",
-      "stop the world workaround",
-      "tech debt",
-      "tech debt alert",
-      "tech debt bug",
-      "tech debt failure",
-      "tech debt hotfix",
-      "tech debt incident",
-      "tech debt issue",
-      "tech debt page",
-      "tech debt problem",
-      "tech debt workaround",
-      "thrash",
-      "thrash alert",
-      "thrash bug",
-      "thrash failure",
-      "thrash hotfix",
-      "thrash incident",
-      "thrash issue",
-      "thrash page",
-      "thrash problem",
-      "thrash workaround",
-      "throttled",
-      "throttled alert",
-      "throttled bug",
-      "throttled failure",
-      "throttled hotfix",
-      "throttled incident",
-      "throttled issue",
-      "throttled page",
-      "throttled problem",
-      "throttled workaround",
-      "timeout",
-      "timeout alert",
-      "timeout bug",
-      "timeout failure",
-      "timeout hotfix",
-      "timeout incident",
-      "timeout issue",
-      "timeout page",
-      "timeout problem",
-      "timeout workaround",
-      "underprovisioned",
-      "underprovisioned alert",
-      "underprovisioned bug",
-      "underprovisioned failure",
-      "underprovisioned hotfix",
-      "underprovisioned incident",
-      "underprovisioned issue",
-      "underprovisioned page",
-      "underprovisioned problem",
-      "underprovisioned workaround",
-      "unmaintainable",
-      "unmaintainable alert",
-      "unmaintainable bug",
-      "unmaintainable failure",
-      "unmaintainable hotfix",
-      "unmaintainable incident",
-      "unmaintainable issue",
-      "unmaintainable page",
-      "unmaintainable problem",
-      "unmaintainable workaround",
-      "vulnerability",
-      "vulnerability alert",
-      "vulnerability bug",
-      "vulnerability failure",
-      "vulnerability hotfix",
-      "vulnerability incident",
-      "vulnerability issue",
-      "vulnerability page",
-      "vulnerability problem",
-      "vulnerability workaround",
-      "xss",
-      "xss alert",
-      "xss bug",
-      "xss failure",
-      "xss hotfix",
-      "xss incident",
-      "xss issue",
-      "xss page",
-      "xss problem",
-      "xss workaround"
-    ],
-    "domain_bias": {
-      "tech": 0.8,
-      "design": 0.1,
-      "finance": 0.1
-    },
-    "curiosity_triggers": [
-      "api",
-      "assumption",
-      "availability?",
-      "backup?",
-      "backward compatible?",
-      "benchmark?",
-      "breaking change?",
-      "compatibility?",
-      "compliance?",
-      "cost?",
-      "docs",
-      "failover?",
-      "gdpr?",
-      "guide",
-      "hipaa?",
-      "how",
-      "integration?",
-      "iso27001?",
-      "latency?",
-      "limits?",
-      "migration?",
-      "pci?",
-      "price?",
-      "pricing?",
-      "quotas?",
-      "restore?",
-      "retention?",
-      "risk",
-      "roadmap",
-      "roadmap?",
-      "sample code",
-      "scalability?",
-      "scale?",
-      "sdk",
-      "security?",
-      "sla",
-      "slo?",
-      "soc2?",
-      "throughput?",
-      "timeline",
-      "trade offs",
-      "trade-offs",
-      "tradeoff",
-      "tutorial",
-      "uptime?",
-      "versioning?",
-      "what if",
-      "why"
-    ],
-    "exclaim_weight": 0.3,
-    "question_weight": 0.5
-  },
-  "design_review": {
-    "keywords_pos": [
-      "a/b test",
-      "a/b test audit",
-      "a/b test best practice",
-      "a/b test checklist",
-      "a/b test guideline",
-      "a/b test hand-off",
-      "a/b test handoff",
-      "a/b test handover",
-      "a/b test pairing",
-      "a/b test pass",
-      "a/b test passage",
-      "a/b test pattern",
-      "a/b test principle",
-      "a/b test redlines",
-      "a/b test review",
-      "a/b test scale",
-      "a/b test score",
-      "a/b test spec",
-      "a/b test system",
-      "a/b test tokens",
-      "a/b test variants",
-      "a11y",
-      "a11y audit",
-      "a11y best practice",
-      "a11y checklist",
-      "a11y guideline",
-      "a11y hand-off",
-      "a11y handoff",
-      "a11y handover",
-      "a11y pairing",
-      "a11y pass",
-      "a11y passage",
-      "a11y pattern",
-      "a11y principle",
-      "a11y redlines",
-      "a11y review",
-      "a11y scale",
-      "a11y score",
-      "a11y spec",
-      "a11y system",
-      "a11y tokens",
-      "a11y variants",
-      "accessible",
-      "accessible audit",
-      "accessible best practice",
-      "accessible checklist",
-      "accessible guideline",
-      "accessible hand-off",
-      "accessible handoff",
-      "accessible handover",
-      "accessible pairing",
-      "accessible pass",
-      "accessible passage",
-      "accessible pattern",
-      "accessible principle",
-      "accessible redlines",
-      "accessible review",
-      "accessible scale",
-      "accessible score",
-      "accessible spec",
-      "accessible system",
-      "accessible tokens",
-      "accessible variants",
-      "adaptive",
-      "adaptive audit",
-      "adaptive best practice",
-      "adaptive checklist",
-      "adaptive guideline",
-      "adaptive hand-off",
-      "adaptive handoff",
-      "adaptive handover",
-      "adaptive pairing",
-      "adaptive pass",
-      "adaptive passage",
-      "adaptive pattern",
-      "adaptive principle",
-      "adaptive redlines",
-      "adaptive review",
-      "adaptive scale",
-      "adaptive score",
-      "adaptive spec",
-      "adaptive system",
-      "adaptive tokens",
-      "adaptive variants",
-      "affordance",
-      "affordance audit",
-      "affordance best practice",
-      "affordance checklist",
-      "affordance guideline",
-      "affordance hand-off",
-      "affordance handoff",
-      "affordance handover",
-      "affordance pairing",
-      "affordance pass",
-      "affordance passage",
-      "affordance pattern",
-      "affordance principle",
-      "affordance redlines",
-      "affordance review",
-      "affordance scale",
-      "affordance score",
-      "affordance spec",
-      "affordance system",
-      "affordance tokens",
-      "affordance variants",
-      "auto layout",
-      "auto layout audit",
-      "auto layout best practice",
-      "auto layout checklist",
-      "auto layout guideline",
-      "auto layout hand-off",
-      "auto layout handoff",
-      "auto layout handover",
-      "auto layout pairing",
-      "auto layout pass",
-      "auto layout passage",
-      "auto layout pattern",
-      "auto layout principle",
-      "auto layout redlines",
-      "auto layout review",
-      "auto layout scale",
-      "auto layout score",
-      "auto layout spec",
-      "auto layout system",
-      "auto layout tokens",
-      "auto layout variants",
-      "clean",
-      "clean audit",
-      "clean best practice",
-      "clean checklist",
-      "clean guideline",
-      "clean hand-off",
-      "clean handoff",
-      "clean handover",
-      "clean pairing",
-      "clean pass",
-      "clean passage",
-      "clean pattern",
-      "clean principle",
-      "clean redlines",
-      "clean review",
-      "clean scale",
-      "clean score",
-      "clean spec",
-      "clean system",
-      "clean tokens",
-      "clean variants",
-      "coherent",
-      "coherent audit",
-      "coherent best practice",
-      "coherent checklist",
-      "coherent guideline",
-      "coherent hand-off",
-      "coherent handoff",
-      "coherent handover",
-      "coherent pairing",
-      "coherent pass",
-      "coherent passage",
-      "coherent pattern",
-      "coherent principle",
-      "coherent redlines",
-      "coherent review",
-      "coherent scale",
-      "coherent score",
-      "coherent spec",
-      "coherent system",
-      "coherent tokens",
-      "coherent variants",
-      "colorblind safe",
-      "colorblind safe audit",
-      "colorblind safe best practice",
-      "colorblind safe checklist",
-      "colorblind safe guideline",
-      "colorblind safe hand-off",
-      "colorblind safe handoff",
-      "colorblind safe handover",
-      "colorblind safe pairing",
-      "colorblind safe pass",
-      "colorblind safe passage",
-      "colorblind safe pattern",
-      "colorblind safe principle",
-      "colorblind safe redlines",
-      "colorblind safe review",
-      "colorblind safe scale",
-      "colorblind safe score",
-      "colorblind safe spec",
-      "colorblind safe system",
-      "colorblind safe tokens",
-      "colorblind safe variants",
-      "component",
-      "component audit",
-      "component best practice",
-      "component checklist",
-      "component guideline",
-      "component hand-off",
-      "component handoff",
-      "component handover",
-      "component pairing",
-      "component pass",
-      "component passage",
-      "component pattern",
-      "component principle",
-      "component redlines",
-      "component review",
-      "component scale",
-      "component score",
-      "component spec",
-      "component system",
-      "component tokens",
-      "component variants",
-      "consistent",
-      "consistent audit",
-      "consistent best practice",
-      "consistent checklist",
-      "consistent guideline",
-      "consistent hand-off",
-      "consistent handoff",
-      "consistent handover",
-      "consistent pairing",
-      "consistent pass",
-      "consistent passage",
-      "consistent pattern",
-      "consistent principle",
-      "consistent redlines",
-      "consistent review",
-      "consistent scale",
-      "consistent score",
-      "consistent spec",
-      "consistent system",
-      "consistent tokens",
-      "consistent variants",
-      "constraints",
-      "constraints audit",
-      "constraints best practice",
-      "constraints checklist",
-      "constraints guideline",
-      "constraints hand-off",
-      "constraints handoff",
-      "constraints handover",
-      "constraints pairing",
-      "constraints pass",
-      "constraints passage",
-      "constraints pattern",
-      "constraints principle",
-      "constraints redlines",
-      "constraints review",
-      "constraints scale",
-      "constraints score",
-      "constraints spec",
-      "constraints system",
-      "constraints tokens",
-      "constraints variants",
-      "container queries",
-      "container queries audit",
-      "container queries best practice",
-      "container queries checklist",
-      "container queries guideline",
-      "container queries hand-off",
-      "container queries handoff",
-      "container queries handover",
-      "container queries pairing",
-      "container queries pass",
-      "container queries passage",
-      "container queries pattern",
-      "container queries principle",
-      "container queries redlines",
-      "container queries review",
-      "container queries scale",
-      "container queries score",
-      "container queries spec",
-      "container queries system",
-      "container queries tokens",
-      "container queries variants",
-      "contrast",
-      "contrast audit",
-      "contrast best practice",
-      "contrast checklist",
-      "contrast guideline",
-      "contrast hand-off",
-      "contrast handoff",
-      "contrast handover",
-      "contrast pairing",
-      "contrast pass",
-      "contrast passage",
-      "contrast pattern",
-      "contrast principle",
-      "contrast ratio",
-      "contrast ratio audit",
-      "contrast ratio best practice",
-      "contrast ratio checklist",
-      "contrast ratio guideline",
-      "contrast ratio hand-off",
-      "contrast ratio handoff",
-      "contrast ratio handover",
-      "contrast ratio pairing",
-      "contrast ratio pass",
-      "contrast ratio passage",
-      "contrast ratio pattern",
-      "contrast ratio principle",
-      "contrast ratio redlines",
-      "contrast ratio review",
-      "contrast ratio scale",
-      "contrast ratio score",
-      "contrast ratio spec",
-      "contrast ratio system",
-      "contrast ratio tokens",
-      "contrast ratio variants",
-      "contrast redlines",
-      "contrast review",
-      "contrast scale",
-      "contrast score",
-      "contrast spec",
-      "contrast system",
-      "contrast tokens",
-      "contrast variants",
-      "css grid",
-      "css grid audit",
-      "css grid best practice",
-      "css grid checklist",
-      "css grid guideline",
-      "css grid hand-off",
-      "css grid handoff",
-      "css grid handover",
-      "css grid pairing",
-      "css grid pass",
-      "css grid passage",
-      "css grid pattern",
-      "css grid principle",
-      "css grid redlines",
-      "css grid review",
-      "css grid scale",
-      "css grid score",
-      "css grid spec",
-      "css grid system",
-      "css grid tokens",
-      "css grid variants",
-      "delightful",
-      "delightful audit",
-      "delightful best practice",
-      "delightful checklist",
-      "delightful guideline",
-      "delightful hand-off",
-      "delightful handoff",
-      "delightful handover",
-      "delightful pairing",
-      "delightful pass",
-      "delightful passage",
-      "delightful pattern",
-      "delightful principle",
-      "delightful redlines",
-      "delightful review",
-      "delightful scale",
-      "delightful score",
-      "delightful spec",
-      "delightful system",
-      "delightful tokens",
-      "delightful variants",
-      "design system",
-      "design system audit",
-      "design system best practice",
-      "design system checklist",
-      "design system guideline",
-      "design system hand-off",
-      "design system handoff",
-      "design system handover",
-      "design system pairing",
-      "design system pass",
-      "design system passage",
-      "design system pattern",
-      "design system principle",
-      "design system redlines",
-      "design system review",
-      "design system scale",
-      "design system score",
-      "design system spec",
-      "design system system",
-      "design system tokens",
-      "design system variants",
-      "discoverability",
-      "discoverability audit",
-      "discoverability best practice",
-      "discoverability checklist",
-      "discoverability guideline",
-      "discoverability hand-off",
-      "discoverability handoff",
-      "discoverability handover",
-      "discoverability pairing",
-      "discoverability pass",
-      "discoverability passage",
-      "discoverability pattern",
-      "discoverability principle",
-      "discoverability redlines",
-      "discoverability review",
-      "discoverability scale",
-      "discoverability score",
-      "discoverability spec",
-      "discoverability system",
-      "discoverability tokens",
-      "discoverability variants",
-      "duration",
-      "duration audit",
-      "duration best practice",
-      "duration checklist",
-      "duration guideline",
-      "duration hand-off",
-      "duration handoff",
-      "duration handover",
-      "duration pairing",
-      "duration pass",
-      "duration passage",
-      "duration pattern",
-      "duration principle",
-      "duration redlines",
-      "duration review",
-      "duration scale",
-      "duration score",
-      "duration spec",
-      "duration system",
-      "duration tokens",
-      "duration variants",
-      "easing",
-      "easing audit",
-      "easing best practice",
-      "easing checklist",
-      "easing guideline",
-      "easing hand-off",
-      "easing handoff",
-      "easing handover",
-      "easing pairing",
-      "easing pass",
-      "easing passage",
-      "easing pattern",
-      "easing principle",
-      "easing redlines",
-      "easing review",
-      "easing scale",
-      "easing score",
-      "easing spec",
-      "easing system",
-      "easing tokens",
-      "easing variants",
-      "elegant",
-      "elegant audit",
-      "elegant best practice",
-      "elegant checklist",
-      "elegant guideline",
-      "elegant hand-off",
-      "elegant handoff",
-      "elegant handover",
-      "elegant pairing",
-      "elegant pass",
-      "elegant passage",
-      "elegant pattern",
-      "elegant principle",
-      "elegant redlines",
-      "elegant review",
-      "elegant scale",
-      "elegant score",
-      "elegant spec",
-      "elegant system",
-      "elegant tokens",
-      "elegant variants",
-      "empty state",
-      "empty state audit",
-      "empty state best practice",
-      "empty state checklist",
-      "empty state guideline",
-      "empty state hand-off",
-      "empty state handoff",
-      "empty state handover",
-      "empty state pairing",
-      "empty state pass",
-      "empty state passage",
-      "empty state pattern",
-      "empty state principle",
-      "empty state redlines",
-      "empty state review",
-      "empty state scale",
-      "empty state score",
-      "empty state spec",
-      "empty state system",
-      "empty state tokens",
-      "empty state variants",
-      "empty-state",
-      "empty-state audit",
-      "empty-state best practice",
-      "empty-state checklist",
-      "empty-state guideline",
-      "empty-state hand-off",
-      "empty-state handoff",
-      "empty-state handover",
-      "empty-state pairing",
-      "empty-state pass",
-      "empty-state passage",
-      "empty-state pattern",
-      "empty-state principle",
-      "empty-state redlines",
-      "empty-state review",
-      "empty-state scale",
-      "empty-state score",
-      "empty-state spec",
-      "empty-state system",
-      "empty-state tokens",
-      "empty-state variants",
-      "error state",
-      "error state audit",
-      "error state best practice",
-      "error state checklist",
-      "error state guideline",
-      "error state hand-off",
-      "error state handoff",
-      "error state handover",
-      "error state pairing",
-      "error state pass",
-      "error state passage",
-      "error state pattern",
-      "error state principle",
-      "error state redlines",
-      "error state review",
-      "error state scale",
-      "error state score",
-      "error state spec",
-      "error state system",
-      "error state tokens",
-      "error state variants",
-      "feedback",
-      "feedback audit",
-      "feedback best practice",
-      "feedback checklist",
-      "feedback guideline",
-      "feedback hand-off",
-      "feedback handoff",
-      "feedback handover",
-      "feedback pairing",
-      "feedback pass",
-      "feedback passage",
-      "feedback pattern",
-      "feedback principle",
-      "feedback redlines",
-      "feedback review",
-      "feedback scale",
-      "feedback score",
-      "feedback spec",
-      "feedback system",
-      "feedback tokens",
-      "feedback variants",
-      "figma",
-      "figma audit",
-      "figma best practice",
-      "figma checklist",
-      "figma guideline",
-      "figma hand-off",
-      "figma handoff",
-      "figma handover",
-      "figma pairing",
-      "figma pass",
-      "figma passage",
-      "figma pattern",
-      "figma principle",
-      "figma redlines",
-      "figma review",
-      "figma scale",
-      "figma score",
-      "figma spec",
-      "figma system",
-      "figma tokens",
-      "figma variants",
-      "flexbox",
-      "flexbox audit",
-      "flexbox best practice",
-      "flexbox checklist",
-      "flexbox guideline",
-      "flexbox hand-off",
-      "flexbox handoff",
-      "flexbox handover",
-      "flexbox pairing",
-      "flexbox pass",
-      "flexbox passage",
-      "flexbox pattern",
-      "flexbox principle",
-      "flexbox redlines",
-      "flexbox review",
-      "flexbox scale",
-      "flexbox score",
-      "flexbox spec",
-      "flexbox system",
-      "flexbox tokens",
-      "flexbox variants",
-      "fluid",
-      "fluid audit",
-      "fluid best practice",
-      "fluid checklist",
-      "fluid guideline",
-      "fluid hand-off",
-      "fluid handoff",
-      "fluid handover",
-      "fluid pairing",
-      "fluid pass",
-      "fluid passage",
-      "fluid pattern",
-      "fluid principle",
-      "fluid redlines",
-      "fluid review",
-      "fluid scale",
-      "fluid score",
-      "fluid spec",
-      "fluid system",
-      "fluid tokens",
-      "fluid variants",
-      "focus ring",
-      "focus ring audit",
-      "focus ring best practice",
-      "focus ring checklist",
-      "focus ring guideline",
-      "focus ring hand-off",
-      "focus ring handoff",
-      "focus ring handover",
-      "focus ring pairing",
-      "focus ring pass",
-      "focus ring passage",
-      "focus ring pattern",
-      "focus ring principle",
-      "focus ring redlines",
-      "focus ring review",
-      "focus ring scale",
-      "focus ring score",
-      "focus ring spec",
-      "focus ring system",
-      "focus ring tokens",
-      "focus ring variants",
-      "font pairing",
-      "font pairing audit",
-      "font pairing best practice",
-      "font pairing checklist",
-      "font pairing guideline",
-      "font pairing hand-off",
-      "font pairing handoff",
-      "font pairing handover",
-      "font pairing pairing",
-      "font pairing pass",
-      "font pairing passage",
-      "font pairing pattern",
-      "font pairing principle",
-      "font pairing redlines",
-      "font pairing review",
-      "font pairing scale",
-      "font pairing score",
-      "font pairing spec",
-      "font pairing system",
-      "font pairing tokens",
-      "font pairing variants",
-      "golden ratio",
-      "golden ratio audit",
-      "golden ratio best practice",
-      "golden ratio checklist",
-      "golden ratio guideline",
-      "golden ratio hand-off",
-      "golden ratio handoff",
-      "golden ratio handover",
-      "golden ratio pairing",
-      "golden ratio pass",
-      "golden ratio passage",
-      "golden ratio pattern",
-      "golden ratio principle",
-      "golden ratio redlines",
-      "golden ratio review",
-      "golden ratio scale",
-      "golden ratio score",
-      "golden ratio spec",
-      "golden ratio system",
-      "golden ratio tokens",
-      "golden ratio variants",
-      "grid",
-      "grid audit",
-      "grid best practice",
-      "grid checklist",
-      "grid guideline",
-      "grid hand-off",
-      "grid handoff",
-      "grid handover",
-      "grid pairing",
-      "grid pass",
-      "grid passage",
-      "grid pattern",
-      "grid principle",
-      "grid redlines",
-      "grid review",
-      "grid scale",
-      "grid score",
-      "grid spec",
-      "grid system",
-      "grid tokens",
-      "grid variants",
-      "harmonious",
-      "harmonious audit",
-      "harmonious best practice",
-      "harmonious checklist",
-      "harmonious guideline",
-      "harmonious hand-off",
-      "harmonious handoff",
-      "harmonious handover",
-      "harmonious pairing",
-      "harmonious pass",
-      "harmonious passage",
-      "harmonious pattern",
-      "harmonious principle",
-      "harmonious redlines",
-      "harmonious review",
-      "harmonious scale",
-      "harmonious score",
-      "harmonious spec",
-      "harmonious system",
-      "harmonious tokens",
-      "harmonious variants",
-      "heuristic evaluation",
-      "heuristic evaluation audit",
-      "heuristic evaluation best practice",
-      "heuristic evaluation checklist",
-      "heuristic evaluation guideline",
-      "heuristic evaluation hand-off",
-      "heuristic evaluation handoff",
-      "heuristic evaluation handover",
-      "heuristic evaluation pairing",
-      "heuristic evaluation pass",
-      "heuristic evaluation passage",
-      "heuristic evaluation pattern",
-      "heuristic evaluation principle",
-      "heuristic evaluation redlines",
-      "heuristic evaluation review",
-      "heuristic evaluation scale",
-      "heuristic evaluation score",
-      "heuristic evaluation spec",
-      "heuristic evaluation system",
-      "heuristic evaluation tokens",
-      "heuristic evaluation variants",
-      "hierarchy",
-      "hierarchy audit",
-      "hierarchy best practice",
-      "hierarchy checklist",
-      "hierarchy guideline",
-      "hierarchy hand-off",
-      "hierarchy handoff",
-      "hierarchy handover",
-      "hierarchy pairing",
-      "hierarchy pass",
-      "hierarchy passage",
-      "hierarchy pattern",
-      "hierarchy principle",
-      "hierarchy redlines",
-      "hierarchy review",
-      "hierarchy scale",
-      "hierarchy score",
-      "hierarchy spec",
-      "hierarchy system",
-      "hierarchy tokens",
-      "hierarchy variants",
-      "high fidelity",
-      "high fidelity audit",
-      "high fidelity best practice",
-      "high fidelity checklist",
-      "high fidelity guideline",
-      "high fidelity hand-off",
-      "high fidelity handoff",
-      "high fidelity handover",
-      "high fidelity pairing",
-      "high fidelity pass",
-      "high fidelity passage",
-      "high fidelity pattern",
-      "high fidelity principle",
-      "high fidelity redlines",
-      "high fidelity review",
-      "high fidelity scale",
-      "high fidelity score",
-      "high fidelity spec",
-      "high fidelity system",
-      "high fidelity tokens",
-      "high fidelity variants",
-      "hit target",
-      "hit target audit",
-      "hit target best practice",
-      "hit target checklist",
-      "hit target guideline",
-      "hit target hand-off",
-      "hit target handoff",
-      "hit target handover",
-      "hit target pairing",
-      "hit target pass",
-      "hit target passage",
-      "hit target pattern",
-      "hit target principle",
-      "hit target redlines",
-      "hit target review",
-      "hit target scale",
-      "hit target score",
-      "hit target spec",
-      "hit target system",
-      "hit target tokens",
-      "hit target variants",
-      "inclusive",
-      "inclusive audit",
-      "inclusive best practice",
-      "inclusive checklist",
-      "inclusive guideline",
-      "inclusive hand-off",
-      "inclusive handoff",
-      "inclusive handover",
-      "inclusive pairing",
-      "inclusive pass",
-      "inclusive passage",
-      "inclusive pattern",
-      "inclusive principle",
-      "inclusive redlines",
-      "inclusive review",
-      "inclusive scale",
-      "inclusive score",
-      "inclusive spec",
-      "inclusive system",
-      "inclusive tokens",
-      "inclusive variants",
-      "information architecture",
-      "information architecture audit",
-      "information architecture best practice",
-      "information architecture checklist",
-      "information architecture guideline",
-      "information architecture hand-off",
-      "information architecture handoff",
-      "information architecture handover",
-      "information architecture pairing",
-      "information architecture pass",
-      "information architecture passage",
-      "information architecture pattern",
-      "information architecture principle",
-      "information architecture redlines",
-      "information architecture review",
-      "information architecture scale",
-      "information architecture score",
-      "information architecture spec",
-      "information architecture system",
-      "information architecture tokens",
-      "information architecture variants",
-      "intuitive",
-      "intuitive audit",
-      "intuitive best practice",
-      "intuitive checklist",
-      "intuitive guideline",
-      "intuitive hand-off",
-      "intuitive handoff",
-      "intuitive handover",
-      "intuitive pairing",
-      "intuitive pass",
-      "intuitive passage",
-      "intuitive pattern",
-      "intuitive principle",
-      "intuitive redlines",
-      "intuitive review",
-      "intuitive scale",
-      "intuitive score",
-      "intuitive spec",
-      "intuitive system",
-      "intuitive tokens",
-      "intuitive variants",
-      "job story",
-      "job story audit",
-      "job story best practice",
-      "job story checklist",
-      "job story guideline",
-      "job story hand-off",
-      "job story handoff",
-      "job story handover",
-      "job story pairing",
-      "job story pass",
-      "job story passage",
-      "job story pattern",
-      "job story principle",
-      "job story redlines",
-      "job story review",
-      "job story scale",
-      "job story score",
-      "job story spec",
-      "job story system",
-      "job story tokens",
-      "job story variants",
-      "jobs to be done",
-      "jobs to be done audit",
-      "jobs to be done best practice",
-      "jobs to be done checklist",
-      "jobs to be done guideline",
-      "jobs to be done hand-off",
-      "jobs to be done handoff",
-      "jobs to be done handover",
-      "jobs to be done pairing",
-      "jobs to be done pass",
-      "jobs to be done passage",
-      "jobs to be done pattern",
-      "jobs to be done principle",
-      "jobs to be done redlines",
-      "jobs to be done review",
-      "jobs to be done scale",
-      "jobs to be done score",
-      "jobs to be done spec",
-      "jobs to be done system",
-      "jobs to be done tokens",
-      "jobs to be done variants",
-      "journey map",
-      "journey map audit",
-      "journey map best practice",
-      "journey map checklist",
-      "journey map guideline",
-      "journey map hand-off",
-      "journey map handoff",
-      "journey map handover",
-      "journey map pairing",
-      "journey map pass",
-      "journey map passage",
-      "journey map pattern",
-      "journey map principle",
-      "journey map redlines",
-      "journey map review",
-      "journey map scale",
-      "journey map score",
-      "journey map spec",
-      "journey map system",
-      "journey map tokens",
-      "journey map variants",
-      "kerning",
-      "kerning audit",
-      "kerning best practice",
-      "kerning checklist",
-      "kerning guideline",
-      "kerning hand-off",
-      "kerning handoff",
-      "kerning handover",
-      "kerning pairing",
-      "kerning pass",
-      "kerning passage",
-      "kerning pattern",
-      "kerning principle",
-      "kerning redlines",
-      "kerning review",
-      "kerning scale",
-      "kerning score",
-      "kerning spec",
-      "kerning system",
-      "kerning tokens",
-      "kerning variants",
-      "keyboard navigable",
-      "keyboard navigable audit",
-      "keyboard navigable best practice",
-      "keyboard navigable checklist",
-      "keyboard navigable guideline",
-      "keyboard navigable hand-off",
-      "keyboard navigable handoff",
-      "keyboard navigable handover",
-      "keyboard navigable pairing",
-      "keyboard navigable pass",
-      "keyboard navigable passage",
-      "keyboard navigable pattern",
-      "keyboard navigable principle",
-      "keyboard navigable redlines",
-      "keyboard navigable review",
-      "keyboard navigable scale",
-      "keyboard navigable score",
-      "keyboard navigable spec",
-      "keyboard navigable system",
-      "keyboard navigable tokens",
-      "keyboard navigable variants",
-      "layout",
-      "layout audit",
-      "layout best practice",
-      "layout checklist",
-      "layout guideline",
-      "layout hand-off",
-      "layout handoff",
-      "layout handover",
-      "layout pairing",
-      "layout pass",
-      "layout passage",
-      "layout pattern",
-      "layout principle",
-      "layout redlines",
-      "layout review",
-      "layout scale",
-      "layout score",
-      "layout spec",
-      "layout system",
-      "layout tokens",
-      "layout variants",
-      "leading",
-      "leading audit",
-      "leading best practice",
-      "leading checklist",
-      "leading guideline",
-      "leading hand-off",
-      "leading handoff",
-      "leading handover",
-      "leading pairing",
-      "leading pass",
-      "leading passage",
-      "leading pattern",
-      "leading principle",
-      "leading redlines",
-      "leading review",
-      "leading scale",
-      "leading score",
-      "leading spec",
-      "leading system",
-      "leading tokens",
-      "leading variants",
-      "legible",
-      "legible audit",
-      "legible best practice",
-      "legible checklist",
-      "legible guideline",
-      "legible hand-off",
-      "legible handoff",
-      "legible handover",
-      "legible pairing",
-      "legible pass",
-      "legible passage",
-      "legible pattern",
-      "legible principle",
-      "legible redlines",
-      "legible review",
-      "legible scale",
-      "legible score",
-      "legible spec",
-      "legible system",
-      "legible tokens",
-      "legible variants",
-      "loading state",
-      "loading state audit",
-      "loading state best practice",
-      "loading state checklist",
-      "loading state guideline",
-      "loading state hand-off",
-      "loading state handoff",
-      "loading state handover",
-      "loading state pairing",
-      "loading state pass",
-      "loading state passage",
-      "loading state pattern",
-      "loading state principle",
-      "loading state redlines",
-      "loading state review",
-      "loading state scale",
-      "loading state score",
-      "loading state spec",
-      "loading state system",
-      "loading state tokens",
-      "loading state variants",
-      "lottie",
-      "lottie audit",
-      "lottie best practice",
-      "lottie checklist",
-      "lottie guideline",
-      "lottie hand-off",
-      "lottie handoff",
-      "lottie handover",
-      "lottie pairing",
-      "lottie pass",
-      "lottie passage",
-      "lottie pattern",
-      "lottie principle",
-      "lottie redlines",
-      "lottie review",
-      "lottie scale",
-      "lottie score",
-      "lottie spec",
-      "lottie system",
-      "lottie tokens",
-      "lottie variants",
-      "low fidelity",
-      "low fidelity audit",
-      "low fidelity best practice",
-      "low fidelity checklist",
-      "low fidelity guideline",
-      "low fidelity hand-off",
-      "low fidelity handoff",
-      "low fidelity handover",
-      "low fidelity pairing",
-      "low fidelity pass",
-      "low fidelity passage",
-      "low fidelity pattern",
-      "low fidelity principle",
-      "low fidelity redlines",
-      "low fidelity review",
-      "low fidelity scale",
-      "low fidelity score",
-      "low fidelity spec",
-      "low fidelity system",
-      "low fidelity tokens",
-      "low fidelity variants",
-      "mapping",
-      "mapping audit",
-      "mapping best practice",
-      "mapping checklist",
-      "mapping guideline",
-      "mapping hand-off",
-      "mapping handoff",
-      "mapping handover",
-      "mapping pairing",
-      "mapping pass",
-      "mapping passage",
-      "mapping pattern",
-      "mapping principle",
-      "mapping redlines",
-      "mapping review",
-      "mapping scale",
-      "mapping score",
-      "mapping spec",
-      "mapping system",
-      "mapping tokens",
-      "mapping variants",
-      "margin",
-      "margin audit",
-      "margin best practice",
-      "margin checklist",
-      "margin guideline",
-      "margin hand-off",
-      "margin handoff",
-      "margin handover",
-      "margin pairing",
-      "margin pass",
-      "margin passage",
-      "margin pattern",
-      "margin principle",
-      "margin redlines",
-      "margin review",
-      "margin scale",
-      "margin score",
-      "margin spec",
-      "margin system",
-      "margin tokens",
-      "margin variants",
-      "micro-animations",
-      "micro-animations audit",
-      "micro-animations best practice",
-      "micro-animations checklist",
-      "micro-animations guideline",
-      "micro-animations hand-off",
-      "micro-animations handoff",
-      "micro-animations handover",
-      "micro-animations pairing",
-      "micro-animations pass",
-      "micro-animations passage",
-      "micro-animations pattern",
-      "micro-animations principle",
-      "micro-animations redlines",
-      "micro-animations review",
-      "micro-animations scale",
-      "micro-animations score",
-      "micro-animations spec",
-      "micro-animations system",
-      "micro-animations tokens",
-      "micro-animations variants",
-      "microinteraction",
-      "microinteraction audit",
-      "microinteraction best practice",
-      "microinteraction checklist",
-      "microinteraction guideline",
-      "microinteraction hand-off",
-      "microinteraction handoff",
-      "microinteraction handover",
-      "microinteraction pairing",
-      "microinteraction pass",
-      "microinteraction passage",
-      "microinteraction pattern",
-      "microinteraction principle",
-      "microinteraction redlines",
-      "microinteraction review",
-      "microinteraction scale",
-      "microinteraction score",
-      "microinteraction spec",
-      "microinteraction system",
-      "microinteraction tokens",
-      "microinteraction variants",
-      "minimal",
-      "minimal audit",
-      "minimal best practice",
-      "minimal checklist",
-      "minimal guideline",
-      "minimal hand-off",
-      "minimal handoff",
-      "minimal handover",
-      "minimal pairing",
-      "minimal pass",
-      "minimal passage",
-      "minimal pattern",
-      "minimal principle",
-      "minimal redlines",
-      "minimal review",
-      "minimal scale",
-      "minimal score",
-      "minimal spec",
-      "minimal system",
-      "minimal tokens",
-      "minimal variants",
-      "minimalist",
-      "minimalist audit",
-      "minimalist best practice",
-      "minimalist checklist",
-      "minimalist guideline",
-      "minimalist hand-off",
-      "minimalist handoff",
-      "minimalist handover",
-      "minimalist pairing",
-      "minimalist pass",
-      "minimalist passage",
-      "minimalist pattern",
-      "minimalist principle",
-      "minimalist redlines",
-      "minimalist review",
-      "minimalist scale",
-      "minimalist score",
-      "minimalist spec",
-      "minimalist system",
-      "minimalist tokens",
-      "minimalist variants",
-      "modular scale",
-      "modular scale audit",
-      "modular scale best practice",
-      "modular scale checklist",
-      "modular scale guideline",
-      "modular scale hand-off",
-      "modular scale handoff",
-      "modular scale handover",
-      "modular scale pairing",
-      "modular scale pass",
-      "modular scale passage",
-      "modular scale pattern",
-      "modular scale principle",
-      "modular scale redlines",
-      "modular scale review",
-      "modular scale scale",
-      "modular scale score",
-      "modular scale spec",
-      "modular scale system",
-      "modular scale tokens",
-      "modular scale variants",
-      "motion",
-      "motion audit",
-      "motion best practice",
-      "motion checklist",
-      "motion guideline",
-      "motion hand-off",
-      "motion handoff",
-      "motion handover",
-      "motion pairing",
-      "motion pass",
-      "motion passage",
-      "motion pattern",
-      "motion principle",
-      "motion redlines",
-      "motion review",
-      "motion scale",
-      "motion score",
-      "motion spec",
-      "motion system",
-      "motion tokens",
-      "motion variants",
-      "multivariate",
-      "multivariate audit",
-      "multivariate best practice",
-      "multivariate checklist",
-      "multivariate guideline",
-      "multivariate hand-off",
-      "multivariate handoff",
-      "multivariate handover",
-      "multivariate pairing",
-      "multivariate pass",
-      "multivariate passage",
-      "multivariate pattern",
-      "multivariate principle",
-      "multivariate redlines",
-      "multivariate review",
-      "multivariate scale",
-      "multivariate score",
-      "multivariate spec",
-      "multivariate system",
-      "multivariate tokens",
-      "multivariate variants",
-      "nav",
-      "nav audit",
-      "nav best practice",
-      "nav checklist",
-      "nav guideline",
-      "nav hand-off",
-      "nav handoff",
-      "nav handover",
-      "nav pairing",
-      "nav pass",
-      "nav passage",
-      "nav pattern",
-      "nav principle",
-      "nav redlines",
-      "nav review",
-      "nav scale",
-      "nav score",
-      "nav spec",
-      "nav system",
-      "nav tokens",
-      "nav variants",
-      "navigation",
-      "navigation audit",
-      "navigation best practice",
-      "navigation checklist",
-      "navigation guideline",
-      "navigation hand-off",
-      "navigation handoff",
-      "navigation handover",
-      "navigation pairing",
-      "navigation pass",
-      "navigation passage",
-      "navigation pattern",
-      "navigation principle",
-      "navigation redlines",
-      "navigation review",
-      "navigation scale",
-      "navigation score",
-      "navigation spec",
-      "navigation system",
-      "navigation tokens",
-      "navigation variants",
-      "nielsen heuristics",
-      "nielsen heuristics audit",
-      "nielsen heuristics best practice",
-      "nielsen heuristics checklist",
-      "nielsen heuristics guideline",
-      "nielsen heuristics hand-off",
-      "nielsen heuristics handoff",
-      "nielsen heuristics handover",
-      "nielsen heuristics pairing",
-      "nielsen heuristics pass",
-      "nielsen heuristics passage",
-      "nielsen heuristics pattern",
-      "nielsen heuristics principle",
-      "nielsen heuristics redlines",
-      "nielsen heuristics review",
-      "nielsen heuristics scale",
-      "nielsen heuristics score",
-      "nielsen heuristics spec",
-      "nielsen heuristics system",
-      "nielsen heuristics tokens",
-      "nielsen heuristics variants",
-      "padding",
-      "padding audit",
-      "padding best practice",
-      "padding checklist",
-      "padding guideline",
-      "padding hand-off",
-      "padding handoff",
-      "padding handover",
-      "padding pairing",
-      "padding pass",
-      "padding passage",
-      "padding pattern",
-      "padding principle",
-      "padding redlines",
-      "padding review",
-      "padding scale",
-      "padding score",
-      "padding spec",
-      "padding system",
-      "padding tokens",
-      "padding variants",
-      "pattern library",
-      "pattern library audit",
-      "pattern library best practice",
-      "pattern library checklist",
-      "pattern library guideline",
-      "pattern library hand-off",
-      "pattern library handoff",
-      "pattern library handover",
-      "pattern library pairing",
-      "pattern library pass",
-      "pattern library passage",
-      "pattern library pattern",
-      "pattern library principle",
-      "pattern library redlines",
-      "pattern library review",
-      "pattern library scale",
-      "pattern library score",
-      "pattern library spec",
-      "pattern library system",
-      "pattern library tokens",
-      "pattern library variants",
-      "persona",
-      "persona audit",
-      "persona best practice",
-      "persona checklist",
-      "persona guideline",
-      "persona hand-off",
-      "persona handoff",
-      "persona handover",
-      "persona pairing",
-      "persona pass",
-      "persona passage",
-      "persona pattern",
-      "persona principle",
-      "persona redlines",
-      "persona review",
-      "persona scale",
-      "persona score",
-      "persona spec",
-      "persona system",
-      "persona tokens",
-      "persona variants",
-      "placeholder",
-      "placeholder audit",
-      "placeholder best practice",
-      "placeholder checklist",
-      "placeholder guideline",
-      "placeholder hand-off",
-      "placeholder handoff",
-      "placeholder handover",
-      "placeholder pairing",
-      "placeholder pass",
-      "placeholder passage",
-      "placeholder pattern",
-      "placeholder principle",
-      "placeholder redlines",
-      "placeholder review",
-      "placeholder scale",
-      "placeholder score",
-      "placeholder spec",
-      "placeholder system",
-      "placeholder tokens",
-      "placeholder variants",
-      "polished",
-      "polished audit",
-      "polished best practice",
-      "polished checklist",
-      "polished guideline",
-      "polished hand-off",
-      "polished handoff",
-      "polished handover",
-      "polished pairing",
-      "polished pass",
-      "polished passage",
-      "polished pattern",
-      "polished principle",
-      "polished redlines",
-      "polished review",
-      "polished scale",
-      "polished score",
-      "polished spec",
-      "polished system",
-      "polished tokens",
-      "polished variants",
-      "prototype",
-      "prototype audit",
-      "prototype best practice",
-      "prototype checklist",
-      "prototype guideline",
-      "prototype hand-off",
-      "prototype handoff",
-      "prototype handover",
-      "prototype pairing",
-      "prototype pass",
-      "prototype passage",
-      "prototype pattern",
-      "prototype principle",
-      "prototype redlines",
-      "prototype review",
-      "prototype scale",
-      "prototype score",
-      "prototype spec",
-      "prototype system",
-      "prototype tokens",
-      "prototype variants",
-      "prototyping",
-      "prototyping audit",
-      "prototyping best practice",
-      "prototyping checklist",
-      "prototyping guideline",
-      "prototyping hand-off",
-      "prototyping handoff",
-      "prototyping handover",
-      "prototyping pairing",
-      "prototyping pass",
-      "prototyping passage",
-      "prototyping pattern",
-      "prototyping principle",
-      "prototyping redlines",
-      "prototyping review",
-      "prototyping scale",
-      "prototyping score",
-      "prototyping spec",
-      "prototyping system",
-      "prototyping tokens",
-      "prototyping variants",
-      "readable",
-      "readable audit",
-      "readable best practice",
-      "readable checklist",
-      "readable guideline",
-      "readable hand-off",
-      "readable handoff",
-      "readable handover",
-      "readable pairing",
-      "readable pass",
-      "readable passage",
-      "readable pattern",
-      "readable principle",
-      "readable redlines",
-      "readable review",
-      "readable scale",
-      "readable score",
-      "readable spec",
-      "readable system",
-      "readable tokens",
-      "readable variants",
-      "refined",
-      "refined audit",
-      "refined best practice",
-      "refined checklist",
-      "refined guideline",
-      "refined hand-off",
-      "refined handoff",
-      "refined handover",
-      "refined pairing",
-      "refined pass",
-      "refined passage",
-      "refined pattern",
-      "refined principle",
-      "refined redlines",
-      "refined review",
-      "refined scale",
-      "refined score",
-      "refined spec",
-      "refined system",
-      "refined tokens",
-      "refined variants",
-      "responsive",
-      "responsive audit",
-      "responsive best practice",
-      "responsive checklist",
-      "responsive guideline",
-      "responsive hand-off",
-      "responsive handoff",
-      "responsive handover",
-      "responsive pairing",
-      "responsive pass",
-      "responsive passage",
-      "responsive pattern",
-      "responsive principle",
-      "responsive redlines",
-      "responsive review",
-      "responsive scale",
-      "responsive score",
-      "responsive spec",
-      "responsive system",
-      "responsive tokens",
-      "responsive variants",
-      "rhythm",
-      "rhythm audit",
-      "rhythm best practice",
-      "rhythm checklist",
-      "rhythm guideline",
-      "rhythm hand-off",
-      "rhythm handoff",
-      "rhythm handover",
-      "rhythm pairing",
-      "rhythm pass",
-      "rhythm passage",
-      "rhythm pattern",
-      "rhythm principle",
-      "rhythm redlines",
-      "rhythm review",
-      "rhythm scale",
-      "rhythm score",
-      "rhythm spec",
-      "rhythm system",
-      "rhythm tokens",
-      "rhythm variants",
-      "signifiers",
-      "signifiers audit",
-      "signifiers best practice",
-      "signifiers checklist",
-      "signifiers guideline",
-      "signifiers hand-off",
-      "signifiers handoff",
-      "signifiers handover",
-      "signifiers pairing",
-      "signifiers pass",
-      "signifiers passage",
-      "signifiers pattern",
-      "signifiers principle",
-      "signifiers redlines",
-      "signifiers review",
-      "signifiers scale",
-      "signifiers score",
-      "signifiers spec",
-      "signifiers system",
-      "signifiers tokens",
-      "signifiers variants",
-      "simple",
-      "simple audit",
-      "simple best practice",
-      "simple checklist",
-      "simple guideline",
-      "simple hand-off",
-      "simple handoff",
-      "simple handover",
-      "simple pairing",
-      "simple pass",
-      "simple passage",
-      "simple pattern",
-      "simple principle",
-      "simple redlines",
-      "simple review",
-      "simple scale",
-      "simple score",
-      "simple spec",
-      "simple system",
-      "simple tokens",
-      "simple variants",
-      "sitemap",
-      "sitemap audit",
-      "sitemap best practice",
-      "sitemap checklist",
-      "sitemap guideline",
-      "sitemap hand-off",
-      "sitemap handoff",
-      "sitemap handover",
-      "sitemap pairing",
-      "sitemap pass",
-      "sitemap passage",
-      "sitemap pattern",
-      "sitemap principle",
-      "sitemap redlines",
-      "sitemap review",
-      "sitemap scale",
-      "sitemap score",
-      "sitemap spec",
-      "sitemap system",
-      "sitemap tokens",
-      "sitemap variants",
-      "skeleton",
-      "skeleton audit",
-      "skeleton best practice",
-      "skeleton checklist",
-      "skeleton guideline",
-      "skeleton hand-off",
-      "skeleton handoff",
-      "skeleton handover",
-      "skeleton pairing",
-      "skeleton pass",
-      "skeleton passage",
-      "skeleton pattern",
-      "skeleton principle",
-      "skeleton redlines",
-      "skeleton review",
-      "skeleton scale",
-      "skeleton score",
-      "skeleton spec",
-      "skeleton system",
-      "skeleton tokens",
-      "skeleton variants",
-      "spacing",
-      "spacing audit",
-      "spacing best practice",
-      "spacing checklist",
-      "spacing guideline",
-      "spacing hand-off",
-      "spacing handoff",
-      "spacing handover",
-      "spacing pairing",
-      "spacing pass",
-      "spacing passage",
-      "spacing pattern",
-      "spacing principle",
-      "spacing redlines",
-      "spacing review",
-      "spacing scale",
-      "spacing score",
-      "spacing spec",
-      "spacing system",
-      "spacing tokens",
-      "spacing variants",
-      "spring",
-      "spring audit",
-      "spring best practice",
-      "spring checklist",
-      "spring guideline",
-      "spring hand-off",
-      "spring handoff",
-      "spring handover",
-      "spring pairing",
-      "spring pass",
-      "spring passage",
-      "spring pattern",
-      "spring principle",
-      "spring redlines",
-      "spring review",
-      "spring scale",
-      "spring score",
-      "spring spec",
-      "spring system",
-      "spring tokens",
-      "spring variants",
-      "storybook",
-      "storybook audit",
-      "storybook best practice",
-      "storybook checklist",
-      "storybook guideline",
-      "storybook hand-off",
-      "storybook handoff",
-      "storybook handover",
-      "storybook pairing",
-      "storybook pass",
-      "storybook passage",
-      "storybook pattern",
-      "storybook principle",
-      "storybook redlines",
-      "storybook review",
-      "storybook scale",
-      "storybook score",
-      "storybook spec",
-      "storybook system",
-      "storybook tokens",
-      "storybook variants",
-      "style guide",
-      "style guide audit",
-      "style guide best practice",
-      "style guide checklist",
-      "style guide guideline",
-      "style guide hand-off",
-      "style guide handoff",
-      "style guide handover",
-      "style guide pairing",
-      "style guide pass",
-      "style guide passage",
-      "style guide pattern",
-      "style guide principle",
-      "style guide redlines",
-      "style guide review",
-      "style guide scale",
-      "style guide score",
-      "style guide spec",
-      "style guide system",
-      "style guide tokens",
-      "style guide variants",
-      "success state",
-      "success state audit",
-      "success state best practice",
-      "success state checklist",
-      "success state guideline",
-      "success state hand-off",
-      "success state handoff",
-      "success state handover",
-      "success state pairing",
-      "success state pass",
-      "success state passage",
-      "success state pattern",
-      "success state principle",
-      "success state redlines",
-      "success state review",
-      "success state scale",
-      "success state score",
-      "success state spec",
-      "success state system",
-      "success state tokens",
-      "success state variants",
-      "tap target",
-      "tap target audit",
-      "tap target best practice",
-      "tap target checklist",
-      "tap target guideline",
-      "tap target hand-off",
-      "tap target handoff",
-      "tap target handover",
-      "tap target pairing",
-      "tap target pass",
-      "tap target passage",
-      "tap target pattern",
-      "tap target principle",
-      "tap target redlines",
-      "tap target review",
-      "tap target scale",
-      "tap target score",
-      "tap target spec",
-      "tap target system",
-      "tap target tokens",
-      "tap target variants",
-      "think aloud",
-      "think aloud audit",
-      "think aloud best practice",
-      "think aloud checklist",
-      "think aloud guideline",
-      "think aloud hand-off",
-      "think aloud handoff",
-      "think aloud handover",
-      "think aloud pairing",
-      "think aloud pass",
-      "think aloud passage",
-      "think aloud pattern",
-      "think aloud principle",
-      "think aloud redlines",
-      "think aloud review",
-      "think aloud scale",
-      "think aloud score",
-      "think aloud spec",
-      "think aloud system",
-      "think aloud tokens",
-      "think aloud variants",
-      "tokens",
-      "tokens audit",
-      "tokens best practice",
-      "tokens checklist",
-      "tokens guideline",
-      "tokens hand-off",
-      "tokens handoff",
-      "tokens handover",
-      "tokens pairing",
-      "tokens pass",
-      "tokens passage",
-      "tokens pattern",
-      "tokens principle",
-      "tokens redlines",
-      "tokens review",
-      "tokens scale",
-      "tokens score",
-      "tokens spec",
-      "tokens system",
-      "tokens tokens",
-      "tokens variants",
-      "touch target",
-      "touch target audit",
-      "touch target best practice",
-      "touch target checklist",
-      "touch target guideline",
-      "touch target hand-off",
-      "touch target handoff",
-      "touch target handover",
-      "touch target pairing",
-      "touch target pass",
-      "touch target passage",
-      "touch target pattern",
-      "touch target principle",
-      "touch target redlines",
-      "touch target review",
-      "touch target scale",
-      "touch target score",
-      "touch target spec",
-      "touch target system",
-      "touch target tokens",
-      "touch target variants",
-      "tracking",
-      "tracking audit",
-      "tracking best practice",
-      "tracking checklist",
-      "tracking guideline",
-      "tracking hand-off",
-      "tracking handoff",
-      "tracking handover",
-      "tracking pairing",
-      "tracking pass",
-      "tracking passage",
-      "tracking pattern",
-      "tracking principle",
-      "tracking redlines",
-      "tracking review",
-      "tracking scale",
-      "tracking score",
-      "tracking spec",
-      "tracking system",
-      "tracking tokens",
-      "tracking variants",
-      "typography",
-      "typography audit",
-      "typography best practice",
-      "typography checklist",
-      "typography guideline",
-      "typography hand-off",
-      "typography handoff",
-      "typography handover",
-      "typography pairing",
-      "typography pass",
-      "typography passage",
-      "typography pattern",
-      "typography principle",
-      "typography redlines",
-      "typography review",
-      "typography scale",
-      "typography score",
-      "typography spec",
-      "typography system",
-      "typography tokens",
-      "typography variants",
-      "usability test",
-      "usability test audit",
-      "usability test best practice",
-      "usability test checklist",
-      "usability test guideline",
-      "usability test hand-off",
-      "usability test handoff",
-      "usability test handover",
-      "usability test pairing",
-      "usability test pass",
-      "usability test passage",
-      "usability test pattern",
-      "usability test principle",
-      "usability test redlines",
-      "usability test review",
-      "usability test scale",
-      "usability test score",
-      "usability test spec",
-      "usability test system",
-      "usability test tokens",
-      "usability test variants",
-      "usable",
-      "usable audit",
-      "usable best practice",
-      "usable checklist",
-      "usable guideline",
-      "usable hand-off",
-      "usable handoff",
-      "usable handover",
-      "usable pairing",
-      "usable pass",
-      "usable passage",
-      "usable pattern",
-      "usable principle",
-      "usable redlines",
-      "usable review",
-      "usable scale",
-      "usable score",
-      "usable spec",
-      "usable system",
-      "usable tokens",
-      "usable variants",
-      "use case",
-      "use case audit",
-      "use case best practice",
-      "use case checklist",
-      "use case guideline",
-      "use case hand-off",
-      "use case handoff",
-      "use case handover",
-      "use case pairing",
-      "use case pass",
-      "use case passage",
-      "use case pattern",
-      "use case principle",
-      "use case redlines",
-      "use case review",
-      "use case scale",
-      "use case score",
-      "use case spec",
-      "use case system",
-      "use case tokens",
-      "use case variants",
-      "useful",
-      "useful audit",
-      "useful best practice",
-      "useful checklist",
-      "useful guideline",
-      "useful hand-off",
-      "useful handoff",
-      "useful handover",
-      "useful pairing",
-      "useful pass",
-      "useful passage",
-      "useful pattern",
-      "useful principle",
-      "useful redlines",
-      "useful review",
-      "useful scale",
-      "useful score",
-      "useful spec",
-      "useful system",
-      "useful tokens",
-      "useful variants",
-      "user flow",
-      "user flow audit",
-      "user flow best practice",
-      "user flow checklist",
-      "user flow guideline",
-      "user flow hand-off",
-      "user flow handoff",
-      "user flow handover",
-      "user flow pairing",
-      "user flow pass",
-      "user flow passage",
-      "user flow pattern",
-      "user flow principle",
-      "user flow redlines",
-      "user flow review",
-      "user flow scale",
-      "user flow score",
-      "user flow spec",
-      "user flow system",
-      "user flow tokens",
-      "user flow variants",
-      "variants",
-      "variants audit",
-      "variants best practice",
-      "variants checklist",
-      "variants guideline",
-      "variants hand-off",
-      "variants handoff",
-      "variants handover",
-      "variants pairing",
-      "variants pass",
-      "variants passage",
-      "variants pattern",
-      "variants principle",
-      "variants redlines",
-      "variants review",
-      "variants scale",
-      "variants score",
-      "variants spec",
-      "variants system",
-      "variants tokens",
-      "variants variants",
-      "visibility",
-      "visibility audit",
-      "visibility best practice",
-      "visibility checklist",
-      "visibility guideline",
-      "visibility hand-off",
-      "visibility handoff",
-      "visibility handover",
-      "visibility pairing",
-      "visibility pass",
-      "visibility passage",
-      "visibility pattern",
-      "visibility principle",
-      "visibility redlines",
-      "visibility review",
-      "visibility scale",
-      "visibility score",
-      "visibility spec",
-      "visibility system",
-      "visibility tokens",
-      "visibility variants",
-      "visual hierarchy",
-      "visual hierarchy audit",
-      "visual hierarchy best practice",
-      "visual hierarchy checklist",
-      "visual hierarchy guideline",
-      "visual hierarchy hand-off",
-      "visual hierarchy handoff",
-      "visual hierarchy handover",
-      "visual hierarchy pairing",
-      "visual hierarchy pass",
-      "visual hierarchy passage",
-      "visual hierarchy pattern",
-      "visual hierarchy principle",
-      "visual hierarchy redlines",
-      "visual hierarchy review",
-      "visual hierarchy scale",
-      "visual hierarchy score",
-      "visual hierarchy spec",
-      "visual hierarchy system",
-      "visual hierarchy tokens",
-      "visual hierarchy variants",
-      "wcag",
-      "wcag audit",
-      "wcag best practice",
-      "wcag checklist",
-      "wcag guideline",
-      "wcag hand-off",
-      "wcag handoff",
-      "wcag handover",
-      "wcag pairing",
-      "wcag pass",
-      "wcag passage",
-      "wcag pattern",
-      "wcag principle",
-      "wcag redlines",
-      "wcag review",
-      "wcag scale",
-      "wcag score",
-      "wcag spec",
-      "wcag system",
-      "wcag tokens",
-      "wcag variants",
-      "wireframe",
-      "wireframe audit",
-      "wireframe best practice",
-      "wireframe checklist",
-      "wireframe guideline",
-      "wireframe hand-off",
-      "wireframe handoff",
-      "wireframe handover",
-      "wireframe pairing",
-      "wireframe pass",
-      "wireframe passage",
-      "wireframe pattern",
-      "wireframe principle",
-      "wireframe redlines",
-      "wireframe review",
-      "wireframe scale",
-      "wireframe score",
-      "wireframe spec",
-      "wireframe system",
-      "wireframe tokens",
-      "wireframe variants"
-    ],
-    "keywords_neg": [
-      "ambiguous",
-      "ambiguous anti-pattern",
-      "ambiguous bug",
-      "ambiguous gap",
-      "ambiguous issue",
-      "ambiguous problem",
-      "ambiguous smell",
-      "ambiguous violation",
-      "bleeding",
-      "bleeding anti-pattern",
-      "bleeding bug",
-      "bleeding gap",
-      "bleeding issue",
-      "bleeding problem",
-      "bleeding smell",
-      "bleeding violation",
-      "broken layout",
-      "broken layout anti-pattern",
-      "broken layout bug",
-      "broken layout gap",
-      "broken layout issue",
-      "broken layout problem",
-      "broken layout smell",
-      "broken layout violation",
-      "busy",
-      "busy anti-pattern",
-      "busy bug",
-      "busy gap",
-      "busy issue",
-      "busy problem",
-      "busy smell",
-      "busy violation",
-      "chaotic",
-      "chaotic anti-pattern",
-      "chaotic bug",
-      "chaotic gap",
-      "chaotic issue",
-      "chaotic problem",
-      "chaotic smell",
-      "chaotic violation",
-      "cls",
-      "cls anti-pattern",
-      "cls bug",
-      "cls gap",
-      "cls issue",
-      "cls problem",
-      "cls smell",
-      "cls violation",
-      "cluttered",
-      "cluttered anti-pattern",
-      "cluttered bug",
-      "cluttered gap",
-      "cluttered issue",
-      "cluttered problem",
-      "cluttered smell",
-      "cluttered violation",
-      "cognitive load",
-      "cognitive load anti-pattern",
-      "cognitive load bug",
-      "cognitive load gap",
-      "cognitive load issue",
-      "cognitive load problem",
-      "cognitive load smell",
-      "cognitive load violation",
-      "confusing",
-      "confusing anti-pattern",
-      "confusing bug",
-      "confusing gap",
-      "confusing issue",
-      "confusing problem",
-      "confusing smell",
-      "confusing violation",
-      "dark pattern",
-      "dark pattern anti-pattern",
-      "dark pattern bug",
-      "dark pattern gap",
-      "dark pattern issue",
-      "dark pattern problem",
-      "dark pattern smell",
-      "dark pattern violation",
-      "dark-pattern",
-      "dark-pattern anti-pattern",
-      "dark-pattern bug",
-      "dark-pattern gap",
-      "dark-pattern issue",
-      "dark-pattern problem",
-      "dark-pattern smell",
-      "dark-pattern violation",
-      "deceptive",
-      "deceptive anti-pattern",
-      "deceptive bug",
-      "deceptive gap",
-      "deceptive issue",
-      "deceptive problem",
-      "deceptive smell",
-      "deceptive violation",
-      "flash of unstyled content",
-      "flash of unstyled content anti-pattern",
-      "flash of unstyled content bug",
-      "flash of unstyled content gap",
-      "flash of unstyled content issue",
-      "flash of unstyled content problem",
-      "flash of unstyled content smell",
-      "flash of unstyled content violation",
-      "flicker",
-      "flicker anti-pattern",
-      "flicker bug",
-      "flicker gap",
-      "flicker issue",
-      "flicker problem",
-      "flicker smell",
-      "flicker violation",
-      "fouc",
-      "fouc anti-pattern",
-      "fouc bug",
-      "fouc gap",
-      "fouc issue",
-      "fouc problem",
-      "fouc smell",
-      "fouc violation",
-      "hard to read",
-      "hard to read anti-pattern",
-      "hard to read bug",
-      "hard to read gap",
-      "hard to read issue",
-      "hard to read problem",
-      "hard to read smell",
-      "hard to read violation",
-      "hidden affordance",
-      "hidden affordance anti-pattern",
-      "hidden affordance bug",
-      "hidden affordance gap",
-      "hidden affordance issue",
-      "hidden affordance problem",
-      "hidden affordance smell",
-      "hidden affordance violation",
-      "illegible",
-      "illegible anti-pattern",
-      "illegible bug",
-      "illegible gap",
-      "illegible issue",
-      "illegible problem",
-      "illegible smell",
-      "illegible violation",
-      "inaccessible",
-      "inaccessible anti-pattern",
-      "inaccessible bug",
-      "inaccessible gap",
-      "inaccessible issue",
-      "inaccessible problem",
-      "inaccessible smell",
-      "inaccessible violation",
-      "inconsistent",
-      "inconsistent anti-pattern",
-      "inconsistent bug",
-      "inconsistent gap",
-      "inconsistent issue",
-      "inconsistent problem",
-      "inconsistent smell",
-      "inconsistent violation",
-      "infinite form",
-      "infinite form anti-pattern",
-      "infinite form bug",
-      "infinite form gap",
-      "infinite form issue",
-      "infinite form problem",
-      "infinite form smell",
-      "infinite form violation",
-      "janky",
-      "janky anti-pattern",
-      "janky bug",
-      "janky gap",
-      "janky issue",
-      "janky problem",
-      "janky smell",
-      "janky violation",
-      "jarring",
-      "jarring anti-pattern",
-      "jarring bug",
-      "jarring gap",
-      "jarring issue",
-      "jarring problem",
-      "jarring smell",
-      "jarring violation",
-      "laggy",
-      "laggy anti-pattern",
-      "laggy bug",
-      "laggy gap",
-      "laggy issue",
-      "laggy problem",
-      "laggy smell",
-      "laggy violation",
-      "layout shift",
-      "layout shift anti-pattern",
-      "layout shift bug",
-      "layout shift gap",
-      "layout shift issue",
-      "layout shift problem",
-      "layout shift smell",
-      "layout shift violation",
-      "long form",
-      "long form anti-pattern",
-      "long form bug",
-      "long form gap",
-      "long form issue",
-      "long form problem",
-      "long form smell",
-      "long form violation",
-      "low contrast",
-      "low contrast anti-pattern",
-      "low contrast bug",
-      "low contrast gap",
-      "low contrast issue",
-      "low contrast problem",
-      "low contrast smell",
-      "low contrast violation",
-      "micro text",
-      "micro text anti-pattern",
-      "micro text bug",
-      "micro text gap",
-      "micro text issue",
-      "micro text problem",
-      "micro text smell",
-      "micro text violation",
-      "misaligned",
-      "misaligned anti-pattern",
-      "misaligned bug",
-      "misaligned gap",
-      "misaligned issue",
-      "misaligned problem",
-      "misaligned smell",
-      "misaligned violation",
-      "no feedback",
-      "no feedback anti-pattern",
-      "no feedback bug",
-      "no feedback gap",
-      "no feedback issue",
-      "no feedback problem",
-      "no feedback smell",
-      "no feedback violation",
-      "noisy",
-      "noisy anti-pattern",
-      "noisy bug",
-      "noisy gap",
-      "noisy issue",
-      "noisy problem",
-      "noisy smell",
-      "noisy violation",
-      "non-responsive",
-      "non-responsive anti-pattern",
-      "non-responsive bug",
-      "non-responsive gap",
-      "non-responsive issue",
-      "non-responsive problem",
-      "non-responsive smell",
-      "non-responsive violation",
-      "not accessible",
-      "not accessible anti-pattern",
-      "not accessible bug",
-      "not accessible gap",
-      "not accessible issue",
-      "not accessible problem",
-      "not accessible smell",
-      "not accessible violation",
-      "not responsive",
-      "not responsive anti-pattern",
-      "not responsive bug",
-      "not responsive gap",
-      "not responsive issue",
-      "not responsive problem",
-      "not responsive smell",
-      "not responsive violation",
-      "off-grid",
-      "off-grid anti-pattern",
-      "off-grid bug",
-      "off-grid gap",
-      "off-grid issue",
-      "off-grid problem",
-      "off-grid smell",
-      "off-grid violation",
-      "overflow",
-      "overflow anti-pattern",
-      "overflow bug",
-      "overflow gap",
-      "overflow issue",
-      "overflow problem",
-      "overflow smell",
-      "overflow violation",
-      "overload",
-      "overload anti-pattern",
-      "overload bug",
-      "overload gap",
-      "overload issue",
-      "overload problem",
-      "overload smell",
-      "overload violation",
-      "overwhelming",
-      "overwhelming anti-pattern",
-      "overwhelming bug",
-      "overwhelming gap",
-      "overwhelming issue",
-      "overwhelming problem",
-      "overwhelming smell",
-      "overwhelming violation",
-      "poor accessibility",
-      "poor accessibility anti-pattern",
-      "poor accessibility bug",
-      "poor accessibility gap",
-      "poor accessibility issue",
-      "poor accessibility problem",
-      "poor accessibility smell",
-      "poor accessibility violation",
-      "scroll jail",
-      "scroll jail anti-pattern",
-      "scroll jail bug",
-      "scroll jail gap",
-      "scroll jail issue",
-      "scroll jail problem",
-      "scroll jail smell",
-      "scroll jail violation",
-      "scrolljank",
-      "scrolljank anti-pattern",
-      "scrolljank bug",
-      "scrolljank gap",
-      "scrolljank issue",
-      "scrolljank problem",
-      "scrolljank smell",
-      "scrolljank violation",
-      "stutter",
-      "stutter anti-pattern",
-      "stutter bug",
-      "stutter gap",
-      "stutter issue",
-      "stutter problem",
-      "stutter smell",
-      "stutter violation",
-      "tap targets too small",
-      "tap targets too small anti-pattern",
-      "tap targets too small bug",
-      "tap targets too small gap",
-      "tap targets too small issue",
-      "tap targets too small problem",
-      "tap targets too small smell",
-      "tap targets too small violation",
-      "tiny text",
-      "tiny text anti-pattern",
-      "tiny text bug",
-      "tiny text gap",
-      "tiny text issue",
-      "tiny text problem",
-      "tiny text smell",
-      "tiny text violation",
-      "tiny touch targets",
-      "tiny touch targets anti-pattern",
-      "tiny touch targets bug",
-      "tiny touch targets gap",
-      "tiny touch targets issue",
-      "tiny touch targets problem",
-      "tiny touch targets smell",
-      "tiny touch targets violation",
-      "too many fields",
-      "too many fields anti-pattern",
-      "too many fields bug",
-      "too many fields gap",
-      "too many fields issue",
-      "too many fields problem",
-      "too many fields smell",
-      "too many fields violation",
-      "too many steps",
-      "too many steps anti-pattern",
-      "too many steps bug",
-      "too many steps gap",
-      "too many steps issue",
-      "too many steps problem",
-      "too many steps smell",
-      "too many steps violation",
-      "truncated",
-      "truncated anti-pattern",
-      "truncated bug",
-      "truncated gap",
-      "truncated issue",
-      "truncated problem",
-      "truncated smell",
-      "truncated violation",
-      "unclear affordance",
-      "unclear affordance anti-pattern",
-      "unclear affordance bug",
-      "unclear affordance gap",
-      "unclear affordance issue",
-      "unclear affordance problem",
-      "unclear affordance smell",
-      "unclear affordance violation",
-      "unclear hierarchy",
-      "unclear hierarchy anti-pattern",
-      "unclear hierarchy bug",
-      "unclear hierarchy gap",
-      "unclear hierarchy issue",
-      "unclear hierarchy problem",
-      "unclear hierarchy smell",
-      "unclear hierarchy violation",
-      "unresponsive",
-      "unresponsive anti-pattern",
-      "unresponsive bug",
-      "unresponsive gap",
-      "unresponsive issue",
-      "unresponsive problem",
-      "unresponsive smell",
-      "unresponsive violation"
-    ],
-    "domain_bias": {
-      "design": 0.7,
-      "tech": 0.2,
-      "finance": 0.1
-    },
-    "curiosity_triggers": [
-      "a/b?",
-      "a11y?",
-      "accessibility?",
-      "components?",
-      "contrast?",
-      "edge case",
-      "empty state?",
-      "error state?",
-      "findings",
-      "flow",
-      "grid?",
-      "handoff?",
-      "happy path",
-      "hierarchy",
-      "hierarchy?",
-      "insights",
-      "keyboard?",
-      "legibility?",
-      "loading?",
-      "motion?",
-      "prototype?",
-      "readability?",
-      "research",
-      "spacing?",
-      "study",
-      "task flow",
-      "test",
-      "tokens?",
-      "typography?",
-      "usability?",
-      "user flow",
-      "user research",
-      "variants?",
-      "wcag?",
-      "wireframe?"
-    ],
-    "exclaim_weight": 0.2,
-    "question_weight": 0.4
-  },
-  "fundraising": {
-    "keywords_pos": [
-      "activation",
-      "activation accelerating",
-      "activation benchmarked",
-      "activation efficient",
-      "activation expanding",
-      "activation healthy",
-      "activation improving",
-      "activation increasing",
-      "activation metric",
-      "activation positive",
-      "activation ratio",
-      "activation signal",
-      "activation strong",
-      "activation top quartile",
-      "activation trajectory",
-      "activation trend",
-      "arppu",
-      "arppu accelerating",
-      "arppu benchmarked",
-      "arppu efficient",
-      "arppu expanding",
-      "arppu healthy",
-      "arppu improving",
-      "arppu increasing",
-      "arppu metric",
-      "arppu positive",
-      "arppu ratio",
-      "arppu signal",
-      "arppu strong",
-      "arppu top quartile",
-      "arppu trajectory",
-      "arppu trend",
-      "arpu",
-      "arpu accelerating",
-      "arpu benchmarked",
-      "arpu efficient",
-      "arpu expanding",
-      "arpu healthy",
-      "arpu improving",
-      "arpu increasing",
-      "arpu metric",
-      "arpu positive",
-      "arpu ratio",
-      "arpu signal",
-      "arpu strong",
-      "arpu top quartile",
-      "arpu trajectory",
-      "arpu trend",
-      "arr",
-      "arr accelerating",
-      "arr benchmarked",
-      "arr efficient",
-      "arr expanding",
-      "arr healthy",
-      "arr improving",
-      "arr increasing",
-      "arr metric",
-      "arr positive",
-      "arr ratio",
-      "arr signal",
-      "arr strong",
-      "arr top quartile",
-      "arr trajectory",
-      "arr trend",
-      "beachhead",
-      "beachhead accelerating",
-      "beachhead benchmarked",
-      "beachhead efficient",
-      "beachhead expanding",
-      "beachhead healthy",
-      "beachhead improving",
-      "beachhead increasing",
-      "beachhead metric",
-      "beachhead positive",
-      "beachhead ratio",
-      "beachhead signal",
-      "beachhead strong",
-      "beachhead top quartile",
-      "beachhead trajectory",
-      "beachhead trend",
-      "billings",
-      "billings accelerating",
-      "billings benchmarked",
-      "billings efficient",
-      "billings expanding",
-      "billings healthy",
-      "billings improving",
-      "billings increasing",
-      "billings metric",
-      "billings positive",
-      "billings ratio",
-      "billings signal",
-      "billings strong",
-      "billings top quartile",
-      "billings trajectory",
-      "billings trend",
-      "bookings",
-      "bookings accelerating",
-      "bookings benchmarked",
-      "bookings efficient",
-      "bookings expanding",
-      "bookings healthy",
-      "bookings improving",
-      "bookings increasing",
-      "bookings metric",
-      "bookings positive",
-      "bookings ratio",
-      "bookings signal",
-      "bookings strong",
-      "bookings top quartile",
-      "bookings trajectory",
-      "bookings trend",
-      "bootstrapped",
-      "bootstrapped accelerating",
-      "bootstrapped benchmarked",
-      "bootstrapped efficient",
-      "bootstrapped expanding",
-      "bootstrapped healthy",
-      "bootstrapped improving",
-      "bootstrapped increasing",
-      "bootstrapped metric",
-      "bootstrapped positive",
-      "bootstrapped ratio",
-      "bootstrapped signal",
-      "bootstrapped strong",
-      "bootstrapped top quartile",
-      "bootstrapped trajectory",
-      "bootstrapped trend",
-      "burn multiple",
-      "burn multiple accelerating",
-      "burn multiple benchmarked",
-      "burn multiple efficient",
-      "burn multiple expanding",
-      "burn multiple healthy",
-      "burn multiple improving",
-      "burn multiple increasing",
-      "burn multiple metric",
-      "burn multiple positive",
-      "burn multiple ratio",
-      "burn multiple signal",
-      "burn multiple strong",
-      "burn multiple top quartile",
-      "burn multiple trajectory",
-      "burn multiple trend",
-      "cac",
-      "cac accelerating",
-      "cac benchmarked",
-      "cac efficient",
-      "cac expanding",
-      "cac healthy",
-      "cac improving",
-      "cac increasing",
-      "cac metric",
-      "cac positive",
-      "cac ratio",
-      "cac signal",
-      "cac strong",
-      "cac top quartile",
-      "cac trajectory",
-      "cac trend",
-      "cagr",
-      "cagr accelerating",
-      "cagr benchmarked",
-      "cagr efficient",
-      "cagr expanding",
-      "cagr healthy",
-      "cagr improving",
-      "cagr increasing",
-      "cagr metric",
-      "cagr positive",
-      "cagr ratio",
-      "cagr signal",
-      "cagr strong",
-      "cagr top quartile",
-      "cagr trajectory",
-      "cagr trend",
-      "capital efficiency",
-      "capital efficiency accelerating",
-      "capital efficiency benchmarked",
-      "capital efficiency efficient",
-      "capital efficiency expanding",
-      "capital efficiency healthy",
-      "capital efficiency improving",
-      "capital efficiency increasing",
-      "capital efficiency metric",
-      "capital efficiency positive",
-      "capital efficiency ratio",
-      "capital efficiency signal",
-      "capital efficiency strong",
-      "capital efficiency top quartile",
-      "capital efficiency trajectory",
-      "capital efficiency trend",
-      "capital efficient",
-      "capital efficient accelerating",
-      "capital efficient benchmarked",
-      "capital efficient efficient",
-      "capital efficient expanding",
-      "capital efficient healthy",
-      "capital efficient improving",
-      "capital efficient increasing",
-      "capital efficient metric",
-      "capital efficient positive",
-      "capital efficient ratio",
-      "capital efficient signal",
-      "capital efficient strong",
-      "capital efficient top quartile",
-      "capital efficient trajectory",
-      "capital efficient trend",
-      "cash collections",
-      "cash collections accelerating",
-      "cash collections benchmarked",
-      "cash collections efficient",
-      "cash collections expanding",
-      "cash collections healthy",
-      "cash collections improving",
-      "cash collections increasing",
-      "cash collections metric",
-      "cash collections positive",
-      "cash collections ratio",
-      "cash collections signal",
-      "cash collections strong",
-      "cash collections top quartile",
-      "cash collections trajectory",
-      "cash collections trend",
-      "cash flow positive",
-      "cash flow positive accelerating",
-      "cash flow positive benchmarked",
-      "cash flow positive efficient",
-      "cash flow positive expanding",
-      "cash flow positive healthy",
-      "cash flow positive improving",
-      "cash flow positive increasing",
-      "cash flow positive metric",
-      "cash flow positive positive",
-      "cash flow positive ratio",
-      "cash flow positive signal",
-      "cash flow positive strong",
-      "cash flow positive top quartile",
-      "cash flow positive trajectory",
-      "cash flow positive trend",
-      "cohort expansion",
-      "cohort expansion accelerating",
-      "cohort expansion benchmarked",
-      "cohort expansion efficient",
-      "cohort expansion expanding",
-      "cohort expansion healthy",
-      "cohort expansion improving",
-      "cohort expansion increasing",
-      "cohort expansion metric",
-      "cohort expansion positive",
-      "cohort expansion ratio",
-      "cohort expansion signal",
-      "cohort expansion strong",
-      "cohort expansion top quartile",
-      "cohort expansion trajectory",
-      "cohort expansion trend",
-      "compounded",
-      "compounded accelerating",
-      "compounded benchmarked",
-      "compounded efficient",
-      "compounded expanding",
-      "compounded healthy",
-      "compounded improving",
-      "compounded increasing",
-      "compounded metric",
-      "compounded positive",
-      "compounded ratio",
-      "compounded signal",
-      "compounded strong",
-      "compounded top quartile",
-      "compounded trajectory",
-      "compounded trend",
-      "contribution margin",
-      "contribution margin accelerating",
-      "contribution margin benchmarked",
-      "contribution margin efficient",
-      "contribution margin expanding",
-      "contribution margin healthy",
-      "contribution margin improving",
-      "contribution margin increasing",
-      "contribution margin metric",
-      "contribution margin positive",
-      "contribution margin ratio",
-      "contribution margin signal",
-      "contribution margin strong",
-      "contribution margin top quartile",
-      "contribution margin trajectory",
-      "contribution margin trend",
-      "conversion rate",
-      "conversion rate accelerating",
-      "conversion rate benchmarked",
-      "conversion rate efficient",
-      "conversion rate expanding",
-      "conversion rate healthy",
-      "conversion rate improving",
-      "conversion rate increasing",
-      "conversion rate metric",
-      "conversion rate positive",
-      "conversion rate ratio",
-      "conversion rate signal",
-      "conversion rate strong",
-      "conversion rate top quartile",
-      "conversion rate trajectory",
-      "conversion rate trend",
-      "cross-sell",
-      "cross-sell accelerating",
-      "cross-sell benchmarked",
-      "cross-sell efficient",
-      "cross-sell expanding",
-      "cross-sell healthy",
-      "cross-sell improving",
-      "cross-sell increasing",
-      "cross-sell metric",
-      "cross-sell positive",
-      "cross-sell ratio",
-      "cross-sell signal",
-      "cross-sell strong",
-      "cross-sell top quartile",
-      "cross-sell trajectory",
-      "cross-sell trend",
-      "dpi",
-      "dpi accelerating",
-      "dpi benchmarked",
-      "dpi efficient",
-      "dpi expanding",
-      "dpi healthy",
-      "dpi improving",
-      "dpi increasing",
-      "dpi metric",
-      "dpi positive",
-      "dpi ratio",
-      "dpi signal",
-      "dpi strong",
-      "dpi top quartile",
-      "dpi trajectory",
-      "dpi trend",
-      "ebitda",
-      "ebitda accelerating",
-      "ebitda benchmarked",
-      "ebitda efficient",
-      "ebitda expanding",
-      "ebitda healthy",
-      "ebitda improving",
-      "ebitda increasing",
-      "ebitda metric",
-      "ebitda positive",
-      "ebitda ratio",
-      "ebitda signal",
-      "ebitda strong",
-      "ebitda top quartile",
-      "ebitda trajectory",
-      "ebitda trend",
-      "efficient growth",
-      "efficient growth accelerating",
-      "efficient growth benchmarked",
-      "efficient growth efficient",
-      "efficient growth expanding",
-      "efficient growth healthy",
-      "efficient growth improving",
-      "efficient growth increasing",
-      "efficient growth metric",
-      "efficient growth positive",
-      "efficient growth ratio",
-      "efficient growth signal",
-      "efficient growth strong",
-      "efficient growth top quartile",
-      "efficient growth trajectory",
-      "efficient growth trend",
-      "expansion",
-      "expansion accelerating",
-      "expansion benchmarked",
-      "expansion efficient",
-      "expansion expanding",
-      "expansion healthy",
-      "expansion improving",
-      "expansion increasing",
-      "expansion metric",
-      "expansion positive",
-      "expansion ratio",
-      "expansion signal",
-      "expansion strong",
-      "expansion top quartile",
-      "expansion trajectory",
-      "expansion trend",
-      "follow-on",
-      "follow-on accelerating",
-      "follow-on benchmarked",
-      "follow-on efficient",
-      "follow-on expanding",
-      "follow-on healthy",
-      "follow-on improving",
-      "follow-on increasing",
-      "follow-on metric",
-      "follow-on positive",
-      "follow-on ratio",
-      "follow-on signal",
-      "follow-on strong",
-      "follow-on top quartile",
-      "follow-on trajectory",
-      "follow-on trend",
-      "gmv",
-      "gmv accelerating",
-      "gmv benchmarked",
-      "gmv efficient",
-      "gmv expanding",
-      "gmv healthy",
-      "gmv improving",
-      "gmv increasing",
-      "gmv metric",
-      "gmv positive",
-      "gmv ratio",
-      "gmv signal",
-      "gmv strong",
-      "gmv top quartile",
-      "gmv trajectory",
-      "gmv trend",
-      "go to market",
-      "go to market accelerating",
-      "go to market benchmarked",
-      "go to market efficient",
-      "go to market expanding",
-      "go to market healthy",
-      "go to market improving",
-      "go to market increasing",
-      "go to market metric",
-      "go to market positive",
-      "go to market ratio",
-      "go to market signal",
-      "go to market strong",
-      "go to market top quartile",
-      "go to market trajectory",
-      "go to market trend",
-      "gross margin",
-      "gross margin accelerating",
-      "gross margin benchmarked",
-      "gross margin efficient",
-      "gross margin expanding",
-      "gross margin healthy",
-      "gross margin improving",
-      "gross margin increasing",
-      "gross margin metric",
-      "gross margin positive",
-      "gross margin ratio",
-      "gross margin signal",
-      "gross margin strong",
-      "gross margin top quartile",
-      "gross margin trajectory",
-      "gross margin trend",
-      "gross retention",
-      "gross retention accelerating",
-      "gross retention benchmarked",
-      "gross retention efficient",
-      "gross retention expanding",
-      "gross retention healthy",
-      "gross retention improving",
-      "gross retention increasing",
-      "gross retention metric",
-      "gross retention positive",
-      "gross retention ratio",
-      "gross retention signal",
-      "gross retention strong",
-      "gross retention top quartile",
-      "gross retention trajectory",
-      "gross retention trend",
-      "growth",
-      "growth accelerating",
-      "growth benchmarked",
-      "growth efficient",
-      "growth expanding",
-      "growth healthy",
-      "growth improving",
-      "growth increasing",
-      "growth metric",
-      "growth positive",
-      "growth ratio",
-      "growth signal",
-      "growth strong",
-      "growth top quartile",
-      "growth trajectory",
-      "growth trend",
-      "grr",
-      "grr accelerating",
-      "grr benchmarked",
-      "grr efficient",
-      "grr expanding",
-      "grr healthy",
-      "grr improving",
-      "grr increasing",
-      "grr metric",
-      "grr positive",
-      "grr ratio",
-      "grr signal",
-      "grr strong",
-      "grr top quartile",
-      "grr trajectory",
-      "grr trend",
-      "gtm",
-      "gtm accelerating",
-      "gtm benchmarked",
-      "gtm efficient",
-      "gtm expanding",
-      "gtm healthy",
-      "gtm improving",
-      "gtm increasing",
-      "gtm metric",
-      "gtm positive",
-      "gtm ratio",
-      "gtm signal",
-      "gtm strong",
-      "gtm top quartile",
-      "gtm trajectory",
-      "gtm trend",
-      "irr",
-      "irr accelerating",
-      "irr benchmarked",
-      "irr efficient",
-      "irr expanding",
-      "irr healthy",
-      "irr improving",
-      "irr increasing",
-      "irr metric",
-      "irr positive",
-      "irr ratio",
-      "irr signal",
-      "irr strong",
-      "irr top quartile",
-      "irr trajectory",
-      "irr trend",
-      "lead committed",
-      "lead committed accelerating",
-      "lead committed benchmarked",
-      "lead committed efficient",
-      "lead committed expanding",
-      "lead committed healthy",
-      "lead committed improving",
-      "lead committed increasing",
-      "lead committed metric",
-      "lead committed positive",
-      "lead committed ratio",
-      "lead committed signal",
-      "lead committed strong",
-      "lead committed top quartile",
-      "lead committed trajectory",
-      "lead committed trend",
-      "ltv",
-      "ltv accelerating",
-      "ltv benchmarked",
-      "ltv efficient",
-      "ltv expanding",
-      "ltv healthy",
-      "ltv improving",
-      "ltv increasing",
-      "ltv metric",
-      "ltv positive",
-      "ltv ratio",
-      "ltv signal",
-      "ltv strong",
-      "ltv to cac",
-      "ltv to cac accelerating",
-      "ltv to cac benchmarked",
-      "ltv to cac efficient",
-      "ltv to cac expanding",
-      "ltv to cac healthy",
-      "ltv to cac improving",
-      "ltv to cac increasing",
-      "ltv to cac metric",
-      "ltv to cac positive",
-      "ltv to cac ratio",
-      "ltv to cac signal",
-      "ltv to cac strong",
-      "ltv to cac top quartile",
-      "ltv to cac trajectory",
-      "ltv to cac trend",
-      "ltv top quartile",
-      "ltv trajectory",
-      "ltv trend",
-      "ltv:cac",
-      "ltv:cac accelerating",
-      "ltv:cac benchmarked",
-      "ltv:cac efficient",
-      "ltv:cac expanding",
-      "ltv:cac healthy",
-      "ltv:cac improving",
-      "ltv:cac increasing",
-      "ltv:cac metric",
-      "ltv:cac positive",
-      "ltv:cac ratio",
-      "ltv:cac signal",
-      "ltv:cac strong",
-      "ltv:cac top quartile",
-      "ltv:cac trajectory",
-      "ltv:cac trend",
-      "margin",
-      "margin accelerating",
-      "margin benchmarked",
-      "margin efficient",
-      "margin expanding",
-      "margin expansion",
-      "margin expansion accelerating",
-      "margin expansion benchmarked",
-      "margin expansion efficient",
-      "margin expansion expanding",
-      "margin expansion healthy",
-      "margin expansion improving",
-      "margin expansion increasing",
-      "margin expansion metric",
-      "margin expansion positive",
-      "margin expansion ratio",
-      "margin expansion signal",
-      "margin expansion strong",
-      "margin expansion top quartile",
-      "margin expansion trajectory",
-      "margin expansion trend",
-      "margin healthy",
-      "margin improving",
-      "margin increasing",
-      "margin metric",
-      "margin positive",
-      "margin ratio",
-      "margin signal",
-      "margin strong",
-      "margin top quartile",
-      "margin trajectory",
-      "margin trend",
-      "market size",
-      "market size accelerating",
-      "market size benchmarked",
-      "market size efficient",
-      "market size expanding",
-      "market size healthy",
-      "market size improving",
-      "market size increasing",
-      "market size metric",
-      "market size positive",
-      "market size ratio",
-      "market size signal",
-      "market size strong",
-      "market size top quartile",
-      "market size trajectory",
-      "market size trend",
-      "markup",
-      "markup accelerating",
-      "markup benchmarked",
-      "markup efficient",
-      "markup expanding",
-      "markup healthy",
-      "markup improving",
-      "markup increasing",
-      "markup metric",
-      "markup positive",
-      "markup ratio",
-      "markup signal",
-      "markup strong",
-      "markup top quartile",
-      "markup trajectory",
-      "markup trend",
-      "moic",
-      "moic accelerating",
-      "moic benchmarked",
-      "moic efficient",
-      "moic expanding",
-      "moic healthy",
-      "moic improving",
-      "moic increasing",
-      "moic metric",
-      "moic positive",
-      "moic ratio",
-      "moic signal",
-      "moic strong",
-      "moic top quartile",
-      "moic trajectory",
-      "moic trend",
-      "months to payback",
-      "months to payback accelerating",
-      "months to payback benchmarked",
-      "months to payback efficient",
-      "months to payback expanding",
-      "months to payback healthy",
-      "months to payback improving",
-      "months to payback increasing",
-      "months to payback metric",
-      "months to payback positive",
-      "months to payback ratio",
-      "months to payback signal",
-      "months to payback strong",
-      "months to payback top quartile",
-      "months to payback trajectory",
-      "months to payback trend",
-      "motion",
-      "motion accelerating",
-      "motion benchmarked",
-      "motion efficient",
-      "motion expanding",
-      "motion healthy",
-      "motion improving",
-      "motion increasing",
-      "motion metric",
-      "motion positive",
-      "motion ratio",
-      "motion signal",
-      "motion strong",
-      "motion top quartile",
-      "motion trajectory",
-      "motion trend",
-      "mrr",
-      "mrr accelerating",
-      "mrr benchmarked",
-      "mrr efficient",
-      "mrr expanding",
-      "mrr healthy",
-      "mrr improving",
-      "mrr increasing",
-      "mrr metric",
-      "mrr positive",
-      "mrr ratio",
-      "mrr signal",
-      "mrr strong",
-      "mrr top quartile",
-      "mrr trajectory",
-      "mrr trend",
-      "ndr",
-      "ndr accelerating",
-      "ndr benchmarked",
-      "ndr efficient",
-      "ndr expanding",
-      "ndr healthy",
-      "ndr improving",
-      "ndr increasing",
-      "ndr metric",
-      "ndr positive",
-      "ndr ratio",
-      "ndr signal",
-      "ndr strong",
-      "ndr top quartile",
-      "ndr trajectory",
-      "ndr trend",
-      "net new",
-      "net new accelerating",
-      "net new benchmarked",
-      "net new efficient",
-      "net new expanding",
-      "net new healthy",
-      "net new improving",
-      "net new increasing",
-      "net new metric",
-      "net new positive",
-      "net new ratio",
-      "net new signal",
-      "net new strong",
-      "net new top quartile",
-      "net new trajectory",
-      "net new trend",
-      "net retention",
-      "net retention accelerating",
-      "net retention benchmarked",
-      "net retention efficient",
-      "net retention expanding",
-      "net retention healthy",
-      "net retention improving",
-      "net retention increasing",
-      "net retention metric",
-      "net retention positive",
-      "net retention ratio",
-      "net retention signal",
-      "net retention strong",
-      "net retention top quartile",
-      "net retention trajectory",
-      "net retention trend",
-      "op leverage",
-      "op leverage accelerating",
-      "op leverage benchmarked",
-      "op leverage efficient",
-      "op leverage expanding",
-      "op leverage healthy",
-      "op leverage improving",
-      "op leverage increasing",
-      "op leverage metric",
-      "op leverage positive",
-      "op leverage ratio",
-      "op leverage signal",
-      "op leverage strong",
-      "op leverage top quartile",
-      "op leverage trajectory",
-      "op leverage trend",
-      "operating leverage",
-      "operating leverage accelerating",
-      "operating leverage benchmarked",
-      "operating leverage efficient",
-      "operating leverage expanding",
-      "operating leverage healthy",
-      "operating leverage improving",
-      "operating leverage increasing",
-      "operating leverage metric",
-      "operating leverage positive",
-      "operating leverage ratio",
-      "operating leverage signal",
-      "operating leverage strong",
-      "operating leverage top quartile",
-      "operating leverage trajectory",
-      "operating leverage trend",
-      "payback",
-      "payback accelerating",
-      "payback benchmarked",
-      "payback efficient",
-      "payback expanding",
-      "payback healthy",
-      "payback improving",
-      "payback increasing",
-      "payback metric",
-      "payback period",
-      "payback period accelerating",
-      "payback period benchmarked",
-      "payback period efficient",
-      "payback period expanding",
-      "payback period healthy",
-      "payback period improving",
-      "payback period increasing",
-      "payback period metric",
-      "payback period positive",
-      "payback period ratio",
-      "payback period signal",
-      "payback period strong",
-      "payback period top quartile",
-      "payback period trajectory",
-      "payback period trend",
-      "payback positive",
-      "payback ratio",
-      "payback signal",
-      "payback strong",
-      "payback top quartile",
-      "payback trajectory",
-      "payback trend",
-      "pipeline",
-      "pipeline accelerating",
-      "pipeline benchmarked",
-      "pipeline efficient",
-      "pipeline expanding",
-      "pipeline healthy",
-      "pipeline improving",
-      "pipeline increasing",
-      "pipeline metric",
-      "pipeline positive",
-      "pipeline ratio",
-      "pipeline signal",
-      "pipeline strong",
-      "pipeline top quartile",
-      "pipeline trajectory",
-      "pipeline trend",
-      "pricing power",
-      "pricing power accelerating",
-      "pricing power benchmarked",
-      "pricing power efficient",
-      "pricing power expanding",
-      "pricing power healthy",
-      "pricing power improving",
-      "pricing power increasing",
-      "pricing power metric",
-      "pricing power positive",
-      "pricing power ratio",
-      "pricing power signal",
-      "pricing power strong",
-      "pricing power top quartile",
-      "pricing power trajectory",
-      "pricing power trend",
-      "profit",
-      "profit accelerating",
-      "profit benchmarked",
-      "profit efficient",
-      "profit expanding",
-      "profit healthy",
-      "profit improving",
-      "profit increasing",
-      "profit metric",
-      "profit positive",
-      "profit ratio",
-      "profit signal",
-      "profit strong",
-      "profit top quartile",
-      "profit trajectory",
-      "profit trend",
-      "profitable",
-      "profitable accelerating",
-      "profitable benchmarked",
-      "profitable efficient",
-      "profitable expanding",
-      "profitable healthy",
-      "profitable improving",
-      "profitable increasing",
-      "profitable metric",
-      "profitable positive",
-      "profitable ratio",
-      "profitable signal",
-      "profitable strong",
-      "profitable top quartile",
-      "profitable trajectory",
-      "profitable trend",
-      "qoq growth",
-      "qoq growth accelerating",
-      "qoq growth benchmarked",
-      "qoq growth efficient",
-      "qoq growth expanding",
-      "qoq growth healthy",
-      "qoq growth improving",
-      "qoq growth increasing",
-      "qoq growth metric",
-      "qoq growth positive",
-      "qoq growth ratio",
-      "qoq growth signal",
-      "qoq growth strong",
-      "qoq growth top quartile",
-      "qoq growth trajectory",
-      "qoq growth trend",
-      "retention",
-      "retention accelerating",
-      "retention benchmarked",
-      "retention efficient",
-      "retention expanding",
-      "retention healthy",
-      "retention improving",
-      "retention increasing",
-      "retention metric",
-      "retention positive",
-      "retention ratio",
-      "retention signal",
-      "retention strong",
-      "retention top quartile",
-      "retention trajectory",
-      "retention trend",
-      "revenue",
-      "revenue accelerating",
-      "revenue benchmarked",
-      "revenue efficient",
-      "revenue expanding",
-      "revenue healthy",
-      "revenue improving",
-      "revenue increasing",
-      "revenue metric",
-      "revenue positive",
-      "revenue ratio",
-      "revenue signal",
-      "revenue strong",
-      "revenue top quartile",
-      "revenue trajectory",
-      "revenue trend",
-      "sales velocity",
-      "sales velocity accelerating",
-      "sales velocity benchmarked",
-      "sales velocity efficient",
-      "sales velocity expanding",
-      "sales velocity healthy",
-      "sales velocity improving",
-      "sales velocity increasing",
-      "sales velocity metric",
-      "sales velocity positive",
-      "sales velocity ratio",
-      "sales velocity signal",
-      "sales velocity strong",
-      "sales velocity top quartile",
-      "sales velocity trajectory",
-      "sales velocity trend",
-      "sam",
-      "sam accelerating",
-      "sam benchmarked",
-      "sam efficient",
-      "sam expanding",
-      "sam healthy",
-      "sam improving",
-      "sam increasing",
-      "sam metric",
-      "sam positive",
-      "sam ratio",
-      "sam signal",
-      "sam strong",
-      "sam top quartile",
-      "sam trajectory",
-      "sam trend",
-      "som",
-      "som accelerating",
-      "som benchmarked",
-      "som efficient",
-      "som expanding",
-      "som healthy",
-      "som improving",
-      "som increasing",
-      "som metric",
-      "som positive",
-      "som ratio",
-      "som signal",
-      "som strong",
-      "som top quartile",
-      "som trajectory",
-      "som trend",
-      "step up",
-      "step up accelerating",
-      "step up benchmarked",
-      "step up efficient",
-      "step up expanding",
-      "step up healthy",
-      "step up improving",
-      "step up increasing",
-      "step up metric",
-      "step up positive",
-      "step up ratio",
-      "step up signal",
-      "step up strong",
-      "step up top quartile",
-      "step up trajectory",
-      "step up trend",
-      "tac",
-      "tac accelerating",
-      "tac benchmarked",
-      "tac efficient",
-      "tac expanding",
-      "tac healthy",
-      "tac improving",
-      "tac increasing",
-      "tac metric",
-      "tac positive",
-      "tac ratio",
-      "tac signal",
-      "tac strong",
-      "tac top quartile",
-      "tac trajectory",
-      "tac trend",
-      "take rate",
-      "take rate accelerating",
-      "take rate benchmarked",
-      "take rate efficient",
-      "take rate expanding",
-      "take rate healthy",
-      "take rate improving",
-      "take rate increasing",
-      "take rate metric",
-      "take rate positive",
-      "take rate ratio",
-      "take rate signal",
-      "take rate strong",
-      "take rate top quartile",
-      "take rate trajectory",
-      "take rate trend",
-      "tam",
-      "tam accelerating",
-      "tam benchmarked",
-      "tam efficient",
-      "tam expanding",
-      "tam healthy",
-      "tam improving",
-      "tam increasing",
-      "tam metric",
-      "tam positive",
-      "tam ratio",
-      "tam signal",
-      "tam strong",
-      "tam top quartile",
-      "tam trajectory",
-      "tam trend",
-      "term sheet",
-      "term sheet accelerating",
-      "term sheet benchmarked",
-      "term sheet efficient",
-      "term sheet expanding",
-      "term sheet healthy",
-      "term sheet improving",
-      "term sheet increasing",
-      "term sheet metric",
-      "term sheet positive",
-      "term sheet ratio",
-      "term sheet signal",
-      "term sheet strong",
-      "term sheet top quartile",
-      "term sheet trajectory",
-      "term sheet trend",
-      "topline",
-      "topline accelerating",
-      "topline benchmarked",
-      "topline efficient",
-      "topline expanding",
-      "topline healthy",
-      "topline improving",
-      "topline increasing",
-      "topline metric",
-      "topline positive",
-      "topline ratio",
-      "topline signal",
-      "topline strong",
-      "topline top quartile",
-      "topline trajectory",
-      "topline trend",
-      "tvpi",
-      "tvpi accelerating",
-      "tvpi benchmarked",
-      "tvpi efficient",
-      "tvpi expanding",
-      "tvpi healthy",
-      "tvpi improving",
-      "tvpi increasing",
-      "tvpi metric",
-      "tvpi positive",
-      "tvpi ratio",
-      "tvpi signal",
-      "tvpi strong",
-      "tvpi top quartile",
-      "tvpi trajectory",
-      "tvpi trend",
-      "unit economics",
-      "unit economics accelerating",
-      "unit economics benchmarked",
-      "unit economics efficient",
-      "unit economics expanding",
-      "unit economics healthy",
-      "unit economics improving",
-      "unit economics increasing",
-      "unit economics metric",
-      "unit economics positive",
-      "unit economics ratio",
-      "unit economics signal",
-      "unit economics strong",
-      "unit economics top quartile",
-      "unit economics trajectory",
-      "unit economics trend",
-      "upsell",
-      "upsell accelerating",
-      "upsell benchmarked",
-      "upsell efficient",
-      "upsell expanding",
-      "upsell healthy",
-      "upsell improving",
-      "upsell increasing",
-      "upsell metric",
-      "upsell positive",
-      "upsell ratio",
-      "upsell signal",
-      "upsell strong",
-      "upsell top quartile",
-      "upsell trajectory",
-      "upsell trend",
-      "value based pricing",
-      "value based pricing accelerating",
-      "value based pricing benchmarked",
-      "value based pricing efficient",
-      "value based pricing expanding",
-      "value based pricing healthy",
-      "value based pricing improving",
-      "value based pricing increasing",
-      "value based pricing metric",
-      "value based pricing positive",
-      "value based pricing ratio",
-      "value based pricing signal",
-      "value based pricing strong",
-      "value based pricing top quartile",
-      "value based pricing trajectory",
-      "value based pricing trend",
-      "win rate",
-      "win rate accelerating",
-      "win rate benchmarked",
-      "win rate efficient",
-      "win rate expanding",
-      "win rate healthy",
-      "win rate improving",
-      "win rate increasing",
-      "win rate metric",
-      "win rate positive",
-      "win rate ratio",
-      "win rate signal",
-      "win rate strong",
-      "win rate top quartile",
-      "win rate trajectory",
-      "win rate trend",
-      "yoy growth",
-      "yoy growth accelerating",
-      "yoy growth benchmarked",
-      "yoy growth efficient",
-      "yoy growth expanding",
-      "yoy growth healthy",
-      "yoy growth improving",
-      "yoy growth increasing",
-      "yoy growth metric",
-      "yoy growth positive",
-      "yoy growth ratio",
-      "yoy growth signal",
-      "yoy growth strong",
-      "yoy growth top quartile",
-      "yoy growth trajectory",
-      "yoy growth trend"
-    ],
-    "keywords_neg": [
-      "bad debt",
-      "bad debt concern",
-      "bad debt flag",
-      "bad debt headwind",
-      "bad debt issue",
-      "bad debt problem",
-      "bad debt risk",
-      "bridge",
-      "bridge concern",
-      "bridge flag",
-      "bridge headwind",
-      "bridge issue",
-      "bridge problem",
-      "bridge risk",
-      "bridge to nowhere",
-      "bridge to nowhere concern",
-      "bridge to nowhere flag",
-      "bridge to nowhere headwind",
-      "bridge to nowhere issue",
-      "bridge to nowhere problem",
-      "bridge to nowhere risk",
-      "burn",
-      "burn concern",
-      "burn flag",
-      "burn headwind",
-      "burn issue",
-      "burn problem",
-      "burn risk",
-      "cap table complexity",
-      "cap table complexity concern",
-      "cap table complexity flag",
-      "cap table complexity headwind",
-      "cap table complexity issue",
-      "cap table complexity problem",
-      "cap table complexity risk",
-      "cap table messy",
-      "cap table messy concern",
-      "cap table messy flag",
-      "cap table messy headwind",
-      "cap table messy issue",
-      "cap table messy problem",
-      "cap table messy risk",
-      "cash burn",
-      "cash burn concern",
-      "cash burn flag",
-      "cash burn headwind",
-      "cash burn issue",
-      "cash burn problem",
-      "cash burn risk",
-      "churn",
-      "churn concern",
-      "churn flag",
-      "churn headwind",
-      "churn issue",
-      "churn problem",
-      "churn risk",
-      "contraction",
-      "contraction concern",
-      "contraction flag",
-      "contraction headwind",
-      "contraction issue",
-      "contraction problem",
-      "contraction risk",
-      "cram down",
-      "cram down concern",
-      "cram down flag",
-      "cram down headwind",
-      "cram down issue",
-      "cram down problem",
-      "cram down risk",
-      "debt",
-      "debt concern",
-      "debt flag",
-      "debt headwind",
-      "debt issue",
-      "debt problem",
-      "debt risk",
-      "default",
-      "default concern",
-      "default flag",
-      "default headwind",
-      "default issue",
-      "default problem",
-      "default risk",
-      "delinquency",
-      "delinquency concern",
-      "delinquency flag",
-      "delinquency headwind",
-      "delinquency issue",
-      "delinquency problem",
-      "delinquency risk",
-      "dilution",
-      "dilution concern",
-      "dilution flag",
-      "dilution headwind",
-      "dilution issue",
-      "dilution problem",
-      "dilution risk",
-      "down round",
-      "down round concern",
-      "down round flag",
-      "down round headwind",
-      "down round issue",
-      "down round problem",
-      "down round risk",
-      "excessive dilution",
-      "excessive dilution concern",
-      "excessive dilution flag",
-      "excessive dilution headwind",
-      "excessive dilution issue",
-      "excessive dilution problem",
-      "excessive dilution risk",
-      "flat round",
-      "flat round concern",
-      "flat round flag",
-      "flat round headwind",
-      "flat round issue",
-      "flat round problem",
-      "flat round risk",
-      "gross churn",
-      "gross churn concern",
-      "gross churn flag",
-      "gross churn headwind",
-      "gross churn issue",
-      "gross churn problem",
-      "gross churn risk",
-      "gross margin pressure",
-      "gross margin pressure concern",
-      "gross margin pressure flag",
-      "gross margin pressure headwind",
-      "gross margin pressure issue",
-      "gross margin pressure problem",
-      "gross margin pressure risk",
-      "high burn",
-      "high burn concern",
-      "high burn flag",
-      "high burn headwind",
-      "high burn issue",
-      "high burn problem",
-      "high burn risk",
-      "high cac",
-      "high cac concern",
-      "high cac flag",
-      "high cac headwind",
-      "high cac issue",
-      "high cac problem",
-      "high cac risk",
-      "liquidation overhang",
-      "liquidation overhang concern",
-      "liquidation overhang flag",
-      "liquidation overhang headwind",
-      "liquidation overhang issue",
-      "liquidation overhang problem",
-      "liquidation overhang risk",
-      "logo churn",
-      "logo churn concern",
-      "logo churn flag",
-      "logo churn headwind",
-      "logo churn issue",
-      "logo churn problem",
-      "logo churn risk",
-      "loss",
-      "loss concern",
-      "loss flag",
-      "loss headwind",
-      "loss issue",
-      "loss problem",
-      "loss risk",
-      "low ltv",
-      "low ltv concern",
-      "low ltv flag",
-      "low ltv headwind",
-      "low ltv issue",
-      "low ltv problem",
-      "low ltv risk",
-      "missed target",
-      "missed target concern",
-      "missed target flag",
-      "missed target headwind",
-      "missed target issue",
-      "missed target problem",
-      "missed target risk",
-      "negative margin",
-      "negative margin concern",
-      "negative margin flag",
-      "negative margin headwind",
-      "negative margin issue",
-      "negative margin problem",
-      "negative margin risk",
-      "negative ndr",
-      "negative ndr concern",
-      "negative ndr flag",
-      "negative ndr headwind",
-      "negative ndr issue",
-      "negative ndr problem",
-      "negative ndr risk",
-      "net churn",
-      "net churn concern",
-      "net churn flag",
-      "net churn headwind",
-      "net churn issue",
-      "net churn problem",
-      "net churn risk",
-      "no pmf",
-      "no pmf concern",
-      "no pmf flag",
-      "no pmf headwind",
-      "no pmf issue",
-      "no pmf problem",
-      "no pmf risk",
-      "no product market fit",
-      "no product market fit concern",
-      "no product market fit flag",
-      "no product market fit headwind",
-      "no product market fit issue",
-      "no product market fit problem",
-      "no product market fit risk",
-      "operating loss",
-      "operating loss concern",
-      "operating loss flag",
-      "operating loss headwind",
-      "operating loss issue",
-      "operating loss problem",
-      "operating loss risk",
-      "overhang",
-      "overhang concern",
-      "overhang flag",
-      "overhang headwind",
-      "overhang issue",
-      "overhang problem",
-      "overhang risk",
-      "payback slipping",
-      "payback slipping concern",
-      "payback slipping flag",
-      "payback slipping headwind",
-      "payback slipping issue",
-      "payback slipping problem",
-      "payback slipping risk",
-      "pipeline slipping",
-      "pipeline slipping concern",
-      "pipeline slipping flag",
-      "pipeline slipping headwind",
-      "pipeline slipping issue",
-      "pipeline slipping problem",
-      "pipeline slipping risk",
-      "retention drop",
-      "retention drop concern",
-      "retention drop flag",
-      "retention drop headwind",
-      "retention drop issue",
-      "retention drop problem",
-      "retention drop risk",
-      "revenue churn",
-      "revenue churn concern",
-      "revenue churn flag",
-      "revenue churn headwind",
-      "revenue churn issue",
-      "revenue churn problem",
-      "revenue churn risk",
-      "runway short",
-      "runway short concern",
-      "runway short flag",
-      "runway short headwind",
-      "runway short issue",
-      "runway short problem",
-      "runway short risk",
-      "shrinking margin",
-      "shrinking margin concern",
-      "shrinking margin flag",
-      "shrinking margin headwind",
-      "shrinking margin issue",
-      "shrinking margin problem",
-      "shrinking margin risk",
-      "slowing growth",
-      "slowing growth concern",
-      "slowing growth flag",
-      "slowing growth headwind",
-      "slowing growth issue",
-      "slowing growth problem",
-      "slowing growth risk",
-      "stalled growth",
-      "stalled growth concern",
-      "stalled growth flag",
-      "stalled growth headwind",
-      "stalled growth issue",
-      "stalled growth problem",
-      "stalled growth risk",
-      "write down",
-      "write down concern",
-      "write down flag",
-      "write down headwind",
-      "write down issue",
-      "write down problem",
-      "write down risk",
-      "write-off",
-      "write-off concern",
-      "write-off flag",
-      "write-off headwind",
-      "write-off issue",
-      "write-off problem",
-      "write-off risk"
-    ],
-    "domain_bias": {
-      "finance": 0.7,
-      "tech": 0.2,
-      "design": 0.1
-    },
-    "curiosity_triggers": [
-      "burn multiple?",
-      "cap table?",
-      "cohort",
-      "convertible?",
-      "dataroom?",
-      "dilution?",
-      "gross margin?",
-      "growth model?",
-      "lead?",
-      "liquidation pref?",
-      "metrics?",
-      "mfns?",
-      "north star?",
-      "notes?",
-      "ownership?",
-      "payback",
-      "payback?",
-      "pipeline?",
-      "post-money?",
-      "pre-money?",
-      "pricing?",
-      "pro rata?",
-      "retention?",
-      "rights?",
-      "round?",
-      "runway",
-      "runway?",
-      "safe?",
-      "terms?",
-      "unit",
-      "valuation?",
-      "vesting?",
-      "warrant?"
-    ],
-    "exclaim_weight": 0.25,
-    "question_weight": 0.6
-  }
-}
-TEMPLATES = {
-  "('supportive', 'pos', 'tech')": [
-    "nice!",
-    "love it",
-    "ship it",
-    "clean!",
-    "fast!",
-    "slick",
-    "let's go",
-    "solid win",
-    "on point",
-    "nailed it",
-    "good call",
-    "smart move",
-    "tight",
-    "🔥 numbers",
-    "shipworthy",
-    "ready to scale",
-    "zero fluff",
-    "strong arch",
-    "great DX",
-    "devs will love",
-    "looks robust",
-    "stable",
-    "battle ready",
-    "prod ready",
-    "that slaps",
-    "chef's kiss",
-    "👏 bench!",
-    "latency crush",
-    "sweet speed",
-    "optimized!"
-  ],
-  "('supportive', 'curious', 'tech')": [
-    "demo?",
-    "benchmarks?",
-    "api?",
-    "link?",
-    "diagram?",
-    "code sample?",
-    "latency numbers?",
-    "p99?",
-    "throughput?",
-    "scaling plan?",
-    "failover?",
-    "slo sheet?",
-    "cost curve?",
-    "roadmap?",
-    "compat?",
-    "migration path?",
-    "sdk sample?",
-    "quota?",
-    "limits?",
-    "security notes?",
-    "compliance?",
-    "infra map?",
-    "deploy guide?",
-    "canary plan?",
-    "traces?",
-    "otel?",
-    "feature flags?",
-    "shadow traffic?"
-  ],
-  "('supportive', 'pos', 'design')": [
-    "elegant",
-    "feels right",
-    "clean",
-    "balanced",
-    "polished",
-    "love the grid",
-    "great rhythm",
-    "readable",
-    "accessible",
-    "nice tokens",
-    "tidy",
-    "delightful",
-    "on-brand",
-    "refined",
-    "calm ui",
-    "buttery",
-    "crisp",
-    "flows well",
-    "clear affordance",
-    "nice contrast",
-    "solid hierarchy",
-    "cohesive",
-    "friendly",
-    "inviting",
-    "snappy",
-    "tactile",
-    "pleasant",
-    "intuitive",
-    "tasteful",
-    "minimal"
-  ],
-  "('supportive', 'curious', 'design')": [
-    "show flow",
-    "prototype?",
-    "users?",
-    "empty state?",
-    "tokens?",
-    "components?",
-    "motion?",
-    "accessibility?",
-    "contrast?",
-    "grid spec?",
-    "spacing scale?",
-    "type scale?",
-    "icons?",
-    "variants?",
-    "error states?",
-    "loading?",
-    "microcopy?",
-    "content style?",
-    "handoff?",
-    "redlines?",
-    "a/b plan?",
-    "research?",
-    "personas?",
-    "journey?",
-    "entry points?",
-    "tap targets?",
-    "keyboard nav?"
-  ],
-  "('supportive', 'pos', 'finance')": [
-    "good growth",
-    "nice margin",
-    "solid",
-    "great unit econ",
-    "love the NDR",
-    "healthy CAC",
-    "fast payback",
-    "capital efficient",
-    "clean cap table",
-    "profitable path",
-    "great pipeline",
-    "strong cohorts",
-    "🔥 ARR",
-    "solid bookings",
-    "margin up",
-    "runway strong",
-    "great step-up",
-    "top quartile",
-    "de-risked",
-    "confident",
-    "compounding",
-    "efficient growth",
-    "good leverage",
-    "expanding",
-    "healthy trend",
-    "love the metrics"
-  ],
-  "('supportive', 'curious', 'finance')": [
-    "unit econ?",
-    "cohorts?",
-    "retention?",
-    "payback?",
-    "burn multiple?",
-    "runway?",
-    "valuation?",
-    "round size?",
-    "lead?",
-    "ownership?",
-    "dilution?",
-    "cap table?",
-    "LRP?",
-    "pricing?",
-    "sales velocity?",
-    "pipeline?",
-    "ARPU?",
-    "NDR split?",
-    "gross margin?",
-    "contribution?",
-    "collections?",
-    "cash burn?",
-    "MOIC?",
-    "TVPI?",
-    "north star?",
-    "assumptions?"
-  ],
-  "('skeptical', 'neg', 'finance')": [
-    "evidence?",
-    "unit econ?",
-    "hmm",
-    "source?",
-    "show math",
-    "assumptions?",
-    "churn drivers?",
-    "retention risk?",
-    "pipeline quality?",
-    "why flat?",
-    "downside?",
-    "sensitivity?",
-    "cash runway?",
-    "bridge why?",
-    "overhang?",
-    "dilution risk?",
-    "payback slips?",
-    "margin pressure?",
-    "burn too high?",
-    "weak cohorts?",
-    "negative NDR?",
-    "debt terms?",
-    "pref stack?",
-    "cap table messy?",
-    "valuation stretch?"
-  ],
-  "('skeptical', 'curious', 'tech')": [
-    "numbers?",
-    "bench?",
-    "how?",
-    "tradeoffs?",
-    "failure modes?",
-    "limits?",
-    "edge cases?",
-    "compat?",
-    "migration pain?",
-    "operational load?",
-    "blast radius?",
-    "rpo/rto?",
-    "cold start?",
-    "locks?",
-    "deadlocks?",
-    "backpressure?",
-    "thundering herd?",
-    "timeouts?",
-    "retries?",
-    "idempotency?",
-    "rollbacks?",
-    "regressions?",
-    "security model?",
-    "supply chain?",
-    "sbom?"
-  ],
-  "('curious', 'neutral', 'design')": [
-    "show flow",
-    "users?",
-    "why this?",
-    "what's next?",
-    "contrast?",
-    "hierarchy?",
-    " tokens?",
-    "copy tone?",
-    "voice?",
-    "microcopy?",
-    "motion?",
-    "variants?",
-    "density?",
-    "mobile first?",
-    "empty states?",
-    "icons?",
-    "type scale?",
-    "leading?",
-    "kerning?",
-    "tap targets?",
-    "scroll length?",
-    "content load?",
-    "edge cases?",
-    "progress?"
-  ],
-  "('curious', 'curious', 'tech')": [
-    "how?",
-    "why?",
-    "tradeoffs?",
-    "alternatives?",
-    "fallbacks?",
-    "graceful degrade?",
-    "when to use?",
-    "limits?",
-    "cost curve?",
-    "latency path?",
-    "throughput path?",
-    "stateful?",
-    "stateless?",
-    "exactly once?",
-    "saga?",
-    "choreography?",
-    "orchestration?",
-    "observability?",
-    "tracing?",
-    "otlp?",
-    "error budget?",
-    "slo math?",
-    "multi-tenant?",
-    "isolation?",
-    "secrets?",
-    "kms?"
-  ]
-}
+import asyncio
+import json
+import os
+import threading
+import time
 
-EMOJI = {
-  "very_pos": [
-    "🤩",
-    "👏",
-    "🔥",
-    "🎉",
-    "💯"
-  ],
-  "pos": [
-    "😀",
-    "🙂",
-    "👍",
-    "✨",
-    "👌"
-  ],
-  "neutral": [
-    "😐",
-    "👀",
-    "🫡",
-    "💭",
-    "🤝"
-  ],
-  "curious": [
-    "🤔",
-    "❓",
-    "🧐",
-    "👂",
-    "💡"
-  ],
-  "neg": [
-    "😕",
-    "🤨",
-    "🤦",
-    "🙄",
-    "🥴"
-  ],
-  "very_neg": [
-    "😡",
-    "💀",
-    "👎",
-    "😤",
-    "❌"
-  ]
-}
+from .keyword_matcher import KeywordMatcher
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "reaction_config.json")
+_DATA_KEYS = ("CATEGORIES", "TEMPLATES", "EMOJI", "DEFAULT_PHRASE", "DEFAULT_PHRASES", "ENCOURAGE")
 
 ESCALATE_ON_QUESTION_STANCES = ["curious", "supportive"]
 STAGE2_TIMEOUT_S = 7
-DEFAULT_PHRASE = {
-  "positive": "nice!",
-  "negative": "hmm",
-  "curious": "hmm?",
-  "neutral": "ok",
-  "anticipation": ""
-}
-DEFAULT_PHRASES = {
-  "positive": [
-    "nice!",
-    "love it",
-    "good point",
-    "well said",
-    "yes!",
-    "makes sense",
-    "great",
-    "cool",
-    "👏",
-  ],
-  "negative": [
-    "hmm",
-    "not sure",
-    "meh",
-    "doubt it",
-    "hmm...",
-  ],
-  "curious": [
-    "why?",
-    "how so?",
-    "what if?",
-    "details?",
-    "explain?",
-    "hmm?",
-    "um...",
-    "uh...",
-    "mm...",
-    "so...",
-  ],
-  "anticipation": [
-    "...",
-    "go on",
-    "listening",
-    "waiting",
-    "interesting...",
-    "um...",
-    "mm...",
-  ],
-  "neutral": [
-    "ok",
-    "got it",
-    "alright",
-    "noted",
-    "hmm",
-    "...",
-    "um...",
-    "mm...",
-  ],
-}
-ENCOURAGE = [
-  [
-    "🫶",
-    "you got this",
-    1
-  ],
-  [
-    "🙂",
-    "keep going",
-    1
-  ]
-]
+# One shared Stage-2 request per chunk for all escalating bots in a room
+STAGE2_BATCH_ENABLED = True
 
 # Reaction probability tuning (edit to tweak behavior)
 FIRE_SUPPRESSION_PROB = 0.35  # 45% chance to ignore a reaction opportunity
 STAGE2_BIAS_PROB = 0.35        # additional 35% bias toward Stage-2 when allowed
 
+# Stage-1 reaction delay bounds (seconds)
+STAGE1_DELAY_MIN_S: float = 0.5
+STAGE1_DELAY_MAX_S: float = 3.0
+
+# Defaults for the hot-reloadable knobs; the loaded snapshot's values win
+_TUNING_DEFAULTS: dict = {
+    "ESCALATE_ON_QUESTION_STANCES": ESCALATE_ON_QUESTION_STANCES,
+    "STAGE2_TIMEOUT_S": STAGE2_TIMEOUT_S,
+    "STAGE2_BATCH_ENABLED": STAGE2_BATCH_ENABLED,
+    "FIRE_SUPPRESSION_PROB": FIRE_SUPPRESSION_PROB,
+    "STAGE2_BIAS_PROB": STAGE2_BIAS_PROB,
+    "STAGE1_DELAY_MIN_S": STAGE1_DELAY_MIN_S,
+    "STAGE1_DELAY_MAX_S": STAGE1_DELAY_MAX_S,
+}
+# What each knob accepts; overrides are checked, never coerced
+_TUNING_TYPES: dict = {
+    "ESCALATE_ON_QUESTION_STANCES": "stances",
+    "STAGE2_TIMEOUT_S": "seconds",
+    "STAGE2_BATCH_ENABLED": "bool",
+    "FIRE_SUPPRESSION_PROB": "probability",
+    "STAGE2_BIAS_PROB": "probability",
+    "STAGE1_DELAY_MIN_S": "seconds",
+    "STAGE1_DELAY_MAX_S": "seconds",
+}
+
+def _check_knob(key: str, value):
+    """Validate one override against the knob's declared type; raises ValueError."""
+    kind = _TUNING_TYPES[key]
+    if kind == "bool":
+        if not isinstance(value, bool):
+            raise ValueError(f"{key} must be true or false, got {value!r}")
+        return value
+    if kind == "stances":
+        if not isinstance(value, (list, tuple)) or not all(isinstance(v, str) for v in value):
+            raise ValueError(f"{key} must be a list of stance names, got {value!r}")
+        return list(value)
+    # Numbers: ints and floats both accepted and kept exact (bool is not a number here)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"{key} must be a number, got {value!r}")
+    if kind == "probability" and not 0.0 <= value <= 1.0:
+        raise ValueError(f"{key} must be between 0 and 1, got {value!r}")
+    if kind == "seconds" and value < 0:
+        raise ValueError(f"{key} must not be negative, got {value!r}")
+    return value
+
+def _resolve_tuning(*overrides: dict | None) -> dict:
+    """Merge overrides onto the defaults; unknown knobs or values of the wrong type raise ValueError."""
+    tuning = dict(_TUNING_DEFAULTS)
+    for layer in overrides:
+        if layer is None:
+            continue
+        if not isinstance(layer, dict):
+            raise ValueError(f"tuning must be an object, got {layer!r}")
+        for key, value in layer.items():
+            if key not in _TUNING_TYPES:
+                raise ValueError(f"unknown tuning knob {key!r}")
+            tuning[key] = _check_knob(key, value)
+    if tuning["STAGE1_DELAY_MIN_S"] > tuning["STAGE1_DELAY_MAX_S"]:
+        raise ValueError("STAGE1_DELAY_MIN_S must not exceed STAGE1_DELAY_MAX_S")
+    tuning["ESCALATE_ON_QUESTION_STANCES"] = frozenset(tuning["ESCALATE_ON_QUESTION_STANCES"])
+    return tuning
+
 # === Helper functions required by main.py ===
-def get_phrases(stance: str, bucket: str, domain: str) -> list[str]:
-    try:
-        key = (stance, "pos" if bucket == "positive" else bucket, domain)
-        tpl = globals().get("TEMPLATES", {})
-        phrases = tpl.get(key, [])  # type: ignore[arg-type]
-        if phrases:
-            return phrases
-        defaults = globals().get("DEFAULT_PHRASES", {})
-        return list(defaults.get(bucket, []))  # type: ignore[index]
-    except Exception:
-        return []
 
-def score_text(
+# TEMPLATES/EMOJI use short bucket names; reaction buckets use long ones
+_TEMPLATE_BUCKET = {"positive": "pos", "negative": "neg"}
+_EMOJI_BUCKET = {"positive": "pos", "negative": "neg", "curious": "curious", "neutral": "neutral"}
+_EMOJI_FALLBACK = {"positive": ("😀", 1), "negative": ("😕", -1), "curious": ("🤔", 0), "neutral": ("😐", 0)}
+_EMOJI_DELTA = {"positive": 1, "negative": -1, "curious": 0, "neutral": 0}
+
+def _parse_template_key(key) -> tuple[str, str, str] | None:
+    """TEMPLATES keys are stringified tuples, e.g. "('supportive', 'pos', 'tech')"."""
+    if isinstance(key, tuple) and len(key) == 3:
+        return key  # type: ignore[return-value]
+    if isinstance(key, str):
+        import ast as _ast
+        try:
+            parsed = _ast.literal_eval(key)
+        except (ValueError, SyntaxError):
+            return None
+        if isinstance(parsed, tuple) and len(parsed) == 3 and all(isinstance(p, str) for p in parsed):
+            return parsed  # type: ignore[return-value]
+    return None
+
+def _build_phrase_index(
+    templates: dict, default_phrases: dict
+) -> tuple[dict[tuple[str, str, str], tuple[str, ...]], dict[str, tuple[str, ...]]]:
+    """Resolve every (stance, bucket, domain) to an immutable phrase tuple.
+
+    Fallback chain, resolved here instead of per call:
+    TEMPLATES[(stance, short_bucket, domain)] -> DEFAULT_PHRASES[bucket] -> ()
+    """
+    defaults = {bucket: tuple(phrases) for bucket, phrases in default_phrases.items()}
+    parsed: dict[tuple[str, str, str], tuple[str, ...]] = {}
+    stances: set[str] = {"supportive", "skeptical", "curious"}
+    domains: set[str] = {"tech", "design", "finance"}
+    for key, phrases in templates.items():
+        tkey = _parse_template_key(key)
+        if tkey is None or not phrases:
+            continue
+        parsed[tkey] = tuple(phrases)
+        stances.add(tkey[0])
+        domains.add(tkey[2])
+    buckets = set(defaults) | {"positive", "negative", "curious", "neutral", "anticipation"}
+    index: dict[tuple[str, str, str], tuple[str, ...]] = {}
+    for stance in stances:
+        for bucket in buckets:
+            for domain in domains:
+                tkey = (stance, _TEMPLATE_BUCKET.get(bucket, bucket), domain)
+                index[(stance, bucket, domain)] = parsed.get(tkey) or defaults.get(bucket, ())
+    return index, defaults
+
+def _build_emoji_index(emoji_groups: dict, encourage: list) -> tuple[dict[str, tuple[str, int]], tuple[str, int] | None]:
+    """First-choice (emoji, delta) per bucket, plus the stutter encouragement override."""
+    index: dict[str, tuple[str, int]] = {"anticipation": ("👀", 1)}
+    for bucket, group in _EMOJI_BUCKET.items():
+        emojis = emoji_groups.get(group) or [_EMOJI_FALLBACK[bucket][0]]
+        index[bucket] = (emojis[0], _EMOJI_DELTA[bucket])
+    encourage_choice = None
+    if isinstance(encourage, list) and encourage:
+        first = encourage[0]
+        encourage_choice = (first[0], first[2])
+    return index, encourage_choice
+
+class ReactionData:
+    """One loaded copy of the reaction data plus the lookups derived from it.
+
+    Treated as read-only once built. Keyword matchers are compiled per
+    category on first use and cached on the instance. Callers that need a
+    consistent view (e.g. one transcript chunk) should fetch the snapshot once
+    and pass it along as `data=`.
+    """
+
+    def __init__(self, raw: dict, version: int = 1, source: str | None = None, tuning: dict | None = None) -> None:
+        self.raw = raw
+        self.version = version
+        self.source = source
+        self.loaded_at = time.time()
+        # Runtime overrides (admin endpoint) are kept so later file reloads reapply them
+        self.overrides = dict(tuning or {})
+        self.tuning = _resolve_tuning(raw.get("TUNING"), self.overrides)
+        self.categories: dict = raw.get("CATEGORIES") or {}
+        self.default_phrase: dict = raw.get("DEFAULT_PHRASE") or {}
+        self.phrase_index, self.default_phrase_index = _build_phrase_index(
+            raw.get("TEMPLATES") or {}, raw.get("DEFAULT_PHRASES") or {}
+        )
+        self.emoji_index, self.encourage_choice = _build_emoji_index(
+            raw.get("EMOJI") or {}, raw.get("ENCOURAGE") or []
+        )
+        self._matchers: dict[str, KeywordMatcher] = {}
+
+    def preset(self, category: str | None) -> dict:
+        return self.categories.get(category or "", {})
+
+    def matcher(self, category: str | None) -> KeywordMatcher | None:
+        key = category or ""
+        matcher = self._matchers.get(key)
+        if matcher is not None:
+            return matcher
+        preset = self.categories.get(key)
+        if not preset:
+            return None
+        matcher = KeywordMatcher(preset.get("keywords_pos", []), preset.get("keywords_neg", []))
+        self._matchers[key] = matcher
+        return matcher
+
+    def warm(self) -> None:
+        for category in self.categories:
+            self.matcher(category)
+
+    def describe(self) -> dict:
+        return {
+            "version": self.version,
+            "source": self.source,
+            "loadedAt": self.loaded_at,
+            "categories": list(self.categories),
+            "overrides": self.overrides,
+            "tuning": {k: (sorted(v) if isinstance(v, frozenset) else v) for k, v in self.tuning.items()},
+        }
+
+
+def load_reaction_data(path: str = DATA_PATH, version: int = 1, tuning: dict | None = None) -> ReactionData:
+    with open(path, "rb") as f:
+        raw = json.loads(f.read())
+    return ReactionData(raw, version=version, source=path, tuning=tuning)
+
+_DATA: ReactionData | None = None
+_DATA_LOCK = threading.Lock()
+_RELOAD_LOCK: asyncio.Lock | None = None
+
+def get_reaction_data() -> ReactionData:
+    """Return the current reaction data snapshot, loading it on first use."""
+    global _DATA
+    data = _DATA
+    if data is None:
+        with _DATA_LOCK:
+            if _DATA is None:
+                _DATA = load_reaction_data()
+            data = _DATA
+    return data
+
+def _build_snapshot(path: str, version: int, tuning: dict | None) -> ReactionData:
+    data = load_reaction_data(path, version=version, tuning=tuning)
+    # Compile everything before the swap so the first chunk on the new version pays nothing
+    data.warm()
+    return data
+
+async def reload_reaction_data(path: str | None = None, tuning: dict | None = None) -> ReactionData:
+    """Rebuild the snapshot in a worker thread and swap it in atomically.
+
+    `tuning` overrides knobs on top of the file's TUNING section and is
+    merged with overrides from earlier reloads. Chunks that
+    already fetched the previous snapshot finish on it; later chunks see the
+    new version. Raises on unreadable/invalid data and keeps the old snapshot.
+    """
+    global _DATA, _RELOAD_LOCK
+    if _RELOAD_LOCK is None:
+        _RELOAD_LOCK = asyncio.Lock()
+    async with _RELOAD_LOCK:
+        current = get_reaction_data()
+        source = path or current.source or DATA_PATH
+        overrides = {**current.overrides, **(tuning or {})}
+        data = await asyncio.to_thread(_build_snapshot, source, current.version + 1, overrides)
+        with _DATA_LOCK:
+            _DATA = data
+        print(f"[reaction_config] loaded version={data.version} source={source}")
+        return data
+
+
+class ReactionConfigWatcher:
+    """Polls the data file's mtime and hot-reloads it when it changes.
+
+    One asyncio task per process; stat() is cheap enough that polling avoids
+    an extra file-watching dependency.
+    """
+
+    def __init__(self, path: str = DATA_PATH, interval_s: float = 2.0) -> None:
+        self.path = path
+        self.interval_s = interval_s
+        self._task: asyncio.Task | None = None
+        self._mtime: float | None = None
+
+    def _stat(self) -> float | None:
+        try:
+            return os.stat(self.path).st_mtime
+        except OSError:
+            return None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._mtime = self._stat()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_s)
+            mtime = self._stat()
+            if mtime is None or mtime == self._mtime:
+                continue
+            self._mtime = mtime
+            try:
+                await reload_reaction_data(self.path)
+            except Exception as e:
+                print(f"[reaction_config] reload of {self.path} failed, keeping current version: {e}")
+
+def __getattr__(name: str):
+    # Lazy module attributes for the data tables (PEP 562)
+    if name in _DATA_KEYS:
+        return get_reaction_data().raw.get(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def get_category_names() -> list[str]:
+    return list(get_reaction_data().categories)
+
+def get_category_preset(category: str | None) -> dict:
+    return get_reaction_data().preset(category)
+
+def get_phrases(stance: str, bucket: str, domain: str, data: ReactionData | None = None) -> tuple[str, ...]:
+    data = data or get_reaction_data()
+    phrases = data.phrase_index.get((stance, bucket, domain))
+    if phrases is None:
+        return data.default_phrase_index.get(bucket, ())
+    return phrases
+
+def get_keyword_matcher(category: str | None) -> KeywordMatcher | None:
+    """Return the compiled matcher for a category (None if the category is unknown)."""
+    return get_reaction_data().matcher(category)
+
+def warm_keyword_matchers() -> None:
+    """Load the data and compile matchers for every category (call once at startup)."""
+    get_reaction_data().warm()
+
+def score_chunk(
     text: str,
     category: str | None,
-    stance: str,
-    domain: str,
     is_question: bool,
     is_exclaim: bool,
+    data: ReactionData | None = None,
 ) -> float:
-    try:
-        preset = globals().get("CATEGORIES", {}).get(category or "", {})  # type: ignore[index]
-    except Exception:
-        preset = {}
+    """Persona-independent part of the score; compute once per flushed chunk."""
+    data = data or get_reaction_data()
+    preset = data.preset(category)
     score = 0.0
     try:
-        txt = (text or "").lower()
-        for kw in preset.get("keywords_pos", []):
-            if kw.lower() in txt:
-                score += 1.0
-        for kw in preset.get("keywords_neg", []):
-            if kw.lower() in txt:
-                score -= 1.0
+        matcher = data.matcher(category)
+        if matcher is not None:
+            hits_pos, hits_neg = matcher.count((text or "").lower())
+            score += float(hits_pos)
+            score -= float(hits_neg)
         if is_exclaim:
             score += float(preset.get("exclaim_weight", 0.0))
         if is_question:
             score += float(preset.get("question_weight", 0.0))
-        score += float(preset.get("domain_bias", {}).get(domain, 0.0))
     except Exception:
         pass
     return score
 
+def apply_domain_bias(chunk_score: float, category: str | None, domain: str, data: ReactionData | None = None) -> float:
+    """Per-persona adjustment on top of score_chunk()."""
+    try:
+        preset = (data or get_reaction_data()).preset(category)
+        return chunk_score + float(preset.get("domain_bias", {}).get(domain, 0.0))
+    except Exception:
+        return chunk_score
+
+def score_text(
+    text: str,
+    category: str | None,
+    stance: str,
+    domain: str,
+    is_question: bool,
+    is_exclaim: bool,
+) -> float:
+    return apply_domain_bias(score_chunk(text, category, is_question, is_exclaim), category, domain)
+
 def map_score_to_bucket(score: float, is_question: bool) -> str:
     bucket = "neutral"
     if score >= 2.0:
@@ -11380,37 +390,21 @@ def choose_emoji_phrase(
     domain: str,
     stutters: int,
     rhet: bool,
+    data: ReactionData | None = None,
 ) -> tuple[str, str, int]:
-    emoji_groups = globals().get("EMOJI", {})
-    pool = {
-        "positive": [(e, "", 1) for e in emoji_groups.get("pos", ["😀"])],
-        "negative": [(e, "", -1) for e in emoji_groups.get("neg", ["😕"])],
-        "curious": [(e, "", 0) for e in emoji_groups.get("curious", ["🤔"])],
-        "anticipation": [("👀", "", 1), ("👏", "", 1)],
-        "neutral": [(e, "", 0) for e in emoji_groups.get("neutral", ["😐"])],
-    }.get(bucket, [("😐", "", 0)])
-
+    data = data or get_reaction_data()
     # Stutter encouragement for supportive
-    try:
-        encourage = globals().get("ENCOURAGE", [])
-        if stutters > 0 and stance == "supportive" and isinstance(encourage, list):
-            pool = encourage + pool  # type: ignore[operator]
-    except Exception:
-        pass
-
-    phrases = get_phrases(stance, bucket, domain)
-    default_phrase = globals().get("DEFAULT_PHRASE", {}).get(bucket, "")  # type: ignore[index]
-    phrase = phrases[0] if phrases else default_phrase
+    if stutters > 0 and stance == "supportive" and data.encourage_choice is not None:
+        emoji, delta = data.encourage_choice
+    else:
+        emoji, delta = data.emoji_index.get(bucket, ("😐", 0))
 
-    choice = pool[0]
-    return choice[0], phrase, choice[2]
+    phrases = get_phrases(stance, bucket, domain, data)
+    phrase = phrases[0] if phrases else data.default_phrase.get(bucket, "")
+    return emoji, phrase, delta
 
 # === Additional helpers to simplify main.py ===
 
-# Stage-1 reaction delay bounds (seconds)
-STAGE1_DELAY_MIN_S: float = 0.5
-STAGE1_DELAY_MAX_S: float = 3.0
-
 def adjust_bucket_for_meta(
     bucket: str,
     stance: str,
@@ -11435,16 +429,24 @@ def select_phrase_for_bucket(
     domain: str,
     recent_emojis_len: int,
     recent_phrases: list[str] | None = None,
+    data: ReactionData | None = None,
 ) -> str:
     """Select a phrase at random, avoiding very recent repeats; fallback to deterministic rotation."""
-    phrases = get_phrases(stance, bucket, domain)
-    default_phrase = globals().get("DEFAULT_PHRASE", {}).get(bucket, "")  # type: ignore[index]
+    data = data or get_reaction_data()
+    phrases = get_phrases(stance, bucket, domain, data)
     if not phrases:
-        return default_phrase
+        return data.default_phrase.get(bucket, "")
     # Attempt random selection first, skipping recent phrases (LRU up to 5)
     try:
         import random as _random
-        recent = set((recent_phrases or [])[-5:])
+        recent = (recent_phrases or [])[-5:]
+        if not recent:
+            return _random.choice(phrases)
+        # Rejection sampling stays uniform over non-recent phrases without building a list
+        for _ in range(8):
+            candidate = _random.choice(phrases)
+            if candidate not in recent:
+                return candidate
         candidates = [p for p in phrases if p not in recent]
         if candidates:
             return _random.choice(candidates)
@@ -11473,25 +475,26 @@ def apply_recent_phrase_lru(selected_phrase: str, recent: list[str], max_size: i
     except Exception:
         return selected_phrase, recent
 
-def should_suppress_fire() -> bool:
+def should_suppress_fire(data: ReactionData | None = None) -> bool:
     """Randomly decide to suppress a reaction opportunity based on configured probability."""
     try:
         import random as _random
-        return _random.random() < float(globals().get("FIRE_SUPPRESSION_PROB", 0.0))
+        return _random.random() < float((data or get_reaction_data()).tuning["FIRE_SUPPRESSION_PROB"])
     except Exception:
         return False
 
-def should_escalate(is_question: bool, stance: str) -> tuple[bool, bool]:
+def should_escalate(is_question: bool, stance: str, data: ReactionData | None = None) -> tuple[bool, bool]:
     """Return (escalate, escalate_allowed) based on stance and configured bias when a question is detected."""
+    tuning = (data or get_reaction_data()).tuning
     try:
-        escalate_allowed = bool(is_question) and (stance in globals().get("ESCALATE_ON_QUESTION_STANCES", set()))
+        escalate_allowed = bool(is_question) and (stance in tuning["ESCALATE_ON_QUESTION_STANCES"])
     except Exception:
         escalate_allowed = bool(is_question)
     if not escalate_allowed:
         return False, escalate_allowed
     try:
         import random as _random
-        escalate_bias = float(globals().get("STAGE2_BIAS_PROB", 0.0))
+        escalate_bias = float(tuning["STAGE2_BIAS_PROB"])
         return (_random.random() < escalate_bias), escalate_allowed
     except Exception:
         return False, escalate_allowed
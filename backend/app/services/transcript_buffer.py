@@ -1,27 +1,98 @@
 from __future__ import annotations
 
 import time
+from array import array
 from dataclasses import dataclass, field
+from typing import Optional, TYPE_CHECKING
+
+from app.services.flush_policy import SENTENCE_TERMINALS, FixedFlushPolicy, FlushPolicy
+
+if TYPE_CHECKING:
+    from app.core.scheduler import DeliveryScheduler, ScheduledCall
+    from app.events.bus import EventBus
 
 
 @dataclass
 class BufferState:
-    text: str
+    """Pending text for one room, kept as pieces and joined once at flush.
+
+    Pieces are stored already trimmed the way repeated
+    `(text + " " + piece).strip()` would leave them, so `text` is identical
+    to the old string accumulation without copying it on every append.
+    """
+
     last_flush_s: float
-    pauses: list[dict] = field(default_factory=list)
+    pieces: list[str] = field(default_factory=list)
+    # Last character of the buffered text ("" when empty)
+    last_char: str = ""
+    words: int = 0
+    has_question: bool = False
+    has_exclaim: bool = False
+    # Pauses as parallel arrays: seconds, and 1 if the pause was mid-sentence
+    pause_s: array = field(default_factory=lambda: array("d"))
+    pause_mid: bytearray = field(default_factory=bytearray)
+    idle_flush: Optional["ScheduledCall"] = None
+
+    @property
+    def text(self) -> str:
+        return " ".join(self.pieces)
+
+    def add(self, piece: str) -> int:
+        """Append a piece; returns how many words it added."""
+        piece = piece.rstrip() if self.pieces else piece.strip()
+        if not piece:
+            return 0
+        words = len(piece.split())
+        self.words += words
+        self.pieces.append(piece)
+        self.last_char = piece[-1]
+        if "?" in piece:
+            self.has_question = True
+        if "!" in piece:
+            self.has_exclaim = True
+        return words
+
+    def clear(self) -> None:
+        self.pieces = []
+        self.last_char = ""
+        self.words = 0
+        self.has_question = self.has_exclaim = False
+        self.pause_s = array("d")
+        self.pause_mid = bytearray()
 
 
 class TranscriptBuffer:
     """Collects transcript pieces and flushes them in chunks.
 
-    Simple heuristics for MVP:
+    When to flush is up to a FlushPolicy (app.services.flush_policy). The
+    default FixedFlushPolicy keeps the MVP heuristics:
     - Flush if buffer contains a sentence terminator (. ! ?) OR
     - Flush if more than max_interval_s elapsed since last flush
+    AdaptiveFlushPolicy instead paces chunks against a per-room
+    reactions-per-minute budget.
+
+    append() can only check the interval when a piece arrives. With a
+    scheduler and bus, a buffer still holding text at the interval deadline
+    is flushed by the shared timer and published as `transcript:chunk`
+    (flush_meta["idle"] is True), so a mid-sentence pause still gets a chunk.
+    Call record_reactions() for published reactions so load-aware policies
+    can see them.
     """
 
-    def __init__(self, max_interval_s: float = 2.0, flush_on_interval: bool = True) -> None:
+    def __init__(
+        self,
+        max_interval_s: float = 2.0,
+        flush_on_interval: bool = True,
+        scheduler: Optional["DeliveryScheduler"] = None,
+        bus: Optional["EventBus"] = None,
+        policy: Optional[FlushPolicy] = None,
+    ) -> None:
         self.max_interval_s = max_interval_s
         self.flush_on_interval = flush_on_interval
+        self.policy = policy or FixedFlushPolicy(max_interval_s, flush_on_interval)
+        self.scheduler = scheduler
+        self.bus = bus
+        self.idle_flushes = 0
         self._room_to_state: dict[str, BufferState] = {}
         self.PAUSE_THRESHOLDS = {
             "min_stutter": 0.6,
@@ -33,53 +104,111 @@ class TranscriptBuffer:
         now = time.monotonic()
         state = self._room_to_state.get(room_id)
         if state is None:
-            state = BufferState(text="", last_flush_s=now)
+            state = BufferState(last_flush_s=now)
             self._room_to_state[room_id] = state
 
-        occurred_mid_sentence = not any(state.text.endswith(ch) for ch in ".!?" )
+        occurred_mid_sentence = not (state.last_char and state.last_char in SENTENCE_TERMINALS)
         if meta is not None:
             try:
                 s = meta.get("silence_preceding_s")
                 if s is not None:
-                    state.pauses.append({"s": float(s), "mid": bool(occurred_mid_sentence)})
+                    state.pause_s.append(float(s))
+                    state.pause_mid.append(1 if occurred_mid_sentence else 0)
             except Exception:
                 pass
 
         # Accumulate
-        state.text = (state.text + " " + piece).strip()
-
-        should_flush = False
-        # question mark flush
-        if state.text.endswith("?"):
-            should_flush = True
-        # sentence terminal or interval
-        elif any(state.text.endswith(ch) for ch in (".", "!")):
-            should_flush = True
-        elif self.flush_on_interval and (now - state.last_flush_s >= self.max_interval_s):
-            should_flush = True
-
-        if should_flush and state.text:
-            chunk = state.text
-            pauses = state.pauses[:]
-            state.text = ""
-            state.pauses = []
-            state.last_flush_s = now
+        self.policy.on_append(room_id, state.add(piece), now)
 
-            try:
-                stutters = sum(1 for p in pauses if p.get("mid") and self.PAUSE_THRESHOLDS["min_stutter"] <= p.get("s", 0.0) < self.PAUSE_THRESHOLDS["max_stutter"])
-                rhet = any((not p.get("mid")) and p.get("s", 0.0) >= self.PAUSE_THRESHOLDS["rhetorical"] for p in pauses)
-                flush_meta = {
-                    "max_pause_s": max([p.get("s", 0.0) for p in pauses], default=0.0),
-                    "stutter_count": int(stutters),
-                    "rhetorical_pause": bool(rhet),
-                    "question": ("?" in chunk),
-                    "exclaim": ("!" in chunk),
-                }
-            except Exception:
-                flush_meta = {"max_pause_s": 0.0, "stutter_count": 0, "rhetorical_pause": False, "question": ("?" in chunk), "exclaim": ("!" in chunk)}
-
-            return True, chunk, flush_meta
+        if state.pieces and self.policy.should_flush(room_id, state, now):
+            return (True, *self._flush(room_id, state, now))
 
+        self._schedule_idle_flush(room_id, state, now)
         return False, "", {}
 
+    def _flush(self, room_id: str, state: BufferState, now: float) -> tuple[str, dict]:
+        chunk = state.text
+        pause_s, pause_mid = state.pause_s, state.pause_mid
+        flush_meta = {
+            "max_pause_s": 0.0,
+            "stutter_count": 0,
+            "rhetorical_pause": False,
+            "question": state.has_question,
+            "exclaim": state.has_exclaim,
+        }
+        state.clear()
+        state.last_flush_s = now
+        self.policy.on_flush(room_id, now)
+        if state.idle_flush is not None and self.scheduler is not None:
+            self.scheduler.cancel(state.idle_flush)
+        state.idle_flush = None
+
+        if pause_s:
+            min_stutter = self.PAUSE_THRESHOLDS["min_stutter"]
+            max_stutter = self.PAUSE_THRESHOLDS["max_stutter"]
+            rhetorical = self.PAUSE_THRESHOLDS["rhetorical"]
+            stutters = 0
+            rhet = False
+            for s, mid in zip(pause_s, pause_mid):
+                if mid:
+                    if min_stutter <= s < max_stutter:
+                        stutters += 1
+                elif s >= rhetorical:
+                    rhet = True
+            flush_meta["max_pause_s"] = max(pause_s)
+            flush_meta["stutter_count"] = stutters
+            flush_meta["rhetorical_pause"] = rhet
+
+        return chunk, flush_meta
+
+    def _schedule_idle_flush(self, room_id: str, state: BufferState, now: float) -> None:
+        if self.scheduler is None or self.bus is None:
+            return
+        if not state.pieces or state.idle_flush is not None:
+            return
+        deadline = self.policy.idle_deadline(room_id, state)
+        if deadline is None:
+            return
+        # Never re-arm in the past: avoids spinning if a policy's deadline and rule disagree
+        delay_s = max(deadline - now, 0.05)
+        state.idle_flush = self.scheduler.call_later(delay_s, ("transcript", room_id), self._idle_flush, room_id)
+
+    async def _idle_flush(self, room_id: str) -> None:
+        state = self._room_to_state.get(room_id)
+        if state is None:
+            return
+        state.idle_flush = None
+        if not state.pieces:
+            return
+        now = time.monotonic()
+        if not self.policy.should_flush(room_id, state, now):
+            # Flushed and refilled since this was scheduled, or the policy moved
+            # its deadline; wait for the new one
+            self._schedule_idle_flush(room_id, state, now)
+            return
+        chunk, flush_meta = self._flush(room_id, state, now)
+        flush_meta["idle"] = True
+        self.idle_flushes += 1
+        if self.bus is not None:
+            await self.bus.publish("transcript:chunk", {"roomId": room_id, "text": chunk, "flush_meta": flush_meta})
+
+    def record_reactions(self, room_id: str, count: int = 1) -> None:
+        # Late reactions for a discarded room must not bring its policy state back
+        if room_id in self._room_to_state:
+            self.policy.record_reactions(room_id, count, time.monotonic())
+
+    def metrics(self) -> dict:
+        return {"rooms": len(self._room_to_state), "idle_flushes": self.idle_flushes, **self.policy.metrics()}
+
+    def room_ids(self) -> list[str]:
+        return list(self._room_to_state)
+
+    def discard(self, room_id: str) -> bool:
+        """Forget a room's buffer and cancel its pending idle flush; False if it had none."""
+        known = self._room_to_state.pop(room_id, None) is not None
+        self.policy.forget(room_id)
+        if self.scheduler is not None:
+            self.scheduler.cancel_key(("transcript", room_id))
+        return known
+
 
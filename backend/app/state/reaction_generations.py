@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import traceback
+from dataclasses import dataclass
+from typing import Coroutine, Dict, Set
+
+
+@dataclass
+class _Work:
+    generation: int
+    task: asyncio.Task
+    awaiting_llm: bool = False
+
+
+class ReactionGenerations:
+    """In-flight reaction work per room and bot, by transcript-chunk generation.
+
+    Every flushed chunk starts a new generation for its room. When a bot is
+    claimed for a newer generation, its older unfinished task is cancelled:
+    the reaction would be stale, and a Stage-2 call it is still waiting on is
+    aborted rather than paid for. Bots the new chunk does not react with keep
+    their pending work (the older reaction still stands in for both chunks).
+
+    The per-chunk job that fans out to the bots runs off the event-bus
+    handler (it outlives the next chunk), so it is started with `spawn`:
+    the task is held until it finishes, and a failure is logged and counted
+    instead of vanishing with an unretrieved exception.
+    """
+
+    def __init__(self) -> None:
+        self._generation: Dict[str, int] = {}
+        self._work: Dict[str, Dict[str, _Work]] = {}
+        self._chunks: Set[asyncio.Task] = set()
+        self.superseded = 0
+        self.llm_calls_avoided = 0
+        self.chunks_done = 0
+        self.chunks_failed = 0
+        self.chunk_max_ms = 0.0
+
+    def begin(self, room_id: str) -> int:
+        generation = self._generation.get(room_id, 0) + 1
+        self._generation[room_id] = generation
+        return generation
+
+    def claim(self, room_id: str, bot_id: str, generation: int, task: asyncio.Task) -> None:
+        """Register `task` as the bot's current work, cancelling older work."""
+        bots = self._work.setdefault(room_id, {})
+        old = bots.get(bot_id)
+        if old is not None and old.generation < generation and not old.task.done():
+            old.task.cancel()
+            self.superseded += 1
+            if old.awaiting_llm:
+                self.llm_calls_avoided += 1
+        bots[bot_id] = _Work(generation=generation, task=task)
+        task.add_done_callback(lambda t: self._release(room_id, bot_id, t))
+
+    def spawn(self, room_id: str, coro: Coroutine) -> asyncio.Task:
+        """Run one chunk's reaction job, supervised until it finishes."""
+        task = asyncio.create_task(coro)
+        self._chunks.add(task)
+        started = time.perf_counter()
+        task.add_done_callback(lambda t: self._chunk_done(room_id, t, started))
+        return task
+
+    def _chunk_done(self, room_id: str, task: asyncio.Task, started: float) -> None:
+        self._chunks.discard(task)
+        self.chunks_done += 1
+        self.chunk_max_ms = max(self.chunk_max_ms, (time.perf_counter() - started) * 1000)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            self.chunks_failed += 1
+            print(f"[reactions] chunk job failed room={room_id}: {exc!r}")
+            traceback.print_exception(type(exc), exc, exc.__traceback__)
+
+    async def close(self) -> None:
+        """Cancel chunk jobs still running (shutdown)."""
+        tasks = list(self._chunks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def set_awaiting_llm(self, room_id: str, bot_id: str, awaiting: bool) -> None:
+        """Flag whether the bot's current task is blocked on its own Stage-2 call."""
+        work = self._work.get(room_id, {}).get(bot_id)
+        if work is not None and work.task is asyncio.current_task():
+            work.awaiting_llm = awaiting
+
+    def record_llm_call_avoided(self) -> None:
+        # Shared batch calls are cancelled by their owner once no bot waits on them
+        self.llm_calls_avoided += 1
+
+    def _release(self, room_id: str, bot_id: str, task: asyncio.Task) -> None:
+        bots = self._work.get(room_id)
+        if not bots:
+            return
+        work = bots.get(bot_id)
+        if work is not None and work.task is task:
+            bots.pop(bot_id, None)
+            if not bots:
+                self._work.pop(room_id, None)
+
+    def cancel_room(self, room_id: str) -> int:
+        """Cancel all in-flight work for a room; returns how many tasks were cancelled."""
+        bots = self._work.pop(room_id, None) or {}
+        cancelled = 0
+        for work in bots.values():
+            if not work.task.done():
+                work.task.cancel()
+                cancelled += 1
+                if work.awaiting_llm:
+                    self.llm_calls_avoided += 1
+        self._generation.pop(room_id, None)
+        return cancelled
+
+    def room_ids(self) -> list[str]:
+        return list(self._generation.keys() | self._work.keys())
+
+    def in_flight(self, room_id: str) -> int:
+        return len(self._work.get(room_id, {}))
+
+    def metrics(self) -> dict:
+        return {
+            "rooms": len(self._work),
+            "in_flight": sum(len(bots) for bots in self._work.values()),
+            "superseded": self.superseded,
+            "llm_calls_avoided": self.llm_calls_avoided,
+            "chunks_in_flight": len(self._chunks),
+            "chunks_done": self.chunks_done,
+            "chunks_failed": self.chunks_failed,
+            "chunk_max_ms": round(self.chunk_max_ms, 1),
+        }
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Dict, Optional
+
+if TYPE_CHECKING:
+    from app.core.scheduler import DeliveryScheduler, ScheduledCall
+    from app.services.transcript_buffer import TranscriptBuffer
+    from app.state.reaction_generations import ReactionGenerations
+    from app.state.room_manager import Room, RoomManager
+    from app.ws.frames import ReactionFrameScheduler
+    from app.ws.manager import ConnectionManager
+
+
+class RoomLifecycle:
+    """Opens, closes and idle-expires rooms across every per-room store.
+
+    A room's state is spread over RoomManager (bots, coach, transcript),
+    TranscriptBuffer (pending text, flush policy), ConnectionManager
+    (sockets, stats, subscriptions), ReactionGenerations and the reaction
+    frame scheduler (in-flight work). close() clears all of them at once.
+
+    A room is idle while it has no sockets and no in-flight reactions. Its
+    clock restarts on activity (open, a transcript piece, a write) and when
+    its last socket disconnects; a sweep on the shared timer heap closes
+    rooms that stayed idle for `idle_ttl_s`.
+    """
+
+    def __init__(
+        self,
+        rooms: "RoomManager",
+        ws_manager: "ConnectionManager",
+        transcript_buffer: "TranscriptBuffer",
+        generations: "ReactionGenerations",
+        reaction_frames: "ReactionFrameScheduler",
+        idle_ttl_s: float = 1800.0,
+        sweep_interval_s: float = 60.0,
+        scheduler: Optional["DeliveryScheduler"] = None,
+    ) -> None:
+        self.rooms = rooms
+        self.ws_manager = ws_manager
+        self.transcript_buffer = transcript_buffer
+        self.generations = generations
+        self.reaction_frames = reaction_frames
+        self.idle_ttl_s = idle_ttl_s
+        self.sweep_interval_s = sweep_interval_s
+        self.scheduler = scheduler
+        self._last_active: Dict[str, float] = {}
+        self._sweep_call: Optional["ScheduledCall"] = None
+        self.opened = 0
+        self.closed = 0
+        self.evicted_idle = 0
+        self.handed_off = 0
+        self.sweeps = 0
+        self.last_sweep_ms = 0.0
+
+    def open(self, room_id: str) -> "Room":
+        if not self.rooms.has_room(room_id):
+            self.opened += 1
+        room = self.rooms.open_room(room_id)
+        self.touch(room_id)
+        return room
+
+    def touch(self, room_id: str) -> None:
+        """Record activity on an open room; the idle TTL counts from the latest touch.
+
+        Ids RoomManager does not know (a socket joining a room that was never
+        opened) are not tracked.
+        """
+        if self.rooms.has_room(room_id):
+            self._last_active[room_id] = time.monotonic()
+
+    def release(self, room_id: str) -> None:
+        """The room's last socket left: restart its idle clock unless it was closed."""
+        if room_id in self._last_active:
+            self.touch(room_id)
+
+    async def close(self, room_id: str, reason: str = "closed", close_sockets: bool = True) -> bool:
+        """Drop a room from every store and close its sockets; False if unknown.
+
+        A room handed off to another worker keeps its sockets: they keep
+        receiving the room's events through the bus.
+        """
+        # Known means some store held state for it; the idle clock alone does not count
+        self._last_active.pop(room_id, None)
+        known = self.rooms.close_room(room_id) is not None
+        known = self.generations.cancel_room(room_id) > 0 or known
+        known = self.reaction_frames.discard(room_id) > 0 or known
+        known = self.transcript_buffer.discard(room_id) or known
+        if close_sockets:
+            known = await self.ws_manager.close_room(room_id) > 0 or known
+        if known:
+            if reason == "idle":
+                self.evicted_idle += 1
+            elif reason == "handoff":
+                self.handed_off += 1
+            else:
+                self.closed += 1
+            print(f"[rooms] closed room={room_id} reason={reason}")
+        return known
+
+    def _is_idle(self, room_id: str) -> bool:
+        return not self.ws_manager.has_sockets(room_id) and not self.generations.in_flight(room_id)
+
+    async def sweep(self, now: Optional[float] = None) -> int:
+        """Close rooms idle for longer than the TTL; returns how many."""
+        t0 = time.perf_counter()
+        now = time.monotonic() if now is None else now
+        room_ids = set(self._last_active)
+        room_ids.update(self.rooms.room_ids())
+        room_ids.update(self.transcript_buffer.room_ids())
+        room_ids.update(self.ws_manager.room_ids())
+        room_ids.update(self.generations.room_ids())
+        expired = []
+        for room_id in room_ids:
+            last = self._last_active.get(room_id)
+            if not self._is_idle(room_id):
+                # Busy rooms restart the clock; sockets on an id that was never opened are not a room
+                if self.rooms.has_room(room_id):
+                    self._last_active[room_id] = now
+            elif last is None:
+                # Idle state created without a touch (e.g. a buffer whose room closed): expire it later
+                self._last_active[room_id] = now
+            elif now - last >= self.idle_ttl_s:
+                expired.append(room_id)
+        for room_id in expired:
+            await self.close(room_id, reason="idle")
+        self.sweeps += 1
+        self.last_sweep_ms = (time.perf_counter() - t0) * 1000
+        return len(expired)
+
+    def start(self) -> None:
+        """Arm the periodic sweep (call from a running loop)."""
+        if self.scheduler is not None and self._sweep_call is None and self.idle_ttl_s > 0:
+            self._sweep_call = self.scheduler.call_later(self.sweep_interval_s, ("rooms", "sweep"), self._sweep_tick)
+
+    def stop(self) -> None:
+        if self._sweep_call is not None and self.scheduler is not None:
+            self.scheduler.cancel(self._sweep_call)
+        self._sweep_call = None
+
+    async def _sweep_tick(self) -> None:
+        self._sweep_call = None
+        try:
+            await self.sweep()
+        except Exception as e:
+            print(f"[rooms] idle sweep failed: {e}")
+        self.start()
+
+    def metrics(self) -> dict:
+        return {
+            "open": len(self.rooms),
+            "tracked": len(self._last_active),
+            "idle_ttl_s": self.idle_ttl_s,
+            "opened": self.opened,
+            "closed": self.closed,
+            "evicted_idle": self.evicted_idle,
+            "handed_off": self.handed_off,
+            "sweeps": self.sweeps,
+            "last_sweep_ms": round(self.last_sweep_ms, 3),
+            "stores": {
+                "rooms": len(self.rooms),
+                "transcript_buffers": len(self.transcript_buffer.room_ids()),
+                "ws_rooms": len(self.ws_manager.room_ids()),
+                "reaction_generations": len(self.generations.room_ids()),
+            },
+        }
@@ -2,7 +2,7 @@ from __future__ import annotations
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Deque, Tuple, Optional
+from typing import Callable, Dict, Deque, Tuple, Optional
 
 from app.services.bot import Bot as ServiceBot
 from app.services.coach import MegaKnight
@@ -19,51 +19,141 @@ class Room:
     category: Optional[str] = None
 
 class RoomManager:
-    def __init__(self) -> None:
+    """In-memory room state.
+
+    Rooms are created by `open_room` and by writes (bots, coach, category);
+    reads never allocate, so a lookup of an unknown id returns an empty
+    result instead of leaving a room behind. `close_room` forgets a room;
+    app.state.room_lifecycle coordinates that with the other per-room stores.
+
+    When `journal` is set, every write is also handed to it as a record
+    (see app.state.session_log), which is how rooms survive a restart.
+    """
+
+    def __init__(self, journal: Optional[Callable[[dict], None]] = None) -> None:
         self._rooms: Dict[str, Room] = {}
+        self.journal = journal
+
+    def _record(self, kind: str, room_id: str, **fields) -> None:
+        if self.journal is not None:
+            self.journal({"type": kind, "roomId": room_id, **fields})
+
+    def open_room(self, room_id: str) -> Room:
+        return self.ensure_room(room_id)
 
     def ensure_room(self, room_id: str) -> Room:
         room = self._rooms.get(room_id)
         if room is None:
             room = Room(id=room_id)
             self._rooms[room_id] = room
+            self._record("open", room_id)
+        return room
+
+    def get_room(self, room_id: str) -> Optional[Room]:
+        return self._rooms.get(room_id)
+
+    def has_room(self, room_id: str) -> bool:
+        return room_id in self._rooms
+
+    def close_room(self, room_id: str) -> Optional[Room]:
+        room = self._rooms.pop(room_id, None)
+        if room is not None:
+            self._record("close", room_id)
+        return room
+
+    def room_ids(self) -> list[str]:
+        return list(self._rooms)
+
+    def __len__(self) -> int:
+        return len(self._rooms)
+
+    def export_room(self, room_id: str) -> Optional[dict]:
+        """JSON-safe snapshot of a room (bots, coach, category, transcript) for handoff."""
+        room = self._rooms.get(room_id)
+        if room is None:
+            return None
+        return {
+            "createdAt": room.created_at.isoformat(),
+            "category": room.category,
+            "bots": [bot.model_dump(mode="json") for bot in room.bots.values()],
+            "coach": room.coach.model_dump(mode="json") if room.coach is not None else None,
+            "transcript": [[ts.isoformat(), text] for ts, text in room.transcript],
+        }
+
+    def import_room(self, room_id: str, snapshot: dict) -> Room:
+        """Install a snapshot from export_room, merged into anything already here."""
+        room = self.ensure_room(room_id)
+        try:
+            room.created_at = min(room.created_at, datetime.fromisoformat(snapshot["createdAt"]))
+        except (KeyError, TypeError, ValueError):
+            pass
+        if snapshot.get("category") is not None:
+            room.category = snapshot["category"]
+        for data in snapshot.get("bots") or []:
+            bot = ServiceBot.model_validate(data)
+            room.bots.setdefault(bot.id, bot)
+        if room.coach is None and snapshot.get("coach"):
+            room.coach = MegaKnight.model_validate(snapshot["coach"])
+        # Chunks received here before the snapshot arrived are newer; keep them last
+        newer = list(room.transcript)
+        room.transcript.clear()
+        for ts, text in snapshot.get("transcript") or []:
+            room.transcript.append((datetime.fromisoformat(ts), text))
+        room.transcript.extend(newer)
+        room.updated_at = datetime.now(timezone.utc)
+        if self.journal is not None:
+            self._record("snapshot", room_id, room=self.export_room(room_id))
         return room
 
     def set_category(self, room_id: str, category: Optional[str]) -> None:
         room = self.ensure_room(room_id)
         room.category = category
         room.updated_at = datetime.now(timezone.utc)
+        self._record("category", room_id, category=category)
 
     def get_category(self, room_id: str) -> Optional[str]:
-        room = self.ensure_room(room_id)
-        return room.category
+        room = self._rooms.get(room_id)
+        return room.category if room is not None else None
 
     def add_coach_to_room(self, room_id: str, coach: MegaKnight):
         room = self.ensure_room(room_id)
         room.coach = coach
+        if self.journal is not None:
+            self._record("coach", room_id, coach=coach.model_dump(mode="json"))
 
     def get_coach_in_room(self, room_id: str) -> Optional[MegaKnight]:
-        room = self.ensure_room(room_id)
-        return room.coach
+        room = self._rooms.get(room_id)
+        return room.coach if room is not None else None
 
     def add_bot_to_room(self, room_id: str, bot: ServiceBot) -> None:
         room = self.ensure_room(room_id)
         room.bots[bot.id] = bot
         room.updated_at = datetime.now(timezone.utc)
+        if self.journal is not None:
+            self._record("join", room_id, bot=bot.model_dump(mode="json"))
 
     def remove_bot_from_room(self, room_id: str, bot_id: str) -> None:
-        room = self.ensure_room(room_id)
+        room = self._rooms.get(room_id)
+        if room is None:
+            return
         room.bots.pop(bot_id, None)
         room.updated_at = datetime.now(timezone.utc)
+        self._record("leave", room_id, botId=bot_id)
 
-    def append_transcript(self, room_id: str, text: str) -> None:
-        room = self.ensure_room(room_id)
-        room.transcript.append((datetime.now(timezone.utc), text))
-        room.updated_at = datetime.now(timezone.utc)
+    def append_transcript(self, room_id: str, text: str, ts: Optional[datetime] = None) -> bool:
+        """Record a chunk for an open room; returns False if the room is gone."""
+        room = self._rooms.get(room_id)
+        if room is None:
+            return False
+        now = datetime.now(timezone.utc)
+        room.transcript.append((ts or now, text))
+        room.updated_at = now
+        self._record("transcript", room_id, text=text)
+        return True
 
     def get_transcript_tail_chars(self, room_id: str, max_chars: int) -> str:
-        room = self.ensure_room(room_id)
-        if max_chars <= 0 or not room.transcript:
+        room = self._rooms.get(room_id)
+        if room is None or max_chars <= 0 or not room.transcript:
             return ""
         collected: list[str] = []
         remaining = max_chars
@@ -85,8 +175,8 @@ class RoomManager:
         return "".join(collected)
 
     def get_transcript_window(self, room_id: str, seconds: int) -> str:
-        room = self.ensure_room(room_id)
-        if not room.transcript:
+        room = self._rooms.get(room_id)
+        if room is None or not room.transcript:
             return ""
         cutoff = datetime.now(timezone.utc) - timedelta(seconds=seconds)
         chunks: list[str] = []
@@ -96,5 +186,5 @@ class RoomManager:
         return " ".join(chunks).strip()
 
     def get_service_bots_in_room(self, room_id: str) -> list[ServiceBot]:
-        room = self.ensure_room(room_id)
-        return list(room.bots.values())
\ No newline at end of file
+        room = self._rooms.get(room_id)
+        return list(room.bots.values()) if room is not None else []
\ No newline at end of file
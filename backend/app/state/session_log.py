@@ -0,0 +1,348 @@
+"""Write-ahead session log: room history on local disk, replayed on startup."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import IO, TYPE_CHECKING, Iterator, List, Optional
+
+from app.services.bot import Bot as ServiceBot
+from app.services.coach import MegaKnight
+from app.ws.encoding import encode_json
+
+if TYPE_CHECKING:
+    from app.state.room_manager import RoomManager
+
+SEGMENT_PREFIX = "session-"
+SEGMENT_SUFFIX = ".log"
+
+
+def _segment_name(index: int) -> str:
+    return f"{SEGMENT_PREFIX}{index:010d}{SEGMENT_SUFFIX}"
+
+
+def list_segments(directory: str) -> List[str]:
+    """Segment paths in write order."""
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return []
+    names = sorted(n for n in names if n.startswith(SEGMENT_PREFIX) and n.endswith(SEGMENT_SUFFIX))
+    return [os.path.join(directory, n) for n in names]
+
+
+def _segment_index(path: str) -> int:
+    return int(os.path.basename(path)[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)])
+
+
+def read_segment(path: str) -> Iterator[dict]:
+    """Records of one segment; stops at a torn or corrupt line (a crash mid-write)."""
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                return
+            try:
+                yield json.loads(line)
+            except ValueError:
+                return
+
+
+def iter_records(directory: str, room_id: Optional[str] = None) -> Iterator[dict]:
+    """Every retained record, oldest first; only one room's when `room_id` is set.
+
+    Checkpoint snapshots are skipped: they restate state, not events.
+    """
+    for path in list_segments(directory):
+        for record in read_segment(path):
+            if record.get("type") in ("checkpoint", "snapshot", "checkpoint_end"):
+                continue
+            if room_id is None or record.get("roomId") == room_id:
+                yield record
+
+
+def apply_record(rooms: "RoomManager", record: dict) -> None:
+    """Replay one record onto a RoomManager (with its journal detached)."""
+    kind = record.get("type")
+    room_id = record.get("roomId")
+    if not room_id:
+        return
+    if kind == "open":
+        rooms.open_room(room_id)
+    elif kind == "close":
+        rooms.close_room(room_id)
+    elif kind == "category":
+        rooms.set_category(room_id, record.get("category"))
+    elif kind == "coach":
+        rooms.add_coach_to_room(room_id, MegaKnight.model_validate(record["coach"]))
+    elif kind == "join":
+        rooms.add_bot_to_room(room_id, ServiceBot.model_validate(record["bot"]))
+    elif kind == "leave":
+        rooms.remove_bot_from_room(room_id, record.get("botId", ""))
+    elif kind == "transcript":
+        ts = datetime.fromtimestamp(record.get("ts", time.time()), timezone.utc)
+        rooms.append_transcript(room_id, record.get("text", ""), ts=ts)
+    elif kind == "snapshot":
+        rooms.close_room(room_id)
+        rooms.import_room(room_id, record.get("room") or {})
+    # reaction / feedback records are history only; they carry no room state
+
+
+@dataclass
+class _Stats:
+    records: int = 0
+    bytes: int = 0
+    batches: int = 0
+    dropped: int = 0
+    write_errors: int = 0
+    segments_rolled: int = 0
+    segments_pruned: int = 0
+    last_fsync_ms: float = 0.0
+    max_fsync_ms: float = 0.0
+    replayed_records: int = 0
+    replayed_rooms: int = 0
+    replay_errors: int = 0
+    replay_ms: float = 0.0
+
+
+class SessionLog:
+    """Append-only, segmented log of room writes and room events.
+
+    RoomManager hands every write (open, close, category, coach, bot join
+    and leave, transcript chunk, handoff snapshot) to `append`; reactions
+    and coach feedback are appended where they are published. `append`
+    only encodes the record and adds it to an in-memory batch, so the
+    broadcast path never waits on the disk. A single writer task flushes
+    the batch every `fsync_interval_s` with one write and one fsync in a
+    worker thread (group commit): a crash loses at most that window.
+
+    Records are JSON lines. A segment rolls over past `segment_bytes`, and
+    every new segment starts with a checkpoint (a snapshot of each open
+    room), so startup replays only from the newest complete checkpoint and
+    segments older than the newest `retain_segments` are deleted. If the
+    disk falls behind by more than `max_pending_bytes`, new records are
+    dropped and counted rather than held in memory.
+
+    Rooms are rebuilt with their bots, coach, category and transcript; bot
+    cooldowns and in-flight reactions are not restored.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        rooms: "RoomManager",
+        segment_bytes: int = 64 * 1024 * 1024,
+        fsync_interval_s: float = 0.05,
+        retain_segments: int = 8,
+        max_pending_bytes: int = 32 * 1024 * 1024,
+    ) -> None:
+        self.directory = directory
+        self.rooms = rooms
+        self.segment_bytes = segment_bytes
+        self.fsync_interval_s = fsync_interval_s
+        self.retain_segments = max(1, retain_segments)
+        self.max_pending_bytes = max_pending_bytes
+        self.enabled = bool(directory)
+        self._pending: List[bytes] = []
+        self._pending_bytes = 0
+        self._wake = asyncio.Event()
+        self._writer: Optional[asyncio.Task] = None
+        self._accepting = False
+        self._closing = False
+        self._file: Optional[IO[bytes]] = None
+        self._segment = 0
+        self._segment_size = 0
+        self._stats = _Stats()
+
+    # -- write path --------------------------------------------------------
+
+    def append(self, record: dict) -> None:
+        if not self._accepting:
+            return
+        try:
+            line = (encode_json({"ts": time.time(), **record}) + "\n").encode("utf-8")
+        except (TypeError, ValueError) as e:
+            self._stats.dropped += 1
+            print(f"[session-log] unencodable {record.get('type')} record: {e}")
+            return
+        if self._pending_bytes + len(line) > self.max_pending_bytes:
+            self._stats.dropped += 1
+            return
+        self._pending.append(line)
+        self._pending_bytes += len(line)
+        self._stats.records += 1
+        if not self._wake.is_set():
+            self._wake.set()
+
+    def _checkpoint(self) -> bytes:
+        # Taken on the loop, in the same step the batch before it was cut
+        now = time.time()
+        ids = self.rooms.room_ids()
+        records = [{"ts": now, "type": "checkpoint", "rooms": len(ids)}]
+        for room_id in ids:
+            records.append({"ts": now, "type": "snapshot", "roomId": room_id, "room": self.rooms.export_room(room_id)})
+        records.append({"ts": now, "type": "checkpoint_end"})
+        return "".join(encode_json(r) + "\n" for r in records).encode("utf-8")
+
+    async def _run(self) -> None:
+        while True:
+            await self._wake.wait()
+            if not self._closing:
+                # Let the batch fill for one interval: one fsync per window, not per record
+                await asyncio.sleep(self.fsync_interval_s)
+            self._wake.clear()
+            await self._flush()
+            if self._closing and not self._pending:
+                return
+
+    async def _flush(self) -> None:
+        if not self._pending:
+            return
+        batch = b"".join(self._pending)
+        self._pending = []
+        self._pending_bytes = 0
+        checkpoint = None
+        if self._segment_size + len(batch) >= self.segment_bytes:
+            checkpoint = self._checkpoint()
+        try:
+            await asyncio.to_thread(self._write, batch, checkpoint)
+        except OSError as e:
+            self._stats.write_errors += 1
+            print(f"[session-log] write failed ({len(batch)} bytes lost): {e}")
+
+    def _write(self, batch: bytes, checkpoint: Optional[bytes]) -> None:
+        # Worker thread; the single writer task never runs two of these at once
+        assert self._file is not None
+        started = time.perf_counter()
+        self._file.write(batch)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._segment_size += len(batch)
+        self._stats.bytes += len(batch)
+        self._stats.batches += 1
+        fsync_ms = (time.perf_counter() - started) * 1000
+        self._stats.last_fsync_ms = fsync_ms
+        self._stats.max_fsync_ms = max(self._stats.max_fsync_ms, fsync_ms)
+        if checkpoint is not None:
+            self._roll(checkpoint)
+
+    def _roll(self, checkpoint: bytes) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._stats.segments_rolled += 1
+        self._segment += 1
+        self._file = open(os.path.join(self.directory, _segment_name(self._segment)), "ab")
+        self._file.write(checkpoint)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._segment_size = len(checkpoint)
+        self._stats.bytes += len(checkpoint)
+        for path in list_segments(self.directory)[:-self.retain_segments]:
+            try:
+                os.remove(path)
+                self._stats.segments_pruned += 1
+            except OSError:
+                pass
+
+    # -- lifecycle ---------------------------------------------------------
+
+    async def replay(self) -> int:
+        """Rebuild rooms from disk into `rooms`; returns the number of rooms restored.
+
+        Call before start(), while nothing else writes to `rooms`.
+        """
+        if not self.enabled:
+            return 0
+        started = time.perf_counter()
+        records = await asyncio.to_thread(self._read_for_replay)
+        journal, self.rooms.journal = self.rooms.journal, None
+        try:
+            for record in records:
+                try:
+                    apply_record(self.rooms, record)
+                    self._stats.replayed_records += 1
+                except Exception as e:
+                    self._stats.replay_errors += 1
+                    print(f"[session-log] skipped {record.get('type')} record room={record.get('roomId')}: {e}")
+        finally:
+            self.rooms.journal = journal
+        self._stats.replayed_rooms = len(self.rooms)
+        self._stats.replay_ms = (time.perf_counter() - started) * 1000
+        if records:
+            print(
+                f"[session-log] replayed {self._stats.replayed_records} records, "
+                f"{self._stats.replayed_rooms} rooms in {self._stats.replay_ms:.0f} ms"
+            )
+        return self._stats.replayed_rooms
+
+    def _read_for_replay(self) -> List[dict]:
+        segments = list_segments(self.directory)
+        if segments:
+            self._segment = _segment_index(segments[-1])
+        # Start at the newest segment whose checkpoint was written completely
+        start = 0
+        for i in range(len(segments) - 1, -1, -1):
+            if any(r.get("type") == "checkpoint_end" for r in read_segment(segments[i])):
+                start = i
+                break
+        records: List[dict] = []
+        for path in segments[start:]:
+            records.extend(read_segment(path))
+        return records
+
+    async def start(self) -> None:
+        """Open a fresh segment (checkpointing the current rooms) and start journaling."""
+        if not self.enabled or self._writer is not None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        if not self._segment:
+            segments = list_segments(self.directory)
+            self._segment = _segment_index(segments[-1]) if segments else 0
+        checkpoint = self._checkpoint()
+        # Writes from here on queue up behind the checkpoint
+        self.rooms.journal = self.append
+        self._accepting = True
+        await asyncio.to_thread(self._roll, checkpoint)
+        self._writer = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Flush and fsync what is pending, then stop journaling."""
+        if self._writer is None:
+            return
+        if self.rooms.journal == self.append:
+            self.rooms.journal = None
+        self._accepting = False
+        self._closing = True
+        self._wake.set()
+        try:
+            await self._writer
+        finally:
+            if self._file is not None:
+                await asyncio.to_thread(self._file.close)
+                self._file = None
+
+    def metrics(self) -> dict:
+        s = self._stats
+        return {
+            "enabled": self.enabled,
+            "segment": self._segment,
+            "segment_bytes": self._segment_size,
+            "records": s.records,
+            "bytes_written": s.bytes,
+            "batches": s.batches,
+            "records_per_batch": round(s.records / s.batches, 1) if s.batches else 0.0,
+            "pending_bytes": self._pending_bytes,
+            "dropped": s.dropped,
+            "write_errors": s.write_errors,
+            "last_fsync_ms": round(s.last_fsync_ms, 3),
+            "max_fsync_ms": round(s.max_fsync_ms, 3),
+            "segments_rolled": s.segments_rolled,
+            "segments_pruned": s.segments_pruned,
+            "replayed_records": s.replayed_records,
+            "replayed_rooms": s.replayed_rooms,
+            "replay_errors": s.replay_errors,
+            "replay_ms": round(s.replay_ms, 1),
+        }
@@ -0,0 +1,73 @@
+"""Wire encoding for server->client WebSocket messages."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Iterable, Optional, Union
+
+try:  # Optional faster encoder
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on environment
+    _orjson = None
+
+try:  # Optional compact binary encoding
+    import msgpack as _msgpack
+except ImportError:  # pragma: no cover - depends on environment
+    _msgpack = None
+
+
+# Encodings a client can negotiate through the WebSocket subprotocol header,
+# in server preference order. JSON text frames stay the default.
+JSON = "json"
+MSGPACK = "msgpack"
+SUBPROTOCOLS = {MSGPACK: "podium.msgpack", JSON: "podium.json"}
+
+Frame = Union[str, bytes]
+
+
+def encode_json(message: Any) -> str:
+    """Encode a message exactly once for fan-out to many sockets.
+
+    Output matches Starlette's WebSocket.send_json (compact separators,
+    non-ASCII kept as-is). orjson is used when installed; payloads it cannot
+    encode fall back to the stdlib encoder.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(message).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+def json_encoder_name() -> str:
+    return "orjson" if _orjson is not None else "json"
+
+
+def encode_msgpack(message: Any) -> bytes:
+    return _msgpack.packb(message, use_bin_type=True)  # type: ignore[union-attr]
+
+
+def encode(message: Any, encoding: str = JSON) -> Frame:
+    """Encode for one wire encoding: str for JSON text frames, bytes for binary."""
+    if encoding == MSGPACK:
+        return encode_msgpack(message)
+    return encode_json(message)
+
+
+def available_encodings() -> list[str]:
+    return [e for e in (MSGPACK, JSON) if e != MSGPACK or _msgpack is not None]
+
+
+def negotiate(offered: Iterable[str]) -> tuple[str, Optional[str]]:
+    """Pick (encoding, subprotocol) from the client's offered subprotocols.
+
+    Clients that offer none of ours get JSON without a subprotocol; clients
+    that offer ours always get one back (browsers fail the handshake
+    otherwise), falling back to JSON when msgpack is not installed.
+    """
+    offered = set(offered)
+    for encoding in available_encodings():
+        if SUBPROTOCOLS[encoding] in offered:
+            return encoding, SUBPROTOCOLS[encoding]
+    return JSON, None
@@ -0,0 +1,116 @@
+"""Per-room reaction frames: coalesce bursts of bot reactions into one message."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+import time
+
+from app.core.scheduler import DeliveryScheduler, ScheduledCall
+from app.ws.manager import ConnectionManager
+
+
+@dataclass
+class _Frame:
+    opened_at: float
+    items: List[dict] = field(default_factory=list)
+    flush: Optional[ScheduledCall] = None
+
+
+class ReactionFrameScheduler:
+    """Collects reactions per room for `window_s` and sends them as one frame.
+
+    The first reaction in an idle room opens a frame; everything arriving
+    within the window is sent as a single `reactions` message:
+
+        {"event": "reactions", "payload": {"roomId": ..., "reactions": [
+            {"botId": ..., "reaction": {...}, "delayMs": 0}, ...]}}
+
+    `delayMs` is how long after receiving the frame the client should show
+    the reaction: its arrival offset within the frame plus any delivery delay
+    the producer asked for (payload `delayMs`, e.g. Stage-1 reaction time).
+    A window of 0 disables framing; each reaction is then sent as its own
+    `reaction` message once its delay has elapsed.
+
+    Frame flushes and delayed sends go through the shared DeliveryScheduler
+    (no task per pending item); discard() drops everything pending for a room.
+    """
+
+    def __init__(
+        self,
+        manager: ConnectionManager,
+        window_s: float = 0.075,
+        scheduler: Optional[DeliveryScheduler] = None,
+    ) -> None:
+        self.manager = manager
+        self.window_s = window_s
+        self.scheduler = scheduler or DeliveryScheduler()
+        self._frames: Dict[str, _Frame] = {}
+        self.frames_sent = 0
+        self.reactions_sent = 0
+
+    async def add(self, room_id: str, payload: dict) -> None:
+        delay_ms = int(payload.get("delayMs") or 0)
+        if self.window_s <= 0:
+            single = {k: v for k, v in payload.items() if k != "delayMs"}
+            if delay_ms > 0:
+                self.scheduler.call_later(delay_ms / 1000, self._key(room_id), self._send_single, room_id, single)
+            else:
+                await self._send_single(room_id, single)
+            return
+        now = time.monotonic()
+        frame = self._frames.get(room_id)
+        if frame is None:
+            frame = _Frame(opened_at=now)
+            self._frames[room_id] = frame
+            frame.flush = self.scheduler.call_later(self.window_s, self._key(room_id), self._flush, room_id, frame)
+        frame.items.append({
+            "botId": payload.get("botId"),
+            "reaction": payload.get("reaction"),
+            "delayMs": int((now - frame.opened_at) * 1000) + delay_ms,
+        })
+
+    @staticmethod
+    def _key(room_id: str) -> tuple:
+        return ("reactions", room_id)
+
+    async def _flush(self, room_id: str, frame: _Frame) -> None:
+        if self._frames.get(room_id) is frame:
+            self._frames.pop(room_id, None)
+        await self._send(room_id, frame)
+
+    async def _send_single(self, room_id: str, payload: dict) -> None:
+        self.reactions_sent += 1
+        await self.manager.broadcast_json(room_id, {"event": "reaction", "payload": payload})
+
+    async def _send(self, room_id: str, frame: _Frame) -> None:
+        if not frame.items:
+            return
+        self.frames_sent += 1
+        self.reactions_sent += len(frame.items)
+        await self.manager.broadcast_json(
+            room_id,
+            {"event": "reactions", "payload": {"roomId": room_id, "reactions": frame.items}},
+        )
+
+    def discard(self, room_id: str) -> int:
+        """Drop a room's pending frame and delayed reactions without sending them."""
+        self._frames.pop(room_id, None)
+        return self.scheduler.cancel_key(self._key(room_id))
+
+    async def close(self) -> None:
+        """Send pending frames immediately (shutdown)."""
+        frames = list(self._frames.items())
+        self._frames.clear()
+        for room_id, frame in frames:
+            if frame.flush is not None:
+                self.scheduler.cancel(frame.flush)
+            await self._send(room_id, frame)
+
+    def metrics(self) -> dict:
+        return {
+            "window_ms": int(self.window_s * 1000),
+            "frames_sent": self.frames_sent,
+            "reactions_sent": self.reactions_sent,
+            "pending_rooms": len(self._frames),
+        }
@@ -1,47 +1,306 @@
+"""WebSocket connection management: per-socket writers, bounded queues, room broadcasts."""
+
 from __future__ import annotations
 
-from typing import Dict, Set
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Optional, Set, Tuple
 import asyncio
+import random
+import time
 
 from fastapi import WebSocket
 
+from app.ws.encoding import JSON, Frame, encode
+
+
+# Dropped first when a client falls behind
+LOW_PRIORITY_EVENTS = frozenset({"reaction_debug"})
+
+# Opt-in streams a client must subscribe to (with a sampling rate) to receive
+OPT_IN_TOPICS = frozenset({"reaction_debug"})
+
+# Close code for sockets disconnected for lagging ("try again later")
+SLOW_CONSUMER_CLOSE_CODE = 1013
+# Close code for sockets of a room that was closed or expired
+ROOM_CLOSED_CLOSE_CODE = 1000
+
+
+@dataclass
+class RoomStats:
+    sent: int = 0
+    dropped: int = 0
+    slow_disconnects: int = 0
+
+
+@dataclass
+class _Connection:
+    room_id: str
+    websocket: WebSocket
+    # (event, frame); event is None for messages without an envelope
+    queue: Deque[Tuple[Optional[str], Frame]] = field(default_factory=deque)
+    # Wire encoding negotiated at connect (see app.ws.encoding)
+    encoding: str = JSON
+    wakeup: asyncio.Event = field(default_factory=asyncio.Event)
+    writer: Optional[asyncio.Task] = None
+    backlogged_since: Optional[float] = None
+    closing: bool = False
+
 
 class ConnectionManager:
     """Tracks WebSocket connections per room and provides broadcast helpers.
 
+    Every socket has its own writer task draining a bounded outbound queue,
+    so one slow client never delays delivery to the rest of the room:
+
+    - above `soft_limit` queued messages, low-priority events are dropped
+    - at `max_queue`, the oldest low-priority message is evicted; if there is
+      none the socket is disconnected
+    - a socket that stays above `soft_limit` for `max_lag_s` is disconnected
+
     In-memory and single-process only (sufficient for MVP).
     """
 
-    def __init__(self) -> None:
-        self._room_to_sockets: Dict[str, Set[WebSocket]] = {}
+    def __init__(
+        self,
+        max_queue: int = 256,
+        soft_limit: int = 64,
+        max_lag_s: float = 10.0,
+        send_timeout_s: float = 5.0,
+    ) -> None:
+        self.max_queue = max_queue
+        self.soft_limit = soft_limit
+        self.max_lag_s = max_lag_s
+        self.send_timeout_s = send_timeout_s
+        self._room_to_sockets: Dict[str, Dict[WebSocket, _Connection]] = {}
+        self._room_stats: Dict[str, RoomStats] = {}
+        # room -> topic -> {socket: sample rate}; rooms without subscribers have no entry
+        self._subscribers: Dict[str, Dict[str, Dict[WebSocket, float]]] = {}
+        # Close handshakes of dropped slow consumers, held until they finish
+        self._closing: Set[asyncio.Task] = set()
 
-    async def connect(self, room_id: str, websocket: WebSocket) -> None:
-        await websocket.accept()
-        if room_id not in self._room_to_sockets:
-            self._room_to_sockets[room_id] = set()
-        self._room_to_sockets[room_id].add(websocket)
+    async def connect(
+        self,
+        room_id: str,
+        websocket: WebSocket,
+        encoding: str = JSON,
+        subprotocol: Optional[str] = None,
+    ) -> None:
+        if subprotocol:
+            await websocket.accept(subprotocol=subprotocol)
+        else:
+            await websocket.accept()
+        conn = _Connection(room_id=room_id, websocket=websocket, encoding=encoding)
+        conn.writer = asyncio.create_task(self._writer(conn))
+        self._room_to_sockets.setdefault(room_id, {})[websocket] = conn
+        self._room_stats.setdefault(room_id, RoomStats())
 
     def disconnect(self, room_id: str, websocket: WebSocket) -> None:
         sockets = self._room_to_sockets.get(room_id)
         if not sockets:
             return
-        sockets.discard(websocket)
+        conn = sockets.pop(websocket, None)
+        self._drop_subscriptions(room_id, websocket)
+        if conn is not None:
+            conn.closing = True
+            conn.queue.clear()
+            if conn.writer is not None and conn.writer is not asyncio.current_task():
+                conn.writer.cancel()
         if not sockets:
-            # Cleanup empty room sets to avoid unbounded growth
+            # Cleanup empty room maps to avoid unbounded growth
             self._room_to_sockets.pop(room_id, None)
+            self._room_stats.pop(room_id, None)
+
+    def has_sockets(self, room_id: str) -> bool:
+        return bool(self._room_to_sockets.get(room_id))
+
+    def room_ids(self) -> list[str]:
+        return list(self._room_to_sockets)
+
+    async def close_room(self, room_id: str) -> int:
+        """Disconnect and close every socket of a closed room; returns how many."""
+        websockets = list(self._room_to_sockets.get(room_id) or {})
+        for websocket in websockets:
+            self.disconnect(room_id, websocket)
+        self._subscribers.pop(room_id, None)
+        self._room_stats.pop(room_id, None)
+        await asyncio.gather(*(self._close_quietly(ws, ROOM_CLOSED_CLOSE_CODE) for ws in websockets))
+        return len(websockets)
+
+    def set_subscription(self, room_id: str, websocket: WebSocket, topic: str, sample_rate: float) -> None:
+        """Subscribe one socket to an opt-in topic; a rate <= 0 unsubscribes."""
+        if topic not in OPT_IN_TOPICS or websocket not in self._room_to_sockets.get(room_id, {}):
+            return
+        if sample_rate <= 0:
+            self._drop_subscriptions(room_id, websocket, topic)
+            return
+        topics = self._subscribers.setdefault(room_id, {})
+        topics.setdefault(topic, {})[websocket] = min(1.0, sample_rate)
+
+    def _drop_subscriptions(self, room_id: str, websocket: WebSocket, topic: Optional[str] = None) -> None:
+        topics = self._subscribers.get(room_id)
+        if not topics:
+            return
+        for name in ([topic] if topic else list(topics)):
+            subs = topics.get(name)
+            if subs is None:
+                continue
+            subs.pop(websocket, None)
+            if not subs:
+                topics.pop(name, None)
+        if not topics:
+            self._subscribers.pop(room_id, None)
+
+    def has_subscribers(self, room_id: str, topic: str) -> bool:
+        """Cheap check so callers can skip building opt-in payloads nobody wants."""
+        topics = self._subscribers.get(room_id)
+        return bool(topics and topics.get(topic))
+
+    async def publish_sampled(self, room_id: str, topic: str, message: dict) -> None:
+        """Send an opt-in message to its subscribers, each at their own sampling rate."""
+        subs = (self._subscribers.get(room_id) or {}).get(topic)
+        if not subs:
+            return
+        sockets = self._room_to_sockets.get(room_id, {})
+        frames: Dict[str, Frame] = {}
+        for websocket, rate in list(subs.items()):
+            if rate < 1.0 and random.random() >= rate:
+                continue
+            conn = sockets.get(websocket)
+            if conn is None:
+                continue
+            self._enqueue(conn, message.get("event"), self._frame_for(conn, message, frames))
+
+    async def send_json(self, room_id: str, websocket: WebSocket, message: dict) -> None:
+        """Send to one socket through its queue (keeps ordering with broadcasts)."""
+        conn = self._room_to_sockets.get(room_id, {}).get(websocket)
+        if conn is None:
+            return
+        self._enqueue(conn, message.get("event"), encode(message, conn.encoding))
 
     async def broadcast_json(self, room_id: str, message: dict) -> None:
-        sockets = list(self._room_to_sockets.get(room_id, set()))
+        sockets = self._room_to_sockets.get(room_id)
+        if not sockets:
+            return
+        # Encode once per wire encoding and queue the same frame for every socket
+        event = message.get("event")
+        frames: Dict[str, Frame] = {}
+        for conn in list(sockets.values()):
+            self._enqueue(conn, event, self._frame_for(conn, message, frames))
+
+    @staticmethod
+    def _frame_for(conn: _Connection, message: dict, frames: Dict[str, Frame]) -> Frame:
+        frame = frames.get(conn.encoding)
+        if frame is None:
+            frame = frames[conn.encoding] = encode(message, conn.encoding)
+        return frame
+
+    async def broadcast_text(self, room_id: str, text: str, event: Optional[str] = None) -> None:
+        sockets = self._room_to_sockets.get(room_id)
         if not sockets:
             return
+        for conn in list(sockets.values()):
+            self._enqueue(conn, event, text)
+
+    def _enqueue(self, conn: _Connection, event: Optional[str], frame: Frame) -> None:
+        if conn.closing:
+            return
+        stats = self._room_stats.setdefault(conn.room_id, RoomStats())
+        queue = conn.queue
+        low_priority = event in LOW_PRIORITY_EVENTS
+
+        if len(queue) >= self.soft_limit:
+            now = time.monotonic()
+            if conn.backlogged_since is None:
+                conn.backlogged_since = now
+            elif now - conn.backlogged_since >= self.max_lag_s:
+                self._drop_slow_consumer(conn, stats)
+                return
+            if low_priority:
+                stats.dropped += 1
+                return
+
+        if len(queue) >= self.max_queue:
+            # Make room by evicting the oldest low-priority message, if any
+            for i, (queued_event, _) in enumerate(queue):
+                if queued_event in LOW_PRIORITY_EVENTS:
+                    del queue[i]
+                    stats.dropped += 1
+                    break
+            else:
+                self._drop_slow_consumer(conn, stats)
+                return
+
+        queue.append((event, frame))
+        conn.wakeup.set()
+
+    def _drop_slow_consumer(self, conn: _Connection, stats: RoomStats) -> None:
+        stats.slow_disconnects += 1
+        stats.dropped += len(conn.queue)
+        print(f"[ws] disconnecting slow consumer room={conn.room_id} queued={len(conn.queue)}")
+        self.disconnect(conn.room_id, conn.websocket)
+        task = asyncio.create_task(self._close_quietly(conn.websocket))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
 
-        async def _send(ws: WebSocket) -> None:
-            try:
-                await ws.send_json(message)
-            except Exception:
-                # If sending fails, drop the socket from the room
-                self.disconnect(room_id, ws)
+    @staticmethod
+    async def _close_quietly(websocket: WebSocket, code: int = SLOW_CONSUMER_CLOSE_CODE) -> None:
+        try:
+            await websocket.close(code=code)
+        except Exception:
+            pass
 
-        await asyncio.gather(*(_send(ws) for ws in sockets), return_exceptions=True)
+    async def _writer(self, conn: _Connection) -> None:
+        queue = conn.queue
+        try:
+            while not conn.closing:
+                if not queue:
+                    conn.wakeup.clear()
+                    await conn.wakeup.wait()
+                    continue
+                _, frame = queue.popleft()
+                async with asyncio.timeout(self.send_timeout_s):
+                    if isinstance(frame, bytes):
+                        await conn.websocket.send_bytes(frame)
+                    else:
+                        await conn.websocket.send_text(frame)
+                stats = self._room_stats.get(conn.room_id)
+                if stats is not None:
+                    stats.sent += 1
+                if conn.backlogged_since is not None and len(queue) < self.soft_limit:
+                    conn.backlogged_since = None
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            # If sending fails (or stalls past send_timeout_s), drop the socket from the room
+            self.disconnect(conn.room_id, conn.websocket)
 
+    async def close(self) -> None:
+        """Stop every writer task (shutdown)."""
+        writers = []
+        for room_id, sockets in list(self._room_to_sockets.items()):
+            for websocket, conn in list(sockets.items()):
+                if conn.writer is not None:
+                    writers.append(conn.writer)
+                self.disconnect(room_id, websocket)
+        await asyncio.gather(*writers, *self._closing, return_exceptions=True)
 
+    def metrics(self) -> dict:
+        rooms = {}
+        for room_id, sockets in self._room_to_sockets.items():
+            depths = [len(c.queue) for c in sockets.values()]
+            stats = self._room_stats.get(room_id, RoomStats())
+            encodings: Dict[str, int] = {}
+            for c in sockets.values():
+                encodings[c.encoding] = encodings.get(c.encoding, 0) + 1
+            rooms[room_id] = {
+                "sockets": len(depths),
+                "encodings": encodings,
+                "queue_depth": sum(depths),
+                "max_queue_depth": max(depths, default=0),
+                "sent": stats.sent,
+                "dropped": stats.dropped,
+                "slow_disconnects": stats.slow_disconnects,
+                "subscribers": {t: len(subs) for t, subs in (self._subscribers.get(room_id) or {}).items()},
+            }
+        return {"rooms": rooms}
@@ -3,6 +3,8 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect, Request
 import json
 
+from app.core.affinity import REDIRECT_CLOSE_CODE
+from app.ws.encoding import encode, negotiate
 from app.ws.manager import ConnectionManager
 from app.events.bus import EventBus
 
@@ -26,10 +28,28 @@ async def websocket_room_endpoint(
     manager: ConnectionManager = Depends(get_manager),
     bus: EventBus = Depends(get_bus),
 ) -> None:
-    await manager.connect(roomId, websocket)
+    # Server->client encoding is negotiated via Sec-WebSocket-Protocol
+    # (podium.msgpack / podium.json); client->server messages stay JSON text.
+    encoding, subprotocol = negotiate(websocket.scope.get("subprotocols") or [])
+    affinity = websocket.app.state.room_affinity  # type: ignore[attr-defined]
+    redirect_url = None if affinity.is_local(roomId) else affinity.ws_redirect_url(roomId)
+    if redirect_url:
+        # Another worker owns this room and browsers can reach it directly
+        await websocket.accept(subprotocol=subprotocol)
+        frame = encode({"event": "redirect", "payload": {"roomId": roomId, "url": redirect_url}}, encoding)
+        await (websocket.send_bytes(frame) if isinstance(frame, bytes) else websocket.send_text(frame))
+        await websocket.close(code=REDIRECT_CLOSE_CODE)
+        return
+    # Otherwise serve the socket here; the room's events arrive over the bus
+    await manager.connect(roomId, websocket, encoding=encoding, subprotocol=subprotocol)
+    # Connecting alone does not open a room; it only keeps an existing one alive
+    lifecycle = websocket.app.state.room_lifecycle  # type: ignore[attr-defined]
+    lifecycle.touch(roomId)
     try:
         # Optional: greet the client
-        await websocket.send_json({"event": "ready", "payload": {"roomId": roomId}})
+        await manager.send_json(
+            roomId, websocket, {"event": "ready", "payload": {"roomId": roomId, "encoding": encoding}}
+        )
         # Client->server messages: handle client_transcript (room-aware)
         while True:
             raw = await websocket.receive_text()
@@ -43,6 +63,23 @@ async def websocket_room_endpoint(
                 text = payload.get("text")
                 meta = payload.get("meta") or {}
                 if isinstance(text, str) and text.strip():
+                    if not affinity.is_local(roomId):
+                        forwarded = await affinity.forward(
+                            roomId,
+                            "POST",
+                            "/webhooks/deepgram",
+                            json.dumps({"roomId": roomId, "text": text.strip(), "meta": meta}).encode("utf-8"),
+                            {"content-type": "application/json"},
+                        )
+                        if forwarded is None or forwarded.status_code >= 300:
+                            # Not buffered here: the owner would never get this room back
+                            await manager.send_json(
+                                roomId,
+                                websocket,
+                                {"event": "error", "payload": {"roomId": roomId, "detail": "room owner unavailable"}},
+                            )
+                        continue
+                    lifecycle.open(roomId)
                     # Append with meta; returns (flushed, chunk, flush_meta)
                     flushed, chunk, flush_meta = websocket.app.state.transcript_buffer.append(roomId, text.strip(), meta)  # type: ignore[attr-defined]
                     if flushed and chunk:
@@ -62,12 +99,27 @@ async def websocket_room_endpoint(
                         await bus.publish("bot:join", {"roomId": roomId, "bot": bot})
                 except Exception:
                     pass
+            elif event in ("subscribe", "unsubscribe"):
+                # Opt-in streams, e.g. {"event": "subscribe", "payload": {"topics": ["reaction_debug"], "sampleRate": 0.2}}
+                settings = websocket.app.state.settings  # type: ignore[attr-defined]
+                topics = payload.get("topics") or []
+                if isinstance(topics, str):
+                    topics = [topics]
+                rate = 0.0
+                if event == "subscribe":
+                    try:
+                        rate = float(payload.get("sampleRate", settings.reaction_debug_sample_rate))
+                    except (TypeError, ValueError):
+                        rate = settings.reaction_debug_sample_rate
+                    rate = min(rate, settings.reaction_debug_max_sample_rate)
+                for topic in topics:
+                    if isinstance(topic, str):
+                        manager.set_subscription(roomId, websocket, topic, rate)
             elif event == "state_request":
                 # Return current bots in room to the requesting client only
                 try:
-                    room = websocket.app.state.room_manager.ensure_room(roomId)  # type: ignore[attr-defined]
                     bots = []
-                    for b in room.bots.values():
+                    for b in websocket.app.state.room_manager.get_service_bots_in_room(roomId):  # type: ignore[attr-defined]
                         bots.append({
                             "id": b.id,
                             "name": b.personality.name,
@@ -77,10 +129,17 @@ async def websocket_room_endpoint(
                                 "domain": b.personality.domain,
                             },
                         })
-                    await websocket.send_json({"event": "state", "payload": {"bots": bots}})
+                    await manager.send_json(roomId, websocket, {"event": "state", "payload": {"bots": bots}})
                 except Exception:
-                    await websocket.send_json({"event": "state", "payload": {"bots": []}})
+                    await manager.send_json(roomId, websocket, {"event": "state", "payload": {"bots": []}})
     except WebSocketDisconnect:
         manager.disconnect(roomId, websocket)
+        if not manager.has_sockets(roomId):
+            # The room's idle TTL starts at its last disconnect
+            lifecycle.release(roomId)
+            # Nobody left to see pending reactions; drop them and stop paying for LLM calls
+            websocket.app.state.reaction_frames.discard(roomId)  # type: ignore[attr-defined]
+            websocket.app.state.reaction_generations.cancel_room(roomId)  # type: ignore[attr-defined]
+            websocket.app.state.transcript_buffer.discard(roomId)  # type: ignore[attr-defined]
 
 
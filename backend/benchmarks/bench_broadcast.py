@@ -0,0 +1,96 @@
+"""Benchmark: CPU per room broadcast with hundreds of sockets.
+
+Compares the old fan-out (send_json per socket, i.e. one JSON encode per
+viewer) with ConnectionManager.broadcast_json (encode once, queue the same
+text for every socket's writer task; timing includes draining the queues).
+Sockets are in-memory fakes that do the same work as Starlette's
+send_json/send_text minus the network write.
+
+Run from backend/:  python -m benchmarks.bench_broadcast [--sockets 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+
+from app.ws.encoding import json_encoder_name
+from app.ws.manager import ConnectionManager
+
+
+class FakeWebSocket:
+    def __init__(self) -> None:
+        self.frames = 0
+        self.bytes = 0
+
+    async def accept(self) -> None:
+        return None
+
+    async def _send(self, text: str) -> None:
+        self.frames += 1
+        self.bytes += len(text)
+
+    async def send_json(self, data) -> None:
+        # Same encoding Starlette performs in WebSocket.send_json
+        await self._send(json.dumps(data, separators=(",", ":"), ensure_ascii=False))
+
+    async def send_text(self, data: str) -> None:
+        await self._send(data)
+
+
+MESSAGE = {
+    "event": "reaction",
+    "payload": {
+        "roomId": "3f1c2a9e-8d7b-4c6a-9e1f-0a2b3c4d5e6f",
+        "botId": "9a8b7c6d-5e4f-4a3b-2c1d-0e9f8a7b6c5d",
+        "reaction": {"emoji_unicode": "🔥", "micro_phrase": "ship it", "score_delta": 1},
+    },
+}
+
+
+async def legacy_broadcast(sockets, message) -> None:
+    await asyncio.gather(*(ws.send_json(message) for ws in sockets), return_exceptions=True)
+
+
+async def run(n_sockets: int, rounds: int) -> None:
+    manager = ConnectionManager()
+    sockets = [FakeWebSocket() for _ in range(n_sockets)]
+    for ws in sockets:
+        await manager.connect("room", ws)  # type: ignore[arg-type]
+
+    async def drained() -> None:
+        expected = sum(ws.frames for ws in sockets) + n_sockets
+        while sum(ws.frames for ws in sockets) < expected:
+            await asyncio.sleep(0)
+
+    async def manager_broadcast() -> None:
+        done = drained()
+        await manager.broadcast_json("room", MESSAGE)
+        await done
+
+    async def timed(fn) -> float:
+        cpu0 = time.process_time()
+        for _ in range(rounds):
+            await fn()
+        return (time.process_time() - cpu0) / rounds
+
+    legacy = await timed(lambda: legacy_broadcast(sockets, MESSAGE))
+    current = await timed(manager_broadcast)
+    print(f"sockets={n_sockets} rounds={rounds} encoder={json_encoder_name()}")
+    print(f"send_json per socket : {legacy * 1e3:7.3f} ms CPU/broadcast")
+    print(f"encode once + queues : {current * 1e3:7.3f} ms CPU/broadcast  ({legacy / current:.2f}x)")
+    await manager.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sockets", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(run(args.sockets, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
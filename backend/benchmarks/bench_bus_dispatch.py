@@ -0,0 +1,117 @@
+"""Benchmark: EventBus handler execution under a publish burst.
+
+Publishes `--events` bot:reaction events as fast as possible to a handler
+that awaits a short I/O-like sleep (and raises for 1% of events), two
+ways: the old fire-and-forget pattern (a task per handler call, no
+reference kept) and the bus's Dispatcher (bounded per-topic pool and
+queue). Reports peak live tasks, peak traced memory, drain time, and how
+many handler exceptions were recorded vs lost.
+
+Run from backend/:  python -m benchmarks.bench_bus_dispatch [--events 50000] [--workers 64]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import io
+import random
+import time
+import tracemalloc
+
+from app.events.bus import EventBus
+from app.events.dispatcher import BLOCK, DROP_OLDEST, TopicPolicy
+
+
+class LegacyBus:
+    """The pre-dispatcher EventBus.publish, kept here for comparison."""
+
+    def __init__(self) -> None:
+        self._handlers: dict[str, set] = {}
+
+    def subscribe(self, topic: str, handler) -> None:
+        self._handlers.setdefault(topic, set()).add(handler)
+
+    async def publish(self, topic: str, payload) -> None:
+        for handler in list(self._handlers.get(topic, set())):
+            asyncio.create_task(handler(payload))
+
+
+async def run_case(label: str, bus, events: int, seed: int, dispatcher=None) -> str:
+    rng = random.Random(seed)
+    done = 0
+    peak_tasks = 0
+    finished = asyncio.Event()
+
+    async def handler(payload: dict) -> None:
+        nonlocal done
+        try:
+            await asyncio.sleep(payload["sleep"])
+            if payload["fail"]:
+                raise RuntimeError("handler failed")
+        finally:
+            done += 1
+            if done == events:
+                finished.set()
+
+    bus.subscribe("bot:reaction", handler)
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    for i in range(events):
+        await bus.publish("bot:reaction", {
+            "roomId": f"room-{i % 200}",
+            "sleep": rng.uniform(0.001, 0.01),
+            "fail": rng.random() < 0.01,
+        })
+        if i % 500 == 0:
+            peak_tasks = max(peak_tasks, len(asyncio.all_tasks()))
+    peak_tasks = max(peak_tasks, len(asyncio.all_tasks()))
+    if dispatcher is None:
+        await finished.wait()
+    else:
+        # Dropped events never reach the handler; wait for the queue to drain instead
+        while dispatcher.depth("bot:reaction") or dispatcher.metrics()["bot:reaction"]["busy"]:
+            await asyncio.sleep(0.005)
+    elapsed = time.perf_counter() - t0
+    _, peak_mem = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    if dispatcher is not None:
+        topic = dispatcher.metrics()["bot:reaction"]
+        errors = f"recorded={topic['errors']}"
+        extra = (
+            f" dropped={topic['dropped']} blocked={topic['blocked']}"
+            f" p50={topic['latency_ms']['p50']} ms p99={topic['latency_ms']['p99']} ms"
+        )
+    else:
+        errors, extra = "recorded=0 (lost)", ""
+    return (
+        f"{label:22s} handled={done:6d} peak_tasks={peak_tasks:6d} peak_mem={peak_mem / 1024 / 1024:6.2f} MB "
+        f"drain={elapsed:5.2f} s errors {errors}{extra}"
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    lines = []
+    # Handler failures are logged with tracebacks; keep them out of the report
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        lines.append(await run_case("fire-and-forget", LegacyBus(), args.events, args.seed))
+        for overflow in (BLOCK, DROP_OLDEST):
+            policy = TopicPolicy(workers=args.workers, max_queue=args.max_queue, overflow=overflow)
+            bus = EventBus(default_policy=policy)
+            lines.append(await run_case(f"dispatcher {overflow}", bus, args.events, args.seed, dispatcher=bus.dispatcher))
+            await bus.close()
+    print("\n".join(lines))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=50_000)
+    parser.add_argument("--workers", type=int, default=64)
+    parser.add_argument("--max-queue", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=7)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
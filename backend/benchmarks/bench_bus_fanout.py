@@ -0,0 +1,139 @@
+"""Benchmark: cross-worker broadcast latency through the EventBus transport.
+
+Starts the pub/sub stand-in (or uses --url for a real Redis), then
+`--workers` separate processes, each with its own EventBus on a
+RedisTransport and a `bot:reaction` handler. The parent publishes
+`--events` reactions at `--rate` per second and every worker records how
+long each one took to reach its handler (CLOCK_MONOTONIC is system-wide,
+so timestamps compare across processes). The in-process bus is measured
+the same way as a baseline.
+
+Run from backend/:  python -m benchmarks.bench_bus_fanout [--workers 4] [--events 2000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import multiprocessing as mp
+import time
+
+from app.events.bus import EventBus
+from app.events.transport import RedisTransport
+from benchmarks.pubsub_server import PubSubServer
+
+
+def _percentiles(samples: list[float]) -> str:
+    samples = sorted(samples)
+    if not samples:
+        return "no samples"
+    pick = lambda q: samples[min(len(samples) - 1, int(len(samples) * q))] * 1e3
+    return f"p50={pick(0.5):6.3f} ms p99={pick(0.99):6.3f} ms max={samples[-1] * 1e3:6.3f} ms"
+
+
+async def _worker_main(url: str, events: int, ready, results) -> None:
+    bus = EventBus(RedisTransport(url))
+    latencies: list[float] = []
+    done = asyncio.Event()
+
+    async def on_reaction(payload: dict) -> None:
+        latencies.append(time.monotonic() - payload["sentAt"])
+        if len(latencies) == events:
+            done.set()
+
+    bus.subscribe("bot:reaction", on_reaction)
+    await bus.start()
+    ready.put(True)
+    try:
+        await asyncio.wait_for(done.wait(), timeout=60)
+    except asyncio.TimeoutError:
+        pass
+    results.put(latencies)
+    await bus.close()
+
+
+def _worker(url: str, events: int, ready, results) -> None:
+    asyncio.run(_worker_main(url, events, ready, results))
+
+
+async def _publish(bus: EventBus, events: int, rate: float) -> None:
+    interval = 1.0 / rate if rate > 0 else 0.0
+    start = time.monotonic()
+    for i in range(events):
+        if interval:
+            delay = start + i * interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        await bus.publish("bot:reaction", {
+            "roomId": f"room-{i % 50}",
+            "botId": f"b{i % 18}",
+            "reaction": {"emoji_unicode": "🔥", "micro_phrase": "Ship it"},
+            "delayMs": 0,
+            "sentAt": time.monotonic(),
+        })
+
+
+async def _in_process(events: int, rate: float) -> list[float]:
+    bus = EventBus()
+    latencies: list[float] = []
+
+    async def on_reaction(payload: dict) -> None:
+        latencies.append(time.monotonic() - payload["sentAt"])
+
+    bus.subscribe("bot:reaction", on_reaction)
+    await _publish(bus, events, rate)
+    await asyncio.sleep(0.05)
+    await bus.close()
+    return latencies
+
+
+async def run(args: argparse.Namespace) -> None:
+    print(f"in-process       events={args.events} {_percentiles(await _in_process(args.events, args.rate))}")
+
+    server = None
+    url = args.url
+    if not url:
+        server = PubSubServer()
+        url = f"redis://127.0.0.1:{await server.start()}"
+    ctx = mp.get_context("spawn")
+    ready, results = ctx.Queue(), ctx.Queue()
+    procs = [ctx.Process(target=_worker, args=(url, args.events, ready, results)) for _ in range(args.workers)]
+    for p in procs:
+        p.start()
+    loop = asyncio.get_running_loop()
+    for _ in procs:
+        await loop.run_in_executor(None, ready.get)
+
+    publisher = EventBus(RedisTransport(url))
+    await publisher.start()
+    t0 = time.perf_counter()
+    await _publish(publisher, args.events, args.rate)
+    samples: list[float] = []
+    received = []
+    for _ in procs:
+        lat = await loop.run_in_executor(None, results.get)
+        received.append(len(lat))
+        samples.extend(lat)
+    elapsed = time.perf_counter() - t0
+    for p in procs:
+        p.join()
+    await publisher.close()
+    if server is not None:
+        await server.close()
+    print(
+        f"{args.workers} workers ({'stand-in' if not args.url else 'redis'}) events={args.events} "
+        f"delivered={sum(received)}/{args.events * args.workers} {_percentiles(samples)} wall={elapsed:5.2f} s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--rate", type=float, default=1000.0, help="events per second (0 = as fast as possible)")
+    parser.add_argument("--url", default="", help="redis://host:port of a real Redis instead of the stand-in")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
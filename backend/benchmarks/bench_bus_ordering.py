@@ -0,0 +1,82 @@
+"""Benchmark: per-room event order through the EventBus dispatcher.
+
+Each of `--rooms` rooms publishes a `bot:join`, then `--events` events
+alternating `transcript:chunk` and `bot:reaction`, interleaved with the
+other rooms. Handlers await a random 0-2 ms (a WS send) before recording
+the event, so the order they finish in is the order a client would see.
+Three setups: no ordering (the pools alone), one lane per roomId, and one
+lane for everything (global serialization). Reports rooms whose first
+reaction beat their join, out-of-order events, and drain time.
+
+Run from backend/:  python -m benchmarks.bench_bus_ordering [--rooms 200] [--events 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+
+from app.events.bus import EventBus
+from app.events.dispatcher import DROP_OLDEST, TopicPolicy
+
+TOPICS = ("bot:join", "transcript:chunk", "bot:reaction")
+
+
+async def run_case(label: str, order_key, args: argparse.Namespace) -> str:
+    rng = random.Random(args.seed)
+    bus = EventBus()
+    for topic in TOPICS:
+        overflow = DROP_OLDEST if topic == "bot:reaction" else "block"
+        bus.configure(topic, TopicPolicy(workers=args.workers, max_queue=100_000, overflow=overflow, order_key=order_key))
+    seen: dict[str, list[int]] = {}
+    total = args.rooms * (args.events + 1)
+    finished = asyncio.Event()
+    handled = 0
+
+    async def handler(payload: dict) -> None:
+        nonlocal handled
+        await asyncio.sleep(payload["sleep"])
+        seen.setdefault(payload["roomId"], []).append(payload["seq"])
+        handled += 1
+        if handled == total:
+            finished.set()
+
+    for topic in TOPICS:
+        bus.subscribe(topic, handler)
+
+    t0 = time.perf_counter()
+    for seq in range(args.events + 1):
+        for r in range(args.rooms):
+            topic = "bot:join" if seq == 0 else TOPICS[1 + seq % 2]
+            await bus.publish(topic, {"roomId": f"room-{r}", "seq": seq, "sleep": rng.uniform(0, 0.002)})
+    await asyncio.wait_for(finished.wait(), timeout=120)
+    elapsed = time.perf_counter() - t0
+    await bus.close()
+
+    join_late = sum(1 for order in seen.values() if order[0] != 0)
+    inversions = sum(sum(1 for a, b in zip(order, order[1:]) if b < a) for order in seen.values())
+    return (
+        f"{label:18s} rooms={args.rooms} events={total:6d} join_after_reaction={join_late:4d} "
+        f"out_of_order={inversions:5d} drain={elapsed:5.2f} s ({total / elapsed:7.0f} ev/s)"
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    print(await run_case("unordered", None, args))
+    print(await run_case("per-room lanes", lambda p: p.get("roomId"), args))
+    print(await run_case("one global lane", lambda p: "all", args))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rooms", type=int, default=200)
+    parser.add_argument("--events", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=7)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Benchmark: delayed reaction delivery with sleeping tasks vs one timer heap.
+
+Schedules rooms x bots deliveries with Stage-1 style delays (0.5-3 s) two
+ways: the old pattern (a task per reaction that sleeps, then sends) and
+app.core.scheduler.DeliveryScheduler (one heap, one loop timer). Reports
+live tasks, traced memory while everything is pending, CPU time, and how
+late deliveries fired.
+
+Run from backend/:  python -m benchmarks.bench_delivery [--rooms 500] [--bots 18]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+import tracemalloc
+
+from app.core.scheduler import DeliveryScheduler
+
+
+async def run_case(label: str, rooms: int, bots: int, use_heap: bool, seed: int) -> None:
+    rng = random.Random(seed)
+    loop = asyncio.get_running_loop()
+    total = rooms * bots
+    lateness: list[float] = []
+    done = asyncio.Event()
+
+    def deliver(room_id: str, reaction: dict, due: float) -> None:
+        lateness.append(loop.time() - due)
+        if len(lateness) == total:
+            done.set()
+
+    async def sleeper(delay_s: float, room_id: str, reaction: dict) -> None:
+        due = loop.time() + delay_s
+        await asyncio.sleep(delay_s)
+        deliver(room_id, reaction, due)
+
+    scheduler = DeliveryScheduler()
+    tasks = []
+    tracemalloc.start()
+    cpu0 = time.process_time()
+    for r in range(rooms):
+        room_id = f"room-{r}"
+        for b in range(bots):
+            delay_s = rng.uniform(0.5, 3.0)
+            reaction = {"botId": f"{room_id}-b{b}", "emoji_unicode": "🔥", "micro_phrase": "Ship it"}
+            if use_heap:
+                due = loop.time() + delay_s
+                scheduler.call_at(due, ("reactions", room_id), deliver, room_id, reaction, due)
+            else:
+                tasks.append(asyncio.create_task(sleeper(delay_s, room_id, reaction)))
+    await asyncio.sleep(0)
+    pending_mem, _ = tracemalloc.get_traced_memory()
+    live_tasks = len(asyncio.all_tasks())
+    await done.wait()
+    cpu = time.process_time() - cpu0
+    tracemalloc.stop()
+    lateness.sort()
+    p99 = lateness[int(len(lateness) * 0.99) - 1] * 1e3
+    print(
+        f"{label:14s} deliveries={total:6d} live_tasks={live_tasks:6d} pending_mem={pending_mem / 1024 / 1024:6.2f} MB "
+        f"cpu={cpu * 1e3:7.1f} ms late p50={lateness[len(lateness) // 2] * 1e3:5.2f} ms p99={p99:5.2f} ms"
+    )
+    await scheduler.close()
+
+
+async def run(args: argparse.Namespace) -> None:
+    await run_case("task + sleep", args.rooms, args.bots, use_heap=False, seed=args.seed)
+    await run_case("timer heap", args.rooms, args.bots, use_heap=True, seed=args.seed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rooms", type=int, default=500)
+    parser.add_argument("--bots", type=int, default=18)
+    parser.add_argument("--seed", type=int, default=7)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark: WebSocket messages per flushed chunk with and without reaction frames.
+
+Simulates one room where every bot reacts to each chunk: Stage-1 bots answer
+at once (their reaction time travels as delayMs), escalated bots arrive after
+a simulated LLM latency. Counts the text frames the room's sockets receive
+with per-reaction messages (REACTION_FRAME_MS=0) and with framing.
+
+Run from backend/:  python -m benchmarks.bench_reaction_frames [--bots 18] [--viewers 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+
+from app.ws.frames import ReactionFrameScheduler
+from app.ws.manager import ConnectionManager
+
+
+class FakeWebSocket:
+    def __init__(self) -> None:
+        self.frames = 0
+
+    async def accept(self) -> None:
+        return None
+
+    async def send_text(self, data: str) -> None:
+        self.frames += 1
+
+
+async def simulate(window_ms: int, bots: int, viewers: int, chunks: int, escalate: float, seed: int) -> tuple[int, int]:
+    rng = random.Random(seed)
+    manager = ConnectionManager()
+    sockets = [FakeWebSocket() for _ in range(viewers)]
+    for ws in sockets:
+        await manager.connect("room", ws)  # type: ignore[arg-type]
+    frames = ReactionFrameScheduler(manager, window_s=window_ms / 1000)
+
+    async def one(bot: int) -> None:
+        if rng.random() < escalate:
+            await asyncio.sleep(rng.uniform(0.6, 2.5))
+            delay_ms = 0
+        else:
+            delay_ms = int(rng.uniform(500, 3000))
+        await frames.add("room", {"roomId": "room", "botId": f"b{bot}", "reaction": {"emoji_unicode": "🔥"}, "delayMs": delay_ms})
+
+    for _ in range(chunks):
+        await asyncio.gather(*(one(i) for i in range(bots)))
+        await asyncio.sleep(window_ms / 1000 + 0.01)
+    await frames.close()
+    while any(len(c.queue) for s in manager._room_to_sockets.values() for c in s.values()):
+        await asyncio.sleep(0)
+    await manager.close()
+    return frames.reactions_sent, sum(ws.frames for ws in sockets)
+
+
+async def run(args: argparse.Namespace) -> None:
+    print(f"bots={args.bots} viewers={args.viewers} chunks={args.chunks} escalate={args.escalate}")
+    baseline = None
+    for window_ms in (0, 50, 75, 100):
+        reactions, sent = await simulate(window_ms, args.bots, args.viewers, args.chunks, args.escalate, args.seed)
+        per_chunk = sent / args.viewers / args.chunks
+        baseline = baseline or per_chunk
+        label = "per reaction" if window_ms == 0 else f"frames {window_ms:3d} ms"
+        print(f"{label:16s} reactions={reactions:5d} messages/chunk/viewer={per_chunk:6.2f} ({baseline / per_chunk:5.1f}x fewer)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bots", type=int, default=18)
+    parser.add_argument("--viewers", type=int, default=50)
+    parser.add_argument("--chunks", type=int, default=5)
+    parser.add_argument("--escalate", type=float, default=0.1, help="share of bots taking the Stage-2 path")
+    parser.add_argument("--seed", type=int, default=7)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Micro-benchmark: compiled keyword matcher vs. the legacy per-keyword loop.
+
+Run from backend/:  python -m benchmarks.bench_score_text
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from app.services.reaction_config import CATEGORIES, score_text, warm_keyword_matchers
+
+FILLER = (
+    "so today I want to walk you through how we got here and what comes next "
+    "the team spent the last quarter talking to customers and the feedback was clear "
+    "we think this changes how people work every single day and honestly it is not perfect yet "
+    "but the numbers speak for themselves and we are really excited about the roadmap"
+).split()
+
+
+def legacy_score_text(text, category, stance, domain, is_question, is_exclaim) -> float:
+    """The pre-automaton implementation, kept here for comparison."""
+    preset = CATEGORIES.get(category or "", {})
+    score = 0.0
+    txt = (text or "").lower()
+    for kw in preset.get("keywords_pos", []):
+        if kw.lower() in txt:
+            score += 1.0
+    for kw in preset.get("keywords_neg", []):
+        if kw.lower() in txt:
+            score -= 1.0
+    if is_exclaim:
+        score += float(preset.get("exclaim_weight", 0.0))
+    if is_question:
+        score += float(preset.get("question_weight", 0.0))
+    score += float(preset.get("domain_bias", {}).get(domain, 0.0))
+    return score
+
+
+def make_transcripts(category: str, n: int, rng: random.Random) -> list[str]:
+    preset = CATEGORIES[category]
+    keywords = preset["keywords_pos"] + preset["keywords_neg"]
+    out = []
+    for _ in range(n):
+        words = rng.choices(FILLER, k=rng.randint(12, 40))
+        for _ in range(rng.randint(0, 4)):
+            words.insert(rng.randrange(len(words) + 1), rng.choice(keywords).upper() if rng.random() < 0.2 else rng.choice(keywords))
+        out.append(" ".join(words) + rng.choice([".", "!", "?", ""]))
+    return out
+
+
+def bench(fn, cases, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for text, cat, stance, domain, q, e in cases:
+            fn(text, cat, stance, domain, q, e)
+        best = min(best, time.perf_counter() - t0)
+    return best / len(cases)
+
+
+def main() -> None:
+    rng = random.Random(42)
+    t0 = time.perf_counter()
+    warm_keyword_matchers()
+    print(f"compile all categories: {(time.perf_counter() - t0) * 1e3:.1f} ms")
+
+    cases = []
+    for category in CATEGORIES:
+        for text in make_transcripts(category, 200, rng):
+            cases.append((text, category, rng.choice(["supportive", "skeptical", "curious"]),
+                          rng.choice(["tech", "design", "finance"]), text.endswith("?"), text.endswith("!")))
+
+    mismatches = sum(1 for c in cases if score_text(*c) != legacy_score_text(*c))
+    print(f"cases: {len(cases)}  mismatches: {mismatches}")
+
+    legacy = bench(legacy_score_text, cases)
+    compiled = bench(score_text, cases)
+    print(f"legacy loop : {legacy * 1e6:9.1f} us/chunk")
+    print(f"automaton   : {compiled * 1e6:9.1f} us/chunk  ({legacy / compiled:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
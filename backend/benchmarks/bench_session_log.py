@@ -0,0 +1,121 @@
+"""Benchmark: cost of journaling room events on the event loop.
+
+Appends `--rate` reaction-sized records per second for `--seconds` while a
+probe task sleeps 1 ms in a loop and records how late it wakes (event-loop
+lag, i.e. what a broadcast would wait). Three setups: no log, a naive
+journal that writes and fsyncs each record on the loop, and SessionLog
+(in-memory batch, one write + fsync per `--fsync-ms` window in a thread).
+Runs in a temporary directory; pass --dir to measure a specific disk.
+
+Run from backend/:  python -m benchmarks.bench_session_log [--rate 5000] [--seconds 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+from app.state.room_manager import RoomManager
+from app.state.session_log import SessionLog
+
+
+def _record(i: int) -> dict:
+    return {
+        "type": "reaction",
+        "roomId": f"room-{i % 50}",
+        "botId": f"b{i % 18}",
+        "reaction": {"emoji_unicode": "🔥", "micro_phrase": "Ship it", "score_delta": 1},
+        "delayMs": 120,
+    }
+
+
+class NaiveJournal:
+    """Write + fsync per record, on the loop."""
+
+    def __init__(self, path: str) -> None:
+        self._file = open(path, "ab")
+
+    def append(self, record: dict) -> None:
+        self._file.write((json.dumps({"ts": time.time(), **record}) + "\n").encode("utf-8"))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        self._file.close()
+
+
+async def _drive(append, rate: float, seconds: float) -> tuple[int, list[float], float]:
+    lags: list[float] = []
+    stop = asyncio.Event()
+
+    async def probe() -> None:
+        while not stop.is_set():
+            t = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lags.append((time.perf_counter() - t - 0.001) * 1000)
+
+    probe_task = asyncio.create_task(probe())
+    interval = 1.0 / rate
+    start = time.perf_counter()
+    append_s = 0.0
+    sent = 0
+    while time.perf_counter() - start < seconds:
+        # Catch up to the schedule in one go, then yield like a real handler would
+        due = int((time.perf_counter() - start) / interval)
+        t = time.perf_counter()
+        while sent < due:
+            append(_record(sent))
+            sent += 1
+        append_s += time.perf_counter() - t
+        await asyncio.sleep(0.001)
+    stop.set()
+    await probe_task
+    return sent, lags, append_s
+
+
+def _lag(lags: list[float]) -> str:
+    lags = sorted(lags)
+    pick = lambda q: lags[min(len(lags) - 1, int(len(lags) * q))]
+    return f"loop_lag p50={pick(0.5):6.3f} ms p99={pick(0.99):6.3f} ms max={lags[-1]:7.3f} ms"
+
+
+async def run(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory(dir=args.dir or None) as tmp:
+        sent, lags, _ = await _drive(lambda r: None, args.rate, args.seconds)
+        print(f"{'no log':14s} records={sent:6d} {_lag(lags)}")
+
+        naive = NaiveJournal(os.path.join(tmp, "naive.log"))
+        sent, lags, append_s = await _drive(naive.append, args.rate, args.seconds)
+        naive.close()
+        print(
+            f"{'naive fsync':14s} records={sent:6d} {_lag(lags)} "
+            f"append={append_s / max(sent, 1) * 1e6:7.1f} us/rec"
+        )
+
+        log = SessionLog(os.path.join(tmp, "wal"), RoomManager(), fsync_interval_s=args.fsync_ms / 1000)
+        await log.start()
+        sent, lags, append_s = await _drive(log.append, args.rate, args.seconds)
+        await log.close()
+        m = log.metrics()
+        print(
+            f"{'session log':14s} records={sent:6d} {_lag(lags)} "
+            f"append={append_s / max(sent, 1) * 1e6:7.1f} us/rec fsyncs={m['batches']} "
+            f"records/batch={m['records_per_batch']} max_fsync={m['max_fsync_ms']} ms dropped={m['dropped']}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rate", type=float, default=5000.0, help="records per second")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--fsync-ms", type=float, default=50.0)
+    parser.add_argument("--dir", default="", help="directory to put the logs in (default: system temp)")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
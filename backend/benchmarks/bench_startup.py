@@ -0,0 +1,78 @@
+"""Startup benchmark: import time and RSS of the reaction config.
+
+Each scenario runs in a fresh interpreter so import caches and RSS are not
+shared. Pass --legacy PATH to also measure an old single-module
+reaction_config.py (e.g. extracted with `git show <rev>:backend/app/services/reaction_config.py`).
+
+Run from backend/:  python -m benchmarks.bench_startup [--legacy /tmp/reaction_config_old.py]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+PROBE = r"""
+import json, resource, sys, time
+rss0 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+t0 = time.perf_counter()
+{import_stmt}
+t1 = time.perf_counter()
+rss1 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+{use_stmt}
+t2 = time.perf_counter()
+rss2 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{"import_ms": (t1 - t0) * 1e3, "import_rss_kb": rss1 - rss0,
+                  "use_ms": (t2 - t1) * 1e3, "total_rss_kb": rss2 - rss0}}))
+"""
+
+# Touch the data tables; works for both the lazy and the legacy module
+FIRST_USE = "rc.CATEGORIES['technical_pitch']['keywords_pos'][0]; rc.get_phrases('supportive', 'positive', 'tech')"
+
+
+def probe(import_stmt: str, use_stmt: str, cwd: str, env: dict | None = None, runs: int = 5) -> dict:
+    results = []
+    code = PROBE.format(import_stmt=import_stmt, use_stmt=use_stmt)
+    # First run warms the bytecode cache; it is not counted
+    for i in range(runs + 1):
+        out = subprocess.run([sys.executable, "-c", code], cwd=cwd, env=env, capture_output=True, text=True, check=True)
+        if i:
+            results.append(json.loads(out.stdout))
+    return {k: sorted(r[k] for r in results)[len(results) // 2] for k in results[0]}
+
+
+def report(label: str, r: dict) -> None:
+    print(
+        f"{label:28s} import {r['import_ms']:7.1f} ms  +{r['import_rss_kb'] / 1024:5.1f} MB RSS | "
+        f"first data access {r['use_ms']:6.1f} ms  total +{r['total_rss_kb'] / 1024:5.1f} MB RSS"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--legacy", help="path to an old single-module reaction_config.py")
+    args = parser.parse_args()
+    backend = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    report("current (lazy JSON)", probe("import app.services.reaction_config as rc", FIRST_USE, backend))
+
+    if args.legacy:
+        tmp = tempfile.mkdtemp()
+        try:
+            pkg = os.path.join(tmp, "legacy_rc")
+            os.makedirs(pkg)
+            open(os.path.join(pkg, "__init__.py"), "w").close()
+            shutil.copy(args.legacy, os.path.join(pkg, "reaction_config.py"))
+            env = dict(os.environ, PYTHONPATH=tmp)
+            report("legacy (python literal)", probe("import legacy_rc.reaction_config as rc", FIRST_USE, tmp, env))
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
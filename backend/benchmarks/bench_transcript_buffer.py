@@ -0,0 +1,125 @@
+"""Benchmark: TranscriptBuffer.append on long unpunctuated interim streams.
+
+Feeds word-by-word streams with no sentence terminators (and no interval
+flush) into the current buffer and into the legacy string-accumulating
+implementation, then flushes once. Before timing, randomized streams with
+punctuation, stray whitespace and pauses are checked for identical chunks
+and flush_meta.
+
+Run from backend/:  python -m benchmarks.bench_transcript_buffer [--words 10000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from app.services.transcript_buffer import TranscriptBuffer
+
+WORDS = (
+    "so what we found when we looked at the numbers is that most of the latency "
+    "comes from the network hop between the services and not from the database itself"
+).split()
+
+
+class LegacyTranscriptBuffer:
+    """The pre-rope implementation, kept here for comparison."""
+
+    PAUSE_THRESHOLDS = {"min_stutter": 0.6, "max_stutter": 2.5, "rhetorical": 2.5}
+
+    def __init__(self, max_interval_s: float = 2.0, flush_on_interval: bool = True) -> None:
+        self.max_interval_s = max_interval_s
+        self.flush_on_interval = flush_on_interval
+        self._room_to_state: dict[str, dict] = {}
+
+    def append(self, room_id: str, piece: str, meta: dict | None = None) -> tuple[bool, str, dict]:
+        now = time.monotonic()
+        state = self._room_to_state.setdefault(room_id, {"text": "", "last_flush_s": now, "pauses": []})
+        occurred_mid_sentence = not any(state["text"].endswith(ch) for ch in ".!?")
+        if meta is not None:
+            try:
+                s = meta.get("silence_preceding_s")
+                if s is not None:
+                    state["pauses"].append({"s": float(s), "mid": bool(occurred_mid_sentence)})
+            except Exception:
+                pass
+        state["text"] = (state["text"] + " " + piece).strip()
+        should_flush = False
+        if state["text"].endswith("?"):
+            should_flush = True
+        elif any(state["text"].endswith(ch) for ch in (".", "!")):
+            should_flush = True
+        elif self.flush_on_interval and (now - state["last_flush_s"] >= self.max_interval_s):
+            should_flush = True
+        if should_flush and state["text"]:
+            chunk, pauses = state["text"], state["pauses"][:]
+            state.update(text="", pauses=[], last_flush_s=now)
+            t = self.PAUSE_THRESHOLDS
+            return True, chunk, {
+                "max_pause_s": max([p.get("s", 0.0) for p in pauses], default=0.0),
+                "stutter_count": sum(1 for p in pauses if p.get("mid") and t["min_stutter"] <= p.get("s", 0.0) < t["max_stutter"]),
+                "rhetorical_pause": any((not p.get("mid")) and p.get("s", 0.0) >= t["rhetorical"] for p in pauses),
+                "question": ("?" in chunk),
+                "exclaim": ("!" in chunk),
+            }
+        return False, "", {}
+
+
+def random_piece(rng: random.Random) -> str:
+    piece = " ".join(rng.choices(WORDS, k=rng.randint(0, 4)))
+    if rng.random() < 0.2:
+        piece += rng.choice([".", "!", "?", "?!", ",", " ."])
+    if rng.random() < 0.2:
+        piece = rng.choice([" ", "  ", "\t", "\n"]) + piece
+    if rng.random() < 0.2:
+        piece += rng.choice([" ", "  ", "\n"])
+    return piece
+
+
+def check_equivalence(streams: int, rng: random.Random) -> int:
+    mismatches = 0
+    for _ in range(streams):
+        current = TranscriptBuffer(max_interval_s=3600, flush_on_interval=False)
+        legacy = LegacyTranscriptBuffer(max_interval_s=3600, flush_on_interval=False)
+        for _ in range(rng.randint(1, 60)):
+            piece = random_piece(rng)
+            r = rng.random()
+            meta = None if r < 0.3 else {} if r < 0.4 else {"silence_preceding_s": round(rng.uniform(0, 4), 2)}
+            if current.append("room", piece, meta) != legacy.append("room", piece, meta):
+                mismatches += 1
+                break
+    return mismatches
+
+
+def feed(buffer, words: list[str]) -> float:
+    t0 = time.perf_counter()
+    for word in words:
+        buffer.append("room", word, {"silence_preceding_s": 0.1})
+    flushed = buffer.append("room", "done.", None)
+    elapsed = time.perf_counter() - t0
+    assert flushed[0] and len(flushed[1].split()) == len(words) + 1
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--words", type=int, default=10_000)
+    parser.add_argument("--streams", type=int, default=5, help="streams per timing run")
+    args = parser.parse_args()
+    rng = random.Random(42)
+
+    print(f"equivalence: 2000 random streams, mismatches={check_equivalence(2000, rng)}")
+
+    for n in (args.words // 10, args.words):
+        words = rng.choices(WORDS, k=n)
+        legacy = min(feed(LegacyTranscriptBuffer(3600, False), words) for _ in range(args.streams))
+        current = min(feed(TranscriptBuffer(3600, False), words) for _ in range(args.streams))
+        print(
+            f"{n:6d} words: legacy {legacy * 1e3:8.1f} ms ({legacy / n * 1e6:6.2f} us/word)  "
+            f"pieces {current * 1e3:6.1f} ms ({current / n * 1e6:5.2f} us/word)  {legacy / current:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
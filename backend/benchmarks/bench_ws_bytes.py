@@ -0,0 +1,115 @@
+"""Benchmark: bytes on the wire per viewer session, per WebSocket encoding.
+
+Replays a synthetic session (ready, bot joins, state, transcript chunks,
+reaction frames, coach feedback) through app.ws.encoding and reports the
+payload bytes for JSON and MessagePack (when installed), each with and
+without permessage-deflate. Deflate is modelled the way uvicorn/browsers
+negotiate it by default: raw DEFLATE with context takeover, one sync flush
+per message and the trailing 0x00 0x00 0xff 0xff stripped (RFC 7692).
+
+Run from backend/:  python -m benchmarks.bench_ws_bytes [--bots 18] [--chunks 60]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import uuid
+import zlib
+
+from app.ws.encoding import JSON, MSGPACK, available_encodings, encode
+
+NAMES = ["Alex", "Blair", "Casey", "Devon", "Emery", "Finley", "Gray", "Harper", "Indy", "Jules"]
+STANCES = ["supportive", "skeptical", "curious"]
+DOMAINS = ["tech", "design", "finance"]
+WORDS = (
+    "so the latency budget for the checkout path is about two hundred milliseconds and we "
+    "spend most of it waiting on the payment provider which is why caching the token matters"
+).split()
+EMOJIS = ["🔥", "👍", "🤔", "👏", "😮", "💡", "❓"]
+PHRASES = ["Ship it", "Nice point", "Hmm, source?", "Love this", "Go on", "Interesting", "Wait what"]
+
+
+def session_messages(bots: int, chunks: int, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    room_id = str(uuid.UUID(int=rng.getrandbits(128)))
+    roster = [
+        {
+            "id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "name": rng.choice(NAMES),
+            "avatar": "🤖",
+            "persona": {"stance": rng.choice(STANCES), "domain": rng.choice(DOMAINS)},
+        }
+        for _ in range(bots)
+    ]
+    messages: list[dict] = [{"event": "ready", "payload": {"roomId": room_id, "encoding": "json"}}]
+    messages += [{"event": "join", "payload": {"bot": bot}} for bot in roster]
+    messages.append({"event": "state", "payload": {"roomId": room_id, "bots": roster}})
+    for i in range(chunks):
+        text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(12, 30)))
+        messages.append({"event": "transcript", "payload": {
+            "roomId": room_id,
+            "text": text,
+            "flush_meta": {
+                "max_pause_s": round(rng.uniform(0, 1.5), 2),
+                "stutter_count": rng.randint(0, 2),
+                "rhetorical_pause": rng.random() < 0.1,
+                "question": rng.random() < 0.2,
+                "exclaim": rng.random() < 0.1,
+            },
+        }})
+        reacting = rng.sample(roster, k=max(1, bots // 3))
+        messages.append({"event": "reactions", "payload": {"roomId": room_id, "reactions": [
+            {
+                "botId": bot["id"],
+                "reaction": {
+                    "emoji_unicode": rng.choice(EMOJIS),
+                    "micro_phrase": rng.choice(PHRASES),
+                    "score_delta": rng.randint(-2, 2),
+                },
+                "delayMs": rng.randint(0, 3000),
+            }
+            for bot in reacting
+        ]}})
+        if i % 10 == 9:
+            messages.append({"event": "coach_feedback", "payload": {
+                "roomId": room_id, "tip": "Slow down and pause after key numbers.", "score": rng.randint(40, 95),
+            }})
+    return messages
+
+
+def deflated_sizes(frames: list[bytes]) -> int:
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    total = 0
+    for frame in frames:
+        out = compressor.compress(frame) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        total += len(out) - 4
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bots", type=int, default=18)
+    parser.add_argument("--chunks", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    messages = session_messages(args.bots, args.chunks, args.seed)
+    print(f"messages={len(messages)} bots={args.bots} chunks={args.chunks}")
+    if MSGPACK not in available_encodings():
+        print("msgpack not installed; `pip install msgpack` to include it")
+    baseline = None
+    for encoding in available_encodings()[::-1]:
+        frames = []
+        for message in messages:
+            frame = encode(message, encoding)
+            frames.append(frame.encode("utf-8") if isinstance(frame, str) else frame)
+        raw = sum(len(f) for f in frames)
+        deflated = deflated_sizes(frames)
+        baseline = baseline or raw
+        for label, size in ((encoding, raw), (f"{encoding}+deflate", deflated)):
+            print(f"{label:16s} {size / 1024:8.1f} KiB/session  {size / len(messages):7.1f} B/msg  ({baseline / size:4.1f}x vs {JSON})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Minimal OpenAI-compatible chat completions server for local load tests.
+
+Speaks just enough HTTP/1.1 (keep-alive, Content-Length bodies) to serve
+`POST /chat/completions` with a fixed delay. No third-party dependencies.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Callable
+
+Responder = Callable[[dict], str]
+
+
+def default_responder(request: dict) -> str:
+    return json.dumps({"emoji_unicode": "🙂", "micro_phrase": "Interesting", "score_delta": 1})
+
+
+class FakeOpenAIServer:
+    def __init__(self, delay_s: float = 0.5, responder: Responder = default_responder) -> None:
+        self.delay_s = delay_s
+        self.responder = responder
+        self.requests = 0
+        self.connections = 0
+        self._server: asyncio.AbstractServer | None = None
+        self._handlers: set[asyncio.Task] = set()
+
+    @property
+    def base_url(self) -> str:
+        assert self._server is not None
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}/v1"
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> "FakeOpenAIServer":
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return self
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            for task in list(self._handlers):
+                task.cancel()
+            await asyncio.gather(*self._handlers, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        task = asyncio.current_task()
+        if task is not None:
+            self._handlers.add(task)
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                headers = {}
+                for line in head.decode("latin-1").split("\r\n")[1:]:
+                    if ":" in line:
+                        k, v = line.split(":", 1)
+                        headers[k.strip().lower()] = v.strip()
+                body = await reader.readexactly(int(headers.get("content-length", "0")))
+                try:
+                    request = json.loads(body or b"{}")
+                except json.JSONDecodeError:
+                    request = {}
+                self.requests += 1
+                await asyncio.sleep(self.delay_s)
+                payload = json.dumps({
+                    "id": f"chatcmpl-{self.requests}",
+                    "object": "chat.completion",
+                    "created": 0,
+                    "model": request.get("model", "fake"),
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": self.responder(request)},
+                        "finish_reason": "stop",
+                    }],
+                    "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+                }).encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\ncontent-type: application/json\r\n"
+                    b"connection: keep-alive\r\ncontent-length: " + str(len(payload)).encode() + b"\r\n\r\n" + payload
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self._handlers.discard(task)  # type: ignore[arg-type]
+            writer.close()
@@ -0,0 +1,79 @@
+"""Load test: event-loop latency while many Stage-2 reactions are in flight.
+
+Starts a local fake OpenAI-compatible server, points the shared Stage-2
+client at it, and fires N concurrent `Bot.generateReaction` calls while a
+ticker measures how late the event loop wakes up. With the async client the
+lag stays flat no matter how many calls are outstanding.
+
+Run from backend/:  python -m benchmarks.load_stage2 [--calls 200] [--delay 0.5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+from benchmarks.fake_openai import FakeOpenAIServer
+
+
+async def _measure_lag(stop: asyncio.Event, interval_s: float, samples: list[float]) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        t0 = loop.time()
+        await asyncio.sleep(interval_s)
+        samples.append(loop.time() - t0 - interval_s)
+
+
+async def run(calls: int, delay_s: float) -> None:
+    server = await FakeOpenAIServer(delay_s=delay_s).start()
+    os.environ["OPENROUTER_BASE_URL"] = server.base_url
+
+    from app.core.config import get_settings
+    get_settings.cache_clear()
+    from app.services import bot as bot_module
+    from app.services.bot import Bot, BotPersona, BotState
+
+    bots = [
+        Bot(personality=BotPersona(name=f"b{i}", stance="curious", domain="tech", snark=0.2, politeness=0.8), state=BotState())
+        for i in range(calls)
+    ]
+
+    for label, n in (("idle", 0), ("loaded", calls)):
+        samples: list[float] = []
+        stop = asyncio.Event()
+        ticker = asyncio.create_task(_measure_lag(stop, 0.01, samples))
+        t0 = time.perf_counter()
+        if n:
+            results = await asyncio.gather(*(b.generateReaction("What is the p99 latency?") for b in bots[:n]))
+            ok = sum(1 for r in results if r)
+        else:
+            await asyncio.sleep(delay_s * 2)
+            ok = 0
+        wall = time.perf_counter() - t0
+        stop.set()
+        await ticker
+        lag_ms = sorted(s * 1e3 for s in samples)
+        p99 = lag_ms[int(len(lag_ms) * 0.99) - 1] if lag_ms else 0.0
+        print(
+            f"{label:7s} calls={n:4d} ok={ok:4d} wall={wall:6.2f}s "
+            f"loop lag median={statistics.median(lag_ms):5.2f}ms p99={p99:5.2f}ms max={lag_ms[-1]:5.2f}ms"
+        )
+
+    print(f"server: requests={server.requests} connections={server.connections}")
+    await bot_module.close_client()
+    await server.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--delay", type=float, default=0.5)
+    args = parser.parse_args()
+    asyncio.run(run(args.calls, args.delay))
+
+
+if __name__ == "__main__":
+    main()
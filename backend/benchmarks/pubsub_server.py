@@ -0,0 +1,92 @@
+"""Local stand-in for Redis pub/sub (RESP2 PUBLISH/SUBSCRIBE only).
+
+Enough of the protocol for app.events.transport.RedisTransport, so the
+multi-worker bus can be exercised without a Redis install. Not for
+production: no persistence, no other commands, no auth checks.
+
+Run from backend/:  python -m benchmarks.pubsub_server [--port 6390]
+then start workers with EVENT_BUS_URL=redis://127.0.0.1:6390
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from typing import Dict, Set
+
+from app.events.transport import _command, _read_reply
+
+
+class PubSubServer:
+    def __init__(self) -> None:
+        self._channels: Dict[bytes, Set[asyncio.StreamWriter]] = {}
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        subscribed: Set[bytes] = set()
+        try:
+            while True:
+                try:
+                    request = await _read_reply(reader)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    break
+                if not isinstance(request, list) or not request:
+                    continue
+                name = request[0].upper()
+                if name == b"PUBLISH" and len(request) == 3:
+                    receivers = self._channels.get(request[1], ())
+                    message = _command(b"message", request[1], request[2])
+                    for other in list(receivers):
+                        other.write(message)
+                    writer.write(b":%d\r\n" % len(receivers))
+                elif name == b"SUBSCRIBE":
+                    for channel in request[1:]:
+                        self._channels.setdefault(channel, set()).add(writer)
+                        subscribed.add(channel)
+                        # [b"subscribe", channel, count]: a 3-element array whose last item is an integer
+                        ack = _command(b"subscribe", channel)
+                        writer.write(b"*3" + ack[2:] + b":%d\r\n" % len(subscribed))
+                elif name in (b"PING", b"AUTH", b"SELECT"):
+                    writer.write(b"+PONG\r\n" if name == b"PING" else b"+OK\r\n")
+                else:
+                    writer.write(b"-ERR unsupported command\r\n")
+                await writer.drain()
+        finally:
+            for channel in subscribed:
+                subs = self._channels.get(channel)
+                if subs is not None:
+                    subs.discard(writer)
+                    if not subs:
+                        self._channels.pop(channel, None)
+            writer.close()
+
+
+async def _serve(host: str, port: int) -> None:
+    server = PubSubServer()
+    port = await server.start(host, port)
+    print(f"pub/sub stand-in listening on redis://{host}:{port}")
+    await asyncio.Event().wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6390)
+    args = parser.parse_args()
+    try:
+        asyncio.run(_serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Simulation: chunks and reactions per minute under each flush policy.
+
+Drives TranscriptBuffer with a simulated clock for a few speaker profiles
+(fast with short sentences, average, slow without punctuation). Every flush
+is assumed to produce `--per-chunk` reactions, which are reported back to
+the buffer the way main.py does, so the adaptive policy sees real load.
+
+Run from backend/:  python -m benchmarks.sim_flush_policy [--budget 120] [--per-chunk 8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+
+import app.services.transcript_buffer as tb_module
+from app.services.flush_policy import AdaptiveFlushPolicy, FixedFlushPolicy
+from app.services.transcript_buffer import TranscriptBuffer
+
+# (label, words per second, words per sentence (0 = no punctuation))
+SPEAKERS = [
+    ("fast, short sentences", 4.0, 5),
+    ("average", 2.5, 14),
+    ("slow, no punctuation", 1.2, 0),
+]
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+def simulate(policy, wps: float, sentence_words: int, per_chunk: int, minutes: float, seed: int) -> tuple[int, float]:
+    rng = random.Random(seed)
+    clock = Clock()
+    real_time = tb_module.time
+    tb_module.time = clock  # type: ignore[assignment]
+    try:
+        buffer = TranscriptBuffer(policy=policy)
+        flushes = 0
+        words_in_sentence = 0
+        end = clock.now + minutes * 60
+        while clock.now < end:
+            # Interim pieces of 1-3 words at the speaker's pace
+            n = rng.randint(1, 3)
+            clock.now += n / wps * rng.uniform(0.8, 1.2)
+            words_in_sentence += n
+            piece = " ".join(["word"] * n)
+            if sentence_words and words_in_sentence >= sentence_words:
+                piece += "."
+                words_in_sentence = 0
+            flushed, _, _ = buffer.append("room", piece, {"silence_preceding_s": 0.1})
+            if flushed:
+                flushes += 1
+                buffer.record_reactions("room", per_chunk)
+        return flushes, flushes * per_chunk / minutes
+    finally:
+        tb_module.time = real_time  # type: ignore[assignment]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--budget", type=float, default=120.0, help="reactions per minute per room")
+    parser.add_argument("--per-chunk", type=int, default=8, help="reactions each chunk produces")
+    parser.add_argument("--minutes", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"budget={args.budget:.0f} reactions/min, {args.per_chunk} reactions per chunk")
+    for label, wps, sentence_words in SPEAKERS:
+        for name, make in (
+            ("fixed 7s", lambda: FixedFlushPolicy(max_interval_s=7.0)),
+            ("adaptive", lambda: AdaptiveFlushPolicy(reactions_per_minute=args.budget, max_interval_s=7.0)),
+        ):
+            flushes, rpm = simulate(make(), wps, sentence_words, args.per_chunk, args.minutes, args.seed)
+            print(f"{label:24s} {name:9s} chunks/min={flushes / args.minutes:6.1f} reactions/min={rpm:7.1f}")
+
+
+if __name__ == "__main__":
+    main()
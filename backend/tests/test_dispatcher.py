@@ -0,0 +1,145 @@
+"""Dispatcher ordering, overflow and lane bookkeeping.
+
+Run from backend/:  python -m pytest -q
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from app.events.dispatcher import BLOCK, DROP_OLDEST, Dispatcher, TopicPolicy
+
+
+def _room(payload: dict) -> str:
+    return payload["roomId"]
+
+
+async def _drained(dispatcher: Dispatcher, *topics: str, timeout: float = 2.0) -> None:
+    async def wait() -> None:
+        while dispatcher.lanes() or any(dispatcher.depth(t) for t in topics):
+            await asyncio.sleep(0.001)
+    await asyncio.wait_for(wait(), timeout)
+
+
+def test_room_order_is_kept_across_topics() -> None:
+    async def run() -> None:
+        dispatcher = Dispatcher()
+        for topic in ("bot:join", "bot:reaction"):
+            dispatcher.configure(topic, TopicPolicy(workers=4, order_key=_room))
+        seen: list[tuple[str, str]] = []
+
+        async def handler(payload: dict) -> None:
+            await asyncio.sleep(payload["sleep"])
+            seen.append((payload["roomId"], payload["event"]))
+
+        # room-a's join is slow; its reaction must still wait for it, room-b must not
+        await dispatcher.submit("bot:join", handler, {"roomId": "room-a", "event": "join", "sleep": 0.05})
+        await dispatcher.submit("bot:reaction", handler, {"roomId": "room-a", "event": "reaction", "sleep": 0})
+        await dispatcher.submit("bot:join", handler, {"roomId": "room-b", "event": "join", "sleep": 0})
+        await dispatcher.submit("bot:reaction", handler, {"roomId": "room-b", "event": "reaction", "sleep": 0})
+        await _drained(dispatcher, "bot:join", "bot:reaction")
+        await dispatcher.close()
+
+        assert [e for r, e in seen if r == "room-a"] == ["join", "reaction"]
+        assert [e for r, e in seen if r == "room-b"] == ["join", "reaction"]
+        assert seen.index(("room-b", "reaction")) < seen.index(("room-a", "join"))
+
+    asyncio.run(run())
+
+
+def test_dropping_a_parked_jobs_predecessor_unblocks_it() -> None:
+    async def run() -> None:
+        dispatcher = Dispatcher()
+        dispatcher.configure("bot:reaction", TopicPolicy(workers=1, max_queue=1, overflow=DROP_OLDEST, order_key=_room))
+        dispatcher.configure("bot:join", TopicPolicy(workers=1, order_key=_room))
+        gate = asyncio.Event()
+        joined = asyncio.Event()
+        seen: list[str] = []
+
+        async def hold(payload: dict) -> None:
+            await gate.wait()
+
+        async def record(payload: dict) -> None:
+            seen.append(payload["event"])
+            if payload["event"] == "join":
+                joined.set()
+
+        # Occupy the only reaction worker so room-k's reaction stays queued
+        await dispatcher.submit("bot:reaction", hold, {"roomId": "other"})
+        await asyncio.sleep(0)
+        await dispatcher.submit("bot:reaction", record, {"roomId": "room-k", "event": "stale"})
+        # Published after it on the same lane: parks behind the queued reaction
+        await dispatcher.submit("bot:join", record, {"roomId": "room-k", "event": "join"})
+        await asyncio.sleep(0.01)
+        assert seen == []
+        assert dispatcher.metrics()["bot:join"]["parked"] == 1
+
+        # Full queue: the stale reaction is dropped, which must release the join
+        await dispatcher.submit("bot:reaction", record, {"roomId": "room-k", "event": "fresh"})
+        await asyncio.wait_for(joined.wait(), 1.0)
+        assert dispatcher.metrics()["bot:reaction"]["dropped"] == 1
+
+        gate.set()
+        await _drained(dispatcher, "bot:join", "bot:reaction")
+        await dispatcher.close()
+        assert seen == ["join", "fresh"]
+
+    asyncio.run(run())
+
+
+def test_lanes_return_to_zero_after_draining() -> None:
+    async def run() -> None:
+        dispatcher = Dispatcher()
+        for topic in ("transcript:chunk", "bot:reaction"):
+            dispatcher.configure(topic, TopicPolicy(workers=8, order_key=_room))
+
+        async def handler(payload: dict) -> None:
+            await asyncio.sleep(0.001 * (payload["seq"] % 3))
+            if payload["seq"] % 7 == 0:
+                raise RuntimeError("handler failure must still release the lane")
+
+        for seq in range(30):
+            for room in range(10):
+                topic = "transcript:chunk" if seq % 2 else "bot:reaction"
+                await dispatcher.submit(topic, handler, {"roomId": f"room-{room}", "seq": seq})
+        assert dispatcher.lanes() > 0
+        await _drained(dispatcher, "transcript:chunk", "bot:reaction")
+        metrics = dispatcher.metrics()
+        await dispatcher.close()
+
+        assert dispatcher.lanes() == 0
+        assert sum(m["handled"] for m in metrics.values()) == 300
+        assert all(m["parked"] == 0 for m in metrics.values())
+
+    asyncio.run(run())
+
+
+def test_block_applies_backpressure_then_resumes() -> None:
+    async def run() -> None:
+        dispatcher = Dispatcher()
+        dispatcher.configure("transcript:chunk", TopicPolicy(workers=1, max_queue=1, overflow=BLOCK))
+        gate = asyncio.Event()
+        seen: list[int] = []
+
+        async def handler(payload: dict) -> None:
+            await gate.wait()
+            seen.append(payload["seq"])
+
+        await dispatcher.submit("transcript:chunk", handler, {"seq": 0})
+        await asyncio.sleep(0)  # the worker takes it and waits on the gate
+        await dispatcher.submit("transcript:chunk", handler, {"seq": 1})
+        publisher = asyncio.create_task(dispatcher.submit("transcript:chunk", handler, {"seq": 2}))
+        await asyncio.sleep(0.01)
+        assert not publisher.done()
+        assert dispatcher.metrics()["transcript:chunk"]["blocked"] == 1
+
+        gate.set()
+        await asyncio.wait_for(publisher, 1.0)
+        await _drained(dispatcher, "transcript:chunk")
+        await asyncio.sleep(0.01)
+        await dispatcher.close()
+
+        assert seen == [0, 1, 2]
+        assert dispatcher.metrics()["transcript:chunk"]["dropped"] == 0
+
+    asyncio.run(run())
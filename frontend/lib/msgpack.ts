@@ -0,0 +1,121 @@
+/* eslint-disable @typescript-eslint/no-explicit-any */
+// Minimal MessagePack decoder for server->client WS frames (podium.msgpack).
+// Covers everything the backend encodes: nil, bool, ints, floats, str, bin,
+// arrays and maps. Extension types are not used and are rejected.
+
+const textDecoder = new TextDecoder();
+
+export function decodeMsgpack(input: ArrayBuffer | Uint8Array): any {
+  const bytes = input instanceof Uint8Array ? input : new Uint8Array(input);
+  const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+  let pos = 0;
+
+  const str = (len: number): string => {
+    const s = textDecoder.decode(bytes.subarray(pos, pos + len));
+    pos += len;
+    return s;
+  };
+  const bin = (len: number): Uint8Array => {
+    const b = bytes.slice(pos, pos + len);
+    pos += len;
+    return b;
+  };
+  const array = (len: number): any[] => {
+    const out = new Array(len);
+    for (let i = 0; i < len; i++) out[i] = read();
+    return out;
+  };
+  const map = (len: number): Record<string, any> => {
+    const out: Record<string, any> = {};
+    for (let i = 0; i < len; i++) {
+      const key = read();
+      out[String(key)] = read();
+    }
+    return out;
+  };
+  const u8 = () => view.getUint8(pos++);
+  const u16 = () => {
+    const v = view.getUint16(pos);
+    pos += 2;
+    return v;
+  };
+  const u32 = () => {
+    const v = view.getUint32(pos);
+    pos += 4;
+    return v;
+  };
+
+  function read(): any {
+    const b = u8();
+    if (b <= 0x7f) return b;
+    if (b >= 0xe0) return b - 0x100;
+    if ((b & 0xf0) === 0x80) return map(b & 0x0f);
+    if ((b & 0xf0) === 0x90) return array(b & 0x0f);
+    if ((b & 0xe0) === 0xa0) return str(b & 0x1f);
+    let v: number;
+    switch (b) {
+      case 0xc0:
+        return null;
+      case 0xc2:
+        return false;
+      case 0xc3:
+        return true;
+      case 0xc4:
+        return bin(u8());
+      case 0xc5:
+        return bin(u16());
+      case 0xc6:
+        return bin(u32());
+      case 0xca:
+        v = view.getFloat32(pos);
+        pos += 4;
+        return v;
+      case 0xcb:
+        v = view.getFloat64(pos);
+        pos += 8;
+        return v;
+      case 0xcc:
+        return u8();
+      case 0xcd:
+        return u16();
+      case 0xce:
+        return u32();
+      case 0xcf:
+        v = Number(view.getBigUint64(pos));
+        pos += 8;
+        return v;
+      case 0xd0:
+        return view.getInt8(pos++);
+      case 0xd1:
+        v = view.getInt16(pos);
+        pos += 2;
+        return v;
+      case 0xd2:
+        v = view.getInt32(pos);
+        pos += 4;
+        return v;
+      case 0xd3:
+        v = Number(view.getBigInt64(pos));
+        pos += 8;
+        return v;
+      case 0xd9:
+        return str(u8());
+      case 0xda:
+        return str(u16());
+      case 0xdb:
+        return str(u32());
+      case 0xdc:
+        return array(u16());
+      case 0xdd:
+        return array(u32());
+      case 0xde:
+        return map(u16());
+      case 0xdf:
+        return map(u32());
+      default:
+        throw new Error(`msgpack: unsupported type 0x${b.toString(16)}`);
+    }
+  }
+
+  return read();
+}
@@ -1,10 +1,56 @@
 /* eslint-disable @typescript-eslint/no-explicit-any */
+import { decodeMsgpack } from "./msgpack";
+
 let socket: WebSocket | null = null;
 let currentRoomId: string | null = null;
 
 type MessageHandler = (data: any) => void;
 const handlers = new Set<MessageHandler>();
 
+function dispatch(data: any): void {
+  handlers.forEach((h) => {
+    try {
+      h(data);
+    } catch {}
+  });
+}
+
+// Server batches reactions into `reactions` frames; replay each one as a
+// plain `reaction` message after its delayMs so handlers keep the stagger.
+function dispatchReactionFrame(payload: any, from: WebSocket): void {
+  const items = Array.isArray(payload?.reactions) ? payload.reactions : [];
+  items.forEach((item: any) => {
+    const deliver = () => {
+      if (socket !== from) return;
+      dispatch({
+        event: "reaction",
+        payload: {
+          roomId: payload.roomId,
+          botId: item.botId,
+          reaction: item.reaction,
+        },
+      });
+    };
+    const delay = Number(item.delayMs) || 0;
+    if (delay > 0) window.setTimeout(deliver, delay);
+    else deliver();
+  });
+}
+
+// Opt in to compact binary frames (MessagePack) with NEXT_PUBLIC_WS_ENCODING=msgpack.
+// JSON is offered as well, so servers without msgpack keep sending text frames.
+function getSubprotocols(): string[] | undefined {
+  return process.env.NEXT_PUBLIC_WS_ENCODING === "msgpack"
+    ? ["podium.msgpack", "podium.json"]
+    : undefined;
+}
+
+function parseFrame(data: unknown): any {
+  if (typeof data === "string") return JSON.parse(data);
+  if (data instanceof ArrayBuffer) return decodeMsgpack(data);
+  return JSON.parse(String(data));
+}
+
 function getWsBase(): string {
   const apiBase = process.env.NEXT_PUBLIC_BACKEND_URL as string;
   if (!apiBase) return "";
@@ -17,11 +63,15 @@ function getWsBase(): string {
   }
 }
 
+// A worker that does not own the room answers with a `redirect` to the owner
+const MAX_REDIRECTS = 3;
+
 export const wsClient = {
-  async connect(roomId: string): Promise<void> {
+  async connect(roomId: string, redirectUrl?: string, redirects = 0): Promise<void> {
     const wsBase = getWsBase();
     if (!wsBase) throw new Error("WS base not configured");
     if (
+      !redirectUrl &&
       socket &&
       socket.readyState === WebSocket.OPEN &&
       currentRoomId === roomId
@@ -32,8 +82,9 @@ export const wsClient = {
     try {
       socket?.close();
     } catch {}
-    const url = `${wsBase}/ws/rooms/${roomId}`;
-    socket = new WebSocket(url);
+    const url = redirectUrl || `${wsBase}/ws/rooms/${roomId}`;
+    socket = new WebSocket(url, getSubprotocols());
+    socket.binaryType = "arraybuffer";
     currentRoomId = roomId;
 
     await new Promise<void>((resolve, reject) => {
@@ -54,19 +105,23 @@ export const wsClient = {
     });
 
     if (!socket) return;
+    const s = socket;
     socket.onmessage = (evt) => {
       try {
-        const data = JSON.parse(String(evt.data));
-        handlers.forEach((h) => {
-          try {
-            h(data);
-          } catch {}
-        });
+        const data = parseFrame(evt.data);
+        if (data?.event === "reactions") dispatchReactionFrame(data.payload, s);
+        else if (data?.event === "redirect" && data.payload?.url) {
+          if (redirects < MAX_REDIRECTS) {
+            wsClient.connect(roomId, data.payload.url, redirects + 1).catch(() => {});
+          }
+        } else dispatch(data);
       } catch {
         // ignore malformed
       }
     };
     socket.onclose = () => {
+      // A redirect may already have replaced this socket
+      if (socket !== s) return;
       socket = null;
       currentRoomId = null;
     };
@@ -94,6 +149,19 @@ export const wsClient = {
     if (meta && typeof meta === "object") payload.meta = meta;
     this.sendJson({ event: "client_transcript", payload });
   },
+  // Opt in to the sampled reaction_debug stream (off by default)
+  subscribeDebug(sampleRate = 1): void {
+    this.sendJson({
+      event: "subscribe",
+      payload: { topics: ["reaction_debug"], sampleRate },
+    });
+  },
+  unsubscribeDebug(): void {
+    this.sendJson({
+      event: "unsubscribe",
+      payload: { topics: ["reaction_debug"] },
+    });
+  },
   subscribe(handler: MessageHandler): () => void {
     handlers.add(handler);
     return () => handlers.delete(handler);